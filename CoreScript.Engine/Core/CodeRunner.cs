@@ -333,10 +333,19 @@ namespace CoreScript.Engine.Core
         {
             var alc = new AssemblyLoadContext("RevitScriptBinary", isCollectible: true);
             string timestamp = DateTime.Now.ToString("dddd dd, MMMM yyyy | hh:mm:ss tt", CultureInfo.InvariantCulture);
+            string scriptName = string.Empty;
 
             try
             {
                 var parameters = MapParameters(parametersJson, context, out var richParams);
+
+                // Dashboard reporting name, passed as for source runs; don't pollute script scope
+                if (parameters.TryGetValue("__script_name__", out var forcedName))
+                {
+                    scriptName = forcedName?.ToString() ?? string.Empty;
+                    parameters.Remove("__script_name__");
+                    richParams.RemoveAll(p => p.Name == "__script_name__");
+                }
                 
                 // V2 FIX: Apply hardening (Units/Defaults) to binary execution too
                 if (richParams.Count > 0)
@@ -357,7 +366,7 @@ namespace CoreScript.Engine.Core
                     var entryType = assembly.GetTypes().FirstOrDefault(t => t.Name.Contains("Submission#0")) 
                                     ?? assembly.GetTypes().FirstOrDefault();
 
-                    if (entryType == null) return ExecutionResult.Failure("Could not find entry type in compiled assembly.");
+                    if (entryType == null) return WithScriptName(ExecutionResult.Failure("Could not find entry type in compiled assembly."), scriptName);
 
                     // For Roslyn scripts, use the <Factory> method which takes globals as the first parameter
                     // The Factory returns a Task<object> that represents the script execution
@@ -383,7 +392,7 @@ namespace CoreScript.Engine.Core
                             var method = entryType.GetMethod("<Initialize>", BindingFlags.Public | BindingFlags.NonPublic | BindingFlags.Instance | BindingFlags.Static)
                                              ?? entryType.GetMethod("Execute", BindingFlags.Public | BindingFlags.NonPublic | BindingFlags.Instance | BindingFlags.Static);
 
-                            if (method == null) return ExecutionResult.Failure("Could not find execution entry point in assembly.");
+                            if (method == null) return WithScriptName(ExecutionResult.Failure("Could not find execution entry point in assembly."), scriptName);
 
                             if (method.IsStatic)
                             {
@@ -393,7 +402,7 @@ namespace CoreScript.Engine.Core
                             {
                                 // For instance methods, we need the constructor that takes (object[] globals)
                                 var ctor = entryType.GetConstructors().FirstOrDefault();
-                                if (ctor == null) return ExecutionResult.Failure("Could not find constructor for script type.");
+                                if (ctor == null) return WithScriptName(ExecutionResult.Failure("Could not find constructor for script type."), scriptName);
                                 
                                 var ctorParams = ctor.GetParameters();
                                 object instance;
@@ -415,18 +424,19 @@ namespace CoreScript.Engine.Core
                         
                         var execResult = ExecutionResult.Success(successMessage, null);
                         execResult.PrintLog = context.PrintLog.ToList();
+                        execResult.ScriptName = scriptName;
                         return execResult;
                     }
                     catch (TargetInvocationException ex)
                     {
                         var innerEx = ex.InnerException ?? ex;
                         FileLogger.LogError("🛑 Binary execution TargetInvocationException: " + innerEx.ToString());
-                        return ExecutionResult.Failure($"❌ Binary execution error: {innerEx.Message} | {timestamp}", context.PrintLog.ToArray());
+                        return WithScriptName(ExecutionResult.Failure($"❌ Binary execution error: {innerEx.Message} | {timestamp}", context.PrintLog.ToArray()), scriptName);
                     }
                     catch (Exception ex)
                     {
                         FileLogger.LogError("🛑 Binary execution General Exception: " + ex.ToString());
-                        return ExecutionResult.Failure($"❌ Binary execution error: {ex.Message} | {timestamp}", context.PrintLog.ToArray());
+                        return WithScriptName(ExecutionResult.Failure($"❌ Binary execution error: {ex.Message} | {timestamp}", context.PrintLog.ToArray()), scriptName);
                     }
                 }
             }
@@ -437,6 +447,12 @@ namespace CoreScript.Engine.Core
             }
         }
 
+        private static ExecutionResult WithScriptName(ExecutionResult result, string scriptName)
+        {
+            result.ScriptName = scriptName;
+            return result;
+        }
+
         public byte[] CompileToBytes(string userCode)
         {
             try
@@ -33,6 +33,11 @@ namespace Paracore.Addin.Context
         // ✅ Backing delegate for script printing
         public Action<string>? PrintCallback { get; private set; }
 
+        // Raised as output is produced so streaming callers can relay it live.
+        // The bool is true when the text continues the previous line (Print) rather than starting a new one (Println).
+        public event Action<string, bool>? OutputAppended;
+        public event Action<StructuredOutputItem>? StructuredOutputAdded;
+
         private static string GetLogPath(string fileName)
         {
             var logDir = Path.Combine(Environment.GetFolderPath(Environment.SpecialFolder.ApplicationData), "paracore-data", "logs");
@@ -62,6 +67,7 @@ namespace Paracore.Addin.Context
         public void Println(string message)
         {
             _printMessages.Add(message);
+            OutputAppended?.Invoke(message, false);
             System.IO.File.AppendAllText(
                 GetLogPath("PrintCallbackDebug.txt"),
                 $"[DEBUG {DateTime.Now:HH:mm:ss}] {message}\n"
@@ -70,7 +76,8 @@ namespace Paracore.Addin.Context
 
         public void Print(string message)
         {
-            if (_printMessages.Count > 0)
+            bool append = _printMessages.Count > 0;
+            if (append)
             {
                 _printMessages[_printMessages.Count - 1] += message;
             }
@@ -78,6 +85,7 @@ namespace Paracore.Addin.Context
             {
                 _printMessages.Add(message);
             }
+            OutputAppended?.Invoke(message, append);
             System.IO.File.AppendAllText(
                 GetLogPath("PrintCallbackDebug.txt"),
                 $"[DEBUG {DateTime.Now:HH:mm:ss}] {message}\n"
@@ -91,7 +99,9 @@ namespace Paracore.Addin.Context
 
         public void AddStructuredOutput(string type, string jsonData)
         {
-            _structuredOutputItems.Add(new StructuredOutputItem { Type = type, Data = jsonData });
+            var item = new StructuredOutputItem { Type = type, Data = jsonData };
+            _structuredOutputItems.Add(item);
+            StructuredOutputAdded?.Invoke(item);
         }
     }
 }
@@ -10,6 +10,8 @@ using Paracore.Addin.Helpers;
 using Paracore.Addin.ViewModels;
 using System;
 using System.Linq;
+using System.Threading;
+using System.Threading.Channels;
 using System.Threading.Tasks;
 using System.Collections.Generic;
 using System.Text.Json;
@@ -92,7 +94,10 @@ namespace Paracore.Addin.Services
                 RevitVersion = revitVersion ?? "",
                 DocumentOpen = documentOpen,
                 DocumentTitle = documentTitle ?? "",
-                DocumentType = documentType
+                DocumentType = documentType,
+                EngineVersion = typeof(CoreScript.Engine.Core.CodeRunner).Assembly.GetName().Version?.ToString() ?? "",
+                // Rebuilt engines often keep their version; the module id tells their compiled assemblies apart
+                EngineBuild = typeof(CoreScript.Engine.Core.CodeRunner).Assembly.ManifestModule.ModuleVersionId.ToString("N")
             };
 
             _logger.Log($"[CoreScriptRunnerService] Revit Status: Open={{revitOpen}}, Version={{revitVersion}}, DocOpen={{documentOpen}}, DocTitle='{{documentTitle}}', DocType={{documentType}}.", LogLevel.Debug);
@@ -102,13 +107,79 @@ namespace Paracore.Addin.Services
         public override async Task<ExecuteScriptResponse> ExecuteScript(ExecuteScriptRequest request, ServerCallContext context)
         {
             _logger.Log("[CoreScriptRunnerService] Entering ExecuteScript.", LogLevel.Debug);
-            ExecutionResult finalResult = new ExecutionResult { IsSuccess = false, ErrorMessage = "Execution not started" };
             if (_uiApp == null)
             {
                 return new ExecuteScriptResponse { IsSuccess = false, ErrorMessage = "Revit UI Application is not available." };
             }
             var serverContext = new ServerContext(_uiApp);
             _logger.Log("[CoreScriptRunnerService] ServerContext created.", LogLevel.Debug);
+
+            var finalResult = await RunScriptAsync(request, serverContext, context.CancellationToken);
+            var response = BuildExecuteResponse(finalResult, serverContext);
+            _logger.Log($"[CoreScriptRunnerService] Returning ExecuteScriptResponse. Success: {response.IsSuccess}, Output Length: {response.Output.Length}, Structured Items: {response.StructuredOutput.Count}", LogLevel.Debug);
+            return response;
+        }
+
+        /// <summary>
+        /// Same as ExecuteScript, but relays Println/Print lines and structured output items as they are produced.
+        /// The last chunk carries the result; its output and already-streamed structured items are left empty.
+        /// </summary>
+        public override async Task ExecuteScriptStream(ExecuteScriptRequest request, IServerStreamWriter<ExecuteScriptStreamChunk> responseStream, ServerCallContext context)
+        {
+            _logger.Log("[CoreScriptRunnerService] Entering ExecuteScriptStream.", LogLevel.Debug);
+            if (_uiApp == null)
+            {
+                await responseStream.WriteAsync(new ExecuteScriptStreamChunk
+                {
+                    Result = new ExecuteScriptResponse { IsSuccess = false, ErrorMessage = "Revit UI Application is not available." }
+                });
+                return;
+            }
+
+            var serverContext = new ServerContext(_uiApp);
+            var chunks = Channel.CreateUnbounded<ExecuteScriptStreamChunk>(new UnboundedChannelOptions { SingleReader = true });
+            int streamedStructuredItems = 0;
+
+            // Context callbacks fire on the Revit UI thread; the channel hands them over to the gRPC writer.
+            serverContext.OutputAppended += (text, append) =>
+                chunks.Writer.TryWrite(new ExecuteScriptStreamChunk { Output = new ConsoleOutput { Text = text, Append = append } });
+            serverContext.StructuredOutputAdded += item =>
+            {
+                Interlocked.Increment(ref streamedStructuredItems);
+                chunks.Writer.TryWrite(new ExecuteScriptStreamChunk { StructuredOutput = new CoreScript.StructuredOutputItem { Type = item.Type, Data = item.Data } });
+            };
+
+            var runTask = Task.Run(async () =>
+            {
+                try
+                {
+                    return await RunScriptAsync(request, serverContext, context.CancellationToken);
+                }
+                finally
+                {
+                    chunks.Writer.TryComplete();
+                }
+            });
+
+            await foreach (var chunk in chunks.Reader.ReadAllAsync(context.CancellationToken))
+            {
+                await responseStream.WriteAsync(chunk);
+            }
+
+            var finalResult = await runTask;
+            var response = BuildExecuteResponse(finalResult, serverContext);
+            response.Output = "";
+            for (int i = 0; i < streamedStructuredItems && response.StructuredOutput.Count > 0; i++)
+            {
+                response.StructuredOutput.RemoveAt(0);
+            }
+            await responseStream.WriteAsync(new ExecuteScriptStreamChunk { Result = response });
+            _logger.Log($"[CoreScriptRunnerService] ExecuteScriptStream finished. Success: {response.IsSuccess}", LogLevel.Debug);
+        }
+
+        private async Task<ExecutionResult> RunScriptAsync(ExecuteScriptRequest request, ServerContext serverContext, CancellationToken cancellationToken)
+        {
+            ExecutionResult finalResult = new ExecutionResult { IsSuccess = false, ErrorMessage = "Execution not started" };
             string scriptContentStr = request.ScriptContent;
             string parametersJsonStr = request.ParametersJson.ToStringUtf8();
             byte[]? compiledAssembly = request.CompiledAssembly?.ToByteArray();
@@ -118,67 +189,70 @@ namespace Paracore.Addin.Services
             if (string.IsNullOrWhiteSpace(scriptContentStr) && !hasCompiledAssembly)
             {
                 _logger.Log("[CoreScriptRunnerService] Script content is empty and no compiled assembly provided.", LogLevel.Debug);
-                finalResult = new ExecutionResult
+                return new ExecutionResult
                 {
                     IsSuccess = false,
                     ErrorMessage = "Empty script content received."
                 };
             }
-            else
+
+            _logger.Log("[CoreScriptRunnerService] Waiting for execution lock.", LogLevel.Debug);
+            await ExecutionLock.WaitAsync(cancellationToken);
+            _logger.Log("[CoreScriptRunnerService] Acquired execution lock.", LogLevel.Debug);
+            Action<ExecutionResult> handler = null;
+            try
             {
-                _logger.Log("[CoreScriptRunnerService] Waiting for execution lock.", LogLevel.Debug);
-                await ExecutionLock.WaitAsync(context.CancellationToken);
-                _logger.Log("[CoreScriptRunnerService] Acquired execution lock.", LogLevel.Debug);
-                Action<ExecutionResult> handler = null;
-                try
+                var completionSource = new TaskCompletionSource<ExecutionResult>();
+                handler = result => completionSource.TrySetResult(result);
+                ServerViewModel.Instance.OnExecutionComplete += handler;
+                ServerViewModel.Instance.LastClientSource = request.Source;
+                
+                if (hasCompiledAssembly)
                 {
-                    var completionSource = new TaskCompletionSource<ExecutionResult>();
-                    handler = result => completionSource.TrySetResult(result);
-                    ServerViewModel.Instance.OnExecutionComplete += handler;
-                    ServerViewModel.Instance.LastClientSource = request.Source;
-                    
-                    if (hasCompiledAssembly)
-                    {
-                        ServerViewModel.Instance.DispatchBinaryScript(compiledAssembly, parametersJsonStr, serverContext);
-                        _logger.Log("[CoreScriptRunnerService] DispatchBinaryScript called. Waiting for completion.", LogLevel.Debug);
-                    }
-                    else
-                    {
-                        ServerViewModel.Instance.DispatchScript(scriptContentStr, parametersJsonStr, serverContext);
-                        _logger.Log("[CoreScriptRunnerService] DispatchScript called. Waiting for completion.", LogLevel.Debug);
-                    }
-                    var timeoutTask = Task.Delay(TimeSpan.FromSeconds(45), context.CancellationToken);
-                    var finishedTask = await Task.WhenAny(completionSource.Task, timeoutTask);
+                    ServerViewModel.Instance.DispatchBinaryScript(compiledAssembly, parametersJsonStr, serverContext);
+                    _logger.Log("[CoreScriptRunnerService] DispatchBinaryScript called. Waiting for completion.", LogLevel.Debug);
+                }
+                else
+                {
+                    ServerViewModel.Instance.DispatchScript(scriptContentStr, parametersJsonStr, serverContext);
+                    _logger.Log("[CoreScriptRunnerService] DispatchScript called. Waiting for completion.", LogLevel.Debug);
+                }
+                var timeoutTask = Task.Delay(TimeSpan.FromSeconds(45), cancellationToken);
+                var finishedTask = await Task.WhenAny(completionSource.Task, timeoutTask);
 
-                    if (finishedTask == completionSource.Task)
-                    {
-                        finalResult = await completionSource.Task;
-                        ServerViewModel.Instance.LastExecutedScriptName = finalResult.ScriptName;
-                        _logger.Log("[CoreScriptRunnerService] Script execution completed.", LogLevel.Debug);
-                    }
-                    else
-                    {
-                        finalResult = new ExecutionResult { IsSuccess = false, ErrorMessage = "Execution timed out." };
-                        _logger.Log("[CoreScriptRunnerService] Script execution timed out.", LogLevel.Debug);
-                    }
+                if (finishedTask == completionSource.Task)
+                {
+                    finalResult = await completionSource.Task;
+                    ServerViewModel.Instance.LastExecutedScriptName = finalResult.ScriptName;
+                    _logger.Log("[CoreScriptRunnerService] Script execution completed.", LogLevel.Debug);
                 }
-                catch (Exception ex)
+                else
                 {
-                    _logger.LogError($"[CoreScriptRunnerService] Exception during script execution: {ex.Message}");
-                    if (ex.StackTrace != null) _logger.LogError(ex.StackTrace);
-                    finalResult = new ExecutionResult { IsSuccess = false, ErrorMessage = $"Server error: {ex.Message}" };
+                    finalResult = new ExecutionResult { IsSuccess = false, ErrorMessage = "Execution timed out." };
+                    _logger.Log("[CoreScriptRunnerService] Script execution timed out.", LogLevel.Debug);
                 }
-                finally
+            }
+            catch (Exception ex)
+            {
+                _logger.LogError($"[CoreScriptRunnerService] Exception during script execution: {ex.Message}");
+                if (ex.StackTrace != null) _logger.LogError(ex.StackTrace);
+                finalResult = new ExecutionResult { IsSuccess = false, ErrorMessage = $"Server error: {ex.Message}" };
+            }
+            finally
+            {
+                if (handler != null)
                 {
-                    if (handler != null)
-                    {
-                        ServerViewModel.Instance.OnExecutionComplete -= handler;
-                    }
-                    ExecutionLock.Release();
-                    _logger.Log("[CoreScriptRunnerService] Released execution lock.", LogLevel.Debug);
+                    ServerViewModel.Instance.OnExecutionComplete -= handler;
                 }
+                ExecutionLock.Release();
+                _logger.Log("[CoreScriptRunnerService] Released execution lock.", LogLevel.Debug);
             }
 
+            return finalResult;
+        }
+
+        private ExecuteScriptResponse BuildExecuteResponse(ExecutionResult finalResult, ServerContext serverContext)
+        {
             var outputMessages = serverContext?.PrintLog ?? new List<string>();
             var errorMessages = serverContext?.ErrorLog ?? new List<string>();
             
@@ -225,7 +299,6 @@ namespace Paracore.Addin.Services
             }
 
             response.InternalData = finalResult.InternalData ?? "";
-            _logger.Log($"[CoreScriptRunnerService] Returning ExecuteScriptResponse. Success: {response.IsSuccess}, Output Length: {response.Output.Length}, Structured Items: {response.StructuredOutput.Count}", LogLevel.Debug);
             return response;
         }
 
@@ -234,26 +307,7 @@ namespace Paracore.Addin.Services
             var response = new GetScriptMetadataResponse();
             try
             {
-                var scriptFiles = request.ScriptFiles.Select(f => new CoreScript.Engine.Models.ScriptFile
-                {
-                    FileName = f.FileName,
-                    Content = f.Content
-                }).ToList();
-                string combinedScript = CoreScript.Engine.Core.SemanticCombinator.Combine(scriptFiles);
-                var extractedMetadata = _metadataExtractor.ExtractMetadata(combinedScript);
-
-                response.Metadata = new CoreScript.ScriptMetadata
-                {
-                    Name = extractedMetadata.Name,
-                    Description = extractedMetadata.Description,
-                    Author = extractedMetadata.Author,
-                    Website = extractedMetadata.Website,
-                    Categories = { extractedMetadata.Categories },
-                    LastRun = extractedMetadata.LastRun,
-                    Dependencies = { extractedMetadata.Dependencies },
-                    DocumentType = extractedMetadata.DocumentType,
-                    UsageExamples = { extractedMetadata.UsageExamples }
-                };
+                response.Metadata = ExtractProtoMetadata(ToEngineScriptFiles(request.ScriptFiles));
             }
             catch (Exception ex)
             {
@@ -268,74 +322,101 @@ namespace Paracore.Addin.Services
             var response = new GetScriptParametersResponse();
             try
             {
-                var scriptFiles = request.ScriptFiles.Select(f => new CoreScript.Engine.Models.ScriptFile
-                {
-                    FileName = f.FileName,
-                    Content = f.Content
-                }).ToList();
-                var topLevelScript = CoreScript.Engine.Core.ScriptParser.IdentifyTopLevelScript(scriptFiles);
+                response.Parameters.AddRange(ExtractProtoParameters(ToEngineScriptFiles(request.ScriptFiles)));
+            }
+            catch (Exception ex)
+            {
+                _logger.LogError($"[CoreScriptRunnerService] Error in GetScriptParameters: {ex.Message}");
+                response.ErrorMessage = $"Failed to extract parameters: {ex.Message}";
+            }
+            return Task.FromResult(response);
+        }
 
-                if (topLevelScript == null)
-                {
-                    return Task.FromResult(response);
-                }
-                var extractedParams = _parameterExtractor.ExtractParameters(topLevelScript.Content);
+        /// <summary>
+        /// Extracts metadata (and optionally parameters) for many scripts in one round trip.
+        /// A failure in one unit is reported on that unit only.
+        /// </summary>
+        public override Task<GetScriptMetadataBatchResponse> GetScriptMetadataBatch(GetScriptMetadataBatchRequest request, ServerCallContext context)
+        {
+            _logger.Log($"[CoreScriptRunnerService] Entering GetScriptMetadataBatch for {request.Units.Count} units.", LogLevel.Debug);
+            var response = new GetScriptMetadataBatchResponse();
+            foreach (var unit in request.Units)
+            {
+                if (context.CancellationToken.IsCancellationRequested) break;
 
-                // If no parameters found in top-level script, check other files for "class Params"
-                if (extractedParams.Count == 0 && scriptFiles.Count > 1)
+                var result = new ScriptMetadataResult { Id = unit.Id };
+                try
                 {
-                   foreach (var file in scriptFiles.Where(f => f.FileName != topLevelScript.FileName))
-                   {
-                        var otherParams = _parameterExtractor.ExtractParameters(file.Content);
-                        if (otherParams.Count > 0)
-                        {
-                            extractedParams = otherParams;
-                             break; // Assume only one Params class definition exists
-                        }
-                   }
+                    var scriptFiles = ToEngineScriptFiles(unit.ScriptFiles);
+                    result.Metadata = ExtractProtoMetadata(scriptFiles);
+                    if (request.IncludeParameters)
+                    {
+                        result.Parameters.AddRange(ExtractProtoParameters(scriptFiles));
+                    }
                 }
-
-                foreach (var p in extractedParams)
+                catch (Exception ex)
                 {
-                    var protoParam = new CoreScript.ScriptParameter
-                    {
-                        Name = p.Name,
-                        Type = p.Type,
-                        DefaultValueJson = p.DefaultValueJson,
-                        Description = p.Description,
-                        MultiSelect = p.MultiSelect,
-                        VisibleWhen = p.VisibleWhen ?? "",
-                        NumericType = p.NumericType ?? "",
-                        IsRevitElement = p.IsRevitElement,
-                        RevitElementType = p.RevitElementType ?? "",
-                        RevitElementCategory = p.RevitElementCategory ?? "",
-                        RequiresCompute = p.RequiresCompute,
-                        Group = p.Group ?? "",
-                        InputType = p.InputType ?? "",
-                        Required = p.Required,
-                        Suffix = p.Suffix ?? "",
-                        Pattern = p.Pattern ?? "",
-                        EnabledWhenParam = p.EnabledWhenParam ?? "",
-                        EnabledWhenValue = p.EnabledWhenValue ?? "",
-                        Unit = p.Unit ?? "",
-                        SelectionType = p.SelectionType ?? ""
-                    };
-                    
-                    protoParam.Options.AddRange(p.Options);
-                    
-                    if (p.Min.HasValue) protoParam.Min = p.Min.Value;
-                    if (p.Max.HasValue) protoParam.Max = p.Max.Value;
-                    if (p.Step.HasValue) protoParam.Step = p.Step.Value;
-                    
-                    response.Parameters.Add(protoParam);
+                    _logger.LogError($"[CoreScriptRunnerService] Error in GetScriptMetadataBatch for '{unit.Id}': {ex.Message}");
+                    result.ErrorMessage = $"Failed to extract metadata: {ex.Message}";
                 }
+                response.Results.Add(result);
             }
-            catch (Exception ex)
+            return Task.FromResult(response);
+        }
+
+        private static List<CoreScript.Engine.Models.ScriptFile> ToEngineScriptFiles(IEnumerable<CoreScript.ScriptFile> files)
+        {
+            return files.Select(f => new CoreScript.Engine.Models.ScriptFile
             {
-                _logger.LogError($"[CoreScriptRunnerService] Error in GetScriptParameters: {ex.Message}");
-                response.ErrorMessage = $"Failed to extract parameters: {ex.Message}";
+                FileName = f.FileName,
+                Content = f.Content
+            }).ToList();
+        }
+
+        private CoreScript.ScriptMetadata ExtractProtoMetadata(List<CoreScript.Engine.Models.ScriptFile> scriptFiles)
+        {
+            string combinedScript = CoreScript.Engine.Core.SemanticCombinator.Combine(scriptFiles);
+            var extractedMetadata = _metadataExtractor.ExtractMetadata(combinedScript);
+
+            return new CoreScript.ScriptMetadata
+            {
+                Name = extractedMetadata.Name,
+                Description = extractedMetadata.Description,
+                Author = extractedMetadata.Author,
+                Website = extractedMetadata.Website,
+                Categories = { extractedMetadata.Categories },
+                LastRun = extractedMetadata.LastRun,
+                Dependencies = { extractedMetadata.Dependencies },
+                DocumentType = extractedMetadata.DocumentType,
+                UsageExamples = { extractedMetadata.UsageExamples }
+            };
+        }
+
+        private List<CoreScript.ScriptParameter> ExtractProtoParameters(List<CoreScript.Engine.Models.ScriptFile> scriptFiles)
+        {
+            var topLevelScript = CoreScript.Engine.Core.ScriptParser.IdentifyTopLevelScript(scriptFiles);
+
+            if (topLevelScript == null)
+            {
+                return new List<CoreScript.ScriptParameter>();
             }
-            return Task.FromResult(response);
+            var extractedParams = _parameterExtractor.ExtractParameters(topLevelScript.Content);
+
+            // If no parameters found in top-level script, check other files for "class Params"
+            if (extractedParams.Count == 0 && scriptFiles.Count > 1)
+            {
+               foreach (var file in scriptFiles.Where(f => f.FileName != topLevelScript.FileName))
+               {
+                    var otherParams = _parameterExtractor.ExtractParameters(file.Content);
+                    if (otherParams.Count > 0)
+                    {
+                        extractedParams = otherParams;
+                         break; // Assume only one Params class definition exists
+                    }
+               }
+            }
+
+            return MapToProtoParameters(extractedParams);
         }
 
         public override Task<GetCombinedScriptResponse> GetCombinedScript(GetCombinedScriptRequest request, ServerCallContext context)
@@ -464,50 +545,15 @@ namespace Paracore.Addin.Services
             var response = new GetScriptManifestResponse();
             try
             {
-                string manifestPathRequest = request.ScriptPath;
-                string rootPath = manifestPathRequest;
-                List<string> targetPaths = new List<string>();
-
-                // Handle multi-path format from Agent (ROOT|path1,path2)
-                if (manifestPathRequest.Contains("|"))
+                if (!TryGetManifestSourceFolders(request.ScriptPath, out string rootPath, out List<string> sourceFolders, out string error))
                 {
-                    var parts = manifestPathRequest.Split('|');
-                    rootPath = parts[0];
-                    if (parts.Length > 1 && !string.IsNullOrEmpty(parts[1]))
-                    {
-                        targetPaths = parts[1].Split(',').ToList();
-                    }
-                }
-                else
-                {
-                    targetPaths.Add(rootPath);
-                }
-
-                if (!System.IO.Directory.Exists(rootPath))
-                {
-                    response.ErrorMessage = $"Root script path does not exist: {rootPath}";
+                    response.ErrorMessage = error;
                     return Task.FromResult(response);
                 }
 
                 var scriptInfoList = new List<InternalScriptInfo>();
-                
-                // 1. Determine the "Source Folders" to scan
-                List<string> sourceFolders = new List<string>();
-                if (targetPaths.Count == 1 && targetPaths[0] == rootPath)
-                {
-                    // If just the root is provided, every subdirectory of the root is a "Source Folder"
-                    sourceFolders = System.IO.Directory.GetDirectories(rootPath)
-                        .Where(d => {
-                            string name = System.IO.Path.GetFileName(d);
-                            return !name.StartsWith(".") && name != "bin" && name != "obj";
-                        }).ToList();
-                }
-                else
-                {
-                    sourceFolders = targetPaths;
-                }
 
-                // 2. Scan each Source Folder for scripts (No deep recursion)
+                // Scan each Source Folder for scripts (No deep recursion)
                 foreach (var sourcePath in sourceFolders)
                 {
                     if (System.IO.Directory.Exists(sourcePath))
@@ -564,6 +610,100 @@ namespace Paracore.Addin.Services
             return Task.FromResult(response);
         }
 
+        /// <summary>
+        /// Streaming variant of GetScriptManifest: one typed entry per script, written as soon as its
+        /// source folder is scanned, so no manifest JSON is built and the client starts before the scan ends.
+        /// </summary>
+        public override async Task StreamScriptManifest(GetScriptManifestRequest request, IServerStreamWriter<ScriptManifestEntry> responseStream, ServerCallContext context)
+        {
+            if (!TryGetManifestSourceFolders(request.ScriptPath, out string rootPath, out List<string> sourceFolders, out string error))
+            {
+                await responseStream.WriteAsync(new ScriptManifestEntry { ErrorMessage = error });
+                return;
+            }
+
+            try
+            {
+                foreach (var sourcePath in sourceFolders)
+                {
+                    context.CancellationToken.ThrowIfCancellationRequested();
+                    if (!System.IO.Directory.Exists(sourcePath)) continue;
+
+                    var scripts = new List<InternalScriptInfo>();
+                    ScanSourceFolder(sourcePath, rootPath, scripts);
+                    foreach (var info in scripts)
+                    {
+                        var entry = new ScriptManifestEntry
+                        {
+                            Name = info.Metadata.Name,
+                            Type = info.Metadata.ScriptType,
+                            AbsolutePath = System.IO.Path.Combine(rootPath, info.Metadata.FilePath),
+                            Metadata = info.Metadata
+                        };
+                        entry.Parameters.AddRange(info.Parameters);
+                        await responseStream.WriteAsync(entry);
+                    }
+                }
+            }
+            catch (OperationCanceledException)
+            {
+                // Client went away
+            }
+            catch (Exception ex)
+            {
+                _logger.LogError($"[CoreScriptRunnerService] Error in StreamScriptManifest: {ex.Message}");
+                await responseStream.WriteAsync(new ScriptManifestEntry { ErrorMessage = $"Failed to generate manifest: {ex.Message}" });
+            }
+        }
+
+        /// <summary>
+        /// Resolves a manifest request path (a root, or ROOT|path1,path2 from the Agent) to its root and the
+        /// "Source Folders" to scan: the listed paths, or every subdirectory of the root.
+        /// </summary>
+        private static bool TryGetManifestSourceFolders(string manifestPathRequest, out string rootPath, out List<string> sourceFolders, out string error)
+        {
+            rootPath = manifestPathRequest;
+            sourceFolders = new List<string>();
+            error = null;
+            List<string> targetPaths = new List<string>();
+
+            // Handle multi-path format from Agent (ROOT|path1,path2)
+            if (manifestPathRequest.Contains("|"))
+            {
+                var parts = manifestPathRequest.Split('|');
+                rootPath = parts[0];
+                if (parts.Length > 1 && !string.IsNullOrEmpty(parts[1]))
+                {
+                    targetPaths = parts[1].Split(',').ToList();
+                }
+            }
+            else
+            {
+                targetPaths.Add(rootPath);
+            }
+
+            if (!System.IO.Directory.Exists(rootPath))
+            {
+                error = $"Root script path does not exist: {rootPath}";
+                return false;
+            }
+
+            if (targetPaths.Count == 1 && targetPaths[0] == rootPath)
+            {
+                // If just the root is provided, every subdirectory of the root is a "Source Folder"
+                sourceFolders = System.IO.Directory.GetDirectories(rootPath)
+                    .Where(d => {
+                        string name = System.IO.Path.GetFileName(d);
+                        return !name.StartsWith(".") && name != "bin" && name != "obj";
+                    }).ToList();
+            }
+            else
+            {
+                sourceFolders = targetPaths;
+            }
+            return true;
+        }
+
         private class InternalScriptInfo
         {
             public CoreScript.ScriptMetadata Metadata { get; set; }
@@ -827,98 +967,167 @@ namespace Paracore.Addin.Services
 
             try
             {
-                var result = await CoreScript.Engine.Runtime.CoreScriptExecutionDispatcher.Instance.ExecuteInUIContext(() =>
+                return await CoreScript.Engine.Runtime.CoreScriptExecutionDispatcher.Instance.ExecuteInUIContext(() =>
                 {
                     var serverContext = new ServerContext(_uiApp, isReadOnly: true);
-                    // 1. Extract the parameter definition to check how to compute options
                     var parameters = _parameterExtractor.ExtractParameters(request.ScriptContent);
-                    var targetParam = parameters.FirstOrDefault(p => p.Name == request.ParameterName);
-                    
-                    if (targetParam == null)
-                    {
-                        return new List<string>();
-                    }
+                    return ComputeOptionsInUIContext(request.ScriptContent, request.ParameterName, parameters, serverContext, new ParameterOptionsExecutor(_logger));
+                });
+            }
+            catch (Exception ex)
+            {
+                response.ErrorMessage = InnermostMessage(ex);
+                _logger.LogError($"[CoreScriptRunnerService] Error in ComputeParameterOptions: {response.ErrorMessage}");
+                return response;
+            }
+        }
+
+        public override async Task<ComputeParameterOptionsBatchResponse> ComputeParameterOptionsBatch(ComputeParameterOptionsBatchRequest request, ServerCallContext context)
+        {
+            _logger.Log($"[CoreScriptRunnerService] Entering ComputeParameterOptionsBatch for {request.Scripts.Count} scripts.", LogLevel.Debug);
+            var response = new ComputeParameterOptionsBatchResponse();
+
+            if (_uiApp == null)
+            {
+                response.ErrorMessage = "Revit UI Application is not available.";
+                return response;
+            }
 
-                    // 2. Manual Providers (The "Pro" Logic)
+            try
+            {
+                // One trip to the UI thread for every script and parameter
+                var results = await CoreScript.Engine.Runtime.CoreScriptExecutionDispatcher.Instance.ExecuteInUIContext(() =>
+                {
+                    var serverContext = new ServerContext(_uiApp, isReadOnly: true);
                     var optionsExecutor = new ParameterOptionsExecutor(_logger);
-                    if (optionsExecutor.HasOptionsFunction(request.ScriptContent, request.ParameterName))
+                    var batchResults = new List<ParameterOptionsResult>();
+                    foreach (var query in request.Scripts)
                     {
-                        try
+                        if (context.CancellationToken.IsCancellationRequested) break;
+                        if (string.IsNullOrWhiteSpace(query.ScriptContent)) continue;
+
+                        var parameters = _parameterExtractor.ExtractParameters(query.ScriptContent);
+                        // No names means every parameter whose options come from the document
+                        var names = query.ParameterNames.Count > 0
+                            ? query.ParameterNames.ToList()
+                            : parameters.Where(p => p.RequiresCompute).Select(p => p.Name).ToList();
+
+                        foreach (var name in names)
                         {
-                            // 2a. Dynamic Range (_Range)
-                            if (optionsExecutor.HasRangeFunction(request.ScriptContent, request.ParameterName))
+                            batchResults.Add(new ParameterOptionsResult
                             {
-                                var range = optionsExecutor.ExecuteRangeFunction(
-                                    request.ScriptContent,
-                                    request.ParameterName,
-                                    serverContext
-                                ).GetAwaiter().GetResult();
+                                Id = query.Id,
+                                ParameterName = name,
+                                Result = ComputeOptionsInUIContext(query.ScriptContent, name, parameters, serverContext, optionsExecutor)
+                            });
+                        }
+                    }
+                    return batchResults;
+                });
+                response.Results.AddRange(results);
+            }
+            catch (Exception ex)
+            {
+                response.ErrorMessage = InnermostMessage(ex);
+                _logger.LogError($"[CoreScriptRunnerService] Error in ComputeParameterOptionsBatch: {response.ErrorMessage}");
+            }
 
-                                if (range.HasValue)
-                                {
-                                    response.Min = range.Value.Min;
-                                    response.Max = range.Value.Max;
-                                    response.Step = range.Value.Step;
-                                    response.IsSuccess = true;
-                                    // Range usually doesn't return options, but if it's Just a range check, we return empty list
-                                }
-                            }
+            return response;
+        }
+
+        /// <summary>
+        /// Computes the options (or range) of one parameter. Must run in the Revit UI context.
+        /// Errors are reported in the response rather than thrown, so one failing provider does not fail a batch.
+        /// </summary>
+        private ComputeParameterOptionsResponse ComputeOptionsInUIContext(string scriptContent, string parameterName, List<CoreScript.Engine.Models.ScriptParameter> parameters, ServerContext serverContext, ParameterOptionsExecutor optionsExecutor)
+        {
+            var response = new ComputeParameterOptionsResponse { IsSuccess = false };
+            // 1. Extract the parameter definition to check how to compute options
+            var targetParam = parameters.FirstOrDefault(p => p.Name == parameterName);
 
-                            // 2b. Manual Options (_Options / _Filter)
-                            // V4 FIX: If a custom provider exists, it is AUTHORITATIVE. 
-                            // We do NOT fallback to automatic extraction if it returns empty.
-                            // An empty list means "no matches found", not "try something else".
-                            var options = optionsExecutor.ExecuteOptionsFunction(
-                                request.ScriptContent,
-                                request.ParameterName,
+            try
+            {
+                List<string> result = null;
+                if (targetParam == null)
+                {
+                    result = new List<string>();
+                }
+                // 2. Manual Providers (The "Pro" Logic)
+                else if (optionsExecutor.HasOptionsFunction(scriptContent, parameterName))
+                {
+                    try
+                    {
+                        // 2a. Dynamic Range (_Range)
+                        if (optionsExecutor.HasRangeFunction(scriptContent, parameterName))
+                        {
+                            var range = optionsExecutor.ExecuteRangeFunction(
+                                scriptContent,
+                                parameterName,
                                 serverContext
                             ).GetAwaiter().GetResult();
-                            
-                            return options ?? new List<string>();
-                        }
-                        catch (InvalidOperationException ex)
-                        {
-                            _logger.Log($"[CoreScriptRunnerService] Options function error: {ex.Message}", LogLevel.Warning);
-                            throw; 
+
+                            if (range.HasValue)
+                            {
+                                response.Min = range.Value.Min;
+                                response.Max = range.Value.Max;
+                                response.Step = range.Value.Step;
+                                response.IsSuccess = true;
+                                // Range usually doesn't return options, but if it's Just a range check, we return empty list
+                            }
                         }
-                    }
 
-                    // 3. Strategy B: Automatic Revit Element Extraction (The "Simple" Fallback)
-                    if (targetParam.IsRevitElement && !string.IsNullOrEmpty(targetParam.RevitElementType))
+                        // 2b. Manual Options (_Options / _Filter)
+                        // V4 FIX: If a custom provider exists, it is AUTHORITATIVE. 
+                        // We do NOT fallback to automatic extraction if it returns empty.
+                        // An empty list means "no matches found", not "try something else".
+                        var options = optionsExecutor.ExecuteOptionsFunction(
+                            scriptContent,
+                            parameterName,
+                            serverContext
+                        ).GetAwaiter().GetResult();
+                        
+                        result = options ?? new List<string>();
+                    }
+                    catch (InvalidOperationException ex)
                     {
-                        var doc = _uiApp.ActiveUIDocument.Document;
-                        var optionsComputer = new ParameterOptionsComputer(doc);
-                        _logger.Log($"[CoreScriptRunnerService] Using Automatic ParameterOptionsComputer for {targetParam.Name} (Type: {targetParam.RevitElementType})", LogLevel.Debug);
-                        return optionsComputer.ComputeOptions(targetParam.RevitElementType, targetParam.RevitElementCategory);
+                        _logger.Log($"[CoreScriptRunnerService] Options function error: {ex.Message}", LogLevel.Warning);
+                        throw; 
                     }
-
-                    return new List<string>();
-                });
+                }
+                // 3. Strategy B: Automatic Revit Element Extraction (The "Simple" Fallback)
+                else if (targetParam.IsRevitElement && !string.IsNullOrEmpty(targetParam.RevitElementType))
+                {
+                    var doc = _uiApp.ActiveUIDocument.Document;
+                    var optionsComputer = new ParameterOptionsComputer(doc);
+                    _logger.Log($"[CoreScriptRunnerService] Using Automatic ParameterOptionsComputer for {targetParam.Name} (Type: {targetParam.RevitElementType})", LogLevel.Debug);
+                    result = optionsComputer.ComputeOptions(targetParam.RevitElementType, targetParam.RevitElementCategory);
+                }
+                else
+                {
+                    result = new List<string>();
+                }
 
                 if (result != null)
                 {
                     if (result.Count > 0)
                     {
                         response.Options.AddRange(result);
-                        _logger.Log($"[CoreScriptRunnerService] Successfully computed {result.Count} options for {request.ParameterName}", LogLevel.Debug);
+                        _logger.Log($"[CoreScriptRunnerService] Successfully computed {result.Count} options for {parameterName}", LogLevel.Debug);
                     }
                     else
                     {
-                        _logger.Log($"[CoreScriptRunnerService] Successfully computed 0 options (Empty Result) for {request.ParameterName}", LogLevel.Debug);
+                        _logger.Log($"[CoreScriptRunnerService] Successfully computed 0 options (Empty Result) for {parameterName}", LogLevel.Debug);
                     }
                     response.IsSuccess = true;
                 }
                 else if (response.IsSuccess) 
                 {
-                    // Case where Range execution succeeded (set manually inside ExecuteInUIContext)
-                    _logger.Log($"[CoreScriptRunnerService] Successfully computed range for {request.ParameterName}", LogLevel.Debug);
+                    // Case where Range execution succeeded (set above)
+                    _logger.Log($"[CoreScriptRunnerService] Successfully computed range for {parameterName}", LogLevel.Debug);
                 }
                 else
                 {
                     // Provide a more helpful error message
-                    var parameters = _parameterExtractor.ExtractParameters(request.ScriptContent);
-                    var targetParam = parameters.FirstOrDefault(p => p.Name == request.ParameterName);
-
                     response.IsSuccess = false;
                     
                     if (targetParam != null && targetParam.IsRevitElement && !string.IsNullOrEmpty(targetParam.RevitElementType))
@@ -928,7 +1137,7 @@ namespace Paracore.Addin.Services
                     }
                     else
                     {
-                        response.ErrorMessage = $"The options provider '{request.ParameterName}_Options' (or Range) returned no results.";
+                        response.ErrorMessage = $"The options provider '{parameterName}_Options' (or Range) returned no results.";
                     }
 
                     _logger.Log($"[CoreScriptRunnerService] {response.ErrorMessage}", LogLevel.Warning);
@@ -936,22 +1145,25 @@ namespace Paracore.Addin.Services
             }
             catch (Exception ex)
             {
-                // Extract the innermost exception message (unwrap AggregateException, etc.)
-                var innerException = ex;
-                while (innerException.InnerException != null)
-                {
-                    innerException = innerException.InnerException;
-                }
-                
-                string errorMessage = innerException.Message;
-                _logger.LogError($"[CoreScriptRunnerService] Error in ComputeParameterOptions: {errorMessage}");
                 response.IsSuccess = false;
-                response.ErrorMessage = errorMessage;
+                response.ErrorMessage = InnermostMessage(ex);
+                _logger.LogError($"[CoreScriptRunnerService] Error computing options for {parameterName}: {response.ErrorMessage}");
             }
 
             return response;
         }
 
+        private static string InnermostMessage(Exception ex)
+        {
+            // Extract the innermost exception message (unwrap AggregateException, etc.)
+            var innerException = ex;
+            while (innerException.InnerException != null)
+            {
+                innerException = innerException.InnerException;
+            }
+            return innerException.Message;
+        }
+
         public override async Task<SelectElementsResponse> SelectElements(SelectElementsRequest request, ServerCallContext context)
         {
             _logger.Log($"[CoreScriptRunnerService] Entering SelectElements. Target count: {request.ElementIds.Count}", LogLevel.Debug);
@@ -137,8 +137,8 @@ async def chat_with_agent(request: ChatRequest):
                                 }
                                 s_id = t_args.get("script_id") if is_selection else t_name.replace("run_", "")
                                 try:
-                                    from agent.orchestrator.registry import ScriptRegistry
-                                    registry = ScriptRegistry(request.agent_scripts_path)
+                                    from agent.orchestrator.registry import get_registry
+                                    registry = get_registry(request.agent_scripts_path)
                                     repo_script = registry.find_script_by_tool_id(s_id)
                                     if repo_script:
                                         active_script = json.loads(json.dumps(repo_script))
@@ -1,89 +1,198 @@
+import hashlib
 import json
 import logging
 import os
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from services.manifest_builder import read_manifest, source_folders, streamed_manifest_entry, update_manifest
 
 # Configure logging for this module
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO) # Set desired logging level
 
-# Global cache for the manifest
-_MANIFEST_CACHE = None
-_LAST_CACHE_UPDATE = 0
-_CACHE_TTL = 300  # 5 minutes
+# Manifests cached per agent_scripts_path (least recently used dropped past _CACHE_SIZE)
+_MANIFEST_CACHE: "OrderedDict[str, _ManifestEntry]" = OrderedDict()
+_CACHE_TTL = 300  # 5 minutes; an expired entry is served while it is refreshed in the background
+_CACHE_SIZE = 16
+_CACHE_LOCK = threading.Lock()
+_REFRESHING: set = set()
+_REFRESH_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="manifest-refresh")
+
+class _ManifestEntry:
+    __slots__ = ("manifest", "fingerprint", "loaded_at")
+
+    def __init__(self, manifest: list, fingerprint: str, loaded_at: float):
+        self.manifest = manifest
+        self.fingerprint = fingerprint
+        self.loaded_at = loaded_at
+
+def _tree_fingerprint(agent_scripts_path: str) -> str:
+    """
+    Digest of manifest.json and the stat signatures of every script the manifest would list: .cs and .ptool
+    files of each source folder and .cs files one level below.
+    Only stats are read, so it is far cheaper than a GetScriptManifest scan.
+    """
+    digest = hashlib.sha1()
+
+    def add(path: str, st: os.stat_result):
+        digest.update(f"{path}\0{st.st_mtime_ns}\0{st.st_size}\n".encode("utf-8"))
+
+    if "|" not in agent_scripts_path:
+        try:
+            add("manifest.json", os.stat(os.path.join(agent_scripts_path, "manifest.json")))
+        except OSError:
+            digest.update(b"no-manifest\n")
+    for folder in source_folders(agent_scripts_path):
+        try:
+            with os.scandir(folder) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError:
+            continue
+        for entry in entries:
+            try:
+                if entry.is_dir():
+                    with os.scandir(entry.path) as sub:
+                        for cs in sorted((e for e in sub if e.name.endswith(".cs")), key=lambda e: e.name):
+                            add(cs.path, cs.stat())
+                elif entry.name.endswith((".cs", ".ptool")):
+                    add(entry.path, entry.stat())
+            except OSError:
+                continue
+    return digest.hexdigest()
+
+def invalidate_manifest_cache(paths: Optional[list[str]] = None):
+    """
+    Drops cached manifests so the next read goes back to disk/gRPC (called when script folders change).
+    With paths, only manifests whose script tree contains one of them are dropped.
+    """
+    with _CACHE_LOCK:
+        if paths is None:
+            _MANIFEST_CACHE.clear()
+            return
+        changed = [os.path.normpath(p) for p in paths]
+        for key in list(_MANIFEST_CACHE):
+            roots = [os.path.normpath(r) for r in [key.partition("|")[0]] + source_folders(key)]
+            if any(c == r or c.startswith(r + os.sep) for c in changed for r in roots):
+                del _MANIFEST_CACHE[key]
+
+def _store(agent_scripts_path: str, manifest: list, fingerprint: str):
+    with _CACHE_LOCK:
+        _MANIFEST_CACHE[agent_scripts_path] = _ManifestEntry(manifest, fingerprint, time.time())
+        _MANIFEST_CACHE.move_to_end(agent_scripts_path)
+        while len(_MANIFEST_CACHE) > _CACHE_SIZE:
+            _MANIFEST_CACHE.popitem(last=False)
+
+def _refresh_in_background(agent_scripts_path: str):
+    with _CACHE_LOCK:
+        if agent_scripts_path in _REFRESHING:
+            return
+        _REFRESHING.add(agent_scripts_path)
+
+    def refresh():
+        try:
+            _load_manifest(agent_scripts_path, force_refresh=False)
+        except Exception as e:
+            logger.warning(f"Background manifest refresh failed for {agent_scripts_path}: {e}")
+        finally:
+            with _CACHE_LOCK:
+                _REFRESHING.discard(agent_scripts_path)
+
+    _REFRESH_POOL.submit(refresh)
 
 def read_local_script_manifest(agent_scripts_path: str, force_refresh: bool = False) -> list[dict]:
     """
     Reads and parses the local manifest.json file from the specified agent_scripts_path.
     If multiple paths are provided (ROOT|path1,path2), or if force_refresh is True,
     it skips the local file check and goes directly to gRPC for a fresh scan.
+    Results are cached per path and revalidated against the script tree's stat fingerprint;
+    an entry older than _CACHE_TTL is returned as is while it is refreshed in the background.
     """
-    global _MANIFEST_CACHE, _LAST_CACHE_UPDATE
-
-    current_time = time.time()
+    if not force_refresh:
+        with _CACHE_LOCK:
+            entry = _MANIFEST_CACHE.get(agent_scripts_path)
+            if entry is not None:
+                _MANIFEST_CACHE.move_to_end(agent_scripts_path)
+        if entry is not None:
+            fingerprint = _tree_fingerprint(agent_scripts_path)
+            if fingerprint == entry.fingerprint:
+                if time.time() - entry.loaded_at >= _CACHE_TTL:
+                    logger.info("Returning cached script manifest (refreshing in the background).")
+                    _refresh_in_background(agent_scripts_path)
+                else:
+                    logger.info("Returning cached script manifest.")
+                return entry.manifest
+            logger.info(f"Script tree changed under {agent_scripts_path}; reloading the manifest.")
+
+    return _load_manifest(agent_scripts_path, force_refresh)
+
+def _stream_manifest(agent_scripts_path: str) -> list[dict]:
+    """
+    The engine's manifest, built entry by entry as StreamScriptManifest yields them
+    (GetScriptManifest on older add-ins).
+    """
+    import grpc
+    from grpc_client import get_script_manifest, stream_script_manifest
+    manifest = []
+    try:
+        for entry in stream_script_manifest(agent_scripts_path):
+            if entry["error_message"] and not entry["name"]:
+                raise RuntimeError(entry["error_message"])
+            manifest.append(streamed_manifest_entry(entry))
+        return manifest
+    except grpc.RpcError as e:
+        if e.code() != grpc.StatusCode.UNIMPLEMENTED:
+            raise
+    manifest_json_str = get_script_manifest(agent_scripts_path)
+    return json.loads(manifest_json_str) if manifest_json_str else []
+
+def _load_manifest(agent_scripts_path: str, force_refresh: bool) -> list[dict]:
+    logger.info(f"Attempting to read manifest from: {agent_scripts_path}")
 
     # Handle multi-path format
     is_multi_path = "|" in agent_scripts_path
 
-    if not force_refresh and not is_multi_path and _MANIFEST_CACHE is not None and (current_time - _LAST_CACHE_UPDATE) < _CACHE_TTL:
-        logger.info("Returning cached script manifest.")
-        return _MANIFEST_CACHE
-
-    logger.info(f"Attempting to read manifest from: {agent_scripts_path}")
-
-    # For single paths, check if directory exists and look for manifest.json
-    if not is_multi_path and not force_refresh:
+    # For single paths, keep manifest.json current incrementally (only added/changed scripts are extracted)
+    if not is_multi_path:
         if not os.path.exists(agent_scripts_path):
             logger.error(f"Agent scripts path does not exist: {agent_scripts_path}")
             return []
+        try:
+            result = update_manifest(agent_scripts_path, full=force_refresh)
+            # Fingerprint after the update, which may have rewritten manifest.json
+            fingerprint = _tree_fingerprint(agent_scripts_path)
+            _store(agent_scripts_path, result["manifest"], fingerprint)
+            return result["manifest"]
+        except Exception as e:
+            logger.warning(f"Incremental manifest update failed: {e}. Falling back to gRPC.")
+
+    # --- Full scan via gRPC from C# backend (multi-path requests, or if the update failed) ---
+    fingerprint = _tree_fingerprint(agent_scripts_path)
+    try:
+        logger.info("Calling gRPC StreamScriptManifest...")
+        manifest_content = _stream_manifest(agent_scripts_path)
+        logger.info(f"Successfully retrieved {len(manifest_content)} scripts via gRPC.")
 
-        # --- Try to read from persistent manifest.json file (FASTEST) ---
-        manifest_file_path = os.path.join(agent_scripts_path, "manifest.json")
-        if os.path.exists(manifest_file_path):
-            try:
-                logger.info(f"Reading persistent manifest from: {manifest_file_path}")
-                with open(manifest_file_path, 'r', encoding='utf-8') as f:
-                    manifest_content = json.load(f)
-
-                # Update memory cache
-                _MANIFEST_CACHE = manifest_content
-                _LAST_CACHE_UPDATE = current_time
-
-                return manifest_content
-            except Exception as e:
-                logger.error(f"Failed to read persistent manifest.json: {e}")
-                # Fallback to gRPC if file read fails
+        # Update cache
+        _store(agent_scripts_path, manifest_content, fingerprint)
 
-    # --- NEW: Try to get manifest via gRPC from C# backend (Recursive Scan) ---
-    try:
-        from grpc_client import get_script_manifest
-        logger.info("Calling gRPC GetScriptManifest...")
-        manifest_json_str = get_script_manifest(agent_scripts_path)
-        if manifest_json_str:
-            manifest_content = json.loads(manifest_json_str)
-            logger.info(f"Successfully retrieved {len(manifest_content)} scripts via gRPC.")
-
-            # --- AUTO-PERSIST: Save the manifest.json to disk so it's ready for next time ---
-            if not is_multi_path:
-                try:
-                    manifest_file_path = os.path.join(agent_scripts_path, "manifest.json")
-                    with open(manifest_file_path, 'w', encoding='utf-8') as f:
-                        json.dump(manifest_content, f, indent=2)
-                    logger.info(f"Auto-persisted manifest.json to {manifest_file_path}")
-                except Exception as save_err:
-                    logger.warning(f"Failed to auto-persist manifest: {save_err}")
-
-            # Update cache
-            _MANIFEST_CACHE = manifest_content
-            _LAST_CACHE_UPDATE = current_time
-
-            return manifest_content
+        return manifest_content
     except Exception as e:
         logger.warning(f"Failed to get manifest via gRPC (Revit might be offline): {e}.")
         # If gRPC fails, try to return cached version even if expired
-        if _MANIFEST_CACHE is not None:
+        with _CACHE_LOCK:
+            entry = _MANIFEST_CACHE.get(agent_scripts_path)
+        if entry is not None:
             logger.warning("Returning expired cache due to gRPC failure.")
-            return _MANIFEST_CACHE
+            return entry.manifest
+        # An out-of-date manifest.json still beats an empty library while Revit is offline
+        if not is_multi_path:
+            manifest_content = read_manifest(agent_scripts_path)
+            if manifest_content is not None:
+                return manifest_content
         return []
 
     return []
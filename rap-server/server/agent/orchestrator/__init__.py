@@ -1,2 +1,4 @@
 # This file makes the 'orchestrator' directory a Python package.
-from .registry import ScriptRegistry
+from .registry import ScriptRegistry, get_registry
+
+__all__ = ["ScriptRegistry", "get_registry"]
@@ -1,36 +1,96 @@
+import bisect
 import logging
-from typing import Dict, List, Optional
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
 
 from agent.api_helpers import read_local_script_manifest
 
 logger = logging.getLogger(__name__)
 
+# How often a shared registry asks the manifest cache whether the library changed
+_REVALIDATE_INTERVAL = 2.0
+
+def _tool_id(script: Dict) -> str:
+    """Generates a stable tool ID from the script path."""
+    metadata = script.get("metadata", {})
+    name = script.get("name", "unnamed_script")
+    rel_path = metadata.get("relativePath") or script.get("path") or name
+    return rel_path.lower().replace(".cs", "").replace(".ptool", "").replace("\\", "_").replace("/", "_").replace(" ", "_").replace(".", "_")
+
+class _RegistryIndex:
+    """Lookup tables over one manifest. Built whole and swapped in with a single assignment."""
+    __slots__ = ("source", "scripts", "tool_ids", "by_tool_id", "by_name", "suffixes", "catalog")
+
+    def __init__(self, source: List[Dict]):
+        self.source = source
+        self.scripts = list(source)
+        self.tool_ids = [_tool_id(s) for s in self.scripts]
+        self.by_tool_id: Dict[str, int] = {}
+        self.by_name: Dict[str, int] = {}
+        for position, (script, tool_id) in enumerate(zip(self.scripts, self.tool_ids, strict=True)):
+            # First occurrence wins, as the linear scans did
+            self.by_tool_id.setdefault(tool_id, position)
+            name = script.get("name")
+            if name is not None:
+                self.by_name.setdefault(name, position)
+        # Reversed tool ids, sorted: every id ending in a suffix sits in one contiguous run
+        self.suffixes: List[Tuple[str, int]] = sorted((t[::-1], i) for i, t in enumerate(self.tool_ids))
+        self.catalog: Optional[List[Dict]] = None
+
+    def find_by_suffix(self, suffix: str) -> Optional[int]:
+        """Position of the first script whose tool id ends with suffix and has more segments than it."""
+        key = suffix[::-1]
+        start = bisect.bisect_left(self.suffixes, (key,))
+        underscores = suffix.count('_')
+        best = None
+        for i in range(start, len(self.suffixes)):
+            reversed_id, position = self.suffixes[i]
+            if not reversed_id.startswith(key):
+                break
+            if reversed_id.count('_') > underscores and (best is None or position < best):
+                best = position
+        return best
+
 class ScriptRegistry:
     """
     A unified registry for Paracore scripts.
     Provides rich discovery and capability mapping for both UI and MCP clients.
+    Lookups go through indexes built once per manifest; use get_registry() to share one per library.
     """
 
     def __init__(self, agent_scripts_path: str):
         self.agent_scripts_path = agent_scripts_path
-        self._scripts = []
+        self._index = _RegistryIndex([])
         self._refresh_needed = True
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
 
     def refresh(self, force: bool = False):
         """Refreshes the script list from the discovery sources."""
         try:
-            self._scripts = read_local_script_manifest(self.agent_scripts_path, force_refresh=force)
+            scripts = read_local_script_manifest(self.agent_scripts_path, force_refresh=force)
+            self._checked_at = time.monotonic()
+            # The manifest cache hands back the same list until the library changes
+            if force or scripts is not self._index.source:
+                self._index = _RegistryIndex(scripts)
+                logger.info(f"Registry refreshed (force={force}): {len(scripts)} scripts loaded "
+                            f"from {self.agent_scripts_path}")
             self._refresh_needed = False
-            logger.info(f"Registry refreshed (force={force}): {len(self._scripts)} scripts loaded from {self.agent_scripts_path}")
         except Exception as e:
             logger.error(f"Failed to refresh script registry: {e}")
-            self._scripts = []
+            self._index = _RegistryIndex([])
+
+    def _current(self) -> _RegistryIndex:
+        if self._refresh_needed or time.monotonic() - self._checked_at >= _REVALIDATE_INTERVAL:
+            with self._lock:
+                if self._refresh_needed or time.monotonic() - self._checked_at >= _REVALIDATE_INTERVAL:
+                    self.refresh()
+        return self._index
 
     def get_all_scripts(self) -> List[Dict]:
         """Returns all scripts in the registry."""
-        if self._refresh_needed:
-            self.refresh()
-        return self._scripts
+        return self._current().scripts
 
     def find_script_by_name(self, name: str) -> Optional[Dict]:
         """
@@ -38,65 +98,59 @@ class ScriptRegistry:
         Tries tool_id (unique) first, then falls back to metadata name,
         then tries suffix match (for robustness against missing folder prefixes).
         """
-        all_scripts = self.get_all_scripts()
+        index = self._current()
         # 1. Try finding by tool_id exactly
-        for script in all_scripts:
-            if self._get_tool_id(script) == name:
-                return script
+        position = index.by_tool_id.get(name)
+        if position is not None:
+            return index.scripts[position]
 
         # 2. Suffix match for tool_id (e.g. wall_auditor matching auditing_wall_auditor)
-        for script in all_scripts:
-            t_id = self._get_tool_id(script)
-            if t_id.endswith(name) and t_id.count('_') > name.count('_'):
-                logger.info(f"Robust Match found: '{name}' matched to '{t_id}' via suffix.")
-                return script
+        position = index.find_by_suffix(name)
+        if position is not None:
+            logger.info(f"Robust Match found: '{name}' matched to '{index.tool_ids[position]}' via suffix.")
+            return index.scripts[position]
 
         # 3. Fallback to metadata name
-        for script in all_scripts:
-            if script.get('name') == name:
-                return script
-        return None
+        position = index.by_name.get(name)
+        return index.scripts[position] if position is not None else None
 
     def _get_tool_id(self, script: Dict) -> str:
         """Generates a stable tool ID from the script path."""
-        metadata = script.get("metadata", {})
-        name = script.get("name", "unnamed_script")
-        rel_path = metadata.get("relativePath") or script.get("path") or name
-        return rel_path.lower().replace(".cs", "").replace(".ptool", "").replace("\\", "_").replace("/", "_").replace(" ", "_").replace(".", "_")
+        return _tool_id(script)
 
     def find_script_by_tool_id(self, tool_id: str) -> Optional[Dict]:
         """Finds a script by its tool ID."""
-        for script in self.get_all_scripts():
-            if self._get_tool_id(script) == tool_id:
-                return script
-        return None
+        index = self._current()
+        position = index.by_tool_id.get(tool_id)
+        return index.scripts[position] if position is not None else None
 
     def get_catalog(self) -> List[Dict]:
         """
         Returns a rich catalog of available scripts for LLM processing.
         Includes full metadata so the agent can pass it back to the UI.
         """
-        catalog = []
-        for script in self.get_all_scripts():
-            tool_id = self._get_tool_id(script)
-
-            # Ensure every script has a unified 'id' field for the UI
-            collated_script = script.copy()
-            collated_script['id'] = tool_id
-            collated_script['tool_id'] = tool_id
-            catalog.append(collated_script)
-
-        return catalog
+        index = self._current()
+        if index.catalog is None:
+            catalog = []
+            for script, tool_id in zip(index.scripts, index.tool_ids, strict=True):
+                # Ensure every script has a unified 'id' field for the UI
+                collated_script = script.copy()
+                collated_script['id'] = tool_id
+                collated_script['tool_id'] = tool_id
+                catalog.append(collated_script)
+            index.catalog = catalog
+
+        return index.catalog
 
     def get_mcp_tools(self) -> List[Dict]:
         """
         Converts curated scripts into MCP tool definitions.
         """
         tools = []
-        for script in self.get_all_scripts():
+        index = self._current()
+        for script, tool_id in zip(index.scripts, index.tool_ids, strict=True):
             metadata = script.get("metadata", {})
             name = script.get("name", "unnamed_script")
-            tool_id = self._get_tool_id(script)
 
             # Map parameters to JSON Schema
             properties = {}
@@ -140,3 +194,14 @@ class ScriptRegistry:
             schema["type"] = "string"
 
         return schema
+
+_registries: Dict[str, ScriptRegistry] = {}
+_registries_lock = threading.Lock()
+
+def get_registry(agent_scripts_path: str) -> ScriptRegistry:
+    """The shared registry of a library, so its indexes are built once rather than on every tool call."""
+    with _registries_lock:
+        registry = _registries.get(agent_scripts_path)
+        if registry is None:
+            registry = _registries[agent_scripts_path] = ScriptRegistry(agent_scripts_path)
+        return registry
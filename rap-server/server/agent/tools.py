@@ -6,7 +6,7 @@ from langchain_core.tools import StructuredTool
 from pydantic import BaseModel, Field
 
 from agent.mcp_client import get_mcp_tools
-from agent.orchestrator.registry import ScriptRegistry
+from agent.orchestrator.registry import get_registry
 
 logger = logging.getLogger(__name__)
 
@@ -53,7 +53,7 @@ async def list_scripts(agent_scripts_path: str = None, **kwargs) -> str:
     """Lists all available scripts in the Paracore library with their IDs and descriptions."""
     if not agent_scripts_path: return "Error: scripts path not provided."
     try:
-        registry = ScriptRegistry(agent_scripts_path)
+        registry = get_registry(agent_scripts_path)
         catalog = registry.get_catalog()
         return f"Available Scripts:\n{json.dumps(catalog, indent=2)}"
     except Exception as e:
@@ -63,7 +63,7 @@ async def inspect_script(tool_id: str, agent_scripts_path: str = None, **kwargs)
     """Gets the full metadata and parameter details for a specific script. Use this to understand parameters before set_active_script."""
     if not agent_scripts_path: return "Error: scripts path not provided."
     try:
-        registry = ScriptRegistry(agent_scripts_path)
+        registry = get_registry(agent_scripts_path)
         script = registry.find_script_by_tool_id(tool_id)
         if not script: return f"Error: Script {tool_id} not found."
         return json.dumps(script, indent=2)
@@ -82,8 +82,8 @@ async def read_script(script_id: str, agent_scripts_path: str = None, **kwargs)
     """
     if not agent_scripts_path: return "Error: scripts path not provided."
     try:
-        from agent.orchestrator.registry import ScriptRegistry
-        registry = ScriptRegistry(agent_scripts_path)
+        from agent.orchestrator.registry import get_registry
+        registry = get_registry(agent_scripts_path)
         script = registry.find_script_by_tool_id(script_id)
         if not script: return f"Error: Script {script_id} not found."
 
@@ -9,7 +9,7 @@ from typing import Any, Dict, List, Optional
 from pydantic import BaseModel, Field
 from pydantic_ai import Agent, RunContext
 
-from agent.orchestrator.registry import ScriptRegistry
+from agent.orchestrator.registry import get_registry
 from agent.prompt import SYSTEM_PROMPT
 
 logger = logging.getLogger(__name__)
@@ -57,7 +57,7 @@ paracore_agent = Agent(
 async def list_scripts(ctx: RunContext[RevitDeps]) -> str:
     """Lists available Revit automation scripts in the Paracore library."""
     try:
-        registry = ScriptRegistry(ctx.deps.agent_scripts_path)
+        registry = get_registry(ctx.deps.agent_scripts_path)
         catalog = registry.get_catalog()
         return json.dumps(catalog, indent=2)
     except Exception as e:
@@ -67,7 +67,7 @@ async def list_scripts(ctx: RunContext[RevitDeps]) -> str:
 async def inspect_script(ctx: RunContext[RevitDeps], tool_id: str) -> str:
     """Gets full metadata and parameter details for a specific script."""
     try:
-        registry = ScriptRegistry(ctx.deps.agent_scripts_path)
+        registry = get_registry(ctx.deps.agent_scripts_path)
         script = registry.find_script_by_tool_id(tool_id)
         if not script: return f"Script {tool_id} not found."
         return json.dumps(script, indent=2)
@@ -78,7 +78,7 @@ async def inspect_script(ctx: RunContext[RevitDeps], tool_id: str) -> str:
 async def read_script(ctx: RunContext[RevitDeps], script_id: str) -> str:
     """Reads the C# source code of a script for logic reference."""
     try:
-        registry = ScriptRegistry(ctx.deps.agent_scripts_path)
+        registry = get_registry(ctx.deps.agent_scripts_path)
         script = registry.find_script_by_tool_id(script_id)
         if not script or not script.get("absolutePath"):
             return f"Script source for {script_id} not found."
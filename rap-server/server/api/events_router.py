@@ -0,0 +1,53 @@
+import asyncio
+
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from services.run_jobs import run_jobs
+from services.script_watcher import script_watcher
+
+router = APIRouter()
+
+@router.websocket("/ws/library-events")
+async def library_events(websocket: WebSocket):
+    """
+    Pushes {"type": "library_changed", "folders": [...], "paths": [...], "timestamp": ...}
+    whenever the script watcher has processed a batch of changes in a watched script folder.
+    """
+    await websocket.accept()
+    queue = script_watcher.subscribe()
+    try:
+        await websocket.send_json({"type": "hello", "watcherMode": script_watcher.mode,
+                                   "lastChangeAt": script_watcher.last_change_at})
+        while True:
+            event = await queue.get()
+            await websocket.send_json(event)
+    except (WebSocketDisconnect, asyncio.CancelledError):
+        pass
+    finally:
+        script_watcher.unsubscribe(queue)
+
+@router.websocket("/ws/run-jobs/{job_id}")
+async def run_job_events(websocket: WebSocket, job_id: str, since: int = 0):
+    """
+    Pushes a run job's events: {"type": "state" | "output" | "structured_output" | "done", "seq": n, "jobId": ...}.
+    Events from seq `since` on are replayed first, so a client that reconnects passes its last seq + 1.
+    The socket is closed after the "done" event, which carries the final job snapshot and result.
+    """
+    await websocket.accept()
+    job = run_jobs.get(job_id)
+    if job is None:
+        await websocket.send_json({"type": "error", "detail": f"Run job not found: {job_id}"})
+        await websocket.close()
+        return
+    queue = job.subscribe(since)
+    try:
+        await websocket.send_json({"type": "hello", "job": job.snapshot(run_jobs.position(job))})
+        while True:
+            event = await queue.get()
+            await websocket.send_json(event)
+            if event["type"] == "done":
+                break
+        await websocket.close()
+    except (WebSocketDisconnect, asyncio.CancelledError):
+        pass
+    finally:
+        job.unsubscribe(queue)
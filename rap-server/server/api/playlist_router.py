@@ -1,8 +1,17 @@
-from typing import List
+import json
+from typing import List, Optional
 
-from fastapi import APIRouter, HTTPException
+from auth import CurrentUser, get_current_user
+from database_config import get_db
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
+from services.playlist_runner import POLICIES, PlaylistRunner
 from services.playlist_service import Playlist, playlist_service
+from sqlalchemy.orm import Session
+
+import models
+from utils import get_or_create_script
 
 router = APIRouter()
 
@@ -53,3 +62,78 @@ async def delete_playlist(req: DeletePlaylistRequest):
     if not success:
         raise HTTPException(status_code=500, detail="Failed to delete playlist.")
     return {"success": True}
+
+class RunPlaylistRequest(BaseModel):
+    filePath: str
+    policy: str = "stop"
+    source_folder: Optional[str] = None
+    source_workspace: Optional[str] = None
+
+@router.post("/run")
+async def run_playlist(req: RunPlaylistRequest, current_user: CurrentUser = Depends(get_current_user)):
+    """
+    Runs a saved playlist on the server (see PlaylistRunner). policy is "stop" (at the first failure) or "continue".
+    Answers with Server-Sent Events: validated, compiled, item_result (one per item run) and summary,
+    or error. Run rows of all items are written in one transaction at the end.
+    """
+    if req.policy not in POLICIES:
+        raise HTTPException(status_code=400,
+                            detail=f"Invalid policy: {req.policy}. Expected one of {', '.join(POLICIES)}.")
+    playlist = playlist_service.load_playlist(req.filePath)
+    if playlist is None:
+        raise HTTPException(status_code=404, detail=f"Playlist not found or invalid: {req.filePath}")
+
+    runner = PlaylistRunner(playlist, req.policy, user=current_user.id)
+
+    def sse(event, payload):
+        return f"event: {event}\ndata: {json.dumps(payload)}\n\n"
+
+    def record_runs(runs):
+        # A session of its own, opened only now, so a long run (or a client that stops reading) holds no connection
+        db: Session = next(get_db())
+        try:
+            for absolute_path, status, output in runs:
+                script = get_or_create_script(db, absolute_path, current_user.id)
+                db.add(models.Run(
+                    script_id=script.id,
+                    user_id=current_user.id,
+                    team_id=current_user.activeTeam,
+                    role=current_user.activeRole,
+                    status=status,
+                    output=output,
+                    source_folder=req.source_folder,
+                    source_workspace=req.source_workspace
+                ))
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    async def relay():
+        runs = []
+        try:
+            async for update in runner.run():
+                event = update.pop("event")
+                # .ptool runs are not logged, as with /run-script
+                if event == "item_result" and not update["absolutePath"].lower().endswith(".ptool"):
+                    result = update["result"]
+                    output = result.get("output", "")
+                    if result.get("error_message"):
+                        output += f"\nERROR: {result['error_message']}"
+                    if result.get("error_details"):
+                        output += "\n" + "\n".join(result["error_details"])
+                    runs.append((update["absolutePath"], "success" if result.get("is_success") else "failure", output))
+                yield sse(event, update)
+        except Exception as e:
+            yield sse("error", {"detail": str(e)})
+        finally:
+            if runs:
+                record_runs(runs)
+
+    return StreamingResponse(
+        relay(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
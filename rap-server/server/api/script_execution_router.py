@@ -1,13 +1,25 @@
 import glob
 import json
+import logging
 import os
 
 import grpc
 from auth import CurrentUser, get_current_user
-from database_config import get_db
+from database_config import SessionLocal, get_db
 from fastapi import APIRouter, Depends, HTTPException, Request
-from fastapi.responses import JSONResponse
-from grpc_client import execute_script, pick_object, select_elements
+from fastapi.responses import JSONResponse, StreamingResponse
+from grpc_client import (
+    execute_script_async,
+    execute_script_stream_async,
+    get_script_parameters_async,
+    pick_object_async,
+    select_elements_async,
+)
+from services import ptool_package
+from services.assembly_cache import assembly_cache
+from services.execution_dispatcher import DEFAULT_LANE, LANES
+from services.parameter_sweep import flatten_parameters, rich_parameters, run_sweep
+from services.run_jobs import run_jobs
 from sqlalchemy.orm import Session
 
 import models
@@ -17,6 +29,7 @@ from utils import get_or_create_script, resolve_script_path
 
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
 from typing import Optional  # Import Optional
 
@@ -33,11 +46,124 @@ async def pick_object_endpoint(request: PickObjectRequest):
     Triggers a PickObject operation in Revit.
     """
     try:
-        response = pick_object(request.selection_type, request.category_filter)
+        response = await pick_object_async(request.selection_type, request.category_filter)
         return JSONResponse(content=response)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+def _build_run_payload(path, script_type, parameters, script):
+    """
+    Turns a /run-script request body into ExecuteScript arguments.
+    Returns (script_content_json, parameters_json, compiled_assembly).
+    """
+    absolute_path = resolve_script_path(path)
+
+    if path.endswith('.ptool'):
+        # IMPORTANT: For .ptool, we preserve the full parameter list with metadata 
+        # so the engine can perform unit conversions and hardening.
+        # The frontend already sends the full list of ScriptParameter objects.
+        parameters_json = parameters if isinstance(parameters, str) else json.dumps(parameters)
+        compiled_assembly = ptool_package.read_assembly(absolute_path)
+        return None, parameters_json, compiled_assembly
+
+    script_files_payload = []
+    if script_type == "single-file":
+        with open(absolute_path, 'r', encoding='utf-8-sig') as f:
+            source_code = f.read()
+        # C# ScriptFile uses snake_case JSON property names: file_name, content
+        script_files_payload.append({"file_name": os.path.basename(path), "content": source_code})
+    elif script_type == "multi-file":
+        for file_path in glob.glob(os.path.join(absolute_path, "*.cs")):
+            with open(file_path, 'r', encoding='utf-8-sig') as f:
+                source_code = f.read()
+            script_files_payload.append({"file_name": os.path.basename(file_path), "content": source_code})
+
+    if not script_files_payload:
+        raise HTTPException(status_code=404, detail="No script files found.")
+
+    # Inject __script_name__ for Dashboard reporting
+    # Default to basename of source path if script object isn't found (e.g. external path)
+    script_name_for_dashboard = os.path.basename(path) if path else "External Script"
+
+    if script:
+        script_name_for_dashboard = script.name
+
+    # CodeRunner expects a flat dict { "name": value } for source scripts
+    parameters = flatten_parameters(parameters)
+
+    # Inject __script_name__ for dashboard reporting
+    # At this point, parameters should be a dict
+    if isinstance(parameters, dict):
+        parameters["__script_name__"] = script_name_for_dashboard
+
+    return json.dumps(script_files_payload), json.dumps(parameters), None
+
+async def _use_cached_assembly(path, script_type, script_content_json, parameters_json, compiled_assembly):
+    """
+    Swaps a source payload for its cached compiled assembly, run with the rich parameter list as a .ptool is.
+    On a miss the source runs as before and the assembly is built in the background for the next run.
+    """
+    if compiled_assembly is not None or not script_content_json:
+        return script_content_json, parameters_json, compiled_assembly
+    script_files = json.loads(script_content_json)
+    assembly_cache.track(resolve_script_path(path), script_type)
+    try:
+        cached = await assembly_cache.lookup(script_files)
+        if cached is None:
+            assembly_cache.build_soon(script_files)
+            return script_content_json, parameters_json, None
+        definitions = (await get_script_parameters_async(script_files)).get("parameters", [])
+    except Exception as e:
+        logger.warning(f"Assembly cache unavailable, running from source: {e}")
+        return script_content_json, parameters_json, None
+    return None, json.dumps(rich_parameters(definitions, json.loads(parameters_json))), cached
+
+def _record_run(db, script, current_user, status, output, source_folder, source_workspace):
+    script_run = models.Run(
+        script_id=script.id,
+        user_id=current_user.id,
+        team_id=current_user.activeTeam,
+        role=current_user.activeRole,
+        status=status,
+        output=output,
+        source_folder=source_folder,
+        source_workspace=source_workspace
+    )
+    db.add(script_run)
+    db.commit()
+
+def _run_log_output(output, response_data):
+    # Combine output and error for the log
+    run_output = output
+    error_message = response_data.get("error_message")
+    if error_message:
+        run_output += f"\nERROR: {error_message}"
+    error_details = response_data.get("error_details")
+    if error_details:
+        run_output += "\n" + "\n".join(error_details)
+    return run_output
+
+def _raise_for_run_error(e, path):
+    if isinstance(e, FileNotFoundError):
+         raise HTTPException(status_code=404, detail=f"Script file not found at source path: {path}")
+    elif isinstance(e, (grpc.RpcError, HTTPException)):
+        raise e
+    else:
+        raise HTTPException(status_code=500, detail=f"An unexpected error occurred: {str(e)}")
+
+def _collect_chunk(event, chunk, lines, structured_output):
+    """Folds one ExecuteScriptStream chunk into the console lines and structured output; completes the result chunk."""
+    if event == "output":
+        if chunk["append"] and lines:
+            lines[-1] += chunk["text"]
+        else:
+            lines.append(chunk["text"])
+    elif event == "structured_output":
+        structured_output.append(dict(chunk))
+    elif event == "result":
+        chunk["output"] = "\n".join(lines)
+        chunk["structured_output"] = structured_output + chunk["structured_output"]
+
 @router.post("/run-script", tags=["Script Execution"])
 async def run_script(
     request: Request,
@@ -62,132 +188,41 @@ async def run_script(
         resolved_script_path = resolve_script_path(path)
         script = get_or_create_script(db, resolved_script_path, current_user.id)
 
-        script_files_payload = []
-        absolute_path = resolved_script_path
+        script_content_json, parameters_json, compiled_assembly = _build_run_payload(
+            path, script_type, parameters, script)
 
         if path.endswith('.ptool'):
-            import base64
-            with open(absolute_path, 'r', encoding='utf-8') as f:
-                package = json.load(f)
-            
-            # IMPORTANT: For .ptool, we preserve the full parameter list with metadata 
-            # so the engine can perform unit conversions and hardening.
-            # The frontend already sends the full list of ScriptParameter objects.
-            parameters_json = parameters if isinstance(parameters, str) else json.dumps(parameters)
-            compiled_assembly = base64.b64decode(package.get("assembly", ""))
-            
             # Execute binary tool
-            response_data = execute_script(
+            response_data = await execute_script_async(
                 script_content=None, 
                 parameters_json=parameters_json,
-                compiled_assembly=compiled_assembly
+                compiled_assembly=compiled_assembly,
+                lane="interactive",
+                user=current_user.id
             )
             
             # Fail-safe: if success, ensure we return result early
             return JSONResponse(content=response_data)
 
-        if script_type == "single-file":
-            with open(absolute_path, 'r', encoding='utf-8-sig') as f:
-                source_code = f.read()
-            # C# ScriptFile uses snake_case JSON property names: file_name, content
-            script_files_payload.append({"file_name": os.path.basename(path), "content": source_code})
-        elif script_type == "multi-file":
-            for file_path in glob.glob(os.path.join(absolute_path, "*.cs")):
-                with open(file_path, 'r', encoding='utf-8-sig') as f:
-                    source_code = f.read()
-                script_files_payload.append({"file_name": os.path.basename(file_path), "content": source_code})
-
-        if not script_files_payload:
-            raise HTTPException(status_code=404, detail="No script files found.")
-
         # --- WORKING SET INJECTION LOGIC ---
-        # Check if any file actually needs injection before doing expensive state lookups and validation
-        placeholder_line = "List<ElementId>? targetWallIds = null; // __INJECT_WORKING_SET__"
-        needs_injection = any(placeholder_line in sf["content"] for sf in script_files_payload)
-
-        if thread_id and needs_injection:
+        if thread_id:
             # Working set injection disabled for Operation Simple
             # This will be replaced with a UI-driven property injection in the future
             pass
         # --- END INJECTION LOGIC ---
 
-        # Inject __script_name__ for Dashboard reporting
-        # Default to basename of source path if script object isn't found (e.g. external path)
-        script_name_for_dashboard = os.path.basename(path) if path else "External Script"
-
-        if script:
-            script_name_for_dashboard = script.name
-
-        # Helper to parse JSON array strings that frontend sends for multi-select
-        def parse_value(val):
-            if isinstance(val, str) and val.startswith('[') and val.endswith(']'):
-                try:
-                    return json.loads(val)
-                except json.JSONDecodeError:
-                    pass
-            return val
-
-        if parameters is None:
-            # CodeRunner expects a flat dict for source scripts
-            parameters = {}
-        elif isinstance(parameters, str):
-            try:
-                # Parse the JSON string from frontend
-                param_list = json.loads(parameters)
-                
-                # Flatten parameters: { "name": value } for CodeRunner's MapParameters
-                # Frontend sends camelCase (name, value)
-                # Filter out any params with None or empty name
-                # IMPORTANT: parse_value handles JSON array strings from multi-select
-                parameters = {p["name"]: parse_value(p.get("value")) for p in param_list if p.get("name")}
-            except (json.JSONDecodeError, TypeError, KeyError) as e:
-                print(f"Warning: Failed to parse parameters JSON: {parameters}, error: {e}")
-                parameters = {}
-        elif isinstance(parameters, list):
-            # Already a list, flatten it
-            # Filter out any params with None or empty name
-            parameters = {
-                p.get("name", p.get("Name")): parse_value(p.get("value", p.get("Value"))) 
-                for p in parameters 
-                if p.get("name") or p.get("Name")
-            }
-
-        # Inject __script_name__ for dashboard reporting
-        # At this point, parameters should be a dict
-        if isinstance(parameters, dict):
-            parameters["__script_name__"] = script_name_for_dashboard
-
-        parameters_json = json.dumps(parameters)
-        script_content_json = json.dumps(script_files_payload)
+        script_content_json, parameters_json, compiled_assembly = await _use_cached_assembly(
+            path, script_type, script_content_json, parameters_json, compiled_assembly)
 
         # Single call to the gRPC service
-        response_data = execute_script(script_content_json, parameters_json)
+        response_data = await execute_script_async(script_content_json, parameters_json, compiled_assembly,
+                                                   lane="interactive", user=current_user.id)
 
         # Log the script run to the database (skip for generated code)
         if script is not None:
             run_status = "success" if response_data.get("is_success") else "failure"
-
-            # Combine output and error for the log
-            run_output = response_data.get("output", "")
-            error_message = response_data.get("error_message")
-            if error_message:
-                run_output += f"\nERROR: {error_message}"
-            error_details = response_data.get("error_details")
-            if error_details:
-                run_output += "\n" + "\n".join(error_details)
-
-            script_run = models.Run(
-                script_id=script.id,
-                user_id=current_user.id,
-                team_id=current_user.activeTeam,
-                role=current_user.activeRole,
-                status=run_status,
-                output=run_output,
-                source_folder=source_folder,
-                source_workspace=source_workspace
-            )
-            db.add(script_run)
-            db.commit()
+            run_output = _run_log_output(response_data.get("output", ""), response_data)
+            _record_run(db, script, current_user, run_status, run_output, source_folder, source_workspace)
 
         # The data from execute_script is already a JSON-serializable dictionary
         return JSONResponse(content=response_data)
@@ -195,25 +230,301 @@ async def run_script(
     except Exception as e:
         # Log failure to the database (skip for generated code)
         if script is not None:
-            script_run = models.Run(
-                script_id=script.id,
-                user_id=current_user.id,
-                team_id=current_user.activeTeam,
-                role=current_user.activeRole,
-                status="failure",
-                output=str(e),
-                source_folder=source_folder,
-                source_workspace=source_workspace
-            )
-            db.add(script_run)
-            db.commit()
+            _record_run(db, script, current_user, "failure", str(e), source_folder, source_workspace)
+        _raise_for_run_error(e, path)
+
+@router.post("/run-script/stream", tags=["Script Execution"])
+async def run_script_stream(
+    request: Request,
+    current_user: CurrentUser = Depends(get_current_user),
+):
+    """
+    Same request body as /run-script, but answers with Server-Sent Events relayed from ExecuteScriptStream:
+      event: output             data: {"text": ..., "append": bool}
+      event: structured_output  data: {"type": ..., "data": ...}
+      event: result             data: the /run-script response (its "output" holds the full console text)
+      event: error              data: {"detail": ...}
+    Each chunk is forwarded as soon as the engine emits it.
+    """
+    data = await request.json()
+    path = data.get("path")
+    parameters = data.get("parameters")
+    script_type = data.get("type")
+    source_folder = data.get("source_folder")
+    source_workspace = data.get("source_workspace")
+
+    if not path:
+        raise HTTPException(status_code=400, detail="No script path provided")
+
+    db: Session = next(get_db())
+    script = None
 
-        if isinstance(e, FileNotFoundError):
-             raise HTTPException(status_code=404, detail=f"Script file not found at source path: {path}")
-        elif isinstance(e, (grpc.RpcError, HTTPException)):
-            raise
+    # Resolve everything that can fail with a proper HTTP status before the stream starts
+    try:
+        resolved_script_path = resolve_script_path(path)
+        script = get_or_create_script(db, resolved_script_path, current_user.id)
+        script_content_json, parameters_json, compiled_assembly = _build_run_payload(
+            path, script_type, parameters, script)
+        script_content_json, parameters_json, compiled_assembly = await _use_cached_assembly(
+            path, script_type, script_content_json, parameters_json, compiled_assembly)
+    except Exception as e:
+        try:
+            if script is not None:
+                _record_run(db, script, current_user, "failure", str(e), source_folder, source_workspace)
+        finally:
+            db.close()
+        _raise_for_run_error(e, path)
+
+    record = script is not None and not path.endswith('.ptool')
+
+    def sse(event, payload):
+        return f"event: {event}\ndata: {json.dumps(payload)}\n\n"
+
+    async def relay():
+        # Output is kept only so the Run row and final result carry the same content as /run-script.
+        lines, structured_output = [], []
+        try:
+            async for chunk in execute_script_stream_async(script_content_json, parameters_json, compiled_assembly,
+                                                           lane="interactive", user=current_user.id):
+                event = chunk.pop("event")
+                _collect_chunk(event, chunk, lines, structured_output)
+                if event == "result":
+                    if record:
+                        run_status = "success" if chunk.get("is_success") else "failure"
+                        _record_run(db, script, current_user, run_status, _run_log_output(chunk["output"], chunk),
+                                    source_folder, source_workspace)
+                yield sse(event, chunk)
+        except grpc.RpcError as e:
+            if record:
+                _record_run(db, script, current_user, "failure", e.details() or str(e), source_folder, source_workspace)
+            yield sse("error", {"detail": e.details() or str(e)})
+        finally:
+            db.close()
+
+    return StreamingResponse(
+        relay(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+# --- Parameter sweeps ---
+
+def _sweep_parameter_sets(db, script, data):
+    """
+    [{"name", "parameters"}] from the body's inline parameterSets followed by its presetIds
+    (presets of this script).
+    """
+    parameter_sets = [
+        {"name": s.get("name") or f"Set {i + 1}", "parameters": s.get("parameters")}
+        for i, s in enumerate(data.get("parameterSets") or [])
+    ]
+    preset_ids = data.get("presetIds") or []
+    if preset_ids:
+        presets = {
+            p.id: p for p in db.query(models.Preset)
+            .filter(models.Preset.id.in_(preset_ids), models.Preset.script_id == script.id)
+        }
+        missing = [i for i in preset_ids if i not in presets]
+        if missing:
+            raise HTTPException(status_code=404, detail=f"Presets not found for this script: {missing}")
+        for preset_id in preset_ids:
+            preset = presets[preset_id]
+            values = json.loads(preset.values) if preset.values else []
+            parameter_sets.append({"name": preset.name, "parameters": values})
+    return parameter_sets
+
+@router.post("/run-script/sweep", tags=["Script Execution"])
+async def run_script_sweep(
+    request: Request,
+    current_user: CurrentUser = Depends(get_current_user),
+):
+    """
+    Runs one script over many parameter sets. Body: path, type, source_folder, source_workspace as for /run-script,
+    plus "parameterSets": [{"name", "parameters"}] and/or "presetIds": [...], and "stopOnError" (default false).
+    The script is read and compiled once; sets then run back to back in the batch lane. Answers with Server-Sent Events:
+      event: compiled    data: {"compiled": bool, "seconds", "error_message"}  (not compiled: each set runs from source)
+      event: set_result  data: {"index", "name", "result": the /run-script response, "seconds"}
+      event: summary     data: {"total", "succeeded", "failed", "skipped", "compiled", "seconds"}
+      event: error       data: {"detail": ...}
+    The Run rows of all sets are written together, in one transaction, when the sweep ends.
+    """
+    data = await request.json()
+    path = data.get("path")
+    script_type = data.get("type")
+    source_folder = data.get("source_folder")
+    source_workspace = data.get("source_workspace")
+    stop_on_error = bool(data.get("stopOnError"))
+
+    if not path:
+        raise HTTPException(status_code=400, detail="No script path provided")
+
+    db: Session = next(get_db())
+
+    try:
+        resolved_script_path = resolve_script_path(path)
+        script = get_or_create_script(db, resolved_script_path, current_user.id)
+        parameter_sets = _sweep_parameter_sets(db, script, data)
+        if not parameter_sets:
+            raise HTTPException(status_code=400, detail="Provide parameterSets or presetIds.")
+        if path.endswith('.ptool'):
+            _, _, compiled_assembly = _build_run_payload(path, script_type, None, script)
+            script_files = None
         else:
-            raise HTTPException(status_code=500, detail=f"An unexpected error occurred: {str(e)}")
+            compiled_assembly = None
+            script_content_json, _, _ = _build_run_payload(path, script_type, None, script)
+            script_files = json.loads(script_content_json)
+    except Exception as e:
+        db.close()
+        _raise_for_run_error(e, path)
+
+    def sse(event, payload):
+        return f"event: {event}\ndata: {json.dumps(payload)}\n\n"
+
+    async def relay():
+        runs = []
+        try:
+            async for update in run_sweep(parameter_sets, script_files, compiled_assembly, script.name,
+                                          user=current_user.id, stop_on_error=stop_on_error):
+                event = update.pop("event")
+                if event == "set_result" and compiled_assembly is None:
+                    result = update["result"]
+                    runs.append(models.Run(
+                        script_id=script.id,
+                        user_id=current_user.id,
+                        team_id=current_user.activeTeam,
+                        role=current_user.activeRole,
+                        status="success" if result.get("is_success") else "failure",
+                        output=_run_log_output(result.get("output", ""), result),
+                        source_folder=source_folder,
+                        source_workspace=source_workspace
+                    ))
+                yield sse(event, update)
+        except Exception as e:
+            yield sse("error", {"detail": str(e)})
+        finally:
+            # Written even if the client went away mid-sweep: those sets did run
+            try:
+                if runs:
+                    db.add_all(runs)
+                    db.commit()
+            except Exception:
+                db.rollback()
+                raise
+            finally:
+                db.close()
+
+    return StreamingResponse(
+        relay(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+# --- Run jobs ---
+
+def _job_snapshot(job):
+    return job.snapshot(run_jobs.position(job))
+
+def _get_job(job_id, current_user):
+    job = run_jobs.get(job_id)
+    if job is None or job.user_id != current_user.id:
+        raise HTTPException(status_code=404, detail=f"Run job not found: {job_id}")
+    return job
+
+@router.post("/run-script/jobs", tags=["Script Execution"], status_code=202)
+async def submit_run_job(
+    request: Request,
+    current_user: CurrentUser = Depends(get_current_user),
+):
+    """
+    Same request body as /run-script (plus an optional "lane": interactive, agent or batch), but queues the run
+    and answers at once with its job (jobId, state, position).
+    Follow it with GET /run-script/jobs/{jobId} or the /ws/run-jobs/{jobId} WebSocket, which replays
+    the job's events from ?since=<seq> so a reconnecting UI picks up an in-flight run where it left off.
+    """
+    data = await request.json()
+    path = data.get("path")
+    parameters = data.get("parameters")
+    script_type = data.get("type")
+    source_folder = data.get("source_folder")
+    source_workspace = data.get("source_workspace")
+    lane = data.get("lane") or DEFAULT_LANE
+
+    if not path:
+        raise HTTPException(status_code=400, detail="No script path provided")
+    if lane not in LANES:
+        raise HTTPException(status_code=400, detail=f"Invalid lane: {lane}. Expected one of {', '.join(LANES)}.")
+
+    db: Session = next(get_db())
+    script = None
+
+    # Files are read now, so the job runs the script as it was when submitted
+    try:
+        resolved_script_path = resolve_script_path(path)
+        script = get_or_create_script(db, resolved_script_path, current_user.id)
+        script_content_json, parameters_json, compiled_assembly = _build_run_payload(
+            path, script_type, parameters, script)
+        script_content_json, parameters_json, compiled_assembly = await _use_cached_assembly(
+            path, script_type, script_content_json, parameters_json, compiled_assembly)
+    except Exception as e:
+        if script is not None:
+            _record_run(db, script, current_user, "failure", str(e), source_folder, source_workspace)
+        _raise_for_run_error(e, path)
+    finally:
+        # The job records its run with its own session
+        db.close()
+
+    record = script is not None and not path.endswith('.ptool')
+
+    def record_run(run_status, output):
+        # The request's session is gone by the time the job finishes
+        job_db = SessionLocal()
+        try:
+            _record_run(job_db, script, current_user, run_status, output, source_folder, source_workspace)
+        finally:
+            job_db.close()
+
+    async def run(job):
+        lines, structured_output = [], []
+        try:
+            async for chunk in execute_script_stream_async(script_content_json, parameters_json, compiled_assembly):
+                event = chunk.pop("event")
+                _collect_chunk(event, chunk, lines, structured_output)
+                if event == "result":
+                    if record:
+                        run_status = "success" if chunk.get("is_success") else "failure"
+                        record_run(run_status, _run_log_output(chunk["output"], chunk))
+                    return chunk
+                job.emit({"type": event, **chunk})
+        except grpc.RpcError as e:
+            if record:
+                record_run("failure", e.details() or str(e))
+            raise RuntimeError(e.details() or str(e)) from e
+        raise RuntimeError("The engine closed the stream without a result.")
+
+    job = run_jobs.submit(path, current_user.id, run, lane)
+    return JSONResponse(status_code=202, content=_job_snapshot(job))
+
+@router.get("/run-script/jobs", tags=["Script Execution"])
+async def list_run_jobs(current_user: CurrentUser = Depends(get_current_user)):
+    """The caller's queued, running and recently finished jobs (without results), plus queue depth and wait times."""
+    jobs = [{**_job_snapshot(job), "result": None} for job in run_jobs.jobs(current_user.id)]
+    return JSONResponse(content={"jobs": jobs, "queue": run_jobs.stats()})
+
+@router.get("/run-script/jobs/{job_id}", tags=["Script Execution"])
+async def get_run_job(job_id: str, current_user: CurrentUser = Depends(get_current_user)):
+    """A job's state and progress; once finished, "result" holds the /run-script response."""
+    return JSONResponse(content=_job_snapshot(_get_job(job_id, current_user)))
+
+@router.delete("/run-script/jobs/{job_id}", tags=["Script Execution"])
+async def cancel_run_job(job_id: str, current_user: CurrentUser = Depends(get_current_user)):
+    """
+    Cancels a queued job. For a running one the server stops waiting on it, but a script
+    already executing in Revit cannot be interrupted and runs to completion there.
+    """
+    job = _get_job(job_id, current_user)
+    if not run_jobs.cancel(job):
+        raise HTTPException(status_code=409, detail=f"Run job already {job.state}.")
+    return JSONResponse(content=_job_snapshot(job))
 
 @router.post("/api/select-elements", tags=["Script Execution"])
 async def select_elements_endpoint(request: Request):
@@ -229,7 +540,7 @@ async def select_elements_endpoint(request: Request):
         # Ensure all IDs are integers
         element_ids = [int(eid) for eid in element_ids]
 
-        response = select_elements(element_ids)
+        response = await select_elements_async(element_ids)
         return JSONResponse(content=response)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -1,27 +1,44 @@
 import asyncio
 import glob
-import os
+import hashlib
 import json
+import os
 import subprocess
+import time
 from datetime import datetime
-from typing import Dict, Literal, Optional
+from typing import Dict, List, Literal, Optional
 
 import grpc
 from auth import CurrentUser, get_current_user
-from fastapi import APIRouter, Depends, HTTPException, Request
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from grpc_client import (
-    compute_parameter_options,
-    create_and_open_workspace,
-    get_combined_script,
-    get_script_metadata,
-    get_script_parameters,
-    rename_script,
+    EXTRACTOR_MODE,
+    create_and_open_workspace_async,
+    get_script_metadata_async,
+    get_script_parameters_async,
+    rename_script_async,
+    script_files_hash,
 )
 from pydantic import BaseModel, Field
+from services import ptool_package
+from services.combined_script_cache import combined_script_cache
+from services.parameter_options_cache import computed_parameter_names, load_options_source, parameter_options_cache
+from services.script_index import (
+    SCRIPT_TYPE_FILTERS,
+    folder_key,
+    listing_matches,
+    paginate_listing,
+    parse_sort,
+    script_index,
+    sort_listing,
+)
+from services.script_search import script_search
+from services.script_watcher import script_watcher
+from services.status_monitor import status_monitor
 from workspace_manager import get_active_workspace, set_active_workspace
 
-from utils import resolve_script_path
+from utils import normalize_script_path, resolve_script_path
 
 router = APIRouter()
 
@@ -77,6 +94,16 @@ class ComputeOptionsRequest(BaseModel):
     scriptPath: str
     type: str
     parameterName: str
+    refresh: bool = False  # Recompute even if a cached result for the active document exists
+
+class OptionsBatchScript(BaseModel):
+    scriptPath: str
+    type: str
+    parameterNames: Optional[List[str]] = None  # Default: every parameter whose options are computed
+
+class ComputeOptionsBatchRequest(BaseModel):
+    scripts: List[OptionsBatchScript]
+    refresh: bool = False
 
 class RenameRequest(BaseModel):
     oldPath: str
@@ -134,155 +161,180 @@ async def create_new_script(request: NewScriptRequest, current_user: CurrentUser
 
 import traceback
 
+# --- Conditional GET (ETag / If-None-Match) ---
+# X-Paracore-Version carries the raw version token (the folder's listing version, or a script's content hash)
+# so the desktop client can key its own cache on it; ETag is that token scoped to the representation.
+VERSION_HEADER = "X-Paracore-Version"
 
-@router.get("/api/scripts", tags=["Script Management"])
-async def get_scripts(folderPath: str):
+def _etag(*parts) -> str:
+    return '"' + hashlib.sha256("\0".join(str(p) for p in parts).encode('utf-8')).hexdigest()[:32] + '"'
+
+def _extractor_etag(*parts) -> str:
+    """
+    ETag of a representation holding extracted metadata or parameters. Besides the content, it depends on
+    what extracted them (the extractor mode and the engine version), so switching PARACORE_EXTRACTOR or
+    updating the add-in never answers 304 with what the previous extractor produced.
+    """
+    return _etag(*parts, EXTRACTOR_MODE, status_monitor.snapshot().get("engineVersion") or "")
+
+def _matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    # Strong comparison: weak validators (W/"...") never match
+    tags = [t.strip() for t in header.split(",")]
+    return "*" in tags or etag in tags
+
+def _cache_headers(etag: str, version: str) -> Dict[str, str]:
+    # no-cache: keep a copy, but revalidate it on every use
+    return {"ETag": etag, VERSION_HEADER: version, "Cache-Control": "no-cache"}
+
+def _not_modified(etag: str, version: str) -> Response:
+    return Response(status_code=304, headers=_cache_headers(etag, version))
+
+def _versioned_response(request: Request, content, etag: str, version: str) -> Response:
+    if _matches(request, etag):
+        return _not_modified(etag, version)
+    return JSONResponse(content=content, headers=_cache_headers(etag, version))
+
+def _indexed_content_hash(path: str) -> Optional[str]:
+    """The script's content hash from the index, if a live watch guarantees it is still current."""
+    if not script_watcher.covers(path):
+        return None
+    return script_index.content_hash(path)
+
+def _validate_script_folder(folderPath: str, script_type: Optional[str]):
     if not folderPath or not os.path.isabs(folderPath):
         raise HTTPException(status_code=400, detail="A valid, absolute folder path is required.")
 
     if not os.path.isdir(folderPath):
         raise HTTPException(status_code=400, detail="Can't find the script source. Make sure you have not deleted or renamed it.")
 
-    scripts = []
+    if script_type and script_type not in SCRIPT_TYPE_FILTERS:
+        raise HTTPException(status_code=400, detail=f"Invalid type. Use one of: {', '.join(SCRIPT_TYPE_FILTERS)}.")
+
+@router.get("/api/scripts", tags=["Script Management"])
+async def get_scripts(
+    request: Request,
+    folderPath: str,
+    category: Optional[List[str]] = Query(None),
+    script_type: Optional[str] = Query(None, alias="type"),
+    sort: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=1000),
+    cursor: Optional[str] = None,
+):
+    """
+    Lists the scripts in a source folder. category (repeatable, all must match) and type
+    (all | tool | single-file | multi-file) filter server-side;
+    sort is "<name|author|lastRun|created|modified>-<asc|desc>".
+    Without limit/cursor the response is the plain list; with them it is a page:
+    {"items", "nextCursor", "total"}, where nextCursor is passed back to get the following page.
+    Responses carry an ETag; a matching If-None-Match gets 304, without a rescan while the folder is watched.
+    """
+    if script_type and script_type not in SCRIPT_TYPE_FILTERS:
+        raise HTTPException(status_code=400, detail=f"Invalid type. Use one of: {', '.join(SCRIPT_TYPE_FILTERS)}.")
     try:
-        # Process single .cs files
-        for file_path in glob.glob(os.path.join(folderPath, "*.cs")):
-            try:
-                resolved_file_path = resolve_script_path(file_path)
+        parse_sort(sort)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
 
-                content = ""
-                try:
-                    with open(resolved_file_path, 'r', encoding='utf-8-sig') as f:
-                        content = f.read()
-                except UnicodeDecodeError:
-                    try:
-                        with open(resolved_file_path, 'r', encoding='utf-8') as f:
-                            content = f.read()
-                    except Exception:
-                        continue
-
-                script_files = [{"file_name": os.path.basename(resolved_file_path), "content": content}]
-
-                metadata = {}
-                try:
-                    metadata = get_script_metadata(script_files).get("metadata", {})
-                except grpc.RpcError as e:
-                    metadata = {"displayName": os.path.splitext(os.path.basename(resolved_file_path))[0], "description": f"Error: {e.details()}"}
-
-                file_stat = os.stat(resolved_file_path)
-                date_created = datetime.fromtimestamp(file_stat.st_ctime).isoformat()
-                date_modified = datetime.fromtimestamp(file_stat.st_mtime).isoformat()
-
-                scripts.append({
-                    "id": resolved_file_path.replace('\\', '/'),
-                    "name": os.path.basename(resolved_file_path),
-                    "type": "single-file",
-                    "absolutePath": resolved_file_path.replace('\\', '/'),
-                    "sourcePath": resolved_file_path.replace('\\', '/'),
-                    "metadata": {
-                        **metadata,
-                        "dateCreated": date_created,
-                        "dateModified": date_modified
-                    }
-                })
-            except Exception:
-                traceback.print_exc()
-                continue
-
-        # Process folders containing .cs files
-        for item in os.listdir(folderPath):
-            item_path = os.path.join(folderPath, item)
-            if os.path.isdir(item_path) and glob.glob(os.path.join(item_path, "*.cs")):
-                try:
-                    resolved_item_path = resolve_script_path(item_path)
-
-                    script_files = []
-                    for fp in glob.glob(os.path.join(item_path, "*.cs")):
-                        content = ""
-                        try:
-                            with open(fp, 'r', encoding='utf-8-sig') as f:
-                                content = f.read()
-                        except UnicodeDecodeError:
-                            try:
-                                with open(fp, 'r', encoding='utf-8') as f:
-                                    content = f.read()
-                            except Exception:
-                                continue
-                        script_files.append({"file_name": os.path.basename(fp), "content": content})
+    def listing_etag(version: str) -> str:
+        return _extractor_etag("scripts", version, sorted(category or []), script_type, sort, limit, cursor)
 
-                    if not script_files:
-                        continue
-
-                    metadata = {}
-                    try:
-                        metadata = get_script_metadata(script_files).get("metadata", {})
-                    except grpc.RpcError as e:
-                        metadata = {"displayName": os.path.basename(resolved_item_path), "description": f"Error: {e.details()}"}
-
-                    # Calculate robust date_modified for folders (latest mtime of any .cs file)
-                    folder_stat = os.stat(resolved_item_path)
-                    date_created = datetime.fromtimestamp(folder_stat.st_ctime).isoformat()
-
-                    latest_mtime = folder_stat.st_mtime
-                    for fp in glob.glob(os.path.join(item_path, "*.cs")):
-                        latest_mtime = max(latest_mtime, os.path.getmtime(fp))
-
-                    date_modified = datetime.fromtimestamp(latest_mtime).isoformat()
-
-                    scripts.append({
-                        "id": resolved_item_path.replace('\\', '/'),
-                        "name": os.path.basename(resolved_item_path),
-                        "type": "multi-file",
-                        "absolutePath": resolved_item_path.replace('\\', '/'),
-                        "sourcePath": resolved_item_path.replace('\\', '/'),
-                        "metadata": {
-                            **metadata,
-                            "dateCreated": date_created,
-                            "dateModified": date_modified
-                        }
-                    })
-                except Exception:
-                    traceback.print_exc()
-                    continue
+    # While the folder is watched, an unchanged library is answered without a rescan
+    if script_watcher.covers(folderPath):
+        version = script_index.version(folderPath)
+        if version and _matches(request, listing_etag(version)):
+            return _not_modified(listing_etag(version), version)
 
-        # Process .ptool files (Proprietary Tools)
-        for ptool_path in glob.glob(os.path.join(folderPath, "*.ptool")):
-            try:
-                resolved_ptool_path = resolve_script_path(ptool_path)
-                with open(resolved_ptool_path, 'r', encoding='utf-8') as f:
-                    package = json.load(f)
-                
-                metadata = package.get("metadata", {})
-                # Ensure flags are set even if not in JSON
-                metadata["is_protected"] = True
-                metadata["is_compiled"] = True
-                
-                ptool_stat = os.stat(resolved_ptool_path)
-                date_created = datetime.fromtimestamp(ptool_stat.st_ctime).isoformat()
-                date_modified = datetime.fromtimestamp(ptool_stat.st_mtime).isoformat()
-                
-                scripts.append({
-                    "id": resolved_ptool_path.replace('\\', '/'),
-                    "name": os.path.basename(resolved_ptool_path),
-                    "type": "single-file", # .ptool is treated as a single unit
-                    "absolutePath": resolved_ptool_path.replace('\\', '/'),
-                    "sourcePath": resolved_ptool_path.replace('\\', '/'),
-                    "parameters": package.get("parameters", []), # IMPORTANT: Include baked parameters
-                    "metadata": {
-                        **metadata,
-                        "dateCreated": date_created,
-                        "dateModified": date_modified
-                    }
-                })
-            except Exception:
-                traceback.print_exc()
-                continue
-
-        return JSONResponse(content=scripts)
+    _validate_script_folder(folderPath, script_type)
+    try:
+        # Answered from the persistent script index; only new or edited scripts hit the engine
+        scripts = await script_index.rescan(folderPath)
     except Exception as e:
         traceback.print_exc()
         raise HTTPException(status_code=500, detail=f"Failed to get scripts: {str(e)}")
 
+    # No version if the library changed during the scan; the response then goes out uncached
+    version = script_index.version(folderPath)
+
+    if category or script_type:
+        scripts = [s for s in scripts if listing_matches(s, category, script_type)]
+    if limit is None and cursor is None:
+        content = sort_listing(scripts, sort) if sort else scripts
+    else:
+        try:
+            page, next_cursor = paginate_listing(scripts, sort, limit or 100, cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
+        content = {"items": page, "nextCursor": next_cursor, "total": len(scripts)}
+
+    if version is None:
+        return JSONResponse(content=content)
+    return _versioned_response(request, content, listing_etag(version), version)
+
+@router.get("/api/scripts/search", tags=["Script Management"])
+async def search_scripts(
+    folderPath: str,
+    q: str,
+    limit: int = Query(20, ge=1, le=200),
+    category: Optional[List[str]] = Query(None),
+    script_type: Optional[str] = Query(None, alias="type"),
+):
+    """
+    Full-text search over a source folder's scripts (name, description, categories, usage examples and
+    parameter names), ranked by BM25. The last word of q also matches as a prefix, for search-as-you-type.
+    """
+    _validate_script_folder(folderPath, script_type)
+    key = folder_key(folderPath)
+    try:
+        if not script_search.is_indexed(key):
+            # First search since startup: the scan fills the search index from the persistent script index
+            await script_index.rescan(folderPath)
+    except Exception as e:
+        traceback.print_exc()
+        raise HTTPException(status_code=500, detail=f"Failed to index scripts: {str(e)}") from e
+
+    started = time.perf_counter()
+    filtered = bool(category or script_type)
+    # Over-fetch when filtering so a page of matches survives the filter
+    results = script_search.search(key, q, limit * 5 if filtered else limit)
+    if filtered:
+        results = [r for r in results if listing_matches(r, category, script_type)][:limit]
+    return JSONResponse(content={
+        "query": q,
+        "results": results,
+        "tookMs": round((time.perf_counter() - started) * 1000, 2),
+    })
+
+@router.get("/api/scripts/stream", tags=["Script Management"])
+async def stream_scripts(
+    folderPath: str,
+    category: Optional[List[str]] = Query(None),
+    script_type: Optional[str] = Query(None, alias="type"),
+):
+    """
+    NDJSON variant of /api/scripts: one listing item per line, written as soon as it is ready
+    (indexed scripts first, then new or edited ones as they are parsed), so large libraries render progressively.
+    Items arrive in readiness order, not sorted. A failure mid-stream ends with an {"error": ...} line.
+    """
+    _validate_script_folder(folderPath, script_type)
+
+    async def lines():
+        try:
+            async for item in script_index.stream(folderPath):
+                if listing_matches(item, category, script_type):
+                    yield json.dumps(item) + "\n"
+        except Exception as e:
+            traceback.print_exc()
+            yield json.dumps({"error": f"Failed to get scripts: {str(e)}"}) + "\n"
+
+    return StreamingResponse(
+        lines(),
+        media_type="application/x-ndjson",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
 @router.post("/api/script-metadata", tags=["Script Management"])
 async def get_script_metadata_endpoint(request: Request):
     data = await request.json()
@@ -295,7 +347,10 @@ async def get_script_metadata_endpoint(request: Request):
     try:
         absolute_path = resolve_script_path(script_path)
         script_files = []
-        if script_type == "single-file":
+        if absolute_path.endswith('.ptool'):
+            # A binary package: read through ptool_package below, never as source text
+            script_files.append({"file_name": os.path.basename(absolute_path), "content": ""})
+        elif script_type == "single-file":
             with open(absolute_path, 'r', encoding='utf-8-sig') as f:
                 source_code = f.read()
             script_files.append({"file_name": os.path.basename(absolute_path), "content": source_code})
@@ -316,14 +371,10 @@ async def get_script_metadata_endpoint(request: Request):
         # Handle empty script content gracefully
         has_content = any(f["content"].strip() for f in script_files)
         if absolute_path.endswith('.ptool'):
-            with open(absolute_path, 'r', encoding='utf-8') as f:
-                package = json.load(f)
-            metadata = package.get("metadata", {})
-            metadata["is_protected"] = True
-            metadata["is_compiled"] = True
+            package = ptool_package.read_header(absolute_path)
             response = {
-                "metadata": metadata,
-                "parameters": package.get("parameters", [])
+                "metadata": package["metadata"],
+                "parameters": package["parameters"]
             }
         elif not has_content:
              # Basic default metadata for empty file
@@ -335,7 +386,7 @@ async def get_script_metadata_endpoint(request: Request):
              }
              response = {"metadata": metadata}
         else:
-            response = get_script_metadata(script_files)
+            response = await get_script_metadata_async(script_files)
 
         # ADDED: Include file stats for refresh detection
         file_stat = os.stat(absolute_path)
@@ -361,19 +412,21 @@ async def get_script_metadata_endpoint(request: Request):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@router.post("/api/get-script-parameters", tags=["Script Management"])
-async def get_script_parameters_endpoint(request: Request):
-    data = await request.json()
-    script_path = data.get("scriptPath")
-    script_type = data.get("type")
-
+async def _script_parameters(request: Request, script_path: Optional[str], script_type: Optional[str]) -> Response:
     if not script_path or not script_type:
         raise HTTPException(status_code=400, detail="scriptPath and type are required.")
 
+    cached_hash = _indexed_content_hash(normalize_script_path(script_path))
+    if cached_hash and _matches(request, _extractor_etag("parameters", cached_hash)):
+        return _not_modified(_extractor_etag("parameters", cached_hash), cached_hash)
+
     try:
         absolute_path = resolve_script_path(script_path)
         script_files = []
-        if script_type == "single-file":
+        if absolute_path.endswith('.ptool'):
+            # A binary package: read through ptool_package below, never as source text
+            script_files.append({"file_name": os.path.basename(absolute_path), "content": ""})
+        elif script_type == "single-file":
             with open(absolute_path, 'r', encoding='utf-8-sig') as f:
                 source_code = f.read()
             script_files.append({"file_name": os.path.basename(absolute_path), "content": source_code})
@@ -388,21 +441,26 @@ async def get_script_parameters_endpoint(request: Request):
         if not script_files:
             raise HTTPException(status_code=404, detail="No script files found.")
 
-        if not script_files:
-            raise HTTPException(status_code=404, detail="No script files found.")
+        # Same token as the script index's content hash, so 304s skip the engine round-trip
+        if absolute_path.endswith('.ptool'):
+            with open(absolute_path, 'rb') as f:
+                content_hash = hashlib.sha256(f.read()).hexdigest()
+        else:
+            content_hash = script_files_hash(script_files)
+        etag = _extractor_etag("parameters", content_hash)
+        if _matches(request, etag):
+            return _not_modified(etag, content_hash)
 
         # Handle empty script content gracefully
         has_content = any(f["content"].strip() for f in script_files)
 
         if absolute_path.endswith('.ptool'):
-            with open(absolute_path, 'r', encoding='utf-8') as f:
-                package = json.load(f)
-            response = {"parameters": package.get("parameters", [])}
+            response = {"parameters": ptool_package.read_header(absolute_path)["parameters"]}
         elif not has_content:
             response = {"parameters": []}
         else:
-            response = get_script_parameters(script_files)
-        return JSONResponse(content=response)
+            response = await get_script_parameters_async(script_files)
+        return JSONResponse(content=response, headers=_cache_headers(etag, content_hash))
 
     except FileNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
@@ -411,15 +469,32 @@ async def get_script_parameters_endpoint(request: Request):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.post("/api/get-script-parameters", tags=["Script Management"])
+async def get_script_parameters_endpoint(request: Request):
+    data = await request.json()
+    return await _script_parameters(request, data.get("scriptPath"), data.get("type"))
+
+@router.get("/api/get-script-parameters", tags=["Script Management"])
+async def get_script_parameters_conditional(request: Request, scriptPath: str, type: str):
+    """GET form of the parameters endpoint, so clients and caches can revalidate with If-None-Match."""
+    return await _script_parameters(request, scriptPath, type)
+
 @router.get("/api/script-content", tags=["Script Management"])
-async def get_script_content(scriptPath: str, type: str):
+async def get_script_content(request: Request, scriptPath: str, type: str):
     if not scriptPath or not type:
         raise HTTPException(status_code=400, detail="scriptPath and type are required")
+
+    cached_hash = _indexed_content_hash(normalize_script_path(scriptPath))
+    if cached_hash and _matches(request, _etag("content", cached_hash)):
+        return _not_modified(_etag("content", cached_hash), cached_hash)
+
     try:
         absolute_path = resolve_script_path(scriptPath)
 
         if absolute_path.endswith('.ptool'):
-            return JSONResponse(content={"sourceCode": "// This is a protected Paracore tool. Source code is hidden to protect intellectual property."})
+            content = {"sourceCode": "// This is a protected Paracore tool. "
+                                     "Source code is hidden to protect intellectual property."}
+            return _versioned_response(request, content, _etag("content", "ptool"), "ptool")
 
         # Retry logic for file locking issues on Windows
         max_retries = 3
@@ -430,15 +505,24 @@ async def get_script_content(scriptPath: str, type: str):
                 if type == "single-file":
                     with open(absolute_path, "r", encoding="utf-8-sig") as f:
                         content = f.read()
-                    return JSONResponse(content={"sourceCode": content})
+                    content_hash = script_files_hash([{"file_name": os.path.basename(absolute_path),
+                                                       "content": content}])
+                    return _versioned_response(request, {"sourceCode": content}, _etag("content", content_hash),
+                                               content_hash)
                 elif type == "multi-file":
                     if not os.path.isdir(absolute_path):
                         raise HTTPException(status_code=400, detail="Path for multi-file script must be a directory.")
 
-                    script_files = []
-                    cs_files = glob.glob(os.path.join(absolute_path, "*.cs"))
+                    # Unchanged since it was last combined: answered from memory, no reads and no engine call
+                    cached = combined_script_cache.lookup(absolute_path)
+                    if cached is not None:
+                        etag = _etag("content", cached.content_hash)
+                        return _versioned_response(request, {"sourceCode": cached.combined_script}, etag,
+                                                   cached.content_hash)
+
+                    script_files = combined_script_cache.read(absolute_path)
 
-                    if not cs_files:
+                    if not script_files:
                          # Retry if directory exists but looks empty (race condition?)
                          if attempt < max_retries - 1:
                              await asyncio.sleep(0.2)
@@ -446,16 +530,14 @@ async def get_script_content(scriptPath: str, type: str):
                          # If truly empty, return empty
                          raise HTTPException(status_code=404, detail="No .cs files found at path.")
 
-                    for file_path in cs_files:
-                        with open(file_path, 'r', encoding='utf-8-sig') as f:
-                            source_code = f.read()
-                        script_files.append({
-                            "file_name": os.path.basename(file_path),
-                            "content": source_code
-                        })
+                    # Checked before combining, so an unchanged script never reaches the engine
+                    content_hash = script_files_hash(script_files)
+                    etag = _etag("content", content_hash)
+                    if _matches(request, etag):
+                        return _not_modified(etag, content_hash)
 
-                    response = get_combined_script(script_files)
-                    return JSONResponse(content={"sourceCode": response.get("combined_script")})
+                    combined = await combined_script_cache.combine(absolute_path, script_files)
+                    return _versioned_response(request, {"sourceCode": combined.combined_script}, etag, content_hash)
                 else:
                     raise HTTPException(status_code=400, detail=f"Invalid script type: {type}")
 
@@ -498,7 +580,7 @@ async def edit_script(request: Request, current_user: CurrentUser = Depends(get_
         if absolute_path.endswith('.ptool'):
              raise HTTPException(status_code=403, detail="Protected Tool: Source code cannot be edited.")
 
-        response = create_and_open_workspace(script_path, script_type)
+        response = await create_and_open_workspace_async(script_path, script_type)
         if response.get("error_message"):
             raise HTTPException(status_code=500, detail=response.get("error_message") )
 
@@ -664,6 +746,10 @@ async def save_script(request: SaveScriptRequest, current_user: CurrentUser = De
                     f.write(request.content)
                 saved_paths.append(target_file)
 
+        if request.type == "multi-file" and not is_workspace_save:
+            # Re-combine now, so the Code tab opens from memory
+            combined_script_cache.refresh_soon(target_dir)
+
         location_type = "Workspace (Synced)" if is_workspace_save else "Original Source"
         print(f"[ScriptManagement] Successfully saved {len(saved_paths)} files to {location_type}")
 
@@ -689,14 +775,14 @@ async def process_script_content(request: ProcessContentRequest):
 
         # Get metadata
         try:
-            metadata_response = get_script_metadata(script_files)
+            metadata_response = await get_script_metadata_async(script_files)
             metadata = metadata_response.get("metadata", {})
         except grpc.RpcError as e:
             metadata = {"displayName": "Published Script", "description": f"Error parsing metadata: {e.details()}"}
 
         # Get parameters
         try:
-            parameters_response = get_script_parameters(script_files)
+            parameters_response = await get_script_parameters_async(script_files)
             parameters = parameters_response.get("parameters", [])
         except grpc.RpcError as e:
             parameters = []
@@ -757,20 +843,15 @@ async def compute_parameter_options_endpoint(request: ComputeOptionsRequest):
                 raise HTTPException(status_code=400, detail="Path for multi-file script must be a directory.")
 
             # For multi-file, we combine the scripts first
-            files = []
-            for file_path in glob.glob(os.path.join(absolute_path, "*.cs")):
-                with open(file_path, 'r', encoding='utf-8-sig') as f:
-                    files.append({"file_name": os.path.basename(file_path), "content": f.read()})
-
-            combined_response = get_combined_script(files)
-            source_code = combined_response.get("combined_script", "")
+            source_code = (await combined_script_cache.get(absolute_path)).combined_script
         else:
             raise HTTPException(status_code=400, detail=f"Invalid script type: {request.type}")
 
         if not source_code:
             raise HTTPException(status_code=404, detail="Script content not found.")
 
-        response = compute_parameter_options(source_code, request.parameterName)
+        # Cached per active document; "from_cache" and "cache_age_seconds" tell the UI how fresh the list is
+        response = await parameter_options_cache.compute(source_code, request.parameterName, refresh=request.refresh)
         return JSONResponse(content=response)
 
     except FileNotFoundError as e:
@@ -779,6 +860,53 @@ async def compute_parameter_options_endpoint(request: ComputeOptionsRequest):
         raise HTTPException(status_code=500, detail=f"gRPC Error: {e.details()}")
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+@router.post("/api/compute-parameter-options/batch", tags=["Script Management"])
+async def compute_parameter_options_batch_endpoint(request: ComputeOptionsBatchRequest):
+    """
+    Computes the dynamic options of one or more scripts in a single engine pass.
+    Returns {"results": {scriptPath: {parameterName: options result}}, "errors": {scriptPath: message},
+    "error_message"};
+    each options result has the same shape as /api/compute-parameter-options.
+    """
+    scripts, errors = [], {}
+    for item in request.scripts:
+        try:
+            absolute_path = resolve_script_path(item.scriptPath)
+            if item.type == "multi-file" and not os.path.isdir(absolute_path):
+                raise ValueError("Path for multi-file script must be a directory.")
+            source_code = await load_options_source(absolute_path, item.type)
+            if not source_code:
+                raise ValueError("Script content not found.")
+            names = item.parameterNames
+            if names is None:
+                names = await computed_parameter_names(source_code)
+        except grpc.RpcError as e:
+            errors[item.scriptPath] = f"gRPC Error: {e.details()}"
+            continue
+        except Exception as e:
+            errors[item.scriptPath] = str(e)
+            continue
+        if names:
+            scripts.append({"id": item.scriptPath, "source_code": source_code, "parameter_names": names})
+
+    try:
+        response = await parameter_options_cache.compute_batch(scripts, refresh=request.refresh)
+    except Exception as e:
+        traceback.print_exc()
+        raise HTTPException(status_code=500, detail=f"Failed to compute parameter options: {str(e)}") from e
+    return JSONResponse(content={**response, "errors": errors})
+
+@router.post("/api/compute-parameter-options/prefetch", tags=["Script Management"])
+async def prefetch_parameter_options_endpoint():
+    """Warms the options cache for favorite and recently run scripts against the active document."""
+    try:
+        count = await parameter_options_cache.prefetch()
+    except Exception as e:
+        traceback.print_exc()
+        raise HTTPException(status_code=500, detail=f"Failed to prefetch parameter options: {str(e)}") from e
+    return JSONResponse(content={"parameters": count})
+
 @router.post("/api/rename-script", tags=["Script Management"])
 async def rename_script_endpoint(request: RenameRequest, current_user: CurrentUser = Depends(get_current_user)):
     """
@@ -788,7 +916,7 @@ async def rename_script_endpoint(request: RenameRequest, current_user: CurrentUs
         raise HTTPException(status_code=400, detail="An absolute script path is required.")
 
     try:
-        response = rename_script(request.oldPath, request.newName)
+        response = await rename_script_async(request.oldPath, request.newName)
         if not response.get("is_success"):
             raise HTTPException(status_code=400, detail=response.get("error_message"))
 
@@ -1,30 +1,52 @@
-import json
-
-import grpc
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter
 from fastapi.responses import JSONResponse
-from google.protobuf import json_format
-from grpc_client import get_status
+from grpc_client import get_extraction_cache_stats
+from services.assembly_cache import assembly_cache
+from services.combined_script_cache import combined_script_cache
+from services.execution_dispatcher import execution_dispatcher
+from services.parameter_options_cache import parameter_options_cache
+from services.run_jobs import run_jobs
+from services.script_search import script_search
+from services.status_monitor import status_monitor
 
 router = APIRouter()
 
 @router.get("/api/status", tags=["status"])
 async def get_status_endpoint():
     """
-    Checks the status of the gRPC server connection.
-    """
-    try:
-        response = get_status()
-        # print(f"[DEBUG] Raw GetStatusResponse from RServer.Addin: {response}") # DEBUG LOG
-        return JSONResponse(content=json.loads(json_format.MessageToJson(response)))
-    except grpc.RpcError:
-        return JSONResponse(content={
-            "paracoreConnected": False,
-            "revitOpen": False,
-            "revitVersion": None,
-            "documentOpen": False,
-            "documentTitle": None,
-            "documentType": "None"
-        })
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    Returns the latest Revit/Paracore connection status.
+    Served from the background status monitor's snapshot, so it never waits on Revit.
+    """
+    if not status_monitor.running:
+        # Monitor not started (e.g. router mounted outside main's lifespan): check directly.
+        return JSONResponse(content=await status_monitor.poll_once())
+    return JSONResponse(content=status_monitor.snapshot())
+
+@router.post("/api/status/refresh", tags=["status"])
+async def refresh_status_endpoint():
+    """
+    Polls GetStatus immediately instead of waiting for the monitor's next (possibly backed-off) tick.
+    """
+    return JSONResponse(content=await status_monitor.poll_once())
+
+@router.get("/api/status/cache", tags=["status"])
+async def get_cache_stats_endpoint():
+    """
+    Hit/miss counters and memory use of the server-side extraction, combined-script and
+    parameter options caches, the compiled assembly cache on disk, and script search index sizes.
+    """
+    return JSONResponse(content={
+        "extraction": get_extraction_cache_stats(),
+        "combined": combined_script_cache.stats(),
+        "options": parameter_options_cache.stats(),
+        "assemblies": assembly_cache.stats(),
+        "search": script_search.stats(),
+    })
+
+@router.get("/api/status/run-queue", tags=["status"])
+async def get_run_queue_endpoint():
+    """
+    Depth of the run job queue and recent wait/run times, plus the execution dispatcher's
+    in-flight run and per-lane queue times for every execution (direct runs, jobs and agent tools).
+    """
+    return JSONResponse(content={**run_jobs.stats(), "engine": execution_dispatcher.stats()})
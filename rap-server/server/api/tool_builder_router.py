@@ -1,17 +1,21 @@
 import logging
 import os
 import json
-import base64
-from fastapi import APIRouter, HTTPException, Body
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from typing import List, Optional
-import grpc_client
+from services.tool_builder import build_folder, build_tool
+from utils import read_script_files
 
 router = APIRouter(prefix="/api/scripts", tags=["scripts"])
 
 class BuildToolRequest(BaseModel):
     scriptPath: str
 
+class BuildToolsRequest(BaseModel):
+    folderPath: str
+    force: bool = False
+
 @router.post("/build-tool")
 async def build_tool_endpoint(request: BuildToolRequest):
     """
@@ -22,69 +26,17 @@ async def build_tool_endpoint(request: BuildToolRequest):
         raise HTTPException(status_code=404, detail="Script path not found")
 
     is_dir = os.path.isdir(script_path)
-    script_files = []
-
-    if is_dir:
-        # Multi-file script
-        for f in os.listdir(script_path):
-            if f.endswith(".cs"):
-                fpath = os.path.join(script_path, f)
-                with open(fpath, "r", encoding="utf-8") as file:
-                    script_files.append({"file_name": f, "content": file.read()})
-    else:
-        # Single-file script
-        if not script_path.endswith(".cs"):
-             raise HTTPException(status_code=400, detail="Only .cs files can be built into tools")
-        with open(script_path, "r", encoding="utf-8") as f:
-            script_files.append({"file_name": os.path.basename(script_path), "content": f.read()})
+    if not is_dir and not script_path.endswith(".cs"):
+        raise HTTPException(status_code=400, detail="Only .cs files can be built into tools")
 
+    script_files = read_script_files(script_path, "multi-file" if is_dir else "single-file")
     if not script_files:
         raise HTTPException(status_code=400, detail="No source code found to build")
 
     try:
-        # 1. Get Metadata and Parameters (to bake them in)
-        metadata_res = grpc_client.get_script_metadata(script_files)
-        params_res = grpc_client.get_script_parameters(script_files)
-        combined_res = grpc_client.get_combined_script(script_files)
-
-        metadata = metadata_res.get("metadata")
-        parameters = params_res.get("parameters")
-        combined_content = combined_res.get("combined_script")
-
-        if not combined_content:
-             raise HTTPException(status_code=400, detail="Failed to combine script files")
-
-        # 2. Trigger Build
-        # We must pass the list of ScriptFile objects as JSON, not the combined content
-        # because the C# backend's BuildScript RPC expects the same JSON input as ExecuteScript
-        script_files_json = json.dumps(script_files)
-        build_res = grpc_client.build_script(script_files_json)
-        if not build_res.get("is_success"):
-             raise HTTPException(status_code=500, detail=f"Compilation failed: {build_res.get('error_message')}")
-
-        assembly_bytes = build_res.get("compiled_assembly")
-        assembly_base64 = base64.b64encode(assembly_bytes).decode('utf-8')
-
-        # 3. Create .ptool package
-        # Force is_protected and is_compiled to True for the baked metadata
-        metadata["is_protected"] = True
-        metadata["is_compiled"] = True
-
-        ptool_data = {
-            "metadata": metadata,
-            "parameters": parameters,
-            "assembly": assembly_base64
-        }
-
-        # Save as .ptool in the same directory (or parent if it's a folder)
-        if is_dir:
-            output_path = script_path.rstrip("/\\") + ".ptool"
-        else:
-            output_path = script_path.replace(".cs", ".ptool")
-
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(ptool_data, f, indent=2)
-
+        # Metadata, parameters and the build are requested together; the tool records its source hash
+        built = await build_tool(script_path, script_files)
+        output_path = built["output_path"]
         return {
             "is_success": True,
             "output_path": output_path,
@@ -94,3 +46,34 @@ async def build_tool_endpoint(request: BuildToolRequest):
     except Exception as e:
         logging.error(f"Error building tool: {e}")
         raise HTTPException(status_code=500, detail=str(e))
+
+@router.post("/build-tools")
+async def build_tools_endpoint(request: BuildToolsRequest):
+    """
+    Builds a .ptool for every script in a folder, several at a time, skipping scripts whose tool is
+    already built from the same source (unless force). Answers with Server-Sent Events:
+      event: discovered  data: {"total", "toBuild", "upToDate"}
+      event: tool        data: {"scriptPath", "outputPath", "status": built | skipped | failed, "seconds", "error"}
+      event: summary     data: {"built", "skipped", "failed", "empty", "buildSeconds", "seconds"}
+      event: error       data: {"detail": ...}
+    """
+    if not os.path.isdir(request.folderPath):
+        raise HTTPException(status_code=404, detail="Folder not found")
+
+    def sse(event, payload):
+        return f"event: {event}\ndata: {json.dumps(payload)}\n\n"
+
+    async def relay():
+        try:
+            async for update in build_folder(request.folderPath, request.force):
+                event = update.pop("event")
+                yield sse(event, update)
+        except Exception as e:
+            logging.error(f"Error building tools: {e}")
+            yield sse("error", {"detail": str(e)})
+
+    return StreamingResponse(
+        relay(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -3,6 +3,7 @@ import json
 import auth
 from database_config import get_db
 from fastapi import APIRouter, Depends, HTTPException, status
+from services.script_watcher import script_watcher
 from sqlalchemy.orm import Session
 
 import models
@@ -64,6 +65,9 @@ def set_custom_script_folders(
     db.commit()
     db.refresh(user_setting)
 
+    # Start watching newly added folders right away
+    script_watcher.request_refresh()
+
     # Deserialize the value back to a list for the response model
     user_setting.setting_value = json.loads(user_setting.setting_value)
     return user_setting
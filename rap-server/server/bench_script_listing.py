@@ -0,0 +1,127 @@
+"""
+Benchmark for the /api/scripts listing pipeline.
+
+Creates N single-file scripts (plus a few multi-file folders) in a temp folder, serves metadata from an
+in-process fake CoreScript engine with a simulated per-request/per-script cost, and times:
+  - sequential: the old loop (read a file, await GetScriptMetadata, repeat)
+  - cold scan:  ScriptIndex.rescan on an empty index (scandir + thread pool + concurrent batch RPCs)
+  - warm scan:  ScriptIndex.rescan again with nothing changed
+
+Usage: python bench_script_listing.py [N]   (default 1000)
+"""
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+# Isolated database for the run; must be set before database_config/grpc_client are imported.
+os.environ["DATABASE_URL"] = "sqlite:///" + os.path.join(tempfile.mkdtemp(), "bench.db")
+# Measure the engine round trips, not the local extractor that answers first by default.
+os.environ.setdefault("PARACORE_EXTRACTOR", "engine")
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import corescript_pb2
+import corescript_pb2_grpc
+import grpc
+import grpc_client
+from database_config import Base, engine
+
+import models  # noqa: F401  (registers the script_index table)
+
+# Simulated engine cost: fixed overhead per RPC plus Roslyn parse time per script.
+REQUEST_OVERHEAD_S = 0.003
+PER_SCRIPT_S = 0.0005
+
+SCRIPT_TEMPLATE = """/*
+DocumentType: Project
+Categories: Benchmark
+Author: Bench
+Description: Benchmark script {i}
+*/
+var p = new Params();
+Println($"Hello {{p.Name}}");
+
+public class Params {{
+    public string Name {{ get; set; }} = "World";
+}}
+"""
+
+def _metadata(script_files):
+    return corescript_pb2.ScriptMetadata(name=script_files[0].file_name, description="Benchmark script", author="Bench")
+
+class FakeEngine(corescript_pb2_grpc.CoreScriptRunnerServicer):
+    async def GetScriptMetadata(self, request, context):
+        await asyncio.sleep(REQUEST_OVERHEAD_S + PER_SCRIPT_S)
+        return corescript_pb2.GetScriptMetadataResponse(metadata=_metadata(request.script_files))
+
+    async def GetScriptMetadataBatch(self, request, context):
+        await asyncio.sleep(REQUEST_OVERHEAD_S + PER_SCRIPT_S * len(request.units))
+        return corescript_pb2.GetScriptMetadataBatchResponse(results=[
+            corescript_pb2.ScriptMetadataResult(id=u.id, metadata=_metadata(u.script_files)) for u in request.units
+        ])
+
+def make_library(n):
+    folder = tempfile.mkdtemp(prefix="paracore-bench-")
+    for i in range(n):
+        with open(os.path.join(folder, f"Script_{i:05d}.cs"), "w", encoding="utf-8") as f:
+            f.write(SCRIPT_TEMPLATE.format(i=i))
+    for j in range(max(1, n // 100)):
+        sub = os.path.join(folder, f"Multi_{j:03d}")
+        os.mkdir(sub)
+        for k in range(3):
+            with open(os.path.join(sub, f"Part{k}.cs"), "w", encoding="utf-8") as f:
+                f.write(SCRIPT_TEMPLATE.format(i=f"{j}_{k}"))
+    return folder
+
+async def sequential_listing(folder):
+    count = 0
+    for name in sorted(os.listdir(folder)):
+        path = os.path.join(folder, name)
+        if os.path.isdir(path):
+            files = [os.path.join(path, f) for f in sorted(os.listdir(path)) if f.endswith(".cs")]
+        elif name.endswith(".cs"):
+            files = [path]
+        else:
+            continue
+        script_files = []
+        for fp in files:
+            with open(fp, "r", encoding="utf-8-sig") as f:
+                script_files.append({"file_name": os.path.basename(fp), "content": f.read()})
+        request = corescript_pb2.GetScriptMetadataRequest(script_files=grpc_client._to_grpc_script_files(script_files))
+        await grpc_client.get_async_stub().GetScriptMetadata(request)
+        count += 1
+    return count
+
+async def main(n):
+    Base.metadata.create_all(bind=engine)
+    from services.script_index import script_index
+
+    server = grpc.aio.server()
+    corescript_pb2_grpc.add_CoreScriptRunnerServicer_to_server(FakeEngine(), server)
+    port = server.add_insecure_port("127.0.0.1:0")
+    await server.start()
+    os.environ["GRPC_SERVER_ADDRESS"] = f"127.0.0.1:{port}"
+    grpc_client.init_aio_channel()
+
+    folder = make_library(n)
+    print(f"Library: {n} single-file + {max(1, n // 100)} multi-file scripts in {folder}")
+
+    start = time.perf_counter()
+    count = await sequential_listing(folder)
+    print(f"sequential : {time.perf_counter() - start:7.3f} s  ({count} scripts)")
+
+    grpc_client.clear_extraction_cache()
+    start = time.perf_counter()
+    listing = await script_index.rescan(folder)
+    print(f"cold scan  : {time.perf_counter() - start:7.3f} s  ({len(listing)} scripts)")
+
+    start = time.perf_counter()
+    listing = await script_index.rescan(folder)
+    print(f"warm scan  : {time.perf_counter() - start:7.3f} s  ({len(listing)} scripts)")
+
+    await grpc_client.close_aio_channel()
+    await server.stop(None)
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000))
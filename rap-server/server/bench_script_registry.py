@@ -0,0 +1,112 @@
+"""
+Benchmark for ScriptRegistry lookups on a large agent library.
+
+Writes N scripts (spread over source folders, a mix of single-file and multi-file) to a temp library,
+builds its manifest.json with the local extractor (so no engine is needed) and times, per lookup,
+the way agent tools used them:
+  - linear:  a fresh registry per call, scanning every script and recomputing its tool id (the old registry)
+  - indexed: the shared get_registry() instance (dict, name and reversed-suffix indexes)
+for exact tool ids, suffix matches (e.g. "wall_auditor" -> "auditing_wall_auditor") and metadata-name fallbacks.
+
+Usage: python bench_script_registry.py [N]   (default 10000)
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+# Extraction is not what is measured; keep the engine out of it
+os.environ["PARACORE_EXTRACTOR"] = "local"
+
+from agent.api_helpers import read_local_script_manifest
+from agent.orchestrator.registry import _tool_id, get_registry
+
+LOOKUPS = 200
+
+SCRIPT = """/*
+DocumentType: Project
+Categories: Bench
+Author: Bench
+Description: Bench tool {i}
+*/
+var p = new Params();
+Println(p.Level);
+
+public class Params
+{{
+    public string Level {{ get; set; }} = "Level 1";
+}}
+"""
+
+def make_library(n):
+    """A temp library of n scripts; every tenth is a multi-file script (a folder with Main.cs)."""
+    folder = tempfile.mkdtemp(prefix="paracore-registry-bench-")
+    for i in range(n):
+        source_folder = os.path.join(folder, f"Discipline_{i % 7}")
+        if i % 10 == 0:
+            path = os.path.join(source_folder, f"Tool_{i:05d}", "Main.cs")
+        else:
+            path = os.path.join(source_folder, f"Tool_{i:05d}.cs")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(SCRIPT.format(i=i))
+    return folder
+
+class LinearRegistry:
+    """The registry before indexing: every lookup scans the manifest and recomputes tool ids."""
+    def __init__(self, agent_scripts_path: str):
+        self.scripts = read_local_script_manifest(agent_scripts_path)
+
+    def find_script_by_name(self, name: str) -> Optional[Dict]:
+        for script in self.scripts:
+            if _tool_id(script) == name:
+                return script
+        for script in self.scripts:
+            t_id = _tool_id(script)
+            if t_id.endswith(name) and t_id.count('_') > name.count('_'):
+                return script
+        for script in self.scripts:
+            if script.get('name') == name:
+                return script
+        return None
+
+def time_lookups(label: str, lookup, names: List[str]):
+    start = time.perf_counter()
+    found = sum(1 for name in names if lookup(name) is not None)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<20}: {elapsed * 1000 / len(names):9.3f} ms/lookup  ({found}/{len(names)} found)")
+    # Timing lookups that find nothing says nothing about the registry
+    assert found == len(names), f"{label}: only {found}/{len(names)} found"
+    return elapsed
+
+def main(n):
+    folder = make_library(n)
+    print(f"Library: {n} scripts in {folder}")
+    start = time.perf_counter()
+    manifest = read_local_script_manifest(folder)
+    print(f"{'manifest build':<20}: {(time.perf_counter() - start) * 1000:9.3f} ms")
+    assert len(manifest) == n, f"manifest lists {len(manifest)} of {n} scripts"
+
+    rng = random.Random(42)
+    picks = [manifest[rng.randrange(n)] for _ in range(LOOKUPS)]
+    exact = [_tool_id(s) for s in picks]
+    suffixes = [t.split("_", 2)[-1] for t in exact]  # drop the discipline prefix
+    names = [s["name"] for s in picks]
+
+    start = time.perf_counter()
+    registry = get_registry(folder)
+    registry.refresh(force=False)
+    print(f"{'index build':<20}: {(time.perf_counter() - start) * 1000:9.3f} ms")
+
+    for kind, queries in (("exact", exact), ("suffix", suffixes), ("name", names)):
+        linear = time_lookups(f"linear {kind}", lambda q: LinearRegistry(folder).find_script_by_name(q), queries)
+        indexed = time_lookups(f"indexed {kind}", lambda q: get_registry(folder).find_script_by_name(q), queries)
+        for query in queries[:20]:
+            assert LinearRegistry(folder).find_script_by_name(query) is registry.find_script_by_name(query), query
+        print(f"{'speedup':<20}: {linear / indexed:9.1f}x")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
@@ -24,7 +24,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x10\x63orescript.proto\x12\nCoreScript\"D\n\x11PickObjectRequest\x12\x16\n\x0eselection_type\x18\x01 \x01(\t\x12\x17\n\x0f\x63\x61tegory_filter\x18\x02 \x01(\t\"a\n\x12PickObjectResponse\x12\r\n\x05value\x18\x01 \x01(\t\x12\x12\n\nis_success\x18\x02 \x01(\x08\x12\x11\n\tcancelled\x18\x03 \x01(\x08\x12\x15\n\rerror_message\x18\x04 \x01(\t\",\n\x15SelectElementsRequest\x12\x13\n\x0b\x65lement_ids\x18\x01 \x03(\x03\"C\n\x16SelectElementsResponse\x12\x12\n\nis_success\x18\x01 \x01(\x08\x12\x15\n\rerror_message\x18\x02 \x01(\t\"B\n\x16\x43reateWorkspaceRequest\x12\x13\n\x0bscript_path\x18\x01 \x01(\t\x12\x13\n\x0bscript_type\x18\x02 \x01(\t\"H\n\x17\x43reateWorkspaceResponse\x12\x16\n\x0eworkspace_path\x18\x01 \x01(\t\x12\x15\n\rerror_message\x18\x02 \x01(\t\"0\n\nScriptFile\x12\x11\n\tfile_name\x18\x01 \x01(\t\x12\x0f\n\x07\x63ontent\x18\x02 \x01(\t\"r\n\x14\x45xecuteScriptRequest\x12\x16\n\x0escript_content\x18\x01 \x01(\t\x12\x17\n\x0fparameters_json\x18\x02 \x01(\x0c\x12\x0e\n\x06source\x18\x03 \x01(\t\x12\x19\n\x11\x63ompiled_assembly\x18\x04 \x01(\x0c\"2\n\x14StructuredOutputItem\x12\x0c\n\x04type\x18\x01 \x01(\t\x12\x0c\n\x04\x64\x61ta\x18\x02 \x01(\t\"\xd4\x01\n\x15\x45xecuteScriptResponse\x12\x12\n\nis_success\x18\x01 \x01(\x08\x12\x0e\n\x06output\x18\x02 \x01(\t\x12\x15\n\rerror_message\x18\x03 \x01(\t\x12\x15\n\rerror_details\x18\x04 \x03(\t\x12;\n\x11structured_output\x18\x05 \x03(\x0b\x32 .CoreScript.StructuredOutputItem\x12\x15\n\rinternal_data\x18\x06 \x01(\t\x12\x15\n\ragent_summary\x18\x07 \x01(\t\"\x12\n\x10GetStatusRequest\"\xa0\x01\n\x11GetStatusResponse\x12\x1a\n\x12paracore_connected\x18\x01 \x01(\x08\x12\x12\n\nrevit_open\x18\x02 \x01(\x08\x12\x15\n\rrevit_version\x18\x03 \x01(\t\x12\x15\n\rdocument_open\x18\x04 \x01(\x08\x12\x16\n\x0e\x64ocument_title\x18\x05 \x01(\t\x12\x15\n\rdocument_type\x18\x06 \x01(\t\"H\n\x18GetScriptMetadataRequest\x12,\n\x0cscript_files\x18\x01 \x03(\x0b\x32\x16.CoreScript.ScriptFile\"`\n\x19GetScriptMetadataResponse\x12,\n\x08metadata\x18\x01 \x01(\x0b\x32\x1a.CoreScript.ScriptMetadata\x12\x15\n\rerror_message\x18\x02 \x01(\t\"J\n\x1aGetScriptParametersRequest\x12,\n\x0cscript_files\x18\x01 \x03(\x0b\x32\x16.CoreScript.ScriptFile\"\x92\x02\n\x0eScriptMetadata\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x11\n\tfile_path\x18\x02 \x01(\t\x12\x13\n\x0bscript_type\x18\x03 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x04 \x01(\t\x12\x0e\n\x06\x61uthor\x18\x05 \x01(\t\x12\x12\n\ncategories\x18\x06 \x03(\t\x12\x14\n\x0c\x64\x65pendencies\x18\x07 \x03(\t\x12\x15\n\rdocument_type\x18\x08 \x01(\t\x12\x16\n\x0eusage_examples\x18\t \x03(\t\x12\x0f\n\x07website\x18\n \x01(\t\x12\x10\n\x08last_run\x18\x0b \x01(\t\x12\x14\n\x0cis_protected\x18\x0c \x01(\x08\x12\x13\n\x0bis_compiled\x18\r \x01(\x08\"e\n\x1bGetScriptParametersResponse\x12/\n\nparameters\x18\x01 \x03(\x0b\x32\x1b.CoreScript.ScriptParameter\x12\x15\n\rerror_message\x18\x02 \x01(\t\"\xa5\x04\n\x0fScriptParameter\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0c\n\x04type\x18\x02 \x01(\t\x12\x1a\n\x12\x64\x65\x66\x61ult_value_json\x18\x03 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x04 \x01(\t\x12\x0f\n\x07options\x18\x05 \x03(\t\x12\x14\n\x0cmulti_select\x18\x06 \x01(\x08\x12\x14\n\x0cvisible_when\x18\x07 \x01(\t\x12\x14\n\x0cnumeric_type\x18\x08 \x01(\t\x12\x10\n\x03min\x18\t \x01(\x01H\x00\x88\x01\x01\x12\x10\n\x03max\x18\n \x01(\x01H\x01\x88\x01\x01\x12\x11\n\x04step\x18\x0b \x01(\x01H\x02\x88\x01\x01\x12\x18\n\x10is_revit_element\x18\x0c \x01(\x08\x12\x1a\n\x12revit_element_type\x18\r \x01(\t\x12\x1e\n\x16revit_element_category\x18\x0e \x01(\t\x12\x18\n\x10requires_compute\x18\x0f \x01(\x08\x12\r\n\x05group\x18\x10 \x01(\t\x12\x12\n\ninput_type\x18\x11 \x01(\t\x12\x10\n\x08required\x18\x12 \x01(\x08\x12\x0e\n\x06suffix\x18\x13 \x01(\t\x12\x0f\n\x07pattern\x18\x14 \x01(\t\x12\x1a\n\x12\x65nabled_when_param\x18\x15 \x01(\t\x12\x1a\n\x12\x65nabled_when_value\x18\x16 \x01(\t\x12\x0c\n\x04unit\x18\x17 \x01(\t\x12\x16\n\x0eselection_type\x18\x18 \x01(\tB\x06\n\x04_minB\x06\n\x04_maxB\x07\n\x05_step\"]\n\x18GetCombinedScriptRequest\x12,\n\x0cscript_files\x18\x01 \x03(\x0b\x32\x16.CoreScript.ScriptFile\x12\x13\n\x0bscript_path\x18\x02 \x01(\t\"K\n\x19GetCombinedScriptResponse\x12\x17\n\x0f\x63ombined_script\x18\x01 \x01(\t\x12\x15\n\rerror_message\x18\x02 \x01(\t\"\x13\n\x11GetContextRequest\"\xc6\x02\n\x12GetContextResponse\x12\x18\n\x10\x61\x63tive_view_name\x18\x01 \x01(\t\x12\x17\n\x0fselection_count\x18\x02 \x01(\x05\x12\x1c\n\x14selected_element_ids\x18\x03 \x03(\x05\x12-\n\x0cproject_info\x18\x04 \x01(\x0b\x32\x17.CoreScript.ProjectInfo\x12\x18\n\x10\x61\x63tive_view_type\x18\x05 \x01(\t\x12\x19\n\x11\x61\x63tive_view_scale\x18\x06 \x01(\x05\x12 \n\x18\x61\x63tive_view_detail_level\x18\x07 \x01(\t\x12\x32\n\x11selected_elements\x18\x08 \x03(\x0b\x32\x17.CoreScript.ElementInfo\x12%\n\x06levels\x18\t \x03(\x0b\x32\x15.CoreScript.LevelInfo\"8\n\tLevelInfo\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x11\n\televation\x18\x03 \x01(\x01\"+\n\x0b\x45lementInfo\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x10\n\x08\x63\x61tegory\x18\x02 \x01(\t\"v\n\x0bProjectInfo\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0e\n\x06number\x18\x02 \x01(\t\x12\r\n\x05title\x18\x03 \x01(\t\x12\x11\n\tfile_path\x18\x04 \x01(\t\x12\x15\n\ris_workshared\x18\x05 \x01(\x08\x12\x10\n\x08username\x18\x06 \x01(\t\"/\n\x18GetScriptManifestRequest\x12\x13\n\x0bscript_path\x18\x01 \x01(\t\"I\n\x19GetScriptManifestResponse\x12\x15\n\rmanifest_json\x18\x01 \x01(\t\x12\x15\n\rerror_message\x18\x02 \x01(\t\"0\n\x19ValidateWorkingSetRequest\x12\x13\n\x0b\x65lement_ids\x18\x01 \x03(\x03\"7\n\x1aValidateWorkingSetResponse\x12\x19\n\x11valid_element_ids\x18\x01 \x03(\x03\"P\n\x1e\x43omputeParameterOptionsRequest\x12\x16\n\x0escript_content\x18\x01 \x01(\t\x12\x16\n\x0eparameter_name\x18\x02 \x01(\t\"\xad\x01\n\x1f\x43omputeParameterOptionsResponse\x12\x0f\n\x07options\x18\x01 \x03(\t\x12\x12\n\nis_success\x18\x02 \x01(\x08\x12\x15\n\rerror_message\x18\x03 \x01(\t\x12\x10\n\x03min\x18\x04 \x01(\x01H\x00\x88\x01\x01\x12\x10\n\x03max\x18\x05 \x01(\x01H\x01\x88\x01\x01\x12\x11\n\x04step\x18\x06 \x01(\x01H\x02\x88\x01\x01\x42\x06\n\x04_minB\x06\n\x04_maxB\x07\n\x05_step\"9\n\x13RenameScriptRequest\x12\x10\n\x08old_path\x18\x01 \x01(\t\x12\x10\n\x08new_name\x18\x02 \x01(\t\"S\n\x14RenameScriptResponse\x12\x12\n\nis_success\x18\x01 \x01(\x08\x12\x10\n\x08new_path\x18\x02 \x01(\t\x12\x15\n\rerror_message\x18\x03 \x01(\t\",\n\x12\x42uildScriptRequest\x12\x16\n\x0escript_content\x18\x01 \x01(\t\"[\n\x13\x42uildScriptResponse\x12\x12\n\nis_success\x18\x01 \x01(\x08\x12\x19\n\x11\x63ompiled_assembly\x18\x02 \x01(\x0c\x12\x15\n\rerror_message\x18\x03 \x01(\t2\x92\n\n\x10\x43oreScriptRunner\x12T\n\rExecuteScript\x12 .CoreScript.ExecuteScriptRequest\x1a!.CoreScript.ExecuteScriptResponse\x12H\n\tGetStatus\x12\x1c.CoreScript.GetStatusRequest\x1a\x1d.CoreScript.GetStatusResponse\x12`\n\x11GetScriptMetadata\x12$.CoreScript.GetScriptMetadataRequest\x1a%.CoreScript.GetScriptMetadataResponse\x12\x66\n\x13GetScriptParameters\x12&.CoreScript.GetScriptParametersRequest\x1a\'.CoreScript.GetScriptParametersResponse\x12`\n\x11GetCombinedScript\x12$.CoreScript.GetCombinedScriptRequest\x1a%.CoreScript.GetCombinedScriptResponse\x12K\n\nGetContext\x12\x1d.CoreScript.GetContextRequest\x1a\x1e.CoreScript.GetContextResponse\x12\x61\n\x16\x43reateAndOpenWorkspace\x12\".CoreScript.CreateWorkspaceRequest\x1a#.CoreScript.CreateWorkspaceResponse\x12`\n\x11GetScriptManifest\x12$.CoreScript.GetScriptManifestRequest\x1a%.CoreScript.GetScriptManifestResponse\x12\x63\n\x12ValidateWorkingSet\x12%.CoreScript.ValidateWorkingSetRequest\x1a&.CoreScript.ValidateWorkingSetResponse\x12r\n\x17\x43omputeParameterOptions\x12*.CoreScript.ComputeParameterOptionsRequest\x1a+.CoreScript.ComputeParameterOptionsResponse\x12W\n\x0eSelectElements\x12!.CoreScript.SelectElementsRequest\x1a\".CoreScript.SelectElementsResponse\x12K\n\nPickObject\x12\x1d.CoreScript.PickObjectRequest\x1a\x1e.CoreScript.PickObjectResponse\x12Q\n\x0cRenameScript\x12\x1f.CoreScript.RenameScriptRequest\x1a .CoreScript.RenameScriptResponse\x12N\n\x0b\x42uildScript\x12\x1e.CoreScript.BuildScriptRequest\x1a\x1f.CoreScript.BuildScriptResponseb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x10\x63orescript.proto\x12\nCoreScript\"D\n\x11PickObjectRequest\x12\x16\n\x0eselection_type\x18\x01 \x01(\t\x12\x17\n\x0f\x63\x61tegory_filter\x18\x02 \x01(\t\"a\n\x12PickObjectResponse\x12\r\n\x05value\x18\x01 \x01(\t\x12\x12\n\nis_success\x18\x02 \x01(\x08\x12\x11\n\tcancelled\x18\x03 \x01(\x08\x12\x15\n\rerror_message\x18\x04 \x01(\t\",\n\x15SelectElementsRequest\x12\x13\n\x0b\x65lement_ids\x18\x01 \x03(\x03\"C\n\x16SelectElementsResponse\x12\x12\n\nis_success\x18\x01 \x01(\x08\x12\x15\n\rerror_message\x18\x02 \x01(\t\"B\n\x16\x43reateWorkspaceRequest\x12\x13\n\x0bscript_path\x18\x01 \x01(\t\x12\x13\n\x0bscript_type\x18\x02 \x01(\t\"H\n\x17\x43reateWorkspaceResponse\x12\x16\n\x0eworkspace_path\x18\x01 \x01(\t\x12\x15\n\rerror_message\x18\x02 \x01(\t\"0\n\nScriptFile\x12\x11\n\tfile_name\x18\x01 \x01(\t\x12\x0f\n\x07\x63ontent\x18\x02 \x01(\t\"r\n\x14\x45xecuteScriptRequest\x12\x16\n\x0escript_content\x18\x01 \x01(\t\x12\x17\n\x0fparameters_json\x18\x02 \x01(\x0c\x12\x0e\n\x06source\x18\x03 \x01(\t\x12\x19\n\x11\x63ompiled_assembly\x18\x04 \x01(\x0c\"2\n\x14StructuredOutputItem\x12\x0c\n\x04type\x18\x01 \x01(\t\x12\x0c\n\x04\x64\x61ta\x18\x02 \x01(\t\"\xd4\x01\n\x15\x45xecuteScriptResponse\x12\x12\n\nis_success\x18\x01 \x01(\x08\x12\x0e\n\x06output\x18\x02 \x01(\t\x12\x15\n\rerror_message\x18\x03 \x01(\t\x12\x15\n\rerror_details\x18\x04 \x03(\t\x12;\n\x11structured_output\x18\x05 \x03(\x0b\x32 .CoreScript.StructuredOutputItem\x12\x15\n\rinternal_data\x18\x06 \x01(\t\x12\x15\n\ragent_summary\x18\x07 \x01(\t\"-\n\rConsoleOutput\x12\x0c\n\x04text\x18\x01 \x01(\t\x12\x0e\n\x06\x61ppend\x18\x02 \x01(\x08\"\xc6\x01\n\x18\x45xecuteScriptStreamChunk\x12+\n\x06output\x18\x01 \x01(\x0b\x32\x19.CoreScript.ConsoleOutputH\x00\x12=\n\x11structured_output\x18\x02 \x01(\x0b\x32 .CoreScript.StructuredOutputItemH\x00\x12\x33\n\x06result\x18\x03 \x01(\x0b\x32!.CoreScript.ExecuteScriptResponseH\x00\x42\t\n\x07payload\"\x12\n\x10GetStatusRequest\"\xce\x01\n\x11GetStatusResponse\x12\x1a\n\x12paracore_connected\x18\x01 \x01(\x08\x12\x12\n\nrevit_open\x18\x02 \x01(\x08\x12\x15\n\rrevit_version\x18\x03 \x01(\t\x12\x15\n\rdocument_open\x18\x04 \x01(\x08\x12\x16\n\x0e\x64ocument_title\x18\x05 \x01(\t\x12\x15\n\rdocument_type\x18\x06 \x01(\t\x12\x16\n\x0e\x65ngine_version\x18\x07 \x01(\t\x12\x14\n\x0c\x65ngine_build\x18\x08 \x01(\t\"H\n\x18GetScriptMetadataRequest\x12,\n\x0cscript_files\x18\x01 \x03(\x0b\x32\x16.CoreScript.ScriptFile\"`\n\x19GetScriptMetadataResponse\x12,\n\x08metadata\x18\x01 \x01(\x0b\x32\x1a.CoreScript.ScriptMetadata\x12\x15\n\rerror_message\x18\x02 \x01(\t\"J\n\x1aGetScriptParametersRequest\x12,\n\x0cscript_files\x18\x01 \x03(\x0b\x32\x16.CoreScript.ScriptFile\"\x92\x02\n\x0eScriptMetadata\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x11\n\tfile_path\x18\x02 \x01(\t\x12\x13\n\x0bscript_type\x18\x03 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x04 \x01(\t\x12\x0e\n\x06\x61uthor\x18\x05 \x01(\t\x12\x12\n\ncategories\x18\x06 \x03(\t\x12\x14\n\x0c\x64\x65pendencies\x18\x07 \x03(\t\x12\x15\n\rdocument_type\x18\x08 \x01(\t\x12\x16\n\x0eusage_examples\x18\t \x03(\t\x12\x0f\n\x07website\x18\n \x01(\t\x12\x10\n\x08last_run\x18\x0b \x01(\t\x12\x14\n\x0cis_protected\x18\x0c \x01(\x08\x12\x13\n\x0bis_compiled\x18\r \x01(\x08\"e\n\x1bGetScriptParametersResponse\x12/\n\nparameters\x18\x01 \x03(\x0b\x32\x1b.CoreScript.ScriptParameter\x12\x15\n\rerror_message\x18\x02 \x01(\t\"\xa5\x04\n\x0fScriptParameter\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0c\n\x04type\x18\x02 \x01(\t\x12\x1a\n\x12\x64\x65\x66\x61ult_value_json\x18\x03 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x04 \x01(\t\x12\x0f\n\x07options\x18\x05 \x03(\t\x12\x14\n\x0cmulti_select\x18\x06 \x01(\x08\x12\x14\n\x0cvisible_when\x18\x07 \x01(\t\x12\x14\n\x0cnumeric_type\x18\x08 \x01(\t\x12\x10\n\x03min\x18\t \x01(\x01H\x00\x88\x01\x01\x12\x10\n\x03max\x18\n \x01(\x01H\x01\x88\x01\x01\x12\x11\n\x04step\x18\x0b \x01(\x01H\x02\x88\x01\x01\x12\x18\n\x10is_revit_element\x18\x0c \x01(\x08\x12\x1a\n\x12revit_element_type\x18\r \x01(\t\x12\x1e\n\x16revit_element_category\x18\x0e \x01(\t\x12\x18\n\x10requires_compute\x18\x0f \x01(\x08\x12\r\n\x05group\x18\x10 \x01(\t\x12\x12\n\ninput_type\x18\x11 \x01(\t\x12\x10\n\x08required\x18\x12 \x01(\x08\x12\x0e\n\x06suffix\x18\x13 \x01(\t\x12\x0f\n\x07pattern\x18\x14 \x01(\t\x12\x1a\n\x12\x65nabled_when_param\x18\x15 \x01(\t\x12\x1a\n\x12\x65nabled_when_value\x18\x16 \x01(\t\x12\x0c\n\x04unit\x18\x17 \x01(\t\x12\x16\n\x0eselection_type\x18\x18 \x01(\tB\x06\n\x04_minB\x06\n\x04_maxB\x07\n\x05_step\"F\n\nScriptUnit\x12\n\n\x02id\x18\x01 \x01(\t\x12,\n\x0cscript_files\x18\x02 \x03(\x0b\x32\x16.CoreScript.ScriptFile\"b\n\x1dGetScriptMetadataBatchRequest\x12%\n\x05units\x18\x01 \x03(\x0b\x32\x16.CoreScript.ScriptUnit\x12\x1a\n\x12include_parameters\x18\x02 \x01(\x08\"\x98\x01\n\x14ScriptMetadataResult\x12\n\n\x02id\x18\x01 \x01(\t\x12,\n\x08metadata\x18\x02 \x01(\x0b\x32\x1a.CoreScript.ScriptMetadata\x12/\n\nparameters\x18\x03 \x03(\x0b\x32\x1b.CoreScript.ScriptParameter\x12\x15\n\rerror_message\x18\x04 \x01(\t\"j\n\x1eGetScriptMetadataBatchResponse\x12\x31\n\x07results\x18\x01 \x03(\x0b\x32 .CoreScript.ScriptMetadataResult\x12\x15\n\rerror_message\x18\x02 \x01(\t\"]\n\x18GetCombinedScriptRequest\x12,\n\x0cscript_files\x18\x01 \x03(\x0b\x32\x16.CoreScript.ScriptFile\x12\x13\n\x0bscript_path\x18\x02 \x01(\t\"K\n\x19GetCombinedScriptResponse\x12\x17\n\x0f\x63ombined_script\x18\x01 \x01(\t\x12\x15\n\rerror_message\x18\x02 \x01(\t\"\x13\n\x11GetContextRequest\"\xc6\x02\n\x12GetContextResponse\x12\x18\n\x10\x61\x63tive_view_name\x18\x01 \x01(\t\x12\x17\n\x0fselection_count\x18\x02 \x01(\x05\x12\x1c\n\x14selected_element_ids\x18\x03 \x03(\x05\x12-\n\x0cproject_info\x18\x04 \x01(\x0b\x32\x17.CoreScript.ProjectInfo\x12\x18\n\x10\x61\x63tive_view_type\x18\x05 \x01(\t\x12\x19\n\x11\x61\x63tive_view_scale\x18\x06 \x01(\x05\x12 \n\x18\x61\x63tive_view_detail_level\x18\x07 \x01(\t\x12\x32\n\x11selected_elements\x18\x08 \x03(\x0b\x32\x17.CoreScript.ElementInfo\x12%\n\x06levels\x18\t \x03(\x0b\x32\x15.CoreScript.LevelInfo\"8\n\tLevelInfo\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x11\n\televation\x18\x03 \x01(\x01\"+\n\x0b\x45lementInfo\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x10\n\x08\x63\x61tegory\x18\x02 \x01(\t\"v\n\x0bProjectInfo\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0e\n\x06number\x18\x02 \x01(\t\x12\r\n\x05title\x18\x03 \x01(\t\x12\x11\n\tfile_path\x18\x04 \x01(\t\x12\x15\n\ris_workshared\x18\x05 \x01(\x08\x12\x10\n\x08username\x18\x06 \x01(\t\"/\n\x18GetScriptManifestRequest\x12\x13\n\x0bscript_path\x18\x01 \x01(\t\"I\n\x19GetScriptManifestResponse\x12\x15\n\rmanifest_json\x18\x01 \x01(\t\x12\x15\n\rerror_message\x18\x02 \x01(\t\"\xbe\x01\n\x13ScriptManifestEntry\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0c\n\x04type\x18\x02 \x01(\t\x12\x15\n\rabsolute_path\x18\x03 \x01(\t\x12,\n\x08metadata\x18\x04 \x01(\x0b\x32\x1a.CoreScript.ScriptMetadata\x12/\n\nparameters\x18\x05 \x03(\x0b\x32\x1b.CoreScript.ScriptParameter\x12\x15\n\rerror_message\x18\x06 \x01(\t\"0\n\x19ValidateWorkingSetRequest\x12\x13\n\x0b\x65lement_ids\x18\x01 \x03(\x03\"7\n\x1aValidateWorkingSetResponse\x12\x19\n\x11valid_element_ids\x18\x01 \x03(\x03\"P\n\x1e\x43omputeParameterOptionsRequest\x12\x16\n\x0escript_content\x18\x01 \x01(\t\x12\x16\n\x0eparameter_name\x18\x02 \x01(\t\"\xad\x01\n\x1f\x43omputeParameterOptionsResponse\x12\x0f\n\x07options\x18\x01 \x03(\t\x12\x12\n\nis_success\x18\x02 \x01(\x08\x12\x15\n\rerror_message\x18\x03 \x01(\t\x12\x10\n\x03min\x18\x04 \x01(\x01H\x00\x88\x01\x01\x12\x10\n\x03max\x18\x05 \x01(\x01H\x01\x88\x01\x01\x12\x11\n\x04step\x18\x06 \x01(\x01H\x02\x88\x01\x01\x42\x06\n\x04_minB\x06\n\x04_maxB\x07\n\x05_step\"T\n\x15ParameterOptionsQuery\x12\n\n\x02id\x18\x01 \x01(\t\x12\x16\n\x0escript_content\x18\x02 \x01(\t\x12\x17\n\x0fparameter_names\x18\x03 \x03(\t\"Y\n#ComputeParameterOptionsBatchRequest\x12\x32\n\x07scripts\x18\x01 \x03(\x0b\x32!.CoreScript.ParameterOptionsQuery\"y\n\x16ParameterOptionsResult\x12\n\n\x02id\x18\x01 \x01(\t\x12\x16\n\x0eparameter_name\x18\x02 \x01(\t\x12;\n\x06result\x18\x03 \x01(\x0b\x32+.CoreScript.ComputeParameterOptionsResponse\"r\n$ComputeParameterOptionsBatchResponse\x12\x33\n\x07results\x18\x01 \x03(\x0b\x32\".CoreScript.ParameterOptionsResult\x12\x15\n\rerror_message\x18\x02 \x01(\t\"9\n\x13RenameScriptRequest\x12\x10\n\x08old_path\x18\x01 \x01(\t\x12\x10\n\x08new_name\x18\x02 \x01(\t\"S\n\x14RenameScriptResponse\x12\x12\n\nis_success\x18\x01 \x01(\x08\x12\x10\n\x08new_path\x18\x02 \x01(\t\x12\x15\n\rerror_message\x18\x03 \x01(\t\",\n\x12\x42uildScriptRequest\x12\x16\n\x0escript_content\x18\x01 \x01(\t\"[\n\x13\x42uildScriptResponse\x12\x12\n\nis_success\x18\x01 \x01(\x08\x12\x19\n\x11\x63ompiled_assembly\x18\x02 \x01(\x0c\x12\x15\n\rerror_message\x18\x03 \x01(\t2\xc9\r\n\x10\x43oreScriptRunner\x12T\n\rExecuteScript\x12 .CoreScript.ExecuteScriptRequest\x1a!.CoreScript.ExecuteScriptResponse\x12_\n\x13\x45xecuteScriptStream\x12 .CoreScript.ExecuteScriptRequest\x1a$.CoreScript.ExecuteScriptStreamChunk0\x01\x12H\n\tGetStatus\x12\x1c.CoreScript.GetStatusRequest\x1a\x1d.CoreScript.GetStatusResponse\x12`\n\x11GetScriptMetadata\x12$.CoreScript.GetScriptMetadataRequest\x1a%.CoreScript.GetScriptMetadataResponse\x12\x66\n\x13GetScriptParameters\x12&.CoreScript.GetScriptParametersRequest\x1a\'.CoreScript.GetScriptParametersResponse\x12`\n\x11GetCombinedScript\x12$.CoreScript.GetCombinedScriptRequest\x1a%.CoreScript.GetCombinedScriptResponse\x12K\n\nGetContext\x12\x1d.CoreScript.GetContextRequest\x1a\x1e.CoreScript.GetContextResponse\x12\x61\n\x16\x43reateAndOpenWorkspace\x12\".CoreScript.CreateWorkspaceRequest\x1a#.CoreScript.CreateWorkspaceResponse\x12`\n\x11GetScriptManifest\x12$.CoreScript.GetScriptManifestRequest\x1a%.CoreScript.GetScriptManifestResponse\x12_\n\x14StreamScriptManifest\x12$.CoreScript.GetScriptManifestRequest\x1a\x1f.CoreScript.ScriptManifestEntry0\x01\x12\x63\n\x12ValidateWorkingSet\x12%.CoreScript.ValidateWorkingSetRequest\x1a&.CoreScript.ValidateWorkingSetResponse\x12r\n\x17\x43omputeParameterOptions\x12*.CoreScript.ComputeParameterOptionsRequest\x1a+.CoreScript.ComputeParameterOptionsResponse\x12W\n\x0eSelectElements\x12!.CoreScript.SelectElementsRequest\x1a\".CoreScript.SelectElementsResponse\x12K\n\nPickObject\x12\x1d.CoreScript.PickObjectRequest\x1a\x1e.CoreScript.PickObjectResponse\x12Q\n\x0cRenameScript\x12\x1f.CoreScript.RenameScriptRequest\x1a .CoreScript.RenameScriptResponse\x12N\n\x0b\x42uildScript\x12\x1e.CoreScript.BuildScriptRequest\x1a\x1f.CoreScript.BuildScriptResponse\x12o\n\x16GetScriptMetadataBatch\x12).CoreScript.GetScriptMetadataBatchRequest\x1a*.CoreScript.GetScriptMetadataBatchResponse\x12\x81\x01\n\x1c\x43omputeParameterOptionsBatch\x12/.CoreScript.ComputeParameterOptionsBatchRequest\x1a\x30.CoreScript.ComputeParameterOptionsBatchResponseb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -51,56 +51,78 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_STRUCTUREDOUTPUTITEM']._serialized_end=674
   _globals['_EXECUTESCRIPTRESPONSE']._serialized_start=677
   _globals['_EXECUTESCRIPTRESPONSE']._serialized_end=889
-  _globals['_GETSTATUSREQUEST']._serialized_start=891
-  _globals['_GETSTATUSREQUEST']._serialized_end=909
-  _globals['_GETSTATUSRESPONSE']._serialized_start=912
-  _globals['_GETSTATUSRESPONSE']._serialized_end=1072
-  _globals['_GETSCRIPTMETADATAREQUEST']._serialized_start=1074
-  _globals['_GETSCRIPTMETADATAREQUEST']._serialized_end=1146
-  _globals['_GETSCRIPTMETADATARESPONSE']._serialized_start=1148
-  _globals['_GETSCRIPTMETADATARESPONSE']._serialized_end=1244
-  _globals['_GETSCRIPTPARAMETERSREQUEST']._serialized_start=1246
-  _globals['_GETSCRIPTPARAMETERSREQUEST']._serialized_end=1320
-  _globals['_SCRIPTMETADATA']._serialized_start=1323
-  _globals['_SCRIPTMETADATA']._serialized_end=1597
-  _globals['_GETSCRIPTPARAMETERSRESPONSE']._serialized_start=1599
-  _globals['_GETSCRIPTPARAMETERSRESPONSE']._serialized_end=1700
-  _globals['_SCRIPTPARAMETER']._serialized_start=1703
-  _globals['_SCRIPTPARAMETER']._serialized_end=2252
-  _globals['_GETCOMBINEDSCRIPTREQUEST']._serialized_start=2254
-  _globals['_GETCOMBINEDSCRIPTREQUEST']._serialized_end=2347
-  _globals['_GETCOMBINEDSCRIPTRESPONSE']._serialized_start=2349
-  _globals['_GETCOMBINEDSCRIPTRESPONSE']._serialized_end=2424
-  _globals['_GETCONTEXTREQUEST']._serialized_start=2426
-  _globals['_GETCONTEXTREQUEST']._serialized_end=2445
-  _globals['_GETCONTEXTRESPONSE']._serialized_start=2448
-  _globals['_GETCONTEXTRESPONSE']._serialized_end=2774
-  _globals['_LEVELINFO']._serialized_start=2776
-  _globals['_LEVELINFO']._serialized_end=2832
-  _globals['_ELEMENTINFO']._serialized_start=2834
-  _globals['_ELEMENTINFO']._serialized_end=2877
-  _globals['_PROJECTINFO']._serialized_start=2879
-  _globals['_PROJECTINFO']._serialized_end=2997
-  _globals['_GETSCRIPTMANIFESTREQUEST']._serialized_start=2999
-  _globals['_GETSCRIPTMANIFESTREQUEST']._serialized_end=3046
-  _globals['_GETSCRIPTMANIFESTRESPONSE']._serialized_start=3048
-  _globals['_GETSCRIPTMANIFESTRESPONSE']._serialized_end=3121
-  _globals['_VALIDATEWORKINGSETREQUEST']._serialized_start=3123
-  _globals['_VALIDATEWORKINGSETREQUEST']._serialized_end=3171
-  _globals['_VALIDATEWORKINGSETRESPONSE']._serialized_start=3173
-  _globals['_VALIDATEWORKINGSETRESPONSE']._serialized_end=3228
-  _globals['_COMPUTEPARAMETEROPTIONSREQUEST']._serialized_start=3230
-  _globals['_COMPUTEPARAMETEROPTIONSREQUEST']._serialized_end=3310
-  _globals['_COMPUTEPARAMETEROPTIONSRESPONSE']._serialized_start=3313
-  _globals['_COMPUTEPARAMETEROPTIONSRESPONSE']._serialized_end=3486
-  _globals['_RENAMESCRIPTREQUEST']._serialized_start=3488
-  _globals['_RENAMESCRIPTREQUEST']._serialized_end=3545
-  _globals['_RENAMESCRIPTRESPONSE']._serialized_start=3547
-  _globals['_RENAMESCRIPTRESPONSE']._serialized_end=3630
-  _globals['_BUILDSCRIPTREQUEST']._serialized_start=3632
-  _globals['_BUILDSCRIPTREQUEST']._serialized_end=3676
-  _globals['_BUILDSCRIPTRESPONSE']._serialized_start=3678
-  _globals['_BUILDSCRIPTRESPONSE']._serialized_end=3769
-  _globals['_CORESCRIPTRUNNER']._serialized_start=3772
-  _globals['_CORESCRIPTRUNNER']._serialized_end=5070
+  _globals['_CONSOLEOUTPUT']._serialized_start=891
+  _globals['_CONSOLEOUTPUT']._serialized_end=936
+  _globals['_EXECUTESCRIPTSTREAMCHUNK']._serialized_start=939
+  _globals['_EXECUTESCRIPTSTREAMCHUNK']._serialized_end=1137
+  _globals['_GETSTATUSREQUEST']._serialized_start=1139
+  _globals['_GETSTATUSREQUEST']._serialized_end=1157
+  _globals['_GETSTATUSRESPONSE']._serialized_start=1160
+  _globals['_GETSTATUSRESPONSE']._serialized_end=1366
+  _globals['_GETSCRIPTMETADATAREQUEST']._serialized_start=1368
+  _globals['_GETSCRIPTMETADATAREQUEST']._serialized_end=1440
+  _globals['_GETSCRIPTMETADATARESPONSE']._serialized_start=1442
+  _globals['_GETSCRIPTMETADATARESPONSE']._serialized_end=1538
+  _globals['_GETSCRIPTPARAMETERSREQUEST']._serialized_start=1540
+  _globals['_GETSCRIPTPARAMETERSREQUEST']._serialized_end=1614
+  _globals['_SCRIPTMETADATA']._serialized_start=1617
+  _globals['_SCRIPTMETADATA']._serialized_end=1891
+  _globals['_GETSCRIPTPARAMETERSRESPONSE']._serialized_start=1893
+  _globals['_GETSCRIPTPARAMETERSRESPONSE']._serialized_end=1994
+  _globals['_SCRIPTPARAMETER']._serialized_start=1997
+  _globals['_SCRIPTPARAMETER']._serialized_end=2546
+  _globals['_SCRIPTUNIT']._serialized_start=2548
+  _globals['_SCRIPTUNIT']._serialized_end=2618
+  _globals['_GETSCRIPTMETADATABATCHREQUEST']._serialized_start=2620
+  _globals['_GETSCRIPTMETADATABATCHREQUEST']._serialized_end=2718
+  _globals['_SCRIPTMETADATARESULT']._serialized_start=2721
+  _globals['_SCRIPTMETADATARESULT']._serialized_end=2873
+  _globals['_GETSCRIPTMETADATABATCHRESPONSE']._serialized_start=2875
+  _globals['_GETSCRIPTMETADATABATCHRESPONSE']._serialized_end=2981
+  _globals['_GETCOMBINEDSCRIPTREQUEST']._serialized_start=2983
+  _globals['_GETCOMBINEDSCRIPTREQUEST']._serialized_end=3076
+  _globals['_GETCOMBINEDSCRIPTRESPONSE']._serialized_start=3078
+  _globals['_GETCOMBINEDSCRIPTRESPONSE']._serialized_end=3153
+  _globals['_GETCONTEXTREQUEST']._serialized_start=3155
+  _globals['_GETCONTEXTREQUEST']._serialized_end=3174
+  _globals['_GETCONTEXTRESPONSE']._serialized_start=3177
+  _globals['_GETCONTEXTRESPONSE']._serialized_end=3503
+  _globals['_LEVELINFO']._serialized_start=3505
+  _globals['_LEVELINFO']._serialized_end=3561
+  _globals['_ELEMENTINFO']._serialized_start=3563
+  _globals['_ELEMENTINFO']._serialized_end=3606
+  _globals['_PROJECTINFO']._serialized_start=3608
+  _globals['_PROJECTINFO']._serialized_end=3726
+  _globals['_GETSCRIPTMANIFESTREQUEST']._serialized_start=3728
+  _globals['_GETSCRIPTMANIFESTREQUEST']._serialized_end=3775
+  _globals['_GETSCRIPTMANIFESTRESPONSE']._serialized_start=3777
+  _globals['_GETSCRIPTMANIFESTRESPONSE']._serialized_end=3850
+  _globals['_SCRIPTMANIFESTENTRY']._serialized_start=3853
+  _globals['_SCRIPTMANIFESTENTRY']._serialized_end=4043
+  _globals['_VALIDATEWORKINGSETREQUEST']._serialized_start=4045
+  _globals['_VALIDATEWORKINGSETREQUEST']._serialized_end=4093
+  _globals['_VALIDATEWORKINGSETRESPONSE']._serialized_start=4095
+  _globals['_VALIDATEWORKINGSETRESPONSE']._serialized_end=4150
+  _globals['_COMPUTEPARAMETEROPTIONSREQUEST']._serialized_start=4152
+  _globals['_COMPUTEPARAMETEROPTIONSREQUEST']._serialized_end=4232
+  _globals['_COMPUTEPARAMETEROPTIONSRESPONSE']._serialized_start=4235
+  _globals['_COMPUTEPARAMETEROPTIONSRESPONSE']._serialized_end=4408
+  _globals['_PARAMETEROPTIONSQUERY']._serialized_start=4410
+  _globals['_PARAMETEROPTIONSQUERY']._serialized_end=4494
+  _globals['_COMPUTEPARAMETEROPTIONSBATCHREQUEST']._serialized_start=4496
+  _globals['_COMPUTEPARAMETEROPTIONSBATCHREQUEST']._serialized_end=4585
+  _globals['_PARAMETEROPTIONSRESULT']._serialized_start=4587
+  _globals['_PARAMETEROPTIONSRESULT']._serialized_end=4708
+  _globals['_COMPUTEPARAMETEROPTIONSBATCHRESPONSE']._serialized_start=4710
+  _globals['_COMPUTEPARAMETEROPTIONSBATCHRESPONSE']._serialized_end=4824
+  _globals['_RENAMESCRIPTREQUEST']._serialized_start=4826
+  _globals['_RENAMESCRIPTREQUEST']._serialized_end=4883
+  _globals['_RENAMESCRIPTRESPONSE']._serialized_start=4885
+  _globals['_RENAMESCRIPTRESPONSE']._serialized_end=4968
+  _globals['_BUILDSCRIPTREQUEST']._serialized_start=4970
+  _globals['_BUILDSCRIPTREQUEST']._serialized_end=5014
+  _globals['_BUILDSCRIPTRESPONSE']._serialized_start=5016
+  _globals['_BUILDSCRIPTRESPONSE']._serialized_end=5107
+  _globals['_CORESCRIPTRUNNER']._serialized_start=5110
+  _globals['_CORESCRIPTRUNNER']._serialized_end=6847
 # @@protoc_insertion_point(module_scope)
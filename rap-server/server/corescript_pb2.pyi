@@ -10,6 +10,40 @@ from google.protobuf.internal import containers as _containers
 
 DESCRIPTOR: _descriptor.FileDescriptor
 
+class PickObjectRequest(_message.Message):
+    __slots__ = ("selection_type", "category_filter")
+    SELECTION_TYPE_FIELD_NUMBER: _ClassVar[int]
+    CATEGORY_FILTER_FIELD_NUMBER: _ClassVar[int]
+    selection_type: str
+    category_filter: str
+    def __init__(self, selection_type: _Optional[str] = ..., category_filter: _Optional[str] = ...) -> None: ...
+
+class PickObjectResponse(_message.Message):
+    __slots__ = ("value", "is_success", "cancelled", "error_message")
+    VALUE_FIELD_NUMBER: _ClassVar[int]
+    IS_SUCCESS_FIELD_NUMBER: _ClassVar[int]
+    CANCELLED_FIELD_NUMBER: _ClassVar[int]
+    ERROR_MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    value: str
+    is_success: bool
+    cancelled: bool
+    error_message: str
+    def __init__(self, value: _Optional[str] = ..., is_success: bool = ..., cancelled: bool = ..., error_message: _Optional[str] = ...) -> None: ...
+
+class SelectElementsRequest(_message.Message):
+    __slots__ = ("element_ids",)
+    ELEMENT_IDS_FIELD_NUMBER: _ClassVar[int]
+    element_ids: _containers.RepeatedScalarFieldContainer[int]
+    def __init__(self, element_ids: _Optional[_Iterable[int]] = ...) -> None: ...
+
+class SelectElementsResponse(_message.Message):
+    __slots__ = ("is_success", "error_message")
+    IS_SUCCESS_FIELD_NUMBER: _ClassVar[int]
+    ERROR_MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    is_success: bool
+    error_message: str
+    def __init__(self, is_success: bool = ..., error_message: _Optional[str] = ...) -> None: ...
+
 class CreateWorkspaceRequest(_message.Message):
     __slots__ = ("script_path", "script_type")
     SCRIPT_PATH_FIELD_NUMBER: _ClassVar[int]
@@ -35,14 +69,16 @@ class ScriptFile(_message.Message):
     def __init__(self, file_name: _Optional[str] = ..., content: _Optional[str] = ...) -> None: ...
 
 class ExecuteScriptRequest(_message.Message):
-    __slots__ = ("script_content", "parameters_json", "source")
+    __slots__ = ("script_content", "parameters_json", "source", "compiled_assembly")
     SCRIPT_CONTENT_FIELD_NUMBER: _ClassVar[int]
     PARAMETERS_JSON_FIELD_NUMBER: _ClassVar[int]
     SOURCE_FIELD_NUMBER: _ClassVar[int]
+    COMPILED_ASSEMBLY_FIELD_NUMBER: _ClassVar[int]
     script_content: str
     parameters_json: bytes
     source: str
-    def __init__(self, script_content: _Optional[str] = ..., parameters_json: _Optional[bytes] = ..., source: _Optional[str] = ...) -> None: ...
+    compiled_assembly: bytes
+    def __init__(self, script_content: _Optional[str] = ..., parameters_json: _Optional[bytes] = ..., source: _Optional[str] = ..., compiled_assembly: _Optional[bytes] = ...) -> None: ...
 
 class StructuredOutputItem(_message.Message):
     __slots__ = ("type", "data")
@@ -70,25 +106,47 @@ class ExecuteScriptResponse(_message.Message):
     agent_summary: str
     def __init__(self, is_success: bool = ..., output: _Optional[str] = ..., error_message: _Optional[str] = ..., error_details: _Optional[_Iterable[str]] = ..., structured_output: _Optional[_Iterable[_Union[StructuredOutputItem, _Mapping]]] = ..., internal_data: _Optional[str] = ..., agent_summary: _Optional[str] = ...) -> None: ...
 
+class ConsoleOutput(_message.Message):
+    __slots__ = ("text", "append")
+    TEXT_FIELD_NUMBER: _ClassVar[int]
+    APPEND_FIELD_NUMBER: _ClassVar[int]
+    text: str
+    append: bool
+    def __init__(self, text: _Optional[str] = ..., append: bool = ...) -> None: ...
+
+class ExecuteScriptStreamChunk(_message.Message):
+    __slots__ = ("output", "structured_output", "result")
+    OUTPUT_FIELD_NUMBER: _ClassVar[int]
+    STRUCTURED_OUTPUT_FIELD_NUMBER: _ClassVar[int]
+    RESULT_FIELD_NUMBER: _ClassVar[int]
+    output: ConsoleOutput
+    structured_output: StructuredOutputItem
+    result: ExecuteScriptResponse
+    def __init__(self, output: _Optional[_Union[ConsoleOutput, _Mapping]] = ..., structured_output: _Optional[_Union[StructuredOutputItem, _Mapping]] = ..., result: _Optional[_Union[ExecuteScriptResponse, _Mapping]] = ...) -> None: ...
+
 class GetStatusRequest(_message.Message):
     __slots__ = ()
     def __init__(self) -> None: ...
 
 class GetStatusResponse(_message.Message):
-    __slots__ = ("rserver_connected", "revit_open", "revit_version", "document_open", "document_title", "document_type")
-    RSERVER_CONNECTED_FIELD_NUMBER: _ClassVar[int]
+    __slots__ = ("paracore_connected", "revit_open", "revit_version", "document_open", "document_title", "document_type", "engine_version", "engine_build")
+    PARACORE_CONNECTED_FIELD_NUMBER: _ClassVar[int]
     REVIT_OPEN_FIELD_NUMBER: _ClassVar[int]
     REVIT_VERSION_FIELD_NUMBER: _ClassVar[int]
     DOCUMENT_OPEN_FIELD_NUMBER: _ClassVar[int]
     DOCUMENT_TITLE_FIELD_NUMBER: _ClassVar[int]
     DOCUMENT_TYPE_FIELD_NUMBER: _ClassVar[int]
-    rserver_connected: bool
+    ENGINE_VERSION_FIELD_NUMBER: _ClassVar[int]
+    ENGINE_BUILD_FIELD_NUMBER: _ClassVar[int]
+    paracore_connected: bool
     revit_open: bool
     revit_version: str
     document_open: bool
     document_title: str
     document_type: str
-    def __init__(self, rserver_connected: bool = ..., revit_open: bool = ..., revit_version: _Optional[str] = ..., document_open: bool = ..., document_title: _Optional[str] = ..., document_type: _Optional[str] = ...) -> None: ...
+    engine_version: str
+    engine_build: str
+    def __init__(self, paracore_connected: bool = ..., revit_open: bool = ..., revit_version: _Optional[str] = ..., document_open: bool = ..., document_title: _Optional[str] = ..., document_type: _Optional[str] = ..., engine_version: _Optional[str] = ..., engine_build: _Optional[str] = ...) -> None: ...
 
 class GetScriptMetadataRequest(_message.Message):
     __slots__ = ("script_files",)
@@ -111,7 +169,7 @@ class GetScriptParametersRequest(_message.Message):
     def __init__(self, script_files: _Optional[_Iterable[_Union[ScriptFile, _Mapping]]] = ...) -> None: ...
 
 class ScriptMetadata(_message.Message):
-    __slots__ = ("name", "file_path", "script_type", "description", "author", "categories", "dependencies", "document_type", "usage_examples", "website", "last_run")
+    __slots__ = ("name", "file_path", "script_type", "description", "author", "categories", "dependencies", "document_type", "usage_examples", "website", "last_run", "is_protected", "is_compiled")
     NAME_FIELD_NUMBER: _ClassVar[int]
     FILE_PATH_FIELD_NUMBER: _ClassVar[int]
     SCRIPT_TYPE_FIELD_NUMBER: _ClassVar[int]
@@ -123,6 +181,8 @@ class ScriptMetadata(_message.Message):
     USAGE_EXAMPLES_FIELD_NUMBER: _ClassVar[int]
     WEBSITE_FIELD_NUMBER: _ClassVar[int]
     LAST_RUN_FIELD_NUMBER: _ClassVar[int]
+    IS_PROTECTED_FIELD_NUMBER: _ClassVar[int]
+    IS_COMPILED_FIELD_NUMBER: _ClassVar[int]
     name: str
     file_path: str
     script_type: str
@@ -134,7 +194,9 @@ class ScriptMetadata(_message.Message):
     usage_examples: _containers.RepeatedScalarFieldContainer[str]
     website: str
     last_run: str
-    def __init__(self, name: _Optional[str] = ..., file_path: _Optional[str] = ..., script_type: _Optional[str] = ..., description: _Optional[str] = ..., author: _Optional[str] = ..., categories: _Optional[_Iterable[str]] = ..., dependencies: _Optional[_Iterable[str]] = ..., document_type: _Optional[str] = ..., usage_examples: _Optional[_Iterable[str]] = ..., website: _Optional[str] = ..., last_run: _Optional[str] = ...) -> None: ...
+    is_protected: bool
+    is_compiled: bool
+    def __init__(self, name: _Optional[str] = ..., file_path: _Optional[str] = ..., script_type: _Optional[str] = ..., description: _Optional[str] = ..., author: _Optional[str] = ..., categories: _Optional[_Iterable[str]] = ..., dependencies: _Optional[_Iterable[str]] = ..., document_type: _Optional[str] = ..., usage_examples: _Optional[_Iterable[str]] = ..., website: _Optional[str] = ..., last_run: _Optional[str] = ..., is_protected: bool = ..., is_compiled: bool = ...) -> None: ...
 
 class GetScriptParametersResponse(_message.Message):
     __slots__ = ("parameters", "error_message")
@@ -145,7 +207,7 @@ class GetScriptParametersResponse(_message.Message):
     def __init__(self, parameters: _Optional[_Iterable[_Union[ScriptParameter, _Mapping]]] = ..., error_message: _Optional[str] = ...) -> None: ...
 
 class ScriptParameter(_message.Message):
-    __slots__ = ("name", "type", "default_value_json", "description", "options", "multi_select", "visible_when", "numeric_type", "min", "max", "step", "is_revit_element", "revit_element_type", "revit_element_category", "requires_compute", "group")
+    __slots__ = ("name", "type", "default_value_json", "description", "options", "multi_select", "visible_when", "numeric_type", "min", "max", "step", "is_revit_element", "revit_element_type", "revit_element_category", "requires_compute", "group", "input_type", "required", "suffix", "pattern", "enabled_when_param", "enabled_when_value", "unit", "selection_type")
     NAME_FIELD_NUMBER: _ClassVar[int]
     TYPE_FIELD_NUMBER: _ClassVar[int]
     DEFAULT_VALUE_JSON_FIELD_NUMBER: _ClassVar[int]
@@ -162,6 +224,14 @@ class ScriptParameter(_message.Message):
     REVIT_ELEMENT_CATEGORY_FIELD_NUMBER: _ClassVar[int]
     REQUIRES_COMPUTE_FIELD_NUMBER: _ClassVar[int]
     GROUP_FIELD_NUMBER: _ClassVar[int]
+    INPUT_TYPE_FIELD_NUMBER: _ClassVar[int]
+    REQUIRED_FIELD_NUMBER: _ClassVar[int]
+    SUFFIX_FIELD_NUMBER: _ClassVar[int]
+    PATTERN_FIELD_NUMBER: _ClassVar[int]
+    ENABLED_WHEN_PARAM_FIELD_NUMBER: _ClassVar[int]
+    ENABLED_WHEN_VALUE_FIELD_NUMBER: _ClassVar[int]
+    UNIT_FIELD_NUMBER: _ClassVar[int]
+    SELECTION_TYPE_FIELD_NUMBER: _ClassVar[int]
     name: str
     type: str
     default_value_json: str
@@ -178,7 +248,51 @@ class ScriptParameter(_message.Message):
     revit_element_category: str
     requires_compute: bool
     group: str
-    def __init__(self, name: _Optional[str] = ..., type: _Optional[str] = ..., default_value_json: _Optional[str] = ..., description: _Optional[str] = ..., options: _Optional[_Iterable[str]] = ..., multi_select: bool = ..., visible_when: _Optional[str] = ..., numeric_type: _Optional[str] = ..., min: _Optional[float] = ..., max: _Optional[float] = ..., step: _Optional[float] = ..., is_revit_element: bool = ..., revit_element_type: _Optional[str] = ..., revit_element_category: _Optional[str] = ..., requires_compute: bool = ..., group: _Optional[str] = ...) -> None: ...
+    input_type: str
+    required: bool
+    suffix: str
+    pattern: str
+    enabled_when_param: str
+    enabled_when_value: str
+    unit: str
+    selection_type: str
+    def __init__(self, name: _Optional[str] = ..., type: _Optional[str] = ..., default_value_json: _Optional[str] = ..., description: _Optional[str] = ..., options: _Optional[_Iterable[str]] = ..., multi_select: bool = ..., visible_when: _Optional[str] = ..., numeric_type: _Optional[str] = ..., min: _Optional[float] = ..., max: _Optional[float] = ..., step: _Optional[float] = ..., is_revit_element: bool = ..., revit_element_type: _Optional[str] = ..., revit_element_category: _Optional[str] = ..., requires_compute: bool = ..., group: _Optional[str] = ..., input_type: _Optional[str] = ..., required: bool = ..., suffix: _Optional[str] = ..., pattern: _Optional[str] = ..., enabled_when_param: _Optional[str] = ..., enabled_when_value: _Optional[str] = ..., unit: _Optional[str] = ..., selection_type: _Optional[str] = ...) -> None: ...
+
+class ScriptUnit(_message.Message):
+    __slots__ = ("id", "script_files")
+    ID_FIELD_NUMBER: _ClassVar[int]
+    SCRIPT_FILES_FIELD_NUMBER: _ClassVar[int]
+    id: str
+    script_files: _containers.RepeatedCompositeFieldContainer[ScriptFile]
+    def __init__(self, id: _Optional[str] = ..., script_files: _Optional[_Iterable[_Union[ScriptFile, _Mapping]]] = ...) -> None: ...
+
+class GetScriptMetadataBatchRequest(_message.Message):
+    __slots__ = ("units", "include_parameters")
+    UNITS_FIELD_NUMBER: _ClassVar[int]
+    INCLUDE_PARAMETERS_FIELD_NUMBER: _ClassVar[int]
+    units: _containers.RepeatedCompositeFieldContainer[ScriptUnit]
+    include_parameters: bool
+    def __init__(self, units: _Optional[_Iterable[_Union[ScriptUnit, _Mapping]]] = ..., include_parameters: bool = ...) -> None: ...
+
+class ScriptMetadataResult(_message.Message):
+    __slots__ = ("id", "metadata", "parameters", "error_message")
+    ID_FIELD_NUMBER: _ClassVar[int]
+    METADATA_FIELD_NUMBER: _ClassVar[int]
+    PARAMETERS_FIELD_NUMBER: _ClassVar[int]
+    ERROR_MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    id: str
+    metadata: ScriptMetadata
+    parameters: _containers.RepeatedCompositeFieldContainer[ScriptParameter]
+    error_message: str
+    def __init__(self, id: _Optional[str] = ..., metadata: _Optional[_Union[ScriptMetadata, _Mapping]] = ..., parameters: _Optional[_Iterable[_Union[ScriptParameter, _Mapping]]] = ..., error_message: _Optional[str] = ...) -> None: ...
+
+class GetScriptMetadataBatchResponse(_message.Message):
+    __slots__ = ("results", "error_message")
+    RESULTS_FIELD_NUMBER: _ClassVar[int]
+    ERROR_MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    results: _containers.RepeatedCompositeFieldContainer[ScriptMetadataResult]
+    error_message: str
+    def __init__(self, results: _Optional[_Iterable[_Union[ScriptMetadataResult, _Mapping]]] = ..., error_message: _Optional[str] = ...) -> None: ...
 
 class GetCombinedScriptRequest(_message.Message):
     __slots__ = ("script_files", "script_path")
@@ -201,7 +315,7 @@ class GetContextRequest(_message.Message):
     def __init__(self) -> None: ...
 
 class GetContextResponse(_message.Message):
-    __slots__ = ("active_view_name", "selection_count", "selected_element_ids", "project_info", "active_view_type", "active_view_scale", "active_view_detail_level", "selected_elements")
+    __slots__ = ("active_view_name", "selection_count", "selected_element_ids", "project_info", "active_view_type", "active_view_scale", "active_view_detail_level", "selected_elements", "levels")
     ACTIVE_VIEW_NAME_FIELD_NUMBER: _ClassVar[int]
     SELECTION_COUNT_FIELD_NUMBER: _ClassVar[int]
     SELECTED_ELEMENT_IDS_FIELD_NUMBER: _ClassVar[int]
@@ -210,6 +324,7 @@ class GetContextResponse(_message.Message):
     ACTIVE_VIEW_SCALE_FIELD_NUMBER: _ClassVar[int]
     ACTIVE_VIEW_DETAIL_LEVEL_FIELD_NUMBER: _ClassVar[int]
     SELECTED_ELEMENTS_FIELD_NUMBER: _ClassVar[int]
+    LEVELS_FIELD_NUMBER: _ClassVar[int]
     active_view_name: str
     selection_count: int
     selected_element_ids: _containers.RepeatedScalarFieldContainer[int]
@@ -218,7 +333,18 @@ class GetContextResponse(_message.Message):
     active_view_scale: int
     active_view_detail_level: str
     selected_elements: _containers.RepeatedCompositeFieldContainer[ElementInfo]
-    def __init__(self, active_view_name: _Optional[str] = ..., selection_count: _Optional[int] = ..., selected_element_ids: _Optional[_Iterable[int]] = ..., project_info: _Optional[_Union[ProjectInfo, _Mapping]] = ..., active_view_type: _Optional[str] = ..., active_view_scale: _Optional[int] = ..., active_view_detail_level: _Optional[str] = ..., selected_elements: _Optional[_Iterable[_Union[ElementInfo, _Mapping]]] = ...) -> None: ...
+    levels: _containers.RepeatedCompositeFieldContainer[LevelInfo]
+    def __init__(self, active_view_name: _Optional[str] = ..., selection_count: _Optional[int] = ..., selected_element_ids: _Optional[_Iterable[int]] = ..., project_info: _Optional[_Union[ProjectInfo, _Mapping]] = ..., active_view_type: _Optional[str] = ..., active_view_scale: _Optional[int] = ..., active_view_detail_level: _Optional[str] = ..., selected_elements: _Optional[_Iterable[_Union[ElementInfo, _Mapping]]] = ..., levels: _Optional[_Iterable[_Union[LevelInfo, _Mapping]]] = ...) -> None: ...
+
+class LevelInfo(_message.Message):
+    __slots__ = ("id", "name", "elevation")
+    ID_FIELD_NUMBER: _ClassVar[int]
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    ELEVATION_FIELD_NUMBER: _ClassVar[int]
+    id: int
+    name: str
+    elevation: float
+    def __init__(self, id: _Optional[int] = ..., name: _Optional[str] = ..., elevation: _Optional[float] = ...) -> None: ...
 
 class ElementInfo(_message.Message):
     __slots__ = ("id", "category")
@@ -258,6 +384,22 @@ class GetScriptManifestResponse(_message.Message):
     error_message: str
     def __init__(self, manifest_json: _Optional[str] = ..., error_message: _Optional[str] = ...) -> None: ...
 
+class ScriptManifestEntry(_message.Message):
+    __slots__ = ("name", "type", "absolute_path", "metadata", "parameters", "error_message")
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    TYPE_FIELD_NUMBER: _ClassVar[int]
+    ABSOLUTE_PATH_FIELD_NUMBER: _ClassVar[int]
+    METADATA_FIELD_NUMBER: _ClassVar[int]
+    PARAMETERS_FIELD_NUMBER: _ClassVar[int]
+    ERROR_MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    type: str
+    absolute_path: str
+    metadata: ScriptMetadata
+    parameters: _containers.RepeatedCompositeFieldContainer[ScriptParameter]
+    error_message: str
+    def __init__(self, name: _Optional[str] = ..., type: _Optional[str] = ..., absolute_path: _Optional[str] = ..., metadata: _Optional[_Union[ScriptMetadata, _Mapping]] = ..., parameters: _Optional[_Iterable[_Union[ScriptParameter, _Mapping]]] = ..., error_message: _Optional[str] = ...) -> None: ...
+
 class ValidateWorkingSetRequest(_message.Message):
     __slots__ = ("element_ids",)
     ELEMENT_IDS_FIELD_NUMBER: _ClassVar[int]
@@ -279,11 +421,85 @@ class ComputeParameterOptionsRequest(_message.Message):
     def __init__(self, script_content: _Optional[str] = ..., parameter_name: _Optional[str] = ...) -> None: ...
 
 class ComputeParameterOptionsResponse(_message.Message):
-    __slots__ = ("options", "is_success", "error_message")
+    __slots__ = ("options", "is_success", "error_message", "min", "max", "step")
     OPTIONS_FIELD_NUMBER: _ClassVar[int]
     IS_SUCCESS_FIELD_NUMBER: _ClassVar[int]
     ERROR_MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    MIN_FIELD_NUMBER: _ClassVar[int]
+    MAX_FIELD_NUMBER: _ClassVar[int]
+    STEP_FIELD_NUMBER: _ClassVar[int]
     options: _containers.RepeatedScalarFieldContainer[str]
     is_success: bool
     error_message: str
-    def __init__(self, options: _Optional[_Iterable[str]] = ..., is_success: bool = ..., error_message: _Optional[str] = ...) -> None: ...
+    min: float
+    max: float
+    step: float
+    def __init__(self, options: _Optional[_Iterable[str]] = ..., is_success: bool = ..., error_message: _Optional[str] = ..., min: _Optional[float] = ..., max: _Optional[float] = ..., step: _Optional[float] = ...) -> None: ...
+
+class ParameterOptionsQuery(_message.Message):
+    __slots__ = ("id", "script_content", "parameter_names")
+    ID_FIELD_NUMBER: _ClassVar[int]
+    SCRIPT_CONTENT_FIELD_NUMBER: _ClassVar[int]
+    PARAMETER_NAMES_FIELD_NUMBER: _ClassVar[int]
+    id: str
+    script_content: str
+    parameter_names: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, id: _Optional[str] = ..., script_content: _Optional[str] = ..., parameter_names: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class ComputeParameterOptionsBatchRequest(_message.Message):
+    __slots__ = ("scripts",)
+    SCRIPTS_FIELD_NUMBER: _ClassVar[int]
+    scripts: _containers.RepeatedCompositeFieldContainer[ParameterOptionsQuery]
+    def __init__(self, scripts: _Optional[_Iterable[_Union[ParameterOptionsQuery, _Mapping]]] = ...) -> None: ...
+
+class ParameterOptionsResult(_message.Message):
+    __slots__ = ("id", "parameter_name", "result")
+    ID_FIELD_NUMBER: _ClassVar[int]
+    PARAMETER_NAME_FIELD_NUMBER: _ClassVar[int]
+    RESULT_FIELD_NUMBER: _ClassVar[int]
+    id: str
+    parameter_name: str
+    result: ComputeParameterOptionsResponse
+    def __init__(self, id: _Optional[str] = ..., parameter_name: _Optional[str] = ..., result: _Optional[_Union[ComputeParameterOptionsResponse, _Mapping]] = ...) -> None: ...
+
+class ComputeParameterOptionsBatchResponse(_message.Message):
+    __slots__ = ("results", "error_message")
+    RESULTS_FIELD_NUMBER: _ClassVar[int]
+    ERROR_MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    results: _containers.RepeatedCompositeFieldContainer[ParameterOptionsResult]
+    error_message: str
+    def __init__(self, results: _Optional[_Iterable[_Union[ParameterOptionsResult, _Mapping]]] = ..., error_message: _Optional[str] = ...) -> None: ...
+
+class RenameScriptRequest(_message.Message):
+    __slots__ = ("old_path", "new_name")
+    OLD_PATH_FIELD_NUMBER: _ClassVar[int]
+    NEW_NAME_FIELD_NUMBER: _ClassVar[int]
+    old_path: str
+    new_name: str
+    def __init__(self, old_path: _Optional[str] = ..., new_name: _Optional[str] = ...) -> None: ...
+
+class RenameScriptResponse(_message.Message):
+    __slots__ = ("is_success", "new_path", "error_message")
+    IS_SUCCESS_FIELD_NUMBER: _ClassVar[int]
+    NEW_PATH_FIELD_NUMBER: _ClassVar[int]
+    ERROR_MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    is_success: bool
+    new_path: str
+    error_message: str
+    def __init__(self, is_success: bool = ..., new_path: _Optional[str] = ..., error_message: _Optional[str] = ...) -> None: ...
+
+class BuildScriptRequest(_message.Message):
+    __slots__ = ("script_content",)
+    SCRIPT_CONTENT_FIELD_NUMBER: _ClassVar[int]
+    script_content: str
+    def __init__(self, script_content: _Optional[str] = ...) -> None: ...
+
+class BuildScriptResponse(_message.Message):
+    __slots__ = ("is_success", "compiled_assembly", "error_message")
+    IS_SUCCESS_FIELD_NUMBER: _ClassVar[int]
+    COMPILED_ASSEMBLY_FIELD_NUMBER: _ClassVar[int]
+    ERROR_MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    is_success: bool
+    compiled_assembly: bytes
+    error_message: str
+    def __init__(self, is_success: bool = ..., compiled_assembly: _Optional[bytes] = ..., error_message: _Optional[str] = ...) -> None: ...
@@ -39,6 +39,11 @@ class CoreScriptRunnerStub(object):
                 request_serializer=corescript__pb2.ExecuteScriptRequest.SerializeToString,
                 response_deserializer=corescript__pb2.ExecuteScriptResponse.FromString,
                 _registered_method=True)
+        self.ExecuteScriptStream = channel.unary_stream(
+                '/CoreScript.CoreScriptRunner/ExecuteScriptStream',
+                request_serializer=corescript__pb2.ExecuteScriptRequest.SerializeToString,
+                response_deserializer=corescript__pb2.ExecuteScriptStreamChunk.FromString,
+                _registered_method=True)
         self.GetStatus = channel.unary_unary(
                 '/CoreScript.CoreScriptRunner/GetStatus',
                 request_serializer=corescript__pb2.GetStatusRequest.SerializeToString,
@@ -74,6 +79,11 @@ class CoreScriptRunnerStub(object):
                 request_serializer=corescript__pb2.GetScriptManifestRequest.SerializeToString,
                 response_deserializer=corescript__pb2.GetScriptManifestResponse.FromString,
                 _registered_method=True)
+        self.StreamScriptManifest = channel.unary_stream(
+                '/CoreScript.CoreScriptRunner/StreamScriptManifest',
+                request_serializer=corescript__pb2.GetScriptManifestRequest.SerializeToString,
+                response_deserializer=corescript__pb2.ScriptManifestEntry.FromString,
+                _registered_method=True)
         self.ValidateWorkingSet = channel.unary_unary(
                 '/CoreScript.CoreScriptRunner/ValidateWorkingSet',
                 request_serializer=corescript__pb2.ValidateWorkingSetRequest.SerializeToString,
@@ -104,6 +114,16 @@ class CoreScriptRunnerStub(object):
                 request_serializer=corescript__pb2.BuildScriptRequest.SerializeToString,
                 response_deserializer=corescript__pb2.BuildScriptResponse.FromString,
                 _registered_method=True)
+        self.GetScriptMetadataBatch = channel.unary_unary(
+                '/CoreScript.CoreScriptRunner/GetScriptMetadataBatch',
+                request_serializer=corescript__pb2.GetScriptMetadataBatchRequest.SerializeToString,
+                response_deserializer=corescript__pb2.GetScriptMetadataBatchResponse.FromString,
+                _registered_method=True)
+        self.ComputeParameterOptionsBatch = channel.unary_unary(
+                '/CoreScript.CoreScriptRunner/ComputeParameterOptionsBatch',
+                request_serializer=corescript__pb2.ComputeParameterOptionsBatchRequest.SerializeToString,
+                response_deserializer=corescript__pb2.ComputeParameterOptionsBatchResponse.FromString,
+                _registered_method=True)
 
 
 class CoreScriptRunnerServicer(object):
@@ -115,6 +135,12 @@ class CoreScriptRunnerServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def ExecuteScriptStream(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def GetStatus(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -157,6 +183,12 @@ class CoreScriptRunnerServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def StreamScriptManifest(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def ValidateWorkingSet(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -193,6 +225,18 @@ class CoreScriptRunnerServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def GetScriptMetadataBatch(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ComputeParameterOptionsBatch(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_CoreScriptRunnerServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -201,6 +245,11 @@ def add_CoreScriptRunnerServicer_to_server(servicer, server):
                     request_deserializer=corescript__pb2.ExecuteScriptRequest.FromString,
                     response_serializer=corescript__pb2.ExecuteScriptResponse.SerializeToString,
             ),
+            'ExecuteScriptStream': grpc.unary_stream_rpc_method_handler(
+                    servicer.ExecuteScriptStream,
+                    request_deserializer=corescript__pb2.ExecuteScriptRequest.FromString,
+                    response_serializer=corescript__pb2.ExecuteScriptStreamChunk.SerializeToString,
+            ),
             'GetStatus': grpc.unary_unary_rpc_method_handler(
                     servicer.GetStatus,
                     request_deserializer=corescript__pb2.GetStatusRequest.FromString,
@@ -236,6 +285,11 @@ def add_CoreScriptRunnerServicer_to_server(servicer, server):
                     request_deserializer=corescript__pb2.GetScriptManifestRequest.FromString,
                     response_serializer=corescript__pb2.GetScriptManifestResponse.SerializeToString,
             ),
+            'StreamScriptManifest': grpc.unary_stream_rpc_method_handler(
+                    servicer.StreamScriptManifest,
+                    request_deserializer=corescript__pb2.GetScriptManifestRequest.FromString,
+                    response_serializer=corescript__pb2.ScriptManifestEntry.SerializeToString,
+            ),
             'ValidateWorkingSet': grpc.unary_unary_rpc_method_handler(
                     servicer.ValidateWorkingSet,
                     request_deserializer=corescript__pb2.ValidateWorkingSetRequest.FromString,
@@ -266,6 +320,16 @@ def add_CoreScriptRunnerServicer_to_server(servicer, server):
                     request_deserializer=corescript__pb2.BuildScriptRequest.FromString,
                     response_serializer=corescript__pb2.BuildScriptResponse.SerializeToString,
             ),
+            'GetScriptMetadataBatch': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetScriptMetadataBatch,
+                    request_deserializer=corescript__pb2.GetScriptMetadataBatchRequest.FromString,
+                    response_serializer=corescript__pb2.GetScriptMetadataBatchResponse.SerializeToString,
+            ),
+            'ComputeParameterOptionsBatch': grpc.unary_unary_rpc_method_handler(
+                    servicer.ComputeParameterOptionsBatch,
+                    request_deserializer=corescript__pb2.ComputeParameterOptionsBatchRequest.FromString,
+                    response_serializer=corescript__pb2.ComputeParameterOptionsBatchResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'CoreScript.CoreScriptRunner', rpc_method_handlers)
@@ -304,6 +368,33 @@ class CoreScriptRunner(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def ExecuteScriptStream(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/CoreScript.CoreScriptRunner/ExecuteScriptStream',
+            corescript__pb2.ExecuteScriptRequest.SerializeToString,
+            corescript__pb2.ExecuteScriptStreamChunk.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def GetStatus(request,
             target,
@@ -493,6 +584,33 @@ class CoreScriptRunner(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def StreamScriptManifest(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/CoreScript.CoreScriptRunner/StreamScriptManifest',
+            corescript__pb2.GetScriptManifestRequest.SerializeToString,
+            corescript__pb2.ScriptManifestEntry.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def ValidateWorkingSet(request,
             target,
@@ -654,3 +772,57 @@ class CoreScriptRunner(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def GetScriptMetadataBatch(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/CoreScript.CoreScriptRunner/GetScriptMetadataBatch',
+            corescript__pb2.GetScriptMetadataBatchRequest.SerializeToString,
+            corescript__pb2.GetScriptMetadataBatchResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def ComputeParameterOptionsBatch(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/CoreScript.CoreScriptRunner/ComputeParameterOptionsBatch',
+            corescript__pb2.ComputeParameterOptionsBatchRequest.SerializeToString,
+            corescript__pb2.ComputeParameterOptionsBatchResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
@@ -0,0 +1,47 @@
+/*
+DocumentType: Any
+Categories: Data
+Description: Imports room data from a spreadsheet.
+*/
+
+var p = new Params();
+Println($"Importing {p.SourceFile}");
+
+public class Params
+{
+    #region Files
+    [InputFile("csv,xlsx"), Required]
+    public string SourceFile { get; set; }
+
+    [FolderPath]
+    public string BackupFolder { get; set; }
+
+    [OutputFile("csv")]
+    public string LogFile { get; set; } = "import-log.csv";
+    #endregion
+
+    #region Options
+    [Description("Rows above this one are skipped.")]
+    public int HeaderRow { get; set; } = 1;
+
+    [Pattern(@"^[A-Z]{2}-\d+$")]
+    public string RoomPrefix { get; set; } = "RM-1";
+
+    [Confirm("DELETE")]
+    public string ConfirmOverwrite { get; set; }
+
+    public bool Overwrite { get; set; } = false;
+
+    [EnabledWhen(nameof(Overwrite), true)]
+    public bool KeepBackup { get; set; } = true;
+
+    [ScriptParameter(VisibleWhen = "Overwrite == true", Group = "Advanced")]
+    public string BackupSuffix { get; set; } = "_bak";
+
+    [Color]
+    public string HighlightColor { get; set; } = "#FF8800";
+
+    [Select(SelectionType.Point)]
+    public string Origin { get; set; }
+    #endregion
+}
@@ -0,0 +1,40 @@
+/*
+DocumentType: Project
+Categories: Documentation
+Description: Creates sheets from a chosen template.
+*/
+
+using Autodesk.Revit.DB;
+using System.Collections.Generic;
+using System.Linq;
+
+var Disciplines = new List<string> { "Architectural", "Structural", "MEP" };
+
+var p = new Params();
+Println($"{p.Discipline}: {string.Join(", ", p.Phases)}");
+
+public class Params
+{
+    [ScriptParameter(Options = nameof(Disciplines))]
+    public string Discipline { get; set; } = "Architectural";
+
+    [ScriptParameter(Options = "A1, A2, A3")]
+    public string PaperSize { get; set; } = "A1";
+
+    [ScriptParameter(MultiSelect = true)]
+    public List<string> Phases { get; set; } = new() { "Existing", "New Construction" };
+    public List<string> Phases_Options => new List<string> { "Existing", "Demolition", "New Construction" };
+
+    [Segmented]
+    public string Orientation { get; set; } = "Landscape";
+    public string[] Orientation_Options => new[] { "Landscape", "Portrait" };
+
+    public string TitleBlock { get; set; }
+    public List<string> TitleBlock_Options => new FilteredElementCollector(Doc)
+        .OfCategory(BuiltInCategory.OST_TitleBlocks)
+        .Select(e => e.Name)
+        .ToList();
+
+    [RevitElements(TargetType = "ViewFamilyType", Category = "Views", MultiSelect = true)]
+    public List<string> ViewTypes { get; set; }
+}
@@ -0,0 +1,35 @@
+/*
+DocumentType: Project
+Categories: Structure
+Description: Places a grid of columns.
+*/
+
+using System.Collections.Generic;
+
+var p = new Params();
+Println($"{p.Columns} x {p.Rows} columns, {p.Spacing} apart");
+
+public class Params
+{
+    [Range(1, 50)]
+    public int Columns { get; set; } = 4;
+
+    [Min(1), Max(20)]
+    public int Rows { get; set; } = 3;
+
+    [Range(0.5, 12.5, 0.25), Unit("m")]
+    public double Spacing { get; set; } = 6;
+
+    [ScriptParameter(Min = -10, Max = 10, Step = 0.1)]
+    public double Rotation { get; set; } = 0;
+
+    public double BaseOffset { get; set; } = -150;
+    public List<double> BaseOffset_Range => new List<double> { -1000, 1000, 25 };
+    public string BaseOffset_Unit => "mm";
+
+    [Unit("sqft")]
+    public double MinBayArea { get; set; } = 1.5e2;
+
+    [Suffix("°")]
+    public double Slope { get; set; } = .5;
+}
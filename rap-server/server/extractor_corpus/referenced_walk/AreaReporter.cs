@@ -0,0 +1,14 @@
+using Autodesk.Revit.DB;
+using System.Collections.Generic;
+
+public class AreaReporter
+{
+    private readonly int _precision;
+
+    public AreaReporter(int precision) { _precision = precision; }
+
+    public void Report(List<XYZ> outline)
+    {
+        Println($"Outline has {outline.Count} points (precision {_precision})");
+    }
+}
@@ -0,0 +1,15 @@
+using Autodesk.Revit.DB;
+using System.Collections.Generic;
+
+public static class Geometry
+{
+    public static List<XYZ> OffsetOutline(Document doc, string floorName, double offset)
+    {
+        var points = new List<XYZ>();
+        foreach (var point in Units.Outline(doc, floorName))
+        {
+            points.Add(point + new XYZ(offset, offset, 0));
+        }
+        return points;
+    }
+}
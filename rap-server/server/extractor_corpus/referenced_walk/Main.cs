@@ -0,0 +1,16 @@
+/*
+DocumentType: Project
+Categories: Floors, Modeling
+Author: Paracore Team
+Description: Offsets the selected floor outline and reports the new area.
+UsageExamples:
+- "Offset the floor outline by 300 mm"
+*/
+
+using Autodesk.Revit.DB;
+
+var p = new Params();
+
+var outline = Geometry.OffsetOutline(Doc, p.FloorName, p.Offset);
+var reporter = new AreaReporter(p.Precision);
+reporter.Report(outline);
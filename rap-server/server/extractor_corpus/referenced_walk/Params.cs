@@ -0,0 +1,19 @@
+using System.Collections.Generic;
+
+public class Params
+{
+    #region Floor
+    /// <summary>The floor whose outline is offset.</summary>
+    [RevitElements(TargetType = "Floor"), Required]
+    public string FloorName { get; set; }
+
+    /// <summary>Outward offset; negative values shrink the outline.</summary>
+    [Range(-2000, 2000, 50), Unit("mm")]
+    public double Offset { get; set; } = 300;
+    #endregion
+
+    #region Report
+    [Stepper]
+    public int Precision { get; set; } = 2;
+    #endregion
+}
@@ -0,0 +1,10 @@
+/*
+DocumentType: Family
+Author: Someone Else
+Description: Scratch file that nothing references; its header and Params must not leak into the tool.
+*/
+
+public class ScratchParams
+{
+    public string Ignored { get; set; } = "not a parameter";
+}
@@ -0,0 +1,11 @@
+using Autodesk.Revit.DB;
+using System.Collections.Generic;
+
+// Only reached through Geometry: checks that references are followed transitively.
+public static class Units
+{
+    public static IEnumerable<XYZ> Outline(Document doc, string floorName)
+    {
+        yield return XYZ.Zero;
+    }
+}
@@ -0,0 +1,22 @@
+// This file enables IntelliSense for CoreScript.Engine helpers and implicit imports.
+// It's included in compilation but contains no runtime logic.
+
+global using System;
+global using System.Collections.Generic;
+global using System.Linq;
+global using System.Text.Json;
+global using Microsoft.CSharp;
+global using Autodesk.Revit.DB;
+global using Autodesk.Revit.DB.Architecture;
+global using Autodesk.Revit.DB.Structure;
+global using Autodesk.Revit.UI;
+global using CoreScript.Engine.Globals;
+global using static CoreScript.Engine.Globals.DesignTimeGlobals;
+global using SixLabors.ImageSharp;
+global using SixLabors.ImageSharp.Processing;
+global using SixLabors.ImageSharp.PixelFormats;
+global using RestSharp;
+global using MiniExcelLibs;
+global using MathNet.Numerics;
+global using MathNet.Numerics.LinearAlgebra;
+global using MathNet.Numerics.Statistics;
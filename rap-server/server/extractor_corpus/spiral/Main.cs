@@ -0,0 +1,58 @@
+/*
+DocumentType: Project
+Author: Paracore Developer
+Description: Entry point for the CoreScript automation.
+
+Note: When running directly from VSCode, parameters in the Params class must have 
+default values, as they cannot be intercepted and changed via UI like in the Paracore application.
+*/
+
+using Autodesk.Revit.DB;
+using System.Linq;
+
+// 1. Setup Parameters
+var p = new Params();
+
+Println($"Starting execution for: {p.ProjectName}...");
+
+// 2. Execution Logic
+Transact("Create Spiral", () =>
+{
+    var spiral = new SpiralCreator();
+    spiral.CreateSpiral(Doc, p.LevelName, p.Radius, p.Turns, p.Resolution);
+});
+
+Println("Execution finished successfully! ✅");
+
+// 3. Parameter Definition (Compatible with Paracore UI)
+public class Params
+{
+    #region Project Settings
+
+    /// <summary>
+    /// The name of the project.
+    /// </summary>
+    public string ProjectName { get; set; } = "My Spiral Project";
+
+    /// <summary>
+    /// The level to create the spiral on.
+    /// </summary>
+    [RevitElements(Category = "Levels"), Required]
+    public string LevelName { get; set; } = "Level 1";
+
+    #endregion
+
+    #region Geometry
+
+    /// <summary>
+    /// The radius of the spiral in centimeters.
+    /// </summary>
+    [Unit("cm")]
+    public double Radius { get; set; } = 2400.0;
+
+    public int Turns { get; set; } = 5;
+
+    public double Resolution { get; set; } = 20.0;
+
+    #endregion
+}
@@ -0,0 +1,44 @@
+using Autodesk.Revit.DB;
+using System;
+using System.Collections.Generic;
+using System.Linq;
+
+public class SpiralCreator
+{
+    public void CreateSpiral(Document doc, string levelName, double maxRadiusFeet, int numTurns, double angleResolutionDegrees)
+    {
+        Level level = new FilteredElementCollector(doc)
+            .OfClass(typeof(Level))
+            .Cast<Level>()
+            .FirstOrDefault(l => l.Name == levelName)
+            ?? throw new Exception($"Level \"{levelName}\" not found.");
+
+        // Radius is already in Feet because the Engine handles [Unit] conversion automatically.
+        double angleResRad = angleResolutionDegrees * Math.PI / 180;
+
+        var curves = new List<Curve>();
+        XYZ origin = XYZ.Zero;
+
+        for (int i = 0; i < numTurns * 360 / angleResolutionDegrees; i++)
+        {
+            double angle1 = i * angleResRad;
+            double angle2 = (i + 1) * angleResRad;
+
+            double radius1 = maxRadiusFeet * angle1 / (numTurns * 2 * Math.PI);
+            double radius2 = maxRadiusFeet * angle2 / (numTurns * 2 * Math.PI);
+
+            XYZ pt1 = new(radius1 * Math.Cos(angle1), radius1 * Math.Sin(angle1), level.Elevation);
+            XYZ pt2 = new(radius2 * Math.Cos(angle2), radius2 * Math.Sin(angle2), level.Elevation);
+
+            Line line = Line.CreateBound(pt1, pt2);
+            if (line.Length > 0.0026)
+                curves.Add(line);
+        }
+
+        var sketch = SketchPlane.Create(doc, Plane.CreateByNormalAndOrigin(XYZ.BasisZ, origin));
+        foreach (var curve in curves)
+        {
+            doc.Create.NewModelCurve(curve, sketch);
+        }
+    }
+}
@@ -0,0 +1 @@
+Println("a");
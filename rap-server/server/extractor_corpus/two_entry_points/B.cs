@@ -0,0 +1,8 @@
+using System;
+
+Println("b");
+
+public class Params
+{
+    public int Count { get; set; } = 1;
+}
@@ -0,0 +1,75 @@
+using Autodesk.Revit.DB;
+using System.Collections.Generic;
+
+/*
+DocumentType: Project
+Categories: Walls, Modeling
+Author: Paracore Team
+Dependencies: RevitAPI 2025
+Website: https://github.com/Sey56/Paracore
+Description: Creates walls along a rectangle
+and tags them with a mark.
+UsageExamples:
+- "Create a 10x5 m rectangle of walls"
+- "Use the selected level"
+*/
+
+var Shapes = new[] { "Rectangle", "Square", "L-Shape" };
+
+var p = new Params();
+Println($"Creating {p.Shape} walls on {p.LevelName}");
+
+/// <summary>
+/// <name>Wall Tools</name>
+/// </summary>
+public class Params
+{
+    #region Layout
+    /// <summary>The level the walls are placed on.</summary>
+    [RevitElements(TargetType = "Level"), Required]
+    public string LevelName { get; set; }
+
+    /// <summary>
+    /// Outline shape.
+    /// Picked from the list.
+    /// </summary>
+    [ScriptParameter(Options = nameof(Shapes))]
+    public string Shape { get; set; } = "Rectangle";
+
+    [Range(1, 100, 0.5)]
+    public double Width_m { get; set; } = 10;
+
+    public double Depth { get; set; } = -2.5;
+    public List<double> Depth_Range => new List<double> { 0.5, 50 };
+
+    [Unit("ft")]
+    public double Height { get; set; } = 3.0e20;
+    #endregion
+
+    #region Tagging
+    public bool AddMark { get; set; } = true;
+
+    [EnabledWhen(nameof(AddMark), true)]
+    public string MarkPrefix { get; set; } = "W-<1>";
+
+    public bool MarkPrefix_Visible => AddMark == true;
+
+    public string WallType { get; set; }
+    public List<string> WallType_Options => new FilteredElementCollector(Doc).OfClass(typeof(WallType)).Select(t => t.Name).ToList();
+
+    public List<string> Tags { get; set; } = new() { "Exterior", "Load Bearing" };
+
+    [Select(SelectionType.Face)]
+    public Reference Face { get; set; }
+
+    public XYZ Origin { get; set; } = new XYZ(1, 2.5, 0);
+
+    // [ScriptParameter(Group: "Advanced", Min: 0, Max: 10, Description: "Retry count")]
+    public int Retries { get; set; } = 3;
+
+    [InputFile("csv")]
+    public string SourceFile { get; set; }
+
+    public string Computed => "read-only";
+    #endregion
+}
@@ -1,19 +1,31 @@
+import asyncio
+import copy
+import hashlib
+import json
 import logging
 import os
+import threading
+from collections import OrderedDict
 from contextlib import contextmanager
 
 import corescript_pb2
 import corescript_pb2_grpc
 import grpc
+import script_extractor
+from services.execution_dispatcher import execution_dispatcher
 
-# Global channel variable
+# Global channel variables
 _channel = None
+_aio_channel = None
+
+def _get_server_address():
+    return os.environ.get('GRPC_SERVER_ADDRESS', 'localhost:50051')
 
 def init_channel():
     """Initializes the global gRPC channel."""
     global _channel
     if _channel is None:
-        grpc_server_address = os.environ.get('GRPC_SERVER_ADDRESS', 'localhost:50051')
+        grpc_server_address = _get_server_address()
         logging.info(f"Initializing gRPC channel to {grpc_server_address}")
         _channel = grpc.insecure_channel(grpc_server_address)
 
@@ -25,6 +37,26 @@ def close_channel():
         _channel.close()
         _channel = None
 
+def init_aio_channel():
+    """
+    Initializes the global asyncio gRPC channel.
+    Must be called from inside the running event loop (e.g. FastAPI lifespan),
+    because grpc.aio channels are bound to the loop that created them.
+    """
+    global _aio_channel
+    if _aio_channel is None:
+        grpc_server_address = _get_server_address()
+        logging.info(f"Initializing asyncio gRPC channel to {grpc_server_address}")
+        _aio_channel = grpc.aio.insecure_channel(grpc_server_address)
+
+async def close_aio_channel():
+    """Closes the global asyncio gRPC channel."""
+    global _aio_channel
+    if _aio_channel:
+        logging.info("Closing asyncio gRPC channel")
+        await _aio_channel.close()
+        _aio_channel = None
+
 @contextmanager
 def get_corescript_runner_stub():
     """Provides a gRPC stub using the global singleton channel."""
@@ -35,7 +67,7 @@ def get_corescript_runner_stub():
     try:
         if _channel is None:
             logging.warning("Global gRPC channel not initialized. Creating temporary channel.")
-            grpc_server_address = os.environ.get('GRPC_SERVER_ADDRESS', 'localhost:50051')
+            grpc_server_address = _get_server_address()
             local_channel = grpc.insecure_channel(grpc_server_address)
             stub = corescript_pb2_grpc.CoreScriptRunnerStub(local_channel)
             yield stub
@@ -46,56 +78,201 @@ def get_corescript_runner_stub():
         if local_channel:
             local_channel.close()
 
-def get_status():
-    # logging.info("Attempting to get gRPC server status.")
+def get_async_stub():
+    """
+    Provides an asyncio gRPC stub bound to the global aio channel.
+    The channel is created lazily so callers running outside the main app still work.
+    """
+    if _aio_channel is None:
+        init_aio_channel()
+    return corescript_pb2_grpc.CoreScriptRunnerStub(_aio_channel)
+
+def _to_grpc_script_files(script_files):
+    return [corescript_pb2.ScriptFile(file_name=f['file_name'], content=f['content']) for f in script_files]
+
+# --- Extraction cache ---
+# Metadata and parameter extraction is deterministic for a given set of source files, so results are
+# cached by a hash of the ScriptFile list. Edited content hashes differently, which is what invalidates
+# an entry; the stale one simply ages out of the LRU.
+
+_EXTRACTION_CACHE_MAX_BYTES = int(os.environ.get('PARACORE_EXTRACTION_CACHE_MB', '32')) * 1024 * 1024
+
+def script_files_hash(script_files):
+    """Stable hash of a ScriptFile list (order-independent, like the engine's multi-file combine)."""
+    digest = hashlib.sha256()
+    for f in sorted(script_files, key=lambda f: f['file_name']):
+        digest.update(f['file_name'].encode('utf-8'))
+        digest.update(b'\0')
+        digest.update(f['content'].encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+class ExtractionCache:
+    """Thread-safe LRU of extraction results with a memory budget measured in serialized bytes."""
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # (kind, content_hash) -> (value, size)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, kind, content_hash):
+        with self._lock:
+            entry = self._entries.get((kind, content_hash))
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end((kind, content_hash))
+            self.hits += 1
+            # Callers are free to mutate what they get back.
+            return copy.deepcopy(entry[0])
+
+    def put(self, kind, content_hash, value):
+        size = len(json.dumps(value))
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop((kind, content_hash), None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._entries[(kind, content_hash)] = (copy.deepcopy(value), size)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": (self.hits / total) if total else 0.0,
+            }
+
+_extraction_cache = ExtractionCache(_EXTRACTION_CACHE_MAX_BYTES)
+
+def get_extraction_cache_stats():
+    return _extraction_cache.stats()
+
+def clear_extraction_cache():
+    _extraction_cache.clear()
+
+def _cache_result(kind, content_hash, result):
+    # Failed extractions are not cached, so a fix on the engine side is picked up on the next call.
+    if not result.get("error_message"):
+        _extraction_cache.put(kind, content_hash, result)
+
+# --- Run listeners ---
+# Called after every script run, successful or not: a run may have changed the Revit model,
+# so caches of model-derived data (e.g. parameter options) register here to drop their entries.
+
+_run_listeners = []
+
+def add_run_listener(callback):
+    _run_listeners.append(callback)
+
+def _notify_run():
+    for callback in _run_listeners:
+        try:
+            callback()
+        except Exception as e:
+            logging.error(f"Run listener failed: {e}")
+
+# --- Local extraction ---
+# script_extractor answers metadata/parameter requests in-process. PARACORE_EXTRACTOR picks the order:
+#   engine - engine first; local only while the engine is unreachable (default). Those results carry
+#            source OFFLINE_SOURCE and are not cached here; persistent indexes skip them too
+#   auto   - local first; the engine only sees sources the local parser cannot follow
+#   local  - never ask the engine
+# auto stays opt-in until test_script_extractor.py --strict passes on a corpus recorded from the engine.
+
+EXTRACTOR_MODE = os.environ.get('PARACORE_EXTRACTOR', 'engine').lower()
+_ENGINE_DOWN_CODES = (grpc.StatusCode.UNAVAILABLE, grpc.StatusCode.DEADLINE_EXCEEDED)
+# "source" of results extracted locally only because the engine was unreachable.
+# Callers may serve them but must not persist them, so the engine gets its turn once it is back.
+OFFLINE_SOURCE = "local-offline"
+
+def is_offline_result(result):
+    return bool(result) and result.get("source") == OFFLINE_SOURCE
+
+def _extract_locally(kind, script_files):
+    """Local result for kind ("metadata" or "parameters"), or None when the engine has to extract it."""
     try:
-        with get_corescript_runner_stub() as stub:
-            response = stub.GetStatus(corescript_pb2.GetStatusRequest())
-        return response
-    except grpc.RpcError as e:
-        logging.error(f"gRPC GetStatus call failed: {e.code()} - {e.details()}")
-        raise # Re-raise the gRPC error
+        if kind == "metadata":
+            return {"metadata": script_extractor.extract_metadata(script_files), "error_message": ""}
+        return {"parameters": script_extractor.extract_parameters(script_files), "error_message": ""}
+    except script_extractor.ScriptExtractionError as e:
+        error = str(e)
     except Exception as e:
-        logging.error(f"An unexpected error occurred during gRPC GetStatus call: {e}")
-        raise # Re-raise the unexpected error
+        if not isinstance(e, script_extractor.UnsupportedSourceError):
+            logging.warning(f"Local {kind} extraction failed, deferring to the engine: {e}")
+        if EXTRACTOR_MODE != 'local':
+            return None
+        error = f"Failed to extract {kind}: {e}"
+    empty = _metadata_to_dict(corescript_pb2.ScriptMetadata()) if kind == "metadata" else []
+    return {kind: empty, "error_message": error}
 
-def execute_script(script_content, parameters_json, compiled_assembly=None):
-    # logging.info("Attempting to execute script via gRPC.")
-    with get_corescript_runner_stub() as stub:
-        request = corescript_pb2.ExecuteScriptRequest(
-            script_content=script_content.encode('utf-8') if script_content else b"",
-            parameters_json=parameters_json.encode('utf-8'),
-            compiled_assembly=compiled_assembly if compiled_assembly else b"",
-            source="Paracore"
-        )
-        try:
-            response = stub.ExecuteScript(request)
-            # logging.info("gRPC ExecuteScript call successful.")
-            # Process and return the successful response
-            structured_output_data = [{"type": item.type, "data": item.data} for item in response.structured_output]
+def _local_first(kind, script_files):
+    return _extract_locally(kind, script_files) if EXTRACTOR_MODE != 'engine' else None
 
-            return {
-                "is_success": response.is_success,
-                "output": response.output,
-                "error_message": response.error_message,
-                "error_details": list(response.error_details),
-                "structured_output": structured_output_data,
-                "internal_data": response.internal_data,
+def _offline_fallback(kind, script_files, error):
+    """In engine mode, answers locally while the engine is unreachable; otherwise re-raises the RpcError."""
+    if EXTRACTOR_MODE == 'engine' and error.code() in _ENGINE_DOWN_CODES:
+        result = _extract_locally(kind, script_files)
+        if result is not None:
+            logging.info(f"Engine unreachable ({error.code()}), extracted {kind} locally")
+            return {**result, "source": OFFLINE_SOURCE}
+    raise error
+
+def _batch_extract_locally(units, include_parameters, results, hashes=None):
+    """Fills results with local extractions and returns the units the engine still has to handle."""
+    remaining = []
+    for unit in units:
+        try:
+            result = script_extractor.extract_script(unit['script_files'], include_parameters)
+        except Exception as e:
+            if not isinstance(e, script_extractor.UnsupportedSourceError):
+                logging.warning(f"Local extraction failed for '{unit['id']}', deferring to the engine: {e}")
+            if EXTRACTOR_MODE != 'local':
+                remaining.append(unit)
+                continue
+            result = {
+                "metadata": _metadata_to_dict(corescript_pb2.ScriptMetadata()),
+                "parameters": [],
+                "error_message": f"Failed to extract metadata: {e}"
             }
-        except grpc.RpcError as e:
-            logging.error(f"gRPC ExecuteScript call failed: {e.code()} - {e.details()}")
-            raise # Re-raise the gRPC error
+        results[unit['id']] = result
+        if hashes is not None:
+            _batch_cache_store(unit['id'], result, hashes, include_parameters)
+    return remaining
 
-def get_script_metadata(script_files):
-    with get_corescript_runner_stub() as stub:
-        grpc_script_files = [corescript_pb2.ScriptFile(file_name=f['file_name'], content=f['content']) for f in script_files]
-        request = corescript_pb2.GetScriptMetadataRequest(script_files=grpc_script_files)
-        response = stub.GetScriptMetadata(request)
+# --- Response converters (shared by the blocking and asyncio clients) ---
+
+def _execution_response_to_dict(response):
+    structured_output_data = [{"type": item.type, "data": item.data} for item in response.structured_output]
+    return {
+        "is_success": response.is_success,
+        "output": response.output,
+        "error_message": response.error_message,
+        "error_details": list(response.error_details),
+        "structured_output": structured_output_data,
+        "internal_data": response.internal_data,
+    }
 
+def _metadata_to_dict(m):
     # Manually construct the dictionary to ensure empty fields are included (Proto3 omits them by default in MessageToDict)
     # and to avoid version-specific keyword arguments errors.
-    m = response.metadata
-    metadata_dict = {
+    return {
         "name": m.name,
         "file_path": m.file_path,
         "script_type": m.script_type,
@@ -111,57 +288,238 @@ def get_script_metadata(script_files):
         "is_compiled": m.is_compiled
     }
 
+def _parameter_to_dict(p):
     return {
-        "metadata": metadata_dict,
-        "error_message": response.error_message
+        "name": p.name,
+        "type": p.type,
+        "defaultValueJson": p.default_value_json,
+        "description": p.description,
+        "options": list(p.options),
+        "multiSelect": p.multi_select,
+        "visibleWhen": p.visible_when,
+        "numericType": p.numeric_type,
+        "min": p.min if p.HasField('min') else None,
+        "max": p.max if p.HasField('max') else None,
+        "step": p.step if p.HasField('step') else None,
+        "isRevitElement": p.is_revit_element,
+        "revitElementType": p.revit_element_type,
+        "revitElementCategory": p.revit_element_category,
+        "requiresCompute": p.requires_compute,
+        "group": p.group,
+        "inputType": p.input_type,
+        "required": p.required,
+        "suffix": p.suffix,
+        "pattern": p.pattern,
+        "enabledWhenParam": p.enabled_when_param,
+        "enabledWhenValue": p.enabled_when_value,
+        "unit": p.unit,
+        "selectionType": p.selection_type
     }
 
-def get_script_parameters(script_files):
-    with get_corescript_runner_stub() as stub:
-        grpc_script_files = [corescript_pb2.ScriptFile(file_name=f['file_name'], content=f['content']) for f in script_files]
-        request = corescript_pb2.GetScriptParametersRequest(script_files=grpc_script_files)
-        response = stub.GetScriptParameters(request)
-
-    # Manually construct the dictionary to avoid potential issues with MessageToDict
-    params_to_return = []
-    for p in response.parameters:
-        param_dict = {
-            "name": p.name,
-            "type": p.type,
-            "defaultValueJson": p.default_value_json,
-            "description": p.description,
-            "options": list(p.options),
-            "multiSelect": p.multi_select,
-            "visibleWhen": p.visible_when,
-            "numericType": p.numeric_type,
-            "min": p.min if p.HasField('min') else None,
-            "max": p.max if p.HasField('max') else None,
-            "step": p.step if p.HasField('step') else None,
-            "isRevitElement": p.is_revit_element,
-            "revitElementType": p.revit_element_type,
-            "revitElementCategory": p.revit_element_category,
-            "requiresCompute": p.requires_compute,
-            "group": p.group,
-            "inputType": p.input_type,
-            "required": p.required,
-            "suffix": p.suffix,
-            "pattern": p.pattern,
-            "enabledWhenParam": p.enabled_when_param,
-            "enabledWhenValue": p.enabled_when_value,
-            "unit": p.unit,
-            "selectionType": p.selection_type
-        }
-        params_to_return.append(param_dict)
+def _manifest_entry_to_dict(entry):
+    return {
+        "name": entry.name,
+        "type": entry.type,
+        "absolute_path": entry.absolute_path,
+        "metadata": _metadata_to_dict(entry.metadata),
+        "parameters": [_parameter_to_dict(p) for p in entry.parameters],
+        "error_message": entry.error_message,
+    }
 
+def _context_to_dict(response):
     return {
-        "parameters": params_to_return,
-        "error_message": response.error_message
+        "active_view_name": response.active_view_name,
+        "active_view_type": response.active_view_type,
+        "active_view_scale": response.active_view_scale,
+        "active_view_detail_level": response.active_view_detail_level,
+        "selection_count": response.selection_count,
+        "selected_element_ids": list(response.selected_element_ids),
+        "selected_elements": [
+            {"id": item.id, "category": item.category}
+            for item in response.selected_elements
+        ],
+        "levels": [
+            {"id": l.id, "name": l.name, "elevation": l.elevation}
+            for l in response.levels
+        ],
+        "project_info": {
+            "name": response.project_info.name,
+            "number": response.project_info.number,
+            "title": response.project_info.title,
+            "file_path": response.project_info.file_path,
+            "is_workshared": response.project_info.is_workshared,
+            "username": response.project_info.username
+        } if response.HasField("project_info") else None
     }
 
+def _compute_options_to_dict(response):
+    return {
+        "options": list(response.options),
+        "is_success": response.is_success,
+        "error_message": response.error_message,
+        "min": response.min if response.HasField('min') else None,
+        "max": response.max if response.HasField('max') else None,
+        "step": response.step if response.HasField('step') else None
+    }
+
+# --- Request builders ---
+
+def _execute_script_request(script_content, parameters_json, compiled_assembly=None):
+    return corescript_pb2.ExecuteScriptRequest(
+        script_content=script_content.encode('utf-8') if script_content else b"",
+        parameters_json=parameters_json.encode('utf-8'),
+        compiled_assembly=compiled_assembly if compiled_assembly else b"",
+        source="Paracore"
+    )
+
+# Keep each batch request well below the engine's default 4 MB gRPC message limit.
+_METADATA_BATCH_MAX_BYTES = 2 * 1024 * 1024
+
+def _metadata_batch_requests(units, include_parameters, max_units=None):
+    """
+    Splits script units into GetScriptMetadataBatch requests bounded by total source size
+    (and optionally by unit count, so several requests can be in flight at once).
+    Each unit is a dict: {"id": str, "script_files": [{"file_name", "content"}]}.
+    """
+    batch, batch_bytes = [], 0
+    for unit in units:
+        unit_bytes = sum(len(f['content']) for f in unit['script_files'])
+        if batch and (batch_bytes + unit_bytes > _METADATA_BATCH_MAX_BYTES or (max_units and len(batch) >= max_units)):
+            yield corescript_pb2.GetScriptMetadataBatchRequest(units=batch, include_parameters=include_parameters)
+            batch, batch_bytes = [], 0
+        batch.append(corescript_pb2.ScriptUnit(id=unit['id'], script_files=_to_grpc_script_files(unit['script_files'])))
+        batch_bytes += unit_bytes
+    if batch:
+        yield corescript_pb2.GetScriptMetadataBatchRequest(units=batch, include_parameters=include_parameters)
+
+def _metadata_batch_result_to_dict(result):
+    return {
+        "metadata": _metadata_to_dict(result.metadata),
+        "parameters": [_parameter_to_dict(p) for p in result.parameters],
+        "error_message": result.error_message
+    }
+
+def _batch_cache_lookup(units, include_parameters):
+    """Splits batch units into cached results and the units that still need a round trip."""
+    cached, misses, hashes = {}, [], {}
+    for unit in units:
+        content_hash = script_files_hash(unit['script_files'])
+        hashes[unit['id']] = content_hash
+        metadata = _extraction_cache.get("metadata", content_hash)
+        parameters = None
+        if include_parameters and metadata is not None:
+            parameters = _extraction_cache.get("parameters", content_hash)
+        if metadata is None or (include_parameters and parameters is None):
+            misses.append(unit)
+            continue
+        cached[unit['id']] = {
+            "metadata": metadata["metadata"],
+            "parameters": parameters["parameters"] if parameters else [],
+            "error_message": ""
+        }
+    return cached, misses, hashes
+
+def _batch_cache_store(unit_id, result, hashes, include_parameters):
+    content_hash = hashes.get(unit_id)
+    if content_hash is None or result["error_message"]:
+        return
+    _extraction_cache.put("metadata", content_hash, {"metadata": result["metadata"], "error_message": ""})
+    if include_parameters:
+        _extraction_cache.put("parameters", content_hash, {"parameters": result["parameters"], "error_message": ""})
+
+def _batch_offline_fallback(misses, include_parameters, results, error):
+    """Batch counterpart of _offline_fallback; re-raises unless every unanswered unit extracts locally."""
+    if EXTRACTOR_MODE != 'engine' or error.code() not in _ENGINE_DOWN_CODES:
+        raise error
+    unanswered = [unit for unit in misses if unit['id'] not in results]
+    if _batch_extract_locally(unanswered, include_parameters, results):
+        raise error
+    for unit in unanswered:
+        results[unit['id']]["source"] = OFFLINE_SOURCE
+    logging.info(f"Engine unreachable ({error.code()}), extracted {len(unanswered)} scripts locally")
+
+def _pick_object_request(selection_type, category_filter):
+    return corescript_pb2.PickObjectRequest(
+        selection_type=selection_type,
+        category_filter=category_filter if category_filter else ""
+    )
+
+# --- Blocking client ---
+
+def get_status():
+    # logging.info("Attempting to get gRPC server status.")
+    try:
+        with get_corescript_runner_stub() as stub:
+            response = stub.GetStatus(corescript_pb2.GetStatusRequest())
+        return response
+    except grpc.RpcError as e:
+        logging.error(f"gRPC GetStatus call failed: {e.code()} - {e.details()}")
+        raise # Re-raise the gRPC error
+    except Exception as e:
+        logging.error(f"An unexpected error occurred during gRPC GetStatus call: {e}")
+        raise # Re-raise the unexpected error
+
+def execute_script(script_content, parameters_json, compiled_assembly=None):
+    # logging.info("Attempting to execute script via gRPC.")
+    with get_corescript_runner_stub() as stub:
+        request = _execute_script_request(script_content, parameters_json, compiled_assembly)
+        try:
+            response = stub.ExecuteScript(request)
+            return _execution_response_to_dict(response)
+        except grpc.RpcError as e:
+            logging.error(f"gRPC ExecuteScript call failed: {e.code()} - {e.details()}")
+            raise # Re-raise the gRPC error
+        finally:
+            _notify_run()
+
+def get_script_metadata(script_files):
+    content_hash = script_files_hash(script_files)
+    cached = _extraction_cache.get("metadata", content_hash)
+    if cached is not None:
+        return cached
+
+    result = _local_first("metadata", script_files)
+    if result is None:
+        try:
+            with get_corescript_runner_stub() as stub:
+                request = corescript_pb2.GetScriptMetadataRequest(script_files=_to_grpc_script_files(script_files))
+                response = stub.GetScriptMetadata(request)
+        except grpc.RpcError as e:
+            return _offline_fallback("metadata", script_files, e)
+
+        result = {
+            "metadata": _metadata_to_dict(response.metadata),
+            "error_message": response.error_message
+        }
+    _cache_result("metadata", content_hash, result)
+    return result
+
+def get_script_parameters(script_files):
+    content_hash = script_files_hash(script_files)
+    cached = _extraction_cache.get("parameters", content_hash)
+    if cached is not None:
+        return cached
+
+    result = _local_first("parameters", script_files)
+    if result is None:
+        try:
+            with get_corescript_runner_stub() as stub:
+                request = corescript_pb2.GetScriptParametersRequest(script_files=_to_grpc_script_files(script_files))
+                response = stub.GetScriptParameters(request)
+        except grpc.RpcError as e:
+            return _offline_fallback("parameters", script_files, e)
+
+        # Manually construct the dictionary to avoid potential issues with MessageToDict
+        result = {
+            "parameters": [_parameter_to_dict(p) for p in response.parameters],
+            "error_message": response.error_message
+        }
+    _cache_result("parameters", content_hash, result)
+    return result
+
 def get_combined_script(script_files):
     with get_corescript_runner_stub() as stub:
-        grpc_script_files = [corescript_pb2.ScriptFile(file_name=f['file_name'], content=f['content']) for f in script_files]
-        request = corescript_pb2.GetCombinedScriptRequest(script_files=grpc_script_files)
+        request = corescript_pb2.GetCombinedScriptRequest(script_files=_to_grpc_script_files(script_files))
         response = stub.GetCombinedScript(request)
 
     return {
@@ -169,6 +527,26 @@ def get_combined_script(script_files):
         "error_message": response.error_message
     }
 
+def get_script_metadata_batch(units, include_parameters=False):
+    """
+    Extracts metadata (and optionally parameters) for many scripts in as few round trips as possible.
+    Returns a dict keyed by unit id, in request order.
+    """
+    results, misses, hashes = _batch_cache_lookup(units, include_parameters)
+    if misses and EXTRACTOR_MODE != 'engine':
+        misses = _batch_extract_locally(misses, include_parameters, results, hashes)
+    if misses:
+        try:
+            with get_corescript_runner_stub() as stub:
+                for request in _metadata_batch_requests(misses, include_parameters):
+                    response = stub.GetScriptMetadataBatch(request)
+                    for r in response.results:
+                        results[r.id] = _metadata_batch_result_to_dict(r)
+                        _batch_cache_store(r.id, results[r.id], hashes, include_parameters)
+        except grpc.RpcError as e:
+            _batch_offline_fallback(misses, include_parameters, results, e)
+    return {unit['id']: results[unit['id']] for unit in units if unit['id'] in results}
+
 def create_and_open_workspace(script_path, script_type):
     with get_corescript_runner_stub() as stub:
         request = corescript_pb2.CreateWorkspaceRequest(
@@ -190,6 +568,17 @@ def get_script_manifest(script_path: str) -> str:
         response = stub.GetScriptManifest(request)
         return response.manifest_json
 
+def stream_script_manifest(script_path: str):
+    """
+    Yields a library's manifest one script at a time as the engine scans it (StreamScriptManifest):
+    {"name", "type", "absolute_path", "metadata", "parameters", "error_message"}. A failed scan
+    yields a single entry with only error_message set.
+    """
+    with get_corescript_runner_stub() as stub:
+        request = corescript_pb2.GetScriptManifestRequest(script_path=script_path)
+        for entry in stub.StreamScriptManifest(request):
+            yield _manifest_entry_to_dict(entry)
+
 def get_context():
     """
     Calls the gRPC service to get the current Revit context (selection, view, etc.).
@@ -202,30 +591,7 @@ def get_context():
             response = stub.GetContext(request)
             print("DEBUG: Received GetContextResponse")
 
-        return {
-            "active_view_name": response.active_view_name,
-            "active_view_type": response.active_view_type,
-            "active_view_scale": response.active_view_scale,
-            "active_view_detail_level": response.active_view_detail_level,
-            "selection_count": response.selection_count,
-            "selected_element_ids": list(response.selected_element_ids),
-            "selected_elements": [
-                {"id": item.id, "category": item.category}
-                for item in response.selected_elements
-            ],
-            "levels": [
-                {"id": l.id, "name": l.name, "elevation": l.elevation}
-                for l in response.levels
-            ],
-            "project_info": {
-                "name": response.project_info.name,
-                "number": response.project_info.number,
-                "title": response.project_info.title,
-                "file_path": response.project_info.file_path,
-                "is_workshared": response.project_info.is_workshared,
-                "username": response.project_info.username
-            } if response.HasField("project_info") else None
-        }
+        return _context_to_dict(response)
     except Exception as e:
         print(f"DEBUG: grpc_client.get_context exception: {e}")
         raise e
@@ -261,14 +627,7 @@ def compute_parameter_options(script_content: str, parameter_name: str):
                 parameter_name=parameter_name
             )
             response = stub.ComputeParameterOptions(request)
-            return {
-                "options": list(response.options),
-                "is_success": response.is_success,
-                "error_message": response.error_message,
-                "min": response.min if response.HasField('min') else None,
-                "max": response.max if response.HasField('max') else None,
-                "step": response.step if response.HasField('step') else None
-            }
+            return _compute_options_to_dict(response)
     except grpc.RpcError as e:
         logging.error(f"gRPC ComputeParameterOptions call failed: {e.code()} - {e.details()}")
         return {
@@ -317,11 +676,7 @@ def pick_object(selection_type: str, category_filter: str = None):
     logging.info(f"Attempting to pick object (Type: {selection_type}, Filter: {category_filter}) via gRPC.")
     try:
         with get_corescript_runner_stub() as stub:
-            request = corescript_pb2.PickObjectRequest(
-                selection_type=selection_type,
-                category_filter=category_filter if category_filter else ""
-            )
-            response = stub.PickObject(request)
+            response = stub.PickObject(_pick_object_request(selection_type, category_filter))
             return {
                 "value": response.value,
                 "is_success": response.is_success,
@@ -400,3 +755,285 @@ def build_script(script_content):
             "is_success": False,
             "error_message": f"Unexpected error: {str(e)}"
         }
+
+# --- Asyncio client ---
+# Awaitable equivalents of the functions above. They run on the grpc.aio channel, so a slow
+# Revit call (ExecuteScript, PickObject) only suspends its own request instead of the event loop.
+
+async def get_status_async(timeout=None):
+    try:
+        return await get_async_stub().GetStatus(corescript_pb2.GetStatusRequest(), timeout=timeout)
+    except grpc.RpcError as e:
+        logging.error(f"gRPC GetStatus call failed: {e.code()} - {e.details()}")
+        raise
+    except Exception as e:
+        logging.error(f"An unexpected error occurred during gRPC GetStatus call: {e}")
+        raise
+
+async def execute_script_async(script_content, parameters_json, compiled_assembly=None, lane=None, user=None):
+    """
+    Runs a script. The call waits for its turn at the execution dispatcher first: lane is
+    "interactive" (default), "agent" or "batch", and user keeps each lane fair across users.
+    """
+    request = _execute_script_request(script_content, parameters_json, compiled_assembly)
+    async with execution_dispatcher.slot(lane, user):
+        try:
+            response = await get_async_stub().ExecuteScript(request)
+            return _execution_response_to_dict(response)
+        except grpc.RpcError as e:
+            logging.error(f"gRPC ExecuteScript call failed: {e.code()} - {e.details()}")
+            raise
+        finally:
+            _notify_run()
+
+async def execute_script_stream_async(script_content, parameters_json, compiled_assembly=None, lane=None, user=None):
+    """
+    Streams a script run, holding the dispatcher slot (see execute_script_async) until the stream ends.
+    Yields event dicts as the engine produces them:
+      {"event": "output", "text": str, "append": bool}
+      {"event": "structured_output", "type": str, "data": str}
+      {"event": "result", **execute_script_async-shaped dict}  (always last; "output" is empty)
+    """
+    request = _execute_script_request(script_content, parameters_json, compiled_assembly)
+    async with execution_dispatcher.slot(lane, user):
+        try:
+            async for chunk in get_async_stub().ExecuteScriptStream(request):
+                kind = chunk.WhichOneof("payload")
+                if kind == "output":
+                    yield {"event": "output", "text": chunk.output.text, "append": chunk.output.append}
+                elif kind == "structured_output":
+                    yield {"event": "structured_output", "type": chunk.structured_output.type,
+                           "data": chunk.structured_output.data}
+                elif kind == "result":
+                    yield {"event": "result", **_execution_response_to_dict(chunk.result)}
+        except grpc.RpcError as e:
+            logging.error(f"gRPC ExecuteScriptStream call failed: {e.code()} - {e.details()}")
+            raise
+        finally:
+            _notify_run()
+
+async def get_script_metadata_async(script_files):
+    content_hash = script_files_hash(script_files)
+    cached = _extraction_cache.get("metadata", content_hash)
+    if cached is not None:
+        return cached
+
+    result = _local_first("metadata", script_files)
+    if result is None:
+        request = corescript_pb2.GetScriptMetadataRequest(script_files=_to_grpc_script_files(script_files))
+        try:
+            response = await get_async_stub().GetScriptMetadata(request)
+        except grpc.RpcError as e:
+            return _offline_fallback("metadata", script_files, e)
+        result = {
+            "metadata": _metadata_to_dict(response.metadata),
+            "error_message": response.error_message
+        }
+    _cache_result("metadata", content_hash, result)
+    return result
+
+async def get_script_parameters_async(script_files):
+    content_hash = script_files_hash(script_files)
+    cached = _extraction_cache.get("parameters", content_hash)
+    if cached is not None:
+        return cached
+
+    result = _local_first("parameters", script_files)
+    if result is None:
+        request = corescript_pb2.GetScriptParametersRequest(script_files=_to_grpc_script_files(script_files))
+        try:
+            response = await get_async_stub().GetScriptParameters(request)
+        except grpc.RpcError as e:
+            return _offline_fallback("parameters", script_files, e)
+        result = {
+            "parameters": [_parameter_to_dict(p) for p in response.parameters],
+            "error_message": response.error_message
+        }
+    _cache_result("parameters", content_hash, result)
+    return result
+
+async def get_combined_script_async(script_files):
+    request = corescript_pb2.GetCombinedScriptRequest(script_files=_to_grpc_script_files(script_files))
+    response = await get_async_stub().GetCombinedScript(request)
+    return {
+        "combined_script": response.combined_script,
+        "error_message": response.error_message
+    }
+
+async def get_script_metadata_batch_async(units, include_parameters=False, max_concurrency=1):
+    """
+    Async twin of get_script_metadata_batch. With max_concurrency > 1 the misses are split into
+    that many requests and sent concurrently; results still come back in request order.
+    """
+    results, misses, hashes = _batch_cache_lookup(units, include_parameters)
+    if misses and EXTRACTOR_MODE != 'engine':
+        misses = _batch_extract_locally(misses, include_parameters, results, hashes)
+    if misses:
+        stub = get_async_stub()
+        max_units = -(-len(misses) // max_concurrency) if max_concurrency > 1 else None
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def send(request):
+            async with semaphore:
+                response = await stub.GetScriptMetadataBatch(request)
+            for r in response.results:
+                results[r.id] = _metadata_batch_result_to_dict(r)
+                _batch_cache_store(r.id, results[r.id], hashes, include_parameters)
+
+        try:
+            requests = _metadata_batch_requests(misses, include_parameters, max_units)
+            await asyncio.gather(*(send(request) for request in requests))
+        except grpc.RpcError as e:
+            _batch_offline_fallback(misses, include_parameters, results, e)
+    return {unit['id']: results[unit['id']] for unit in units if unit['id'] in results}
+
+async def create_and_open_workspace_async(script_path, script_type):
+    request = corescript_pb2.CreateWorkspaceRequest(script_path=script_path, script_type=script_type)
+    response = await get_async_stub().CreateAndOpenWorkspace(request)
+    return {
+        "workspace_path": response.workspace_path,
+        "error_message": response.error_message
+    }
+
+async def get_script_manifest_async(script_path: str) -> str:
+    request = corescript_pb2.GetScriptManifestRequest(script_path=script_path)
+    response = await get_async_stub().GetScriptManifest(request)
+    return response.manifest_json
+
+async def stream_script_manifest_async(script_path: str):
+    """Async counterpart of stream_script_manifest."""
+    request = corescript_pb2.GetScriptManifestRequest(script_path=script_path)
+    async for entry in get_async_stub().StreamScriptManifest(request):
+        yield _manifest_entry_to_dict(entry)
+
+async def get_context_async():
+    try:
+        response = await get_async_stub().GetContext(corescript_pb2.GetContextRequest())
+        return _context_to_dict(response)
+    except Exception as e:
+        logging.error(f"gRPC GetContext call failed: {e}")
+        raise
+
+async def validate_working_set_async(element_ids: list[int]) -> list[int]:
+    try:
+        request = corescript_pb2.ValidateWorkingSetRequest(element_ids=element_ids)
+        response = await get_async_stub().ValidateWorkingSet(request)
+        return list(response.valid_element_ids)
+    except grpc.RpcError as e:
+        logging.error(f"gRPC ValidateWorkingSet call failed: {e.code()} - {e.details()}")
+        return []
+    except Exception as e:
+        logging.error(f"An unexpected error occurred during gRPC ValidateWorkingSet call: {e}")
+        return []
+
+async def compute_parameter_options_async(script_content: str, parameter_name: str):
+    logging.info(f"Attempting to compute options for parameter '{parameter_name}' via gRPC.")
+    try:
+        request = corescript_pb2.ComputeParameterOptionsRequest(
+            script_content=script_content,
+            parameter_name=parameter_name
+        )
+        response = await get_async_stub().ComputeParameterOptions(request)
+        return _compute_options_to_dict(response)
+    except grpc.RpcError as e:
+        logging.error(f"gRPC ComputeParameterOptions call failed: {e.code()} - {e.details()}")
+        return {"options": [], "is_success": False, "error_message": f"gRPC error: {e.details()}"}
+    except Exception as e:
+        logging.error(f"An unexpected error occurred during gRPC ComputeParameterOptions call: {e}")
+        return {"options": [], "is_success": False, "error_message": f"Unexpected error: {str(e)}"}
+
+async def compute_parameter_options_batch_async(queries):
+    """
+    Computes options for several scripts in one engine pass.
+    queries: [{"id", "script_content", "parameter_names"}];
+    empty parameter_names means every requires_compute parameter.
+    Returns {"results": {id: {parameter_name: compute_parameter_options_async-shaped dict}}, "error_message"}.
+    """
+    logging.info(f"Attempting to compute options for {len(queries)} scripts via gRPC batch.")
+    request = corescript_pb2.ComputeParameterOptionsBatchRequest(scripts=[
+        corescript_pb2.ParameterOptionsQuery(id=q["id"], script_content=q["script_content"],
+                                             parameter_names=q.get("parameter_names") or [])
+        for q in queries
+    ])
+    try:
+        response = await get_async_stub().ComputeParameterOptionsBatch(request)
+    except grpc.RpcError as e:
+        if e.code() != grpc.StatusCode.UNIMPLEMENTED:
+            logging.error(f"gRPC ComputeParameterOptionsBatch call failed: {e.code()} - {e.details()}")
+            return {"results": {}, "error_message": f"gRPC error: {e.details()}"}
+        # Add-in predating the batch RPC: one call per named parameter
+        logging.info("ComputeParameterOptionsBatch not available, computing options one by one.")
+        results = {}
+        for q in queries:
+            for name in q.get("parameter_names") or []:
+                results.setdefault(q["id"], {})[name] = await compute_parameter_options_async(q["script_content"], name)
+        return {"results": results, "error_message": ""}
+
+    results = {}
+    for item in response.results:
+        results.setdefault(item.id, {})[item.parameter_name] = _compute_options_to_dict(item.result)
+    return {"results": results, "error_message": response.error_message}
+
+async def select_elements_async(element_ids: list[int]):
+    logging.info(f"Attempting to select {len(element_ids)} elements via gRPC.")
+    try:
+        request = corescript_pb2.SelectElementsRequest(element_ids=element_ids)
+        response = await get_async_stub().SelectElements(request)
+        return {"is_success": response.is_success, "error_message": response.error_message}
+    except grpc.RpcError as e:
+        logging.error(f"gRPC SelectElements call failed: {e.code()} - {e.details()}")
+        return {"is_success": False, "error_message": f"gRPC error: {e.details()}"}
+    except Exception as e:
+        logging.error(f"An unexpected error occurred during gRPC SelectElements call: {e}")
+        return {"is_success": False, "error_message": f"Unexpected error: {str(e)}"}
+
+async def pick_object_async(selection_type: str, category_filter: str = None):
+    logging.info(f"Attempting to pick object (Type: {selection_type}, Filter: {category_filter}) via gRPC.")
+    try:
+        response = await get_async_stub().PickObject(_pick_object_request(selection_type, category_filter))
+        return {
+            "value": response.value,
+            "is_success": response.is_success,
+            "cancelled": response.cancelled,
+            "error_message": response.error_message
+        }
+    except grpc.RpcError as e:
+        logging.error(f"gRPC PickObject call failed: {e.code()} - {e.details()}")
+        return {"is_success": False, "error_message": f"gRPC error: {e.details()}"}
+    except Exception as e:
+        logging.error(f"An unexpected error occurred during gRPC PickObject call: {e}")
+        return {"is_success": False, "error_message": f"Unexpected error: {str(e)}"}
+
+async def rename_script_async(old_path: str, new_name: str):
+    logging.info(f"Attempting to rename script '{old_path}' to '{new_name}' via gRPC.")
+    try:
+        request = corescript_pb2.RenameScriptRequest(old_path=old_path, new_name=new_name)
+        response = await get_async_stub().RenameScript(request)
+        return {
+            "is_success": response.is_success,
+            "new_path": response.new_path,
+            "error_message": response.error_message
+        }
+    except grpc.RpcError as e:
+        logging.error(f"gRPC RenameScript call failed: {e.code()} - {e.details()}")
+        return {"is_success": False, "new_path": "", "error_message": f"gRPC error: {e.details()}"}
+    except Exception as e:
+        logging.error(f"An unexpected error occurred during gRPC RenameScript call: {e}")
+        return {"is_success": False, "new_path": "", "error_message": f"Unexpected error: {str(e)}"}
+
+async def build_script_async(script_content):
+    logging.info("Attempting to build script via gRPC.")
+    try:
+        request = corescript_pb2.BuildScriptRequest(script_content=script_content)
+        response = await get_async_stub().BuildScript(request)
+        return {
+            "is_success": response.is_success,
+            "compiled_assembly": response.compiled_assembly,
+            "error_message": response.error_message
+        }
+    except grpc.RpcError as e:
+        logging.error(f"gRPC BuildScript call failed: {e.code()} - {e.details()}")
+        return {"is_success": False, "error_message": f"gRPC error: {e.details()}"}
+    except Exception as e:
+        logging.error(f"An unexpected error occurred during gRPC BuildScript call: {e}")
+        return {"is_success": False, "error_message": f"Unexpected error: {str(e)}"}
@@ -33,6 +33,7 @@ from agent import agent_router
 from api import (
     assist_router,
     auth_router,
+    events_router,
     manifest_router,
     playlist_router,
     presets_router,
@@ -40,16 +41,15 @@ from api import (
     script_execution_router,
     script_management_router,
     status_router,
+    tool_builder_router,
     user_settings_router,
     workspace_router,
-    tool_builder_router,
 )
 
-
 # Configure Uvicorn logging to suppress access logs
 logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
 
-from grpc_client import close_channel, init_channel
+from grpc_client import close_aio_channel, close_channel, init_aio_channel, init_channel
 
 
 @asynccontextmanager
@@ -61,8 +61,28 @@ async def lifespan(app: FastAPI):
     # Note: In a production environment with Alembic, you might remove this.
     Base.metadata.create_all(bind=engine)
 
-    # Initialize singleton gRPC channel
+    # Initialize singleton gRPC channels (blocking + asyncio)
     init_channel()
+    init_aio_channel()
+
+    # Background Revit status polling; /api/status serves its snapshot
+    from services.parameter_options_cache import parameter_options_cache
+    from services.status_monitor import status_monitor
+    # Optionally warm dynamic parameter options when a document becomes active (PARACORE_PREFETCH_OPTIONS)
+    status_monitor.add_listener(parameter_options_cache.on_status_changed)
+    status_monitor.start()
+
+    # Watch script folders so the script index and caches follow edits, git pulls and .ptool builds
+    from services.assembly_cache import assembly_cache
+    from services.combined_script_cache import combined_script_cache
+    from services.run_jobs import run_jobs
+    from services.script_watcher import script_watcher
+
+    from agent.api_helpers import invalidate_manifest_cache
+    script_watcher.add_listener(invalidate_manifest_cache)
+    script_watcher.add_listener(combined_script_cache.on_paths_changed)
+    script_watcher.add_listener(assembly_cache.on_paths_changed)
+    script_watcher.start()
 
 # Start Phase 3: Git Sync Background Task
     from sync.git_sync_service import start_git_sync_loop
@@ -79,7 +99,11 @@ async def lifespan(app: FastAPI):
         except asyncio.CancelledError:
             pass
 
+    await run_jobs.stop()
+    await script_watcher.stop()
+    await status_monitor.stop()
     close_channel()
+    await close_aio_channel()
 
 app = FastAPI(lifespan=lifespan)
 
@@ -91,6 +115,8 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Let the web client read the version tokens of conditional GETs
+    expose_headers=["ETag", "X-Paracore-Version"],
 )
 
 # --- Include Routers ---
@@ -107,6 +133,7 @@ app.include_router(agent_router.router)
 app.include_router(manifest_router.router)
 app.include_router(assist_router.router)
 app.include_router(tool_builder_router.router)
+app.include_router(events_router.router)
 
 app.include_router(playlist_router.router, prefix="/playlists", tags=["Playlists"])
 
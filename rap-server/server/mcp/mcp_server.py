@@ -12,9 +12,17 @@ if __name__ == "__main__" and __package__ is None:
     import sys
     sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from grpc_client import close_channel, execute_script, get_context, init_channel
+from grpc_client import (
+    close_aio_channel,
+    close_channel,
+    execute_script_async,
+    get_context_async,
+    init_aio_channel,
+    init_channel,
+)
+from services.parameter_options_cache import parameter_options_cache
 
-from agent.orchestrator.registry import ScriptRegistry
+from agent.orchestrator.registry import get_registry
 
 # Configure logging
 log_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), "mcp_debug.log")
@@ -50,7 +58,7 @@ def get_scripts_path():
 SCRIPTS_PATH = get_scripts_path()
 
 # Initialize Registry
-registry = ScriptRegistry(SCRIPTS_PATH)
+registry = get_registry(SCRIPTS_PATH)
 server = Server("paracore-mcp", version="0.1.0")
 
 @server.list_tools()
@@ -109,7 +117,7 @@ async def handle_call_tool(
 
     if name == "get_revit_context":
         try:
-            context = get_context()
+            context = await get_context_async()
             return [types.TextContent(type="text", text=json.dumps(context, indent=2))]
         except Exception as e:
             return [types.TextContent(type="text", text=f"Error getting context: {str(e)}")]
@@ -162,8 +170,8 @@ async def handle_call_tool(
                     with open(cs_files[0], 'r', encoding='utf-8-sig') as f:
                         source_code = f.read()
 
-            from grpc_client import compute_parameter_options
-            resp = compute_parameter_options(source_code, param_name)
+            # Repeat calls for the same document are answered from memory until a run changes the model
+            resp = await parameter_options_cache.compute(source_code, param_name)
             return [types.TextContent(type="text", text=json.dumps(resp, indent=2))]
         except Exception as e:
             return [types.TextContent(type="text", text=f"Error computing options: {str(e)}")]
@@ -221,7 +229,8 @@ async def handle_call_tool(
             # Metadata injection
             parameters.append({"Name": "__script_name__", "Value": script_name, "Type": "string"})
 
-            response = execute_script(json.dumps(script_files_payload), json.dumps(parameters))
+            response = await execute_script_async(json.dumps(script_files_payload), json.dumps(parameters),
+                                                  lane="agent")
 
             result = f"Execution {'Successful' if response.get('is_success') else 'Failed'}\n"
             if response.get('output'):
@@ -253,6 +262,7 @@ async def handle_read_resource(uri: str) -> types.ReadResourceResult:
 
 async def main():
     init_channel()
+    init_aio_channel()
     # Trigger a fresh script scan on startup
     logger.info("Triggering fresh script registry refresh...")
     registry.refresh(force=True)
@@ -260,6 +270,7 @@ async def main():
     async with stdio_server() as (read_stream, write_stream):
         await server.run(read_stream, write_stream, server.create_initialization_options())
     close_channel()
+    await close_aio_channel()
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -1,5 +1,5 @@
 from database_config import Base
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import Boolean, Column, DateTime, Float, ForeignKey, Integer, String, Text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -33,6 +33,24 @@ class Script(Base):
     owner = relationship("User")
     presets = relationship("Preset", back_populates="script")
 
+class ScriptIndexEntry(Base):
+    """
+    Cached scan result for one script unit (single .cs file, multi-file folder or .ptool).
+    Rows are refreshed by services.script_index when the unit's size/mtime or content hash changes.
+    """
+    __tablename__ = "script_index"
+    id = Column(Integer, primary_key=True, index=True)
+    path = Column(String, unique=True, index=True) # Normalized absolute path (forward slashes)
+    folder = Column(String, index=True) # Scanned source folder the unit was found in
+    type = Column(String) # "single-file", "multi-file" or "ptool"
+    size = Column(Integer) # Total bytes of the unit's source files
+    mtime = Column(Float) # Latest mtime of the unit (folder or any of its .cs files)
+    ctime = Column(Float)
+    content_hash = Column(String, index=True)
+    metadata_json = Column(Text, nullable=True)
+    parameters_json = Column(Text, nullable=True)
+    indexed_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
 class Workspace(Base):
     __tablename__ = "workspaces"
     id = Column(Integer, primary_key=True, index=True)
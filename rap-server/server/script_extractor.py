@@ -0,0 +1,2086 @@
+"""
+Offline script metadata and parameter extraction.
+
+A pure-Python port of the engine's extractors (CoreScript.Engine/Core/MetadataExtractor.cs,
+ParameterExtractor.cs and the ScriptParser/SemanticCombinator combine rules). It produces the same dicts
+as grpc_client.get_script_metadata / get_script_parameters without a round trip to Revit, so listings and
+parameter forms work while Revit is closed and are cheap while it is open.
+
+The C# source is lexed and parsed only as far as the extractors look: using directives, type declarations,
+top-level statements, the members of `class Params`, attributes and initializer expressions. Anything the
+parser cannot follow raises UnsupportedSourceError so the caller can ask the engine instead.
+"""
+import json
+import re
+import struct
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class UnsupportedSourceError(Exception):
+    """The source uses syntax this parser does not follow; the engine has to extract it."""
+
+
+class ScriptExtractionError(Exception):
+    """Extraction failed the same way it fails in the engine; the message mirrors its error_message."""
+
+
+# --- Lexer ---
+
+_MODIFIERS = {
+    "public", "private", "protected", "internal", "static", "readonly", "const", "volatile", "virtual",
+    "override", "abstract", "sealed", "new", "extern", "unsafe", "partial", "required", "async", "ref", "file",
+    "fixed",
+}
+_ACCESS_MODIFIERS = {"public", "private", "protected", "internal"}
+_TYPE_KEYWORDS = {"class", "struct", "interface", "enum"}
+_PREDEFINED_TYPES = {
+    "bool", "byte", "sbyte", "char", "decimal", "double", "float", "int", "uint", "long", "ulong", "short",
+    "ushort", "object", "string", "void", "nint", "nuint",
+}
+_PUNCTUATORS = sorted([
+    "=>", "==", "!=", "<=", "&&", "||", "??=", "??", "?.", "::", "++", "--", "->", "+=", "-=", "*=", "/=", "%=",
+    "&=", "|=", "^=", "<<=", "<<", "..",
+], key=len, reverse=True)
+_LINE_BREAKS = "\r\n\u2028\u2029\u0085"
+_SIMPLE_ESCAPES = {"'": "'", '"': '"', "\\": "\\", "0": "\0", "a": "\a", "b": "\b", "f": "\f", "n": "\n",
+                   "r": "\r", "t": "\t", "v": "\v"}
+
+
+class _Trivia:
+    __slots__ = ("kind", "start", "end", "text")
+
+    def __init__(self, kind, start, end, text):
+        self.kind, self.start, self.end, self.text = kind, start, end, text
+
+
+class _Token:
+    __slots__ = ("kind", "start", "end", "text", "value", "ltype", "leading", "trailing")
+
+    def __init__(self, kind, start, end, text, value=None, ltype=None):
+        self.kind, self.start, self.end, self.text = kind, start, end, text
+        self.value, self.ltype = value, ltype
+        self.leading: List[_Trivia] = []
+        self.trailing: List[_Trivia] = []
+
+
+def _is_ident_start(ch):
+    return ch == "_" or ch.isalpha()
+
+
+def _is_ident_part(ch):
+    return ch == "_" or ch.isalnum()
+
+
+class _Lexer:
+    def __init__(self, text):
+        self.text = text
+        self.pos = 0
+
+    def tokens(self) -> List[_Token]:
+        tokens = []
+        leading = self._trivia(trailing=False)
+        while True:
+            if self.pos >= len(self.text):
+                eof = _Token("eof", self.pos, self.pos, "")
+                eof.leading = leading
+                tokens.append(eof)
+                return tokens
+            token = self._token()
+            token.leading = leading
+            token.trailing = self._trivia(trailing=True)
+            tokens.append(token)
+            leading = self._trivia(trailing=False)
+
+    # Trivia follows Roslyn: a token owns what follows it up to and including the end of its line,
+    # everything else up to the next token is that token's leading trivia.
+    def _trivia(self, trailing) -> List[_Trivia]:
+        text, result = self.text, []
+        while self.pos < len(text):
+            start, ch = self.pos, text[self.pos]
+            if ch in _LINE_BREAKS:
+                self.pos += 2 if text.startswith("\r\n", start) else 1
+                result.append(_Trivia("eol", start, self.pos, text[start:self.pos]))
+                if trailing:
+                    break
+            elif ch.isspace():
+                while self.pos < len(text) and text[self.pos].isspace() and text[self.pos] not in _LINE_BREAKS:
+                    self.pos += 1
+                result.append(_Trivia("ws", start, self.pos, text[start:self.pos]))
+            elif text.startswith("///", start) and not text.startswith("////", start) and not trailing:
+                end = self._line_end(start)
+                # Consecutive /// lines form one documentation comment
+                while True:
+                    m = re.compile(r"(\r\n|[\r\n\u2028\u2029\u0085])[ \t]*///(?!/)").match(text, end)
+                    if not m:
+                        break
+                    end = self._line_end(m.end())
+                self.pos = end
+                result.append(_Trivia("doc", start, end, text[start:end]))
+            elif text.startswith("//", start):
+                self.pos = self._line_end(start)
+                result.append(_Trivia("comment", start, self.pos, text[start:self.pos]))
+            elif text.startswith("/*", start):
+                end = text.find("*/", start + 2)
+                self.pos = len(text) if end < 0 else end + 2
+                result.append(_Trivia("ml_comment", start, self.pos, text[start:self.pos]))
+            elif ch == "#" and not trailing and self._at_line_start(start):
+                self.pos = self._line_end(start)
+                result.append(_Trivia("directive", start, self.pos, text[start:self.pos]))
+            else:
+                break
+        return result
+
+    def _line_end(self, pos):
+        text = self.text
+        while pos < len(text) and text[pos] not in _LINE_BREAKS:
+            pos += 1
+        return pos
+
+    def _at_line_start(self, pos):
+        i = pos - 1
+        while i >= 0 and self.text[i] not in _LINE_BREAKS:
+            if not self.text[i].isspace():
+                return False
+            i -= 1
+        return True
+
+    def _token(self) -> _Token:
+        text, start = self.text, self.pos
+        ch = text[start]
+        nxt = text[start + 1] if start + 1 < len(text) else ""
+
+        if ch in "$@" or ch == '"':
+            m = re.compile(r'(\$+@?|@\$+|@)?("+)').match(text, start)
+            if m and (m.group(1) or ch == '"'):
+                prefix, quotes = m.group(1) or "", len(m.group(2))
+                if "$" not in prefix and "@" not in prefix and quotes >= 3:
+                    return self._raw_string(start, m.end(), quotes, interpolated=False)
+                if "$" in prefix and "@" not in prefix and quotes >= 3:
+                    return self._raw_string(start, m.end(), quotes, interpolated=True)
+                if "$" in prefix:
+                    return self._interpolated_string(start, m.start(2) + 1, verbatim="@" in prefix)
+                if prefix == "@":
+                    return self._verbatim_string(start, m.start(2) + 1)
+                return self._regular_string(start)
+        if ch == "@" and _is_ident_start(nxt):
+            self.pos = start + 1
+            while self.pos < len(text) and _is_ident_part(text[self.pos]):
+                self.pos += 1
+            return _Token("ident", start, self.pos, text[start:self.pos])
+        if _is_ident_start(ch):
+            self.pos = start
+            while self.pos < len(text) and _is_ident_part(text[self.pos]):
+                self.pos += 1
+            return _Token("ident", start, self.pos, text[start:self.pos])
+        if ch.isdigit() or (ch == "." and nxt.isdigit()):
+            return self._number(start)
+        if ch == "'":
+            return self._char(start)
+        for punct in _PUNCTUATORS:
+            if text.startswith(punct, start):
+                self.pos = start + len(punct)
+                return _Token("punct", start, self.pos, punct)
+        self.pos = start + 1
+        return _Token("punct", start, self.pos, ch)
+
+    def _escape(self, pos) -> Tuple[str, int]:
+        text = self.text
+        ch = text[pos + 1] if pos + 1 < len(text) else ""
+        if ch in _SIMPLE_ESCAPES:
+            return _SIMPLE_ESCAPES[ch], pos + 2
+        if ch in "uU":
+            width = 4 if ch == "u" else 8
+            digits = text[pos + 2:pos + 2 + width]
+            if len(digits) == width and all(c in "0123456789abcdefABCDEF" for c in digits):
+                code = int(digits, 16)
+                return (chr(code) if code <= 0x10FFFF else ""), pos + 2 + width
+        if ch == "x":
+            m = re.compile(r"[0-9a-fA-F]{1,4}").match(text, pos + 2)
+            if m:
+                return chr(int(m.group(0), 16)), m.end()
+        raise UnsupportedSourceError(f"Unrecognized escape sequence at offset {pos}.")
+
+    def _string_suffix(self, token):
+        # "..."u8 is a UTF-8 literal (a ReadOnlySpan<byte>), not a string
+        if self.text[self.pos:self.pos + 2] in ("u8", "U8"):
+            self.pos += 2
+            token.kind, token.ltype = "utf8", None
+            token.end, token.text = self.pos, self.text[token.start:self.pos]
+        return token
+
+    def _regular_string(self, start):
+        text, pos, value = self.text, start + 1, []
+        while pos < len(text) and text[pos] != '"':
+            if text[pos] in _LINE_BREAKS:
+                raise UnsupportedSourceError(f"Unterminated string literal at offset {start}.")
+            if text[pos] == "\\":
+                ch, pos = self._escape(pos)
+                value.append(ch)
+            else:
+                value.append(text[pos])
+                pos += 1
+        if pos >= len(text):
+            raise UnsupportedSourceError(f"Unterminated string literal at offset {start}.")
+        self.pos = pos + 1
+        return self._string_suffix(_Token("string", start, self.pos, text[start:self.pos], "".join(value), "string"))
+
+    def _verbatim_string(self, start, pos):
+        text, value = self.text, []
+        while True:
+            if pos >= len(text):
+                raise UnsupportedSourceError(f"Unterminated verbatim string at offset {start}.")
+            if text[pos] == '"':
+                if text.startswith('""', pos):
+                    value.append('"')
+                    pos += 2
+                    continue
+                break
+            value.append(text[pos])
+            pos += 1
+        self.pos = pos + 1
+        return self._string_suffix(_Token("string", start, self.pos, text[start:self.pos], "".join(value), "string"))
+
+    def _raw_string(self, start, pos, quotes, interpolated):
+        text, closing = self.text, '"' * quotes
+        end = text.find(closing, pos)
+        if end < 0:
+            raise UnsupportedSourceError(f"Unterminated raw string literal at offset {start}.")
+        self.pos = end + quotes
+        while self.pos < len(text) and text[self.pos] == '"':
+            self.pos += 1
+            end += 1
+        if interpolated:
+            return _Token("interp", start, self.pos, text[start:self.pos])
+        body = text[pos:end]
+        if re.match(r"[ \t]*(\r\n|[\r\n])", body):
+            # Multi-line raw string: drop the opening and closing lines and the closing line's indentation
+            lines = re.split(r"\r\n|[\r\n]", body)
+            indent = lines[-1]
+            value = "\n".join(line[len(indent):] if line.startswith(indent) else line.lstrip() for line in lines[1:-1])
+        else:
+            value = body
+        return self._string_suffix(_Token("string", start, self.pos, text[start:self.pos], value, "string"))
+
+    def _interpolated_string(self, start, pos, verbatim):
+        text, depth = self.text, 0
+        while pos < len(text):
+            ch = text[pos]
+            if depth == 0:
+                if ch == '"':
+                    if verbatim and text.startswith('""', pos):
+                        pos += 2
+                        continue
+                    self.pos = pos + 1
+                    return _Token("interp", start, self.pos, text[start:self.pos])
+                if ch == "\\" and not verbatim:
+                    pos += 2
+                    continue
+                if ch == "{":
+                    if text.startswith("{{", pos):
+                        pos += 2
+                        continue
+                    depth = 1
+                elif ch in _LINE_BREAKS and not verbatim:
+                    break
+                pos += 1
+                continue
+            # Inside an interpolation hole
+            if ch == "{":
+                depth += 1
+            elif ch == "}":
+                depth -= 1
+            elif ch in "\"'$@":
+                saved = self.pos
+                self.pos = pos
+                pos = self._token().end
+                self.pos = saved
+                continue
+            pos += 1
+        raise UnsupportedSourceError(f"Unterminated interpolated string at offset {start}.")
+
+    def _char(self, start):
+        text, pos = self.text, start + 1
+        if pos < len(text) and text[pos] == "\\":
+            value, pos = self._escape(pos)
+        elif pos < len(text):
+            value, pos = text[pos], pos + 1
+        else:
+            value = ""
+        if pos >= len(text) or text[pos] != "'":
+            raise UnsupportedSourceError(f"Malformed character literal at offset {start}.")
+        self.pos = pos + 1
+        return _Token("char", start, self.pos, text[start:self.pos], value, "char")
+
+    def _number(self, start):
+        text = self.text
+        m = re.compile(r"0[xX][0-9a-fA-F_]+|0[bB][01_]+").match(text, start)
+        is_real = False
+        if m:
+            pos = m.end()
+        else:
+            m = re.compile(r"[0-9_]*(\.[0-9][0-9_]*)?([eE][+-]?[0-9_]+)?").match(text, start)
+            pos = m.end()
+            is_real = bool(m.group(1) or m.group(2))
+        body = text[start:pos]
+        sm = re.compile(r"[uU][lL]?|[lL][uU]?|[fFdDmM]").match(text, pos)
+        suffix = sm.group(0).lower() if sm else ""
+        if sm:
+            pos = sm.end()
+        if pos < len(text) and _is_ident_part(text[pos]):
+            raise UnsupportedSourceError(f"Malformed numeric literal at offset {start}.")
+        self.pos = pos
+        clean = body.replace("_", "")
+        token = _Token("number", start, pos, text[start:pos])
+        if is_real or suffix in ("f", "d", "m"):
+            ltype = {"f": "float", "m": "decimal"}.get(suffix, "double")
+            token.ltype = ltype
+            token.value = Decimal(clean) if ltype == "decimal" else float(clean)
+            return token
+        lower = clean.lower()
+        if lower.startswith("0x"):
+            value = int(lower[2:], 16)
+        elif lower.startswith("0b"):
+            value = int(lower[2:], 2)
+        else:
+            value = int(clean)
+        if suffix == "":
+            ltype = "int" if value <= 0x7FFFFFFF else "uint" if value <= 0xFFFFFFFF else \
+                "long" if value <= 0x7FFFFFFFFFFFFFFF else "ulong"
+        elif suffix == "u":
+            ltype = "uint" if value <= 0xFFFFFFFF else "ulong"
+        elif suffix == "l":
+            ltype = "long" if value <= 0x7FFFFFFFFFFFFFFF else "ulong"
+        else:
+            ltype = "ulong"
+        token.ltype, token.value = ltype, value
+        return token
+
+
+# --- .NET formatting (System.Text.Json with the default encoder, Convert.ToString) ---
+
+def _format_double(value: float) -> str:
+    """Shortest round-trip formatting of a double, as .NET Core's double.ToString()/Utf8JsonWriter write it."""
+    if value != value:
+        return "NaN"
+    if value in (float("inf"), float("-inf")):
+        return "Infinity" if value > 0 else "-Infinity"
+    if value == 0:
+        return "-0" if struct.pack(">d", value)[0] & 0x80 else "0"
+    sign, digits, exponent = Decimal(repr(value)).normalize().as_tuple()
+    d = "".join(map(str, digits))
+    sci = len(d) - 1 + exponent
+    if sci >= 15 or sci < -5:
+        body = d[0] + ("." + d[1:] if len(d) > 1 else "") + "E" + ("+" if sci >= 0 else "-") + f"{abs(sci):02d}"
+    elif exponent >= 0:
+        body = d + "0" * exponent
+    else:
+        point = len(d) + exponent
+        body = d[:point] + "." + d[point:] if point > 0 else "0." + "0" * -point + d
+    return ("-" if sign else "") + body
+
+
+def _format_float32(value: float) -> str:
+    single = struct.unpack("<f", struct.pack("<f", value))[0]
+    for precision in range(1, 10):
+        candidate = float(f"{single:.{precision}g}")
+        if struct.unpack("<f", struct.pack("<f", candidate))[0] == single:
+            return _format_double(candidate)
+    return _format_double(single)
+
+
+_JSON_SHORT_ESCAPES = {"\b": "\\b", "\t": "\\t", "\n": "\\n", "\f": "\\f", "\r": "\\r", "\\": "\\\\"}
+# JavaScriptEncoder.Default also escapes these HTML-sensitive ASCII characters
+_JSON_ESCAPED_ASCII = set("\"&'+<>`")
+
+
+def _json_string(value: str) -> str:
+    out = ['"']
+    for ch in value:
+        if ch in _JSON_SHORT_ESCAPES:
+            out.append(_JSON_SHORT_ESCAPES[ch])
+        elif " " <= ch <= "~" and ch not in _JSON_ESCAPED_ASCII:
+            out.append(ch)
+        else:
+            units = ch.encode("utf-16-be", "surrogatepass")
+            for i in range(0, len(units), 2):
+                out.append("\\u%04X" % int.from_bytes(units[i:i + 2], "big"))
+    out.append('"')
+    return "".join(out)
+
+
+def _serialize(value) -> str:
+    """JsonSerializer.Serialize for the value types ParameterExtractor writes into DefaultValueJson."""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, float):
+        return _format_double(value)
+    if isinstance(value, list):
+        return "[" + ",".join(_json_string(v) for v in value) + "]"
+    return _json_string(value)
+
+
+def _try_parse_double(text: str) -> Optional[float]:
+    if not re.fullmatch(r"\s*[+-]?(\d[\d,]*\.?\d*|\.\d+)([eE][+-]?\d+)?\s*", text):
+        return None
+    return float(text.replace(",", "").strip())
+
+
+# --- Source model ---
+
+class _Source:
+    """A lexed C# file with bracket matching and the declaration-level structure the extractors need."""
+
+    def __init__(self, text: str):
+        self.text = text
+        self.tokens = _Lexer(text).tokens()
+        self.match: Dict[int, int] = {}
+        stack = []
+        pairs = {")": "(", "]": "[", "}": "{"}
+        for i, tok in enumerate(self.tokens):
+            if tok.kind != "punct":
+                continue
+            if tok.text in "([{":
+                stack.append(i)
+            elif tok.text in pairs:
+                if not stack or self.tokens[stack[-1]].text != pairs[tok.text]:
+                    raise UnsupportedSourceError("Unbalanced brackets.")
+                opener = stack.pop()
+                self.match[opener] = i
+                self.match[i] = opener
+        if stack:
+            raise UnsupportedSourceError("Unbalanced brackets.")
+        self._line_starts = [0] + [m.end() for m in re.finditer(r"\r\n|[\r\n\u2028\u2029\u0085]", text)]
+        self.usings = self._find_using_directives()
+        self.types = self._find_type_declarations()
+
+    # Token helpers
+    def tok(self, i) -> _Token:
+        return self.tokens[min(i, len(self.tokens) - 1)]
+
+    def is_(self, i, text) -> bool:
+        tok = self.tok(i)
+        return tok.kind in ("punct", "ident") and tok.text == text
+
+    def full_start(self, i) -> int:
+        tok = self.tokens[i]
+        return tok.leading[0].start if tok.leading else tok.start
+
+    def full_end(self, i) -> int:
+        tok = self.tokens[i]
+        return tok.trailing[-1].end if tok.trailing else tok.end
+
+    def span_text(self, first, last) -> str:
+        return self.text[self.tokens[first].start:self.tokens[last].end]
+
+    def line_of(self, pos) -> int:
+        lo, hi = 0, len(self._line_starts) - 1
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if self._line_starts[mid] <= pos:
+                lo = mid
+            else:
+                hi = mid - 1
+        return lo
+
+    def skip_to(self, i, stops, limit=None) -> int:
+        """Index of the first token at bracket depth 0 whose text is in stops (or limit/eof)."""
+        limit = len(self.tokens) - 1 if limit is None else limit
+        while i < limit:
+            tok = self.tokens[i]
+            if tok.kind == "punct" and tok.text in stops:
+                return i
+            if tok.kind == "punct" and tok.text in "([{" and i in self.match:
+                i = self.match[i]
+            i += 1
+        return limit
+
+    def skip_angles(self, i) -> int:
+        """i is at '<'; returns the index after the matching '>'."""
+        depth = 0
+        while i < len(self.tokens) - 1:
+            text = self.tokens[i].text if self.tokens[i].kind == "punct" else ""
+            if text == "<":
+                depth += 1
+            elif text == ">":
+                depth -= 1
+                if depth == 0:
+                    return i + 1
+            elif text in ("(", "["):
+                i = self.match[i]
+            elif text in (";", "{", "}", ")", "]"):
+                raise UnsupportedSourceError("Malformed type argument list.")
+            i += 1
+        raise UnsupportedSourceError("Unterminated type argument list.")
+
+    def skip_type(self, i) -> int:
+        """Skips a type (qualified/generic name, tuple, nullable, array, pointer) starting at i."""
+        tok = self.tok(i)
+        if self.is_(i, "("):
+            i = self.match[i] + 1
+        elif tok.kind == "ident":
+            i += 1
+            while True:
+                if self.is_(i, "<"):
+                    i = self.skip_angles(i)
+                if (self.is_(i, ".") or self.is_(i, "::")) and self.tok(i + 1).kind == "ident":
+                    i += 2
+                    continue
+                break
+        else:
+            raise UnsupportedSourceError(f"Expected a type at offset {tok.start}.")
+        while True:
+            if self.is_(i, "?") or self.is_(i, "*"):
+                i += 1
+            elif self.is_(i, "[") and all(self.is_(k, ",") for k in range(i + 1, self.match[i])):
+                i = self.match[i] + 1
+            else:
+                return i
+
+    def _find_using_directives(self) -> List[Tuple[int, int]]:
+        result = []
+        candidates = [0] + [i + 1 for i, t in enumerate(self.tokens) if t.kind == "punct" and t.text in ("{", ";")
+                            and self._after_namespace_header(i)]
+        for i in candidates:
+            while True:
+                first = i
+                if self.is_(i, "extern") and self.is_(i + 1, "alias"):
+                    i = self.skip_to(i, (";",)) + 1
+                    continue
+                if self.is_(i, "global") and self.is_(i + 1, "using"):
+                    i += 1
+                if not self.is_(i, "using"):
+                    break
+                if not self._is_using_directive(i):
+                    end = self.skip_to(i + 1, (";", "{"))
+                    # A using directive missing its ';' runs into the declarations after it
+                    if any(self.tokens[k].kind == "ident" and self.tokens[k].text in _ACCESS_MODIFIERS | _TYPE_KEYWORDS
+                           for k in range(i + 1, end)):
+                        raise UnsupportedSourceError(f"Unterminated using directive at offset {self.tokens[i].start}.")
+                    break
+                end = self.skip_to(i, (";",))
+                result.append((first, end))
+                i = end + 1
+        return result
+
+    def _after_namespace_header(self, i) -> bool:
+        j = i - 1
+        while j >= 0 and (self.tokens[j].kind == "ident" or self.is_(j, ".")):
+            if self.is_(j, "namespace"):
+                return True
+            j -= 1
+        return False
+
+    def _is_using_directive(self, i) -> bool:
+        if self.is_(i + 1, "static"):
+            return True
+        if self.is_(i + 1, "(") or self.is_(i + 1, "await"):
+            return False
+        end = self.skip_to(i + 1, (";", "{"))
+        if not self.is_(end, ";"):
+            return False
+        eq = next((k for k in range(i + 1, end) if self.is_(k, "=")), None)
+        if eq is None:
+            return True
+        # `using Alias = Name;` vs. a using declaration `using Type name = value;`
+        return eq == i + 2 and self.tok(i + 1).kind == "ident"
+
+    def _find_type_declarations(self) -> List[Dict[str, Any]]:
+        decls = []
+        for i, tok in enumerate(self.tokens):
+            if tok.kind != "ident" or tok.text not in _TYPE_KEYWORDS:
+                continue
+            name = self.tok(i + 1)
+            if name.kind != "ident" or name.text == "where" or (i > 0 and self.is_(i - 1, "record")):
+                continue
+            first = i
+            while first > 0:
+                prev = self.tokens[first - 1]
+                if prev.kind == "ident" and prev.text in _MODIFIERS:
+                    first -= 1
+                elif self.is_(first - 1, "]"):
+                    first = self.match[first - 1]
+                else:
+                    break
+            body = self.skip_to(i + 2, ("{", ";"))
+            for k in range(i + 2, body):
+                header = self.tokens[k]
+                # Modifiers, a type keyword (other than a `where T : class` constraint) or an attribute list
+                # (brackets that aren't an array rank) mean a broken header
+                if header.kind == "ident" and (header.text in _ACCESS_MODIFIERS or header.text in _TYPE_KEYWORDS
+                                               and not (self.is_(k - 1, ":") or self.is_(k - 1, ","))) \
+                        or self.is_(k, "[") and not all(self.is_(x, ",") for x in range(k + 1, self.match.get(k, k))):
+                    raise UnsupportedSourceError(f"Malformed {tok.text} declaration at offset {tok.start}.")
+            last = self.match.get(body, body) if self.is_(body, "{") else body
+            if self.is_(body, "{") and self.is_(last + 1, ";"):
+                last += 1
+            decls.append({"first": first, "keyword": tok.text, "name": name.text, "open": body, "last": last})
+        decls.sort(key=lambda d: d["first"])
+        return decls
+
+    def removed_spans(self) -> List[Tuple[int, int]]:
+        """Full spans of the using directives and type declarations (what ScriptParser strips from the body)."""
+        spans = [(self.full_start(a), self.full_end(b)) for a, b in self.usings]
+        spans += [(self.full_start(d["first"]), self.full_end(d["last"])) for d in self.types]
+        merged = []
+        for start, end in sorted(spans):
+            if merged and start <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+            else:
+                merged.append((start, end))
+        return merged
+
+    def body_text(self) -> str:
+        parts, pos = [], 0
+        for start, end in self.removed_spans():
+            parts.append(self.text[pos:start])
+            pos = end
+        parts.append(self.text[pos:])
+        return "".join(parts)
+
+    def global_statements(self) -> List[Tuple[int, int]]:
+        """Token ranges [first, last] of the top-level statements."""
+        removed = self.removed_spans()
+        result, i, n = [], 0, len(self.tokens) - 1
+
+        def in_removed(tok):
+            return any(start <= tok.start < end for start, end in removed)
+
+        while i < n:
+            if in_removed(self.tokens[i]):
+                i += 1
+                continue
+            if self.is_(i, "namespace"):
+                body = self.skip_to(i, ("{", ";"))
+                i = (self.match[body] if self.is_(body, "{") else body) + 1
+                continue
+            first = i
+            while i < n and not in_removed(self.tokens[i]):
+                tok = self.tokens[i]
+                if tok.kind == "punct" and tok.text == ";":
+                    break
+                if tok.kind == "punct" and tok.text in "([{":
+                    closer = self.match[i]
+                    if tok.text == "{" and not self.is_(closer + 1, ";") and not self.is_(closer + 1, ")") \
+                            and not self.is_(closer + 1, ",") and not self.is_(closer + 1, "."):
+                        i = closer
+                        break
+                    i = closer
+                i += 1
+            result.append((first, min(i, n - 1)))
+            i += 1
+        return result
+
+
+# --- Expressions ---
+
+class _Node:
+    __slots__ = ("kind", "first", "last", "op", "name", "target", "operand", "left", "right", "args",
+                 "elements", "init", "explicit")
+
+    def __init__(self, kind, first, last, **fields):
+        self.kind, self.first, self.last = kind, first, last
+        self.op = self.name = self.target = self.operand = self.left = self.right = None
+        self.args = self.elements = self.init = None
+        self.explicit = False
+        for key, value in fields.items():
+            setattr(self, key, value)
+
+
+class _Bail(Exception):
+    pass
+
+
+_BINARY_LEVELS = [("??",), ("||",), ("&&",), ("|",), ("^",), ("&",), ("==", "!="), ("<", ">", "<=", ">="),
+                  ("<<", ">>", ">>>"), ("+", "-"), ("*", "/", "%")]
+
+
+class _ExpressionParser:
+    """Recursive-descent parser for the expression shapes the engine's extractors distinguish."""
+
+    def __init__(self, src: _Source, first: int, end: int):
+        self.src, self.pos, self.end = src, first, end
+
+    def parse(self) -> _Node:
+        node = self._expression()
+        if self.pos != self.end:
+            raise _Bail()
+        return node
+
+    def _peek(self, offset=0) -> Optional[_Token]:
+        i = self.pos + offset
+        return self.src.tokens[i] if i < self.end else None
+
+    def _is(self, text, offset=0) -> bool:
+        tok = self._peek(offset)
+        return tok is not None and tok.kind in ("punct", "ident") and tok.text == text
+
+    def _expression(self) -> _Node:
+        tok = self._peek()
+        if tok is None:
+            raise _Bail()
+        if (tok.kind == "ident" and self._is("=>", 1)) or self._is("async") or \
+                (self._is("(") and self.src.is_(self.src.match[self.pos] + 1, "=>")):
+            raise _Bail()
+        node = self._binary(0)
+        nxt = self._peek()
+        # Conditional and assignment expressions are never one of the shapes the extractors look for
+        if nxt is not None and nxt.kind == "punct" and (nxt.text == "?" or nxt.text.endswith("=")) \
+                and nxt.text not in ("==", "!=", "<=", ">="):
+            raise _Bail()
+        return node
+
+    def _operator(self) -> Tuple[Optional[str], int]:
+        tok = self._peek()
+        if tok is None or tok.kind != "punct":
+            return None, 0
+        if tok.text == ">":
+            width, op = 1, ">"
+            while self._is(">", width) and self._peek(width).start == self._peek(width - 1).end and len(op) < 3:
+                op += ">"
+                width += 1
+            if self._is("=", width) and self._peek(width).start == self._peek(width - 1).end:
+                if op == ">":
+                    return ">=", 2
+                return None, 0  # >>= is an assignment
+            return op, width
+        return tok.text, 1
+
+    def _binary(self, level) -> _Node:
+        if level == len(_BINARY_LEVELS):
+            return self._unary()
+        left = self._binary(level + 1)
+        while True:
+            if self._is("is") or self._is("as") or self._is("switch") or self._is("with"):
+                raise _Bail()
+            op, width = self._operator()
+            if op not in _BINARY_LEVELS[level]:
+                return left
+            self.pos += width
+            right = self._binary(level) if op == "??" else self._binary(level + 1)
+            left = _Node("binary", left.first, right.last, op=op, left=left, right=right)
+            if op == "??":
+                return left
+
+    def _unary(self) -> _Node:
+        tok = self._peek()
+        if tok is None:
+            raise _Bail()
+        if tok.kind == "punct" and tok.text in ("-", "!", "+", "~", "++", "--", "^", "&", "*"):
+            first = self.pos
+            self.pos += 1
+            operand = self._unary()
+            return _Node("prefix", first, operand.last, op=tok.text, operand=operand)
+        if tok.kind == "ident" and tok.text in ("await", "throw", "ref", "out", "stackalloc", "delegate", "static"):
+            raise _Bail()
+        if self._is("(") and self._is_cast():
+            first = self.pos
+            self.pos = self.src.match[self.pos] + 1
+            operand = self._unary()
+            return _Node("other", first, operand.last)
+        return self._postfix(self._primary())
+
+    def _is_cast(self) -> bool:
+        close = self.src.match[self.pos]
+        inner = range(self.pos + 1, close)
+        if not inner or close + 1 >= self.end:
+            return False
+        tokens = [self.src.tokens[k] for k in inner]
+        if not all(t.kind == "ident" or t.text in (".", "<", ">", ",", "?", "[", "]", "::") for t in tokens):
+            return False
+        after = self.src.tokens[close + 1]
+        if tokens[0].text in _PREDEFINED_TYPES:
+            return after.kind != "punct" or after.text in ("(", "-", "!", "~", "+")
+        if any(t.text == "," for t in tokens):
+            return False
+        if after.kind in ("ident", "number", "string", "char", "interp"):
+            return True
+        return after.kind == "punct" and after.text in ("(", "!", "~")
+
+    def _primary(self) -> _Node:
+        src, tok, first = self.src, self._peek(), self.pos
+        if tok.kind in ("number", "string", "char", "utf8"):
+            self.pos += 1
+            return _Node("literal", first, first)
+        if tok.kind == "interp":
+            self.pos += 1
+            return _Node("other", first, first)
+        if tok.kind == "ident":
+            if tok.text in ("true", "false", "null"):
+                self.pos += 1
+                return _Node("literal", first, first)
+            if tok.text == "default" and not self._is("(", 1):
+                self.pos += 1
+                return _Node("literal", first, first)
+            if tok.text in ("typeof", "sizeof", "default", "checked", "unchecked", "nameof") and self._is("(", 1):
+                if tok.text == "nameof":
+                    self.pos += 1
+                    return _Node("identifier", first, first, name=tok.text)
+                self.pos = src.match[self.pos + 1] + 1
+                return _Node("other", first, self.pos - 1)
+            if tok.text in ("this", "base") or tok.text in _PREDEFINED_TYPES:
+                self.pos += 1
+                return _Node("other", first, first)
+            if tok.text == "new":
+                return self._creation()
+            if tok.text in ("is", "as", "switch", "with"):
+                raise _Bail()
+            self.pos += 1
+            return _Node("identifier", first, first, name=tok.text)
+        if self._is("["):
+            close = src.match[self.pos]
+            elements = []
+            for a, b in self._split(self.pos + 1, close):
+                if src.is_(a, ".."):
+                    elements.append((True, _parse_expression(src, a + 1, b)))
+                else:
+                    elements.append((False, _parse_expression(src, a, b)))
+            self.pos = close + 1
+            return _Node("collection", first, close, elements=elements)
+        if self._is("("):
+            close = src.match[self.pos]
+            parts = self._split(self.pos + 1, close)
+            self.pos = close + 1
+            if len(parts) > 1:
+                return _Node("tuple", first, close, args=[self._argument(a, b, allow_equals=False) for a, b in parts])
+            if not parts:
+                raise _Bail()
+            inner = _parse_expression(src, parts[0][0], parts[0][1])
+            return _Node("paren", first, close, operand=inner)
+        raise _Bail()
+
+    def _postfix(self, node: _Node) -> _Node:
+        src = self.src
+        while True:
+            if self._is(".") and self._peek(1) is not None and self._peek(1).kind == "ident":
+                self.pos += 2
+                node = _Node("member", node.first, self.pos - 1, target=node, name=src.tokens[self.pos - 1].text)
+                if self._is("<"):
+                    raise _Bail()
+            elif self._is("("):
+                close = src.match[self.pos]
+                args = [self._argument(a, b, allow_equals=False) for a, b in self._split(self.pos + 1, close)]
+                self.pos = close + 1
+                node = _Node("invocation", node.first, close, target=node, args=args)
+            elif self._is("["):
+                self.pos = src.match[self.pos] + 1
+                node = _Node("other", node.first, self.pos - 1)
+            elif self._is("++") or self._is("--") or (self._is("!") and not self._is("=", 1)):
+                self.pos += 1
+                node = _Node("other", node.first, self.pos - 1)
+            elif self._is("?.") or self._is("->") or self._is("?") and self._is("[", 1):
+                raise _Bail()
+            else:
+                return node
+
+    def _creation(self) -> _Node:
+        src, first = self.src, self.pos
+        self.pos += 1
+        if self._is("["):
+            close = src.match[self.pos]
+            if not self._is("{", close - self.pos + 1):
+                raise _Bail()
+            self.pos = close + 1
+            init = self._initializer()
+            return _Node("implicit_array", first, self.pos - 1, init=init)
+        if self._is("("):
+            close = src.match[self.pos]
+            args = [self._argument(a, b, allow_equals=False) for a, b in self._split(self.pos + 1, close)]
+            self.pos = close + 1
+            init = self._initializer() if self._is("{") else None
+            return _Node("object_creation", first, self.pos - 1, args=args, init=init, explicit=False)
+        if self._is("{"):
+            self.pos = src.match[self.pos] + 1
+            return _Node("other", first, self.pos - 1)
+        if self._peek() is None or self._peek().kind != "ident":
+            raise _Bail()
+        self.pos += 1
+        while True:
+            if self._is("<"):
+                self.pos = src.skip_angles(self.pos)
+            if (self._is(".") or self._is("::")) and self._peek(1) is not None and self._peek(1).kind == "ident":
+                self.pos += 2
+                continue
+            break
+        if self._is("?"):
+            self.pos += 1
+        if self._is("["):
+            while self._is("["):
+                self.pos = src.match[self.pos] + 1
+            init = self._initializer() if self._is("{") else None
+            return _Node("array_creation", first, self.pos - 1, init=init)
+        args = []
+        if self._is("("):
+            close = src.match[self.pos]
+            args = [self._argument(a, b, allow_equals=False) for a, b in self._split(self.pos + 1, close)]
+            self.pos = close + 1
+        elif not self._is("{"):
+            raise _Bail()
+        init = self._initializer() if self._is("{") else None
+        return _Node("object_creation", first, self.pos - 1, args=args, init=init, explicit=True)
+
+    def _initializer(self) -> List[_Node]:
+        src = self.src
+        close = src.match[self.pos]
+        init = []
+        for a, b in self._split(self.pos + 1, close):
+            if src.is_(a, "{"):
+                init.append(_Node("other", a, b - 1))
+            else:
+                init.append(_parse_expression(src, a, b))
+        self.pos = close + 1
+        return init
+
+    def _split(self, first, end) -> List[Tuple[int, int]]:
+        return _split_commas(self.src, first, end)
+
+    def _argument(self, first, end, allow_equals):
+        return _parse_argument(self.src, first, end, allow_equals)
+
+
+def _split_commas(src: _Source, first: int, end: int) -> List[Tuple[int, int]]:
+    """Comma-separated token ranges [a, b) between first and end, skipping nested brackets."""
+    parts, start, i = [], first, first
+    while i < end:
+        if src.is_(i, ","):
+            parts.append((start, i))
+            start = i + 1
+        elif src.tokens[i].kind == "punct" and src.tokens[i].text in "([{" and i in src.match:
+            i = src.match[i]
+        i += 1
+    if start < end:
+        parts.append((start, end))
+    return parts
+
+
+def _parse_expression(src: _Source, first: int, end: int, strict: bool = False) -> Optional[_Node]:
+    """
+    Parses tokens [first, end) into a node; anything unrecognized becomes an opaque "other" node,
+    or raises UnsupportedSourceError if strict.
+    """
+    if first >= end:
+        return None
+    try:
+        return _ExpressionParser(src, first, end).parse()
+    except (_Bail, KeyError, UnsupportedSourceError) as e:
+        if strict:
+            raise UnsupportedSourceError(f"Unsupported expression at offset {src.tok(first).start}.") from e
+        return _Node("other", first, end - 1)
+
+
+def _parse_argument(src: _Source, first: int, end: int, allow_equals: bool,
+                    strict: bool = False) -> Tuple[str, Optional[_Node]]:
+    """(name, expression) for `expr`, `name: expr` and, in attributes, `Name = expr`."""
+    name = ""
+    if src.tok(first).kind == "ident" and first + 1 < end:
+        if src.is_(first + 1, ":"):
+            name, first = src.tok(first).text, first + 2
+        elif allow_equals and src.is_(first + 1, "="):
+            name, first = src.tok(first).text, first + 2
+    if src.tok(first).kind == "ident" and src.tok(first).text in ("ref", "out", "in") and first + 1 < end:
+        first += 1
+    return name, _parse_expression(src, first, end, strict)
+
+
+def _text(src: _Source, node: Optional[_Node]) -> str:
+    return "" if node is None else src.span_text(node.first, node.last)
+
+
+# --- Literal values (SyntaxToken.Value / ValueText) ---
+
+def _literal_token(src: _Source, node: Optional[_Node]) -> Optional[_Token]:
+    return src.tokens[node.first] if node is not None and node.kind == "literal" else None
+
+
+def _literal_value(tok: _Token) -> Tuple[str, Any]:
+    """(type, value) of a literal token; type is the CLR type name the engine pattern-matches on."""
+    if tok.kind in ("number", "string", "char"):
+        return tok.ltype, tok.value
+    if tok.kind == "utf8":
+        return "utf8", None  # Value is a byte[]
+    if tok.text in ("true", "false"):
+        return "bool", tok.text == "true"
+    return "null", None
+
+
+def _value_text(tok: _Token) -> str:
+    if tok.kind == "utf8":
+        return tok.value
+    ltype, value = _literal_value(tok)
+    if ltype in ("string", "char"):
+        return value
+    if ltype == "double":
+        return _format_double(value)
+    if ltype == "float":
+        return _format_float32(value)
+    if ltype in ("int", "uint", "long", "ulong", "decimal"):
+        return str(value)
+    return tok.text
+
+
+def _is_string_literal(src, node) -> bool:
+    tok = _literal_token(src, node)
+    return tok is not None and tok.kind == "string"
+
+
+def _is_nameof(src, node) -> bool:
+    return node is not None and node.kind == "invocation" and _text(src, node.target) == "nameof" and len(node.args) > 0
+
+
+def _extract_string(src, node) -> str:
+    tok = _literal_token(src, node)
+    if tok is not None:
+        return _value_text(tok)
+    if _is_nameof(src, node):
+        return _text(src, node.args[0][1])
+    if node is not None and node.kind == "identifier":
+        return node.name
+    return ""
+
+
+def _extract_string_value(src, node) -> Optional[str]:
+    if node is None:
+        return None
+    tok = _literal_token(src, node)
+    if tok is not None:
+        return _value_text(tok)
+    if _is_nameof(src, node):
+        return _text(src, node.args[0][1])
+    if node.kind in ("identifier", "member"):
+        return node.name
+    return None
+
+
+def _extract_double(src, node) -> Optional[float]:
+    tok = _literal_token(src, node)
+    if tok is not None:
+        ltype, value = _literal_value(tok)
+        return float(value) if ltype in ("double", "int") else None
+    if node is not None and node.kind == "prefix" and node.op == "-":
+        tok = _literal_token(src, node.operand)
+        if tok is not None:
+            ltype, value = _literal_value(tok)
+            return -float(value) if ltype in ("double", "int") else None
+    return None
+
+
+def _extract_bool(src, node) -> bool:
+    tok = _literal_token(src, node)
+    return tok is not None and _literal_value(tok) == ("bool", True)
+
+
+def _strings_from_initializer(src, node) -> List[str]:
+    if node is None:
+        return []
+    tok = _literal_token(src, node)
+    if tok is not None and tok.kind == "string":
+        if "," in tok.value:
+            return [o.strip() for o in tok.value.split(",") if o.strip()]
+        return [tok.value]
+    if node.kind == "collection":
+        values = [_extract_string_value(src, e) for spread, e in node.elements if not spread]
+    elif node.kind == "implicit_array" or (
+            node.kind in ("array_creation", "object_creation") and node.init is not None):
+        values = [_extract_string_value(src, e) for e in node.init]
+    else:
+        single = _extract_string_value(src, node)
+        return [single] if single is not None else []
+    return [v for v in values if v is not None]
+
+
+def _is_simple_static(src, node) -> bool:
+    if node is None or node.kind == "literal":
+        return True
+    if node.kind == "tuple":
+        return all(_is_simple_static(src, e) for _, e in node.args)
+    if node.kind == "collection":
+        return all(_is_simple_static(src, e) for spread, e in node.elements if not spread)
+    if node.kind == "implicit_array":
+        return all(_is_simple_static(src, e) for e in node.init)
+    if node.kind == "array_creation":
+        return node.init is None or all(_is_simple_static(src, e) for e in node.init)
+    return node.kind == "invocation" and _text(src, node.target) == "nameof"
+
+
+def _extract_range(src, node) -> Tuple[Optional[float], Optional[float], Optional[float]]:
+    if node is None:
+        values = []
+    elif node.kind == "tuple":
+        values = [_extract_double(src, e) for _, e in node.args]
+    elif node.kind == "implicit_array" or (node.kind == "array_creation" and node.init is not None):
+        values = [_extract_double(src, e) for e in node.init]
+    elif node.kind == "collection":
+        values = [_extract_double(src, e) for spread, e in node.elements if not spread]
+    else:
+        values = []
+    values += [None] * (3 - len(values))
+    return values[0], values[1], values[2]
+
+
+def _parse_visibility(src, node) -> str:
+    if node is None:
+        return ""
+    if node.kind == "binary":
+        if node.op in ("==", "!="):
+            right = _text(src, node.right).strip("\"'")
+            return f"{_text(src, node.left)} {node.op} '{right}'"
+    elif node.kind == "identifier":
+        return f"{node.name} == 'true'"
+    elif node.kind == "prefix" and node.op == "!":
+        return f"{_text(src, node.operand)} != 'true'"
+    return ""
+
+
+# --- Params class members ---
+
+class _Attribute:
+    def __init__(self, name: str, args: Optional[List[Tuple[str, Optional[_Node]]]]):
+        self.name = name
+        self.args = args  # None when the attribute has no argument list
+
+
+class _Member:
+    def __init__(self, kind: str, first: int):
+        self.kind = kind  # "property", "field", "method" or "other"
+        self.first = first
+        self.name: Optional[str] = None
+        self.modifiers: List[str] = []
+        self.attributes: List[_Attribute] = []
+        self.type_text = ""
+        self.initializer: Optional[_Node] = None
+        self.expression_body: Optional[_Node] = None
+        self.accessors: List[Dict[str, Any]] = []
+        self.variables: List[Tuple[str, Optional[_Node]]] = []
+        self.return_expression: Optional[_Node] = None  # first direct return in a getter block
+
+    def initial_expression(self) -> Optional[_Node]:
+        """ParameterExtractor.GetInitialExpression."""
+        if self.kind == "property":
+            if self.initializer is not None:
+                return self.initializer
+            if self.expression_body is not None:
+                return self.expression_body
+            getter = next((a for a in self.accessors if a["keyword"] == "get"), None)
+            if getter is not None:
+                return getter["expression"] if getter["expression"] is not None else getter["return"]
+            return None
+        if self.kind == "field":
+            return self.variables[0][1] if self.variables else None
+        return None
+
+    def is_logic_based(self, src) -> bool:
+        """ParameterExtractor.IsLogicBasedProvider."""
+        if self.kind == "method":
+            return True
+        if self.kind == "property":
+            if any(a["has_body"] for a in self.accessors):
+                return True
+            getter = next((a for a in self.accessors if a["keyword"] == "get"), None)
+            expr = self.expression_body if self.expression_body is not None else (getter or {}).get("expression")
+            if expr is not None:
+                return not _is_simple_static(src, expr)
+        return False
+
+
+def _parse_attribute_list(src: _Source, open_idx: int) -> List[_Attribute]:
+    close = src.match[open_idx]
+    first = open_idx + 1
+    if src.tok(first).kind == "ident" and src.is_(first + 1, ":"):
+        first += 2
+    attributes = []
+    for a, b in _split_commas(src, first, close):
+        paren = next((k for k in range(a, b) if src.is_(k, "(")), None)
+        name_end = paren if paren is not None else b
+        name = src.span_text(a, name_end - 1) if name_end > a else ""
+        args = None
+        if paren is not None:
+            inner_close = src.match[paren]
+            # Attribute arguments are constants: one this parser can't read (e.g. after a missing comma,
+            # which Roslyn recovers from) goes to the engine
+            args = [_parse_argument(src, x, y, allow_equals=True, strict=True)
+                    for x, y in _split_commas(src, paren + 1, inner_close)]
+        attributes.append(_Attribute(name, args))
+    return attributes
+
+
+def _first_direct_return(src: _Source, open_idx: int) -> Tuple[bool, Optional[_Node]]:
+    """(found, expression) for the first return statement directly inside a block."""
+    close = src.match[open_idx]
+    i, at_start = open_idx + 1, True
+    while i < close:
+        tok = src.tokens[i]
+        if at_start and tok.kind == "ident" and tok.text == "return":
+            end = src.skip_to(i + 1, (";",), close)
+            return True, _parse_expression(src, i + 1, end)
+        if tok.kind == "punct" and tok.text in "([{":
+            closer = src.match[i]
+            at_start = tok.text == "{" and not src.is_(closer + 1, ";")
+            i = closer + 1
+            continue
+        at_start = tok.kind == "punct" and tok.text == ";"
+        if tok.kind == "ident" and tok.text in ("else", "do"):
+            at_start = False
+        i += 1
+    return False, None
+
+
+_ACCESSOR_MODIFIERS = ("private", "protected", "internal", "public", "readonly")
+
+
+def _parse_accessors(src: _Source, open_idx: int) -> List[Dict[str, Any]]:
+    close = src.match[open_idx]
+    accessors, i = [], open_idx + 1
+    while i < close:
+        while src.is_(i, "["):
+            i = src.match[i] + 1
+        while src.tok(i).kind == "ident" and src.tok(i).text in _ACCESSOR_MODIFIERS:
+            i += 1
+        keyword = src.tok(i).text
+        if keyword not in ("get", "set", "init", "add", "remove"):
+            raise UnsupportedSourceError(f"Unexpected accessor at offset {src.tok(i).start}.")
+        accessor = {"keyword": keyword, "has_body": False, "expression": None, "return": None}
+        i += 1
+        if src.is_(i, ";"):
+            i += 1
+        elif src.is_(i, "=>"):
+            end = src.skip_to(i + 1, (";",), close)
+            accessor["expression"] = _parse_expression(src, i + 1, end)
+            i = end + 1
+        elif src.is_(i, "{"):
+            accessor["has_body"] = True
+            _, accessor["return"] = _first_direct_return(src, i)
+            i = src.match[i] + 1
+        else:
+            raise UnsupportedSourceError(f"Malformed accessor at offset {src.tok(i).start}.")
+        accessors.append(accessor)
+    return accessors
+
+
+def _parse_members(src: _Source, decl: Dict[str, Any]) -> List[_Member]:
+    open_idx = decl["open"]
+    if not src.is_(open_idx, "{"):
+        return []
+    close = src.match[open_idx]
+
+    def member_end(start):
+        """The ';' that ends a field, initializer or expression body started at start."""
+        semi = src.skip_to(start, (";",), close)
+        # Roslyn recovers from a missing ';' differently (e.g. a following attribute list becomes an indexer)
+        if semi == close or any(src.tok(x).kind == "ident" and src.tok(x).text in _ACCESS_MODIFIERS
+                                for x in range(start, semi)):
+            raise UnsupportedSourceError(f"Missing ';' after offset {src.tok(start).start}.")
+        return semi
+
+    members, i = [], open_idx + 1
+    while i < close:
+        if src.is_(i, ";"):
+            i += 1
+            continue
+        member = _Member("other", i)
+        while src.is_(i, "["):
+            member.attributes.extend(_parse_attribute_list(src, i))
+            i = src.match[i] + 1
+        while src.tok(i).kind == "ident" and src.tok(i).text in _MODIFIERS and not (
+                src.tok(i).text == "new" and src.is_(i + 1, "(")):
+            member.modifiers.append(src.tok(i).text)
+            i += 1
+        tok = src.tok(i)
+        if tok.kind == "ident" and tok.text in ("using", "namespace", "extern") and not member.modifiers:
+            raise UnsupportedSourceError(f"Unexpected '{tok.text}' in a type body at offset {tok.start}.")
+        if tok.kind == "ident" and tok.text in ("class", "struct", "interface", "enum", "record", "delegate", "event") \
+                or src.is_(i, "~") or (tok.kind == "ident" and tok.text == decl["name"] and src.is_(i + 1, "(")):
+            body = src.skip_to(i, ("{", ";", "=>"), close)
+            if src.is_(body, "=>"):
+                body = member_end(body)
+            end = src.match[body] if src.is_(body, "{") else body
+            if src.is_(body, "{") and tok.text in ("record", "class", "struct", "interface", "enum") \
+                    and src.is_(end + 1, ";"):
+                end += 1
+            members.append(member)
+            i = end + 1
+            continue
+
+        type_end = src.skip_type(i)
+        member.type_text = src.span_text(i, type_end - 1)
+        j = type_end
+        if src.is_(j, "operator") or src.is_(j, "this") or src.is_(i, "implicit") or src.is_(i, "explicit"):
+            body = src.skip_to(j, ("{", "=>", ";"), close)
+            if src.is_(body, "=>"):
+                body = member_end(body)
+            members.append(member)
+            i = (src.match[body] if src.is_(body, "{") else body) + 1
+            continue
+        if src.tok(j).kind != "ident":
+            raise UnsupportedSourceError(f"Unexpected member syntax at offset {src.tok(j).start}.")
+        member.name = src.tok(j).text
+        while src.is_(j + 1, ".") and src.tok(j + 2).kind == "ident":  # explicit interface implementation
+            j += 2
+            member.name = src.tok(j).text
+        k = j + 1
+        if src.is_(k, "{"):
+            member.kind = "property"
+            member.accessors = _parse_accessors(src, k)
+            end = src.match[k]
+            if src.is_(end + 1, "="):
+                semi = member_end(end + 2)
+                member.initializer = _parse_expression(src, end + 2, semi)
+                end = semi
+            i = end + 1
+        elif src.is_(k, "=>"):
+            member.kind = "property"
+            semi = member_end(k + 1)
+            member.expression_body = _parse_expression(src, k + 1, semi)
+            i = semi + 1
+        elif src.is_(k, "(") or src.is_(k, "<"):
+            member.kind = "method"
+            if src.is_(k, "<"):
+                k = src.skip_angles(k)
+            if not src.is_(k, "("):
+                raise UnsupportedSourceError(f"Malformed method at offset {src.tok(k).start}.")
+            body = src.skip_to(src.match[k] + 1, ("{", "=>", ";"), close)
+            if src.is_(body, "=>"):
+                body = member_end(body)
+            i = (src.match[body] if src.is_(body, "{") else body) + 1
+        elif src.is_(k, "=") or src.is_(k, ";") or src.is_(k, ",") or src.is_(k, "["):
+            member.kind = "field"
+            semi = member_end(j)
+            for a, b in _split_commas(src, j, semi):
+                name = src.tok(a).text
+                eq = next((x for x in range(a, b) if src.is_(x, "=")), None)
+                member.variables.append((name, _parse_expression(src, eq + 1, b) if eq is not None else None))
+            i = semi + 1
+        else:
+            raise UnsupportedSourceError(f"Unexpected member syntax at offset {src.tok(k).start}.")
+        members.append(member)
+    return members
+
+
+def _region_map(src: _Source, decl: Dict[str, Any]) -> List[Tuple[int, str]]:
+    """ParameterExtractor.BuildRegionMap: (line, region) for every #region/#endregion in the Params class."""
+    start, end = src.full_start(decl["first"]), src.full_end(decl["last"])
+    entries = []
+    for tok in src.tokens:
+        for trivia in tok.leading:
+            if trivia.kind != "directive" or not (start <= trivia.start < end):
+                continue
+            m = re.match(r"#\s*(end)?region\b", trivia.text)
+            if not m:
+                continue
+            if m.group(1):
+                entries.append((src.line_of(trivia.start), ""))
+            else:
+                name = re.search(r"#region\s+(.+)", trivia.text)
+                if name:
+                    entries.append((src.line_of(trivia.start), name.group(1).strip()))
+    by_line: Dict[int, str] = {}
+    for line, region in entries:
+        by_line[line] = region
+    return sorted(by_line.items())
+
+
+def _region_for_line(line: int, region_map: List[Tuple[int, str]]) -> str:
+    current = ""
+    for entry_line, region in region_map:
+        if entry_line <= line:
+            current = region
+        else:
+            break
+    return current
+
+
+def _parse_comment_metadata(comment: str) -> Dict[str, str]:
+    bracket = re.search(r"\[\w+\((.*)\)\]", comment)
+    content = bracket.group(1) if bracket else comment
+    metadata = {}
+    for m in re.finditer(r'(\w+)(?:\s*[:=]\s*(?:"([^"]*)"|([^,)\s]+)))?', content, re.IGNORECASE):
+        value = m.group(2) if m.group(2) is not None else m.group(3) if m.group(3) is not None else "true"
+        metadata[m.group(1).lower()] = value
+    return metadata
+
+
+def _description_from_docs(leading: List[_Trivia]) -> str:
+    xml = [t.text.strip() for t in leading if t.text.strip().startswith("///")]
+    if not xml:
+        return ""
+    joined = "\n".join(xml)
+    m = re.search(r"<summary>\s*/*\s*(.*?)\s*/*\s*</summary>", joined, re.S | re.I)
+    if m:
+        lines = [line.strip("/ ") for line in m.group(1).split("\n")]
+        return " ".join(line for line in lines if line.strip())
+    lines = [line.strip("/ ") for line in xml]
+    return " ".join(line for line in lines if line.strip() and not line.startswith("<"))
+
+
+_COLLECTION_PREFIXES = ("List<", "IList<", "IEnumerable<")
+
+
+def _parse_parameter(src: _Source, member: _Member, statements, params_members) -> Dict[str, Any]:
+    """ParameterExtractor.ParseParameter."""
+    p = {
+        "options": [], "multiSelect": False, "description": "", "visibleWhen": "", "min": None, "max": None,
+        "step": None, "required": False, "suffix": "", "pattern": "", "enabledWhenParam": "",
+        "enabledWhenValue": "", "isRevitElement": False, "revitElementType": "", "revitElementCategory": "",
+        "group": "", "inputType": "", "requiresCompute": False, "selectionType": "",
+    }
+    leading = src.tokens[member.first].leading
+    p["description"] = _description_from_docs(leading)
+
+    for attr in member.attributes:
+        name, args = attr.name, attr.args or []
+        first_arg = args[0][1] if args else None
+        if "Required" in name or "Mandatory" in name:
+            p["required"] = True
+        if "Min" in name and args:
+            p["min"] = _extract_double(src, first_arg)
+        if "Max" in name and args:
+            p["max"] = _extract_double(src, first_arg)
+        if "Range" in name and len(args) >= 2:
+            p["min"] = _extract_double(src, args[0][1])
+            p["max"] = _extract_double(src, args[1][1])
+            if len(args) >= 3:
+                p["step"] = _extract_double(src, args[2][1])
+        if "Suffix" in name and args:
+            p["suffix"] = _extract_string(src, first_arg)
+        if "Pattern" in name and args:
+            p["pattern"] = _extract_string(src, first_arg)
+        if "Confirm" in name and args:
+            p["pattern"] = f"^{_extract_string(src, first_arg)}$"
+        if name == "Description" and args:
+            p["description"] = _extract_string(src, first_arg)
+        if "EnabledWhen" in name and len(args) >= 2:
+            p["enabledWhenParam"] = _extract_string(src, first_arg)
+            value_node, value_tok = args[1][1], _literal_token(src, args[1][1])
+            if value_tok is not None:
+                ltype, value = _literal_value(value_tok)
+                if ltype == "bool":
+                    p["enabledWhenValue"] = "True" if value else "False"  # object.ToString() of a bool
+                else:
+                    p["enabledWhenValue"] = "" if value is None else _value_text(value_tok)
+            else:
+                p["enabledWhenValue"] = _text(src, value_node).strip("\"'")
+        if name == "Select" and args and first_arg is not None and first_arg.kind == "member":
+            p["selectionType"] = first_arg.name
+        if "InputFile" in name:
+            p["inputType"] = "File"
+            if args:
+                p["pattern"] = _extract_string(src, first_arg)
+        if "FolderPath" in name:
+            p["inputType"] = "Folder"
+        if "OutputFile" in name:
+            p["inputType"] = "SaveFile"
+            if args:
+                p["pattern"] = _extract_string(src, first_arg)
+        if "Color" in name:
+            p["inputType"] = "Color"
+        if "Stepper" in name:
+            p["inputType"] = "Stepper"
+        if "Segmented" in name:
+            p["inputType"] = "Segmented"
+        if "ScriptParameter" in name or "RevitElements" in name:
+            if "RevitElements" in name:
+                p["isRevitElement"] = True
+            for arg_name, expr in (attr.args or []):
+                if arg_name == "Options":
+                    p["options"] = _extract_options(src, expr, statements, params_members)
+                elif arg_name == "MultiSelect":
+                    p["multiSelect"] = _extract_bool(src, expr)
+                elif arg_name == "Description":
+                    p["description"] = _extract_string(src, expr)
+                elif arg_name == "VisibleWhen":
+                    p["visibleWhen"] = _extract_string(src, expr)
+                elif arg_name in ("Min", "Max", "Step"):
+                    p[arg_name.lower()] = _extract_double(src, expr)
+                elif arg_name == "Suffix":
+                    p["suffix"] = _extract_string(src, expr)
+                elif arg_name == "Group":
+                    p["group"] = _extract_string(src, expr)
+                elif arg_name in ("Computable", "Fetch", "Compute"):
+                    p["requiresCompute"] = _extract_bool(src, expr)
+                elif arg_name == "InputType":
+                    p["inputType"] = _extract_string(src, expr)
+                elif arg_name in ("Type", "TargetType"):
+                    p["revitElementType"] = _extract_string(src, expr)
+                elif arg_name == "Category":
+                    p["revitElementCategory"] = _extract_string(src, expr)
+                elif arg_name == "Select" and expr is not None and expr.kind == "member":
+                    p["selectionType"] = expr.name
+
+    # Backup: `// [ScriptParameter(...)]` comments
+    comment = next((t.text for t in leading
+                    if t.kind == "comment" and re.match(r"^\s*//\s*\[ScriptParameter", t.text)), None)
+    if comment:
+        meta = _parse_comment_metadata(comment)
+        if "multiselect" in meta:
+            p["multiSelect"] = meta["multiselect"].lower() == "true"
+        if "description" in meta:
+            p["description"] = meta["description"]
+        if "visiblewhen" in meta:
+            p["visibleWhen"] = meta["visiblewhen"]
+        for key in ("min", "max", "step"):
+            if key in meta and _try_parse_double(meta[key]) is not None:
+                p[key] = _try_parse_double(meta[key])
+        if "options" in meta:
+            p["options"] = [o.strip() for o in meta["options"].split(",") if o.strip()]
+        if "group" in meta:
+            p["group"] = meta["group"]
+        if "computable" in meta:
+            p["requiresCompute"] = meta["computable"].lower() == "true"
+        if "fetch" in meta:
+            p["requiresCompute"] = meta["fetch"].lower() == "true"
+        if "type" in meta:
+            p["revitElementType"] = meta["type"]
+        if "category" in meta:
+            p["revitElementCategory"] = meta["category"]
+        if "suffix" in meta:
+            p["suffix"] = meta["suffix"]
+        if "required" in meta:
+            p["required"] = meta["required"].lower() == "true"
+
+    # Type inference from the declared type, then from the initializer
+    csharp_type = member.type_text
+    base_type = csharp_type.rstrip("?")
+    is_xyz = base_type in ("XYZ", "Autodesk.Revit.DB.XYZ")
+    is_reference = base_type in ("Reference", "Autodesk.Revit.DB.Reference")
+    value_type, default_json, numeric_type = "string", "", None
+
+    if base_type in ("int", "long", "double", "float", "decimal", "number"):
+        value_type, numeric_type, default_json = "number", "int" if base_type in ("int", "long") else "double", "0"
+    elif base_type in ("bool", "boolean"):
+        value_type, default_json = "boolean", "false"
+    elif base_type == "string":
+        default_json = '""'
+    elif is_xyz:
+        value_type, default_json = "xyz", _serialize("0,0,0")
+        p["selectionType"] = p["selectionType"] or "Point"
+    elif is_reference:
+        value_type, default_json = "reference", _serialize("")
+        p["selectionType"] = p["selectionType"] or "Element"
+    elif base_type.startswith(("List<", "IList<")) or "[]" in base_type or "IEnumerable<" in base_type:
+        p["multiSelect"], default_json = True, "[]"
+
+    init = member.initializer
+    if init is not None and init.kind == "literal":
+        ltype, value = _literal_value(src.tokens[init.first])
+        if ltype == "string":
+            value_type, default_json = "string", _serialize(value)
+        elif ltype == "bool":
+            value_type, default_json = "boolean", _serialize(value)
+        elif ltype == "int":
+            value_type, numeric_type, default_json = "number", "int", _serialize(value)
+        elif ltype == "double":
+            value_type, numeric_type, default_json = "number", "double", _serialize(value)
+        elif src.tokens[init.first].kind == "number":
+            value_type = "number"
+            parsed = _try_parse_double(_value_text(src.tokens[init.first]))
+            if parsed is not None:
+                default_json = _serialize(parsed)
+    elif init is not None and init.kind == "prefix" and init.op == "-":
+        value_type = "number"
+        value = _extract_double(src, init)
+        if value is not None:
+            default_json = _serialize(value)
+    elif init is not None and init.kind == "object_creation" and init.explicit and is_xyz:
+        value_type = "xyz"
+        xyz = "0,0,0"
+        if len(init.args) == 3:
+            xyz = ",".join(_text(src, expr) for _, expr in init.args)
+        default_json = _serialize(xyz)
+        p["selectionType"] = p["selectionType"] or "Point"
+    elif init is not None and init.kind in ("collection", "implicit_array", "array_creation", "object_creation"):
+        default_json = _serialize(_strings_from_initializer(src, init))
+        p["multiSelect"] = True
+    elif init is not None:
+        raw = _text(src, init).strip(" \"'")
+        if raw:
+            default_json = _serialize(raw)
+
+    if is_xyz and value_type == "string":
+        value_type = "xyz"
+        p["selectionType"] = p["selectionType"] or "Point"
+    if numeric_type is None and value_type == "number":
+        numeric_type = {"int": "int", "double": "double"}.get(csharp_type)
+    if not p["options"] and p["isRevitElement"]:
+        p["requiresCompute"] = True
+    if csharp_type.startswith(_COLLECTION_PREFIXES) or "[]" in csharp_type:
+        p["multiSelect"] = True
+        if default_json in ('""', ""):
+            default_json = "[]"
+
+    p.update({"name": member.name, "type": value_type, "defaultValueJson": default_json, "numericType": numeric_type})
+    return p
+
+
+def _extract_options(src, node, statements, params_members) -> List[str]:
+    """ParameterExtractor.ExtractOptions."""
+    if node is None:
+        return []
+    if _is_nameof(src, node):
+        identifier = _text(src, node.args[0][1])
+        resolved = _resolve_options(src, identifier, statements, params_members)
+        return resolved if resolved else [identifier]
+    if node.kind == "identifier":
+        return _resolve_options(src, node.name, statements, params_members)
+    if node.kind == "member":
+        return _resolve_options(src, node.name, statements, params_members)
+    tok = _literal_token(src, node)
+    if tok is not None and tok.kind == "string" and "," not in tok.value:
+        resolved = _resolve_options(src, tok.value, statements, params_members)
+        if resolved:
+            return resolved
+    return _strings_from_initializer(src, node)
+
+
+def _local_declaration(src: _Source, first: int, last: int) -> Optional[List[Tuple[str, Optional[_Node]]]]:
+    """Variables of a top-level `[const] Type a = x, b = y;` statement, or None for other statements."""
+    i = first
+    if src.is_(i, "const"):
+        i += 1
+    try:
+        j = src.skip_type(i)
+    except (UnsupportedSourceError, KeyError):
+        return None
+    if j > last or src.tok(j).kind != "ident" or not any(src.is_(j + 1, p) for p in ("=", ",", ";")):
+        return None
+    end = last if src.is_(last, ";") else last + 1
+    variables = []
+    for a, b in _split_commas(src, j, end):
+        eq = next((x for x in range(a, b) if src.is_(x, "=")), None)
+        variables.append((src.tok(a).text, _parse_expression(src, eq + 1, b) if eq is not None else None))
+    return variables
+
+
+def _resolve_options(src, identifier, statements, params_members) -> List[str]:
+    """ParameterExtractor.ResolveOptionsFromIdentifier: top-level locals first, then Params fields."""
+    for first, last in statements:
+        variables = _local_declaration(src, first, last)
+        if variables and any(name == identifier for name, _ in variables):
+            init = next(expr for name, expr in variables if name == identifier)
+            if init is not None:
+                return _strings_from_initializer(src, init)
+            break
+    for member in params_members:
+        if member.kind == "field" and any(name == identifier for name, _ in member.variables):
+            init = next(expr for name, expr in member.variables if name == identifier)
+            if init is not None:
+                return _strings_from_initializer(src, init)
+            break
+    return []
+
+
+_UNIT_SUFFIXES = (("_mm", "mm"), ("_cm", "cm"), ("_m", "m"), ("_ft", "ft"), ("_in", "in"), ("_inch", "in"))
+_PROVIDER_SUFFIXES = ("_Options", "_Range", "_Visible", "_Enabled", "_Filter")
+
+
+def _parameters_from_source(text: str) -> List[Dict[str, Any]]:
+    """ParameterExtractor.ExtractParameters for one file, in the proto/grpc_client dict shape."""
+    if not text.strip():
+        return []
+    stripped = text.strip()
+    if stripped.startswith("{") and stripped.endswith("}"):
+        ptool = _ptool_parameters(stripped)
+        if ptool is not None:
+            return ptool
+
+    src = _Source(text)
+    decl = next((d for d in src.types if d["keyword"] == "class" and d["name"] == "Params"), None)
+    if decl is None:
+        return []
+    region_map = _region_map(src, decl)
+    members = _parse_members(src, decl)
+    statements = src.global_statements()
+    by_name: Dict[str, _Member] = {}
+    for m in members:
+        if m.kind in ("property", "field", "method"):
+            name = m.variables[0][0] if m.kind == "field" and m.variables else m.name
+            by_name.setdefault(name, m)
+
+    def provider(*names):
+        return next((m for m in members if m.kind in ("property", "field", "method")
+                     and (m.variables[0][0] if m.kind == "field" and m.variables else m.name) in names), None)
+
+    parameters = []
+    for member in members:
+        if member.kind != "property" or "public" not in member.modifiers or member.name.endswith(_PROVIDER_SUFFIXES):
+            continue
+        if member.expression_body is not None or not any(a["keyword"] in ("set", "init") for a in member.accessors):
+            continue  # read-only: a provider or computed value, not a parameter
+        name = member.name
+        p = _parse_parameter(src, member, statements, members)
+        if not p["group"]:
+            p["group"] = _region_for_line(src.line_of(src.tokens[member.first].start), region_map)
+
+        options_provider = provider(f"{name}_Options", f"{name}_Filter")
+        if options_provider is not None:
+            expr = options_provider.initial_expression()
+            if expr is not None:
+                p["options"] = _extract_options(src, expr, statements, members)
+            if options_provider.is_logic_based(src) and not p["options"]:
+                p["requiresCompute"] = True
+
+        range_provider = by_name.get(f"{name}_Range")
+        if range_provider is not None:
+            expr = range_provider.initial_expression()
+            if expr is not None:
+                low, high, step = _extract_range(src, expr)
+                if low is not None:
+                    p["min"] = low
+                if high is not None:
+                    p["max"] = high
+                if step is not None:
+                    p["step"] = step
+            if range_provider.is_logic_based(src):
+                p["requiresCompute"] = True
+
+        visible_provider = by_name.get(f"{name}_Visible")
+        if visible_provider is not None and visible_provider.initial_expression() is not None:
+            p["visibleWhen"] = _parse_visibility(src, visible_provider.initial_expression())
+
+        enabled_provider = by_name.get(f"{name}_Enabled")
+        if enabled_provider is not None and enabled_provider.initial_expression() is not None:
+            p["enabledWhenParam"] = _parse_visibility(src, enabled_provider.initial_expression())
+
+        unit = None
+        unit_attr = next((a for a in member.attributes if "Unit" in a.name), None)
+        if unit_attr is not None and unit_attr.args and _is_string_literal(src, unit_attr.args[0][1]):
+            unit = src.tokens[unit_attr.args[0][1].first].value
+        if not unit:
+            unit_provider = by_name.get(f"{name}_Unit")
+            expr = unit_provider.initial_expression() if unit_provider is not None else None
+            if _is_string_literal(src, expr):
+                unit = src.tokens[expr.first].value
+        if not unit:
+            for suffix, value in _UNIT_SUFFIXES:
+                if name.endswith(suffix):
+                    unit = value
+                    break
+        p["unit"] = ""
+        if unit:
+            p["unit"] = unit
+            p["suffix"] = unit
+        parameters.append(_to_parameter_dict(p))
+    return parameters
+
+
+_PARAMETER_KEYS = (
+    "name", "type", "defaultValueJson", "description", "options", "multiSelect", "visibleWhen", "numericType",
+    "min", "max", "step", "isRevitElement", "revitElementType", "revitElementCategory", "requiresCompute", "group",
+    "inputType", "required", "suffix", "pattern", "enabledWhenParam", "enabledWhenValue", "unit", "selectionType",
+)
+_BOOL_KEYS = {"multiSelect", "isRevitElement", "requiresCompute", "required"}
+_NUMBER_KEYS = {"min", "max", "step"}
+
+
+def _to_parameter_dict(p: Dict[str, Any]) -> Dict[str, Any]:
+    """Same shape as grpc_client._parameter_to_dict (null strings become "", as in MapToProtoParameters)."""
+    result = {}
+    for key in _PARAMETER_KEYS:
+        value = p.get(key)
+        if key == "options":
+            result[key] = list(value or [])
+        elif key in _BOOL_KEYS:
+            result[key] = bool(value)
+        elif key in _NUMBER_KEYS:
+            result[key] = float(value) if value is not None else None
+        else:
+            result[key] = value if value is not None else ""
+    return result
+
+
+def _ptool_parameters(text: str) -> Optional[List[Dict[str, Any]]]:
+    try:
+        package = json.loads(text)
+    except ValueError:
+        return None
+    if not isinstance(package, dict):
+        return None
+    raw = next((v for k, v in package.items() if k == "parameters"), None)
+    if raw is None or not isinstance(raw, list):
+        return None
+    keys = {k.lower(): k for k in _PARAMETER_KEYS}
+    return [_to_parameter_dict({keys[k.lower()]: v for k, v in item.items() if k.lower() in keys})
+            for item in raw if isinstance(item, dict)]
+
+
+# --- Metadata ---
+
+_METADATA_LIST_KEYS = ("categories", "dependencies", "usage_examples")
+
+
+def _empty_metadata() -> Dict[str, Any]:
+    return {
+        "name": "", "file_path": "", "script_type": "", "description": "", "author": "", "categories": [],
+        "dependencies": [], "document_type": "", "usage_examples": [], "website": "", "last_run": "",
+        "is_protected": False, "is_compiled": False,
+    }
+
+
+def _apply_metadata_value(metadata, key, value):
+    """MetadataExtractor.ProcessMetadataValue."""
+    if not value:
+        return
+    key = key.lower()
+    if key in ("author", "website", "description"):
+        metadata[key] = value
+    elif key == "lastrun":
+        metadata["last_run"] = value
+    elif key == "documenttype":
+        if value.lower() in ("conceptualmass", "project", "family"):
+            metadata["document_type"] = value
+    elif key in ("categories", "dependencies"):
+        metadata[key].extend(v.strip() for v in value.split(",") if v.strip())
+    elif key == "usageexamples":
+        for line in re.split(r"\r\n|\r|\n", value):
+            line = line.strip()
+            if line.startswith("-"):
+                metadata["usage_examples"].append(line[1:].strip())
+
+
+def _apply_comment(metadata, comment: str):
+    """MetadataExtractor: strip the /* */ delimiters and parse `Key: value` blocks."""
+    content = comment[2:-2] if len(comment) > 4 else ""
+    lines = [line.strip().lstrip("*").strip() for line in re.split(r"\r\n|\r|\n", content)]
+    current_key, current_value = None, []
+
+    def flush():
+        if current_key is not None and current_value:
+            _apply_metadata_value(metadata, current_key, "\n".join(current_value).strip())
+        current_value.clear()
+
+    for line in (line for line in "\n".join(lines).split("\n") if line):
+        m = re.match(r"^([a-zA-Z_]+):\s*(.*)", line)
+        if m:
+            flush()
+            current_key = m.group(1).strip()
+            rest = m.group(2).strip()
+            if rest:
+                current_value.append(rest)
+        elif current_key is not None:
+            current_value.append(line.strip())
+    flush()
+
+
+def _metadata_from_source(text: str) -> Dict[str, Any]:
+    """MetadataExtractor.ExtractMetadata over combined source, mapped like ExtractProtoMetadata."""
+    if not text.strip():
+        # The engine's ScriptMetadata.DocumentType stays null here and the proto setter rejects it.
+        raise ScriptExtractionError("Value cannot be null. (Parameter 'value')")
+    metadata = _empty_metadata()
+    metadata["document_type"] = "Any"
+    src = _Source(text)
+    for tok in src.tokens:
+        for trivia in tok.leading + tok.trailing:
+            if trivia.kind == "ml_comment":
+                _apply_comment(metadata, trivia.text)
+
+    decl = next((d for d in src.types if d["keyword"] == "class"), None)
+    if decl is not None:
+        doc = next((t for t in src.tokens[decl["first"]].leading if t.kind == "doc"), None)
+        if doc is not None:
+            content = _top_level_xml_element(doc.text, "name")
+            if content:
+                content = re.sub(r"(\r\n|[\r\n])[ \t]*///$", r"\1", content)
+                if content.strip():
+                    metadata["name"] = content.strip()
+    return metadata
+
+
+_XML_TAG = re.compile(r"<(/?)([A-Za-z_][\w.:-]*)[^<>]*?(/?)>")
+
+
+def _top_level_xml_element(doc: str, tag: str) -> Optional[str]:
+    """
+    MetadataExtractor.GetTextFromTag: content of the first element named tag directly in the doc comment.
+    Elements nested in another one (e.g. <name> inside <summary>) don't count.
+    """
+    stack: List[str] = []
+    start = None
+    for m in _XML_TAG.finditer(doc):
+        closing, name, empty = m.group(1), m.group(2).lower(), m.group(3)
+        if empty:
+            continue
+        if not closing:
+            if not stack and name == tag:
+                start = m.end()
+            stack.append(name)
+        elif stack and stack[-1] == name:
+            stack.pop()
+            if not stack and start is not None:
+                return doc[start:m.start()]
+    return None
+
+
+# --- Combining multi-file scripts (ScriptParser / SemanticCombinator) ---
+
+def _top_level_file(files: List[Dict[str, str]], sources: Dict[str, _Source]) -> Optional[Dict[str, str]]:
+    """ScriptParser.IdentifyTopLevelScript."""
+    if not files:
+        return None
+    if len(files) == 1:
+        return files[0]
+    top = None
+    for f in files:
+        if sources[f["file_name"]].body_text().strip():
+            if top is not None:
+                raise ScriptExtractionError("Only one script file can contain top-level statements.")
+            top = f
+    return top
+
+
+def _combine_files(files: List[Dict[str, str]], sources: Dict[str, _Source]) -> str:
+    """ScriptParser.CombineScriptFiles."""
+    top = _top_level_file(files, sources)
+    usings: Dict[str, None] = {}
+    params_part, other_parts = None, []
+    main_body, main_line = ("" if top is None else None), 1
+    for f in files:
+        src = sources[f["file_name"]]
+        for first, last in src.usings:
+            usings.setdefault(src.span_text(first, last), None)
+        for decl in src.types:
+            start = src.full_start(decl["first"])
+            content = src.text[start:src.full_end(decl["last"])].rstrip()
+            line = src.line_of(start) + 1
+            if decl["keyword"] == "class" and decl["name"] == "Params":
+                params_part = (content, f["file_name"], line)
+            elif all(content != c for c, _, _ in other_parts):
+                other_parts.append((content, f["file_name"], line))
+        if top is not None and f["file_name"] == top["file_name"]:
+            statements = src.global_statements()
+            if statements:
+                main_line = src.line_of(src.full_start(statements[0][0])) + 1
+            main_body = src.body_text()
+
+    parts = []
+    global_usings = [u for u in usings if u.strip().startswith("global using")]
+    normal_usings = [u for u in usings if u.strip().startswith("using")]
+    if global_usings:
+        parts.append("\n".join(global_usings))
+    if normal_usings:
+        parts.append("\n".join(normal_usings))
+    if main_body and main_body.strip():
+        parts.append(f"#line {main_line} \"{top['file_name']}\"\n{main_body}" if top is not None else main_body)
+    if params_part:
+        parts.append(f"#line {params_part[2]} \"{params_part[1]}\"\n{params_part[0]}")
+    for content, file_name, line in other_parts:
+        parts.append(f"#line {line} \"{file_name}\"\n{content}")
+    return "\n\n".join(parts)
+
+
+def _referenced_files(files, sources, top) -> List[Dict[str, str]]:
+    """
+    Approximates SemanticCombinator's symbol walk: starting from the top-level file (and Params.cs), follow
+    identifiers that name a type or extension method declared in another file.
+    """
+    declared: Dict[str, str] = {}
+    for f in files:
+        src = sources[f["file_name"]]
+        names = [d["name"] for d in src.types]
+        for i, tok in enumerate(src.tokens):
+            if tok.kind == "ident" and tok.text == "this" and src.is_(i - 1, "(") and not src.is_(i + 1, ".") \
+                    and src.tok(i - 2).kind == "ident":
+                names.append(src.tok(i - 2).text)
+        for name in names:
+            declared.setdefault(name, f["file_name"])
+
+    referenced = {top["file_name"]}
+    params_file = next((f["file_name"] for f in files if f["file_name"].lower() == "params.cs"), None)
+    if params_file:
+        referenced.add(params_file)
+    queue = [top["file_name"]]
+    while queue:
+        src = sources[queue.pop(0)]
+        for tok in src.tokens:
+            target = declared.get(tok.text) if tok.kind == "ident" else None
+            if target and target not in referenced:
+                referenced.add(target)
+                queue.append(target)
+    return [f for f in files if f["file_name"] in referenced]
+
+
+def _check_type_bodies(src: _Source):
+    """
+    Parses every class and struct body. Members this parser can't follow (e.g. a stray block) mean Roslyn
+    may read the file's structure differently, top-level statements included, so the engine has to.
+    """
+    for decl in src.types:
+        if decl["keyword"] in ("class", "struct"):
+            _parse_members(src, decl)
+
+
+def combine_script_files(script_files: List[Dict[str, str]]) -> str:
+    """SemanticCombinator.Combine: the source the engine extracts metadata from (and compiles)."""
+    if not script_files:
+        raise ScriptExtractionError("No script files provided to combine.")
+    sources = {f["file_name"]: _Source(f["content"]) for f in script_files}
+    for src in sources.values():
+        _check_type_bodies(src)
+    if len(script_files) == 1:
+        return _combine_files(script_files, sources)
+    top = _top_level_file(script_files, sources)
+    if top is None:
+        return _combine_files(script_files, sources)
+    valid = [f for f in script_files if f["file_name"]]
+    if not valid:
+        raise ScriptExtractionError("No valid script files with filenames found.")
+    return _combine_files(_referenced_files(valid, sources, top), sources)
+
+
+# --- Public API (same dicts as grpc_client) ---
+
+def _extract_metadata(script_files):
+    if any(f["content"].strip().startswith("{") and f["content"].strip().endswith("}") for f in script_files):
+        # Compiled .ptool packages are read by the engine; their JSON does not survive the C# combine step here.
+        raise UnsupportedSourceError("Packaged tool content.")
+    return _metadata_from_source(combine_script_files(script_files))
+
+
+def _extract_parameters(script_files):
+    sources = {f["file_name"]: _Source(f["content"]) for f in script_files} if len(script_files) > 1 else {}
+    top = _top_level_file(script_files, sources)
+    if top is None:
+        return []
+    parameters = _parameters_from_source(top["content"])
+    if not parameters and len(script_files) > 1:
+        for f in script_files:
+            if f["file_name"] != top["file_name"]:
+                parameters = _parameters_from_source(f["content"])
+                if parameters:
+                    break
+    return parameters
+
+
+def extract_script(script_files: List[Dict[str, str]], include_parameters: bool = True) -> Dict[str, Any]:
+    """
+    {"metadata", "parameters", "error_message"} like one GetScriptMetadataBatch result.
+    Raises UnsupportedSourceError when the engine has to do the extraction.
+    """
+    try:
+        metadata = _extract_metadata(script_files)
+        parameters = _extract_parameters(script_files) if include_parameters else []
+    except ScriptExtractionError as e:
+        return {"metadata": _empty_metadata(), "parameters": [], "error_message": f"Failed to extract metadata: {e}"}
+    return {"metadata": metadata, "parameters": parameters, "error_message": ""}
+
+
+def extract_metadata(script_files: List[Dict[str, str]]) -> Dict[str, Any]:
+    """
+    Metadata dict as returned under "metadata" by grpc_client.get_script_metadata.
+    Raises ScriptExtractionError with the engine's error_message, or UnsupportedSourceError.
+    """
+    try:
+        return _extract_metadata(script_files)
+    except ScriptExtractionError as e:
+        raise ScriptExtractionError(f"Failed to extract metadata: {e}") from e
+
+
+def extract_parameters(script_files: List[Dict[str, str]]) -> List[Dict[str, Any]]:
+    """
+    Parameter list as returned under "parameters" by grpc_client.get_script_parameters.
+    Raises ScriptExtractionError with the engine's error_message, or UnsupportedSourceError.
+    """
+    try:
+        return _extract_parameters(script_files)
+    except ScriptExtractionError as e:
+        raise ScriptExtractionError(f"Failed to extract parameters: {e}") from e
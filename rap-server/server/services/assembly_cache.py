@@ -0,0 +1,219 @@
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import threading
+from typing import Dict, List, Optional, Set, Tuple
+
+from grpc_client import build_script_async, script_files_hash
+from services.status_monitor import status_monitor
+
+from utils import read_script_files
+
+logger = logging.getLogger(__name__)
+
+# Source scripts run from cached BuildScript output when unchanged (PARACORE_ASSEMBLY_CACHE=0 turns it off).
+ASSEMBLY_CACHE_ENABLED = os.environ.get("PARACORE_ASSEMBLY_CACHE", "1").lower() not in ("0", "false", "no")
+
+def _default_cache_dir() -> str:
+    """Per user: next to the app's database when it was started with one, else in the user's cache folder."""
+    database_path = os.environ.get("RAP_DATABASE_PATH")
+    if database_path:
+        return os.path.join(os.path.dirname(database_path), "assembly_cache")
+    base = (os.environ.get("LOCALAPPDATA") or os.environ.get("XDG_CACHE_HOME")
+            or os.path.join(os.path.expanduser("~"), ".cache"))
+    return os.path.join(base, "paracore-data", "assembly_cache")
+
+ASSEMBLY_CACHE_DIR = os.environ.get("PARACORE_ASSEMBLY_CACHE_DIR") or _default_cache_dir()
+ASSEMBLY_CACHE_MAX_BYTES = int(os.environ.get("PARACORE_ASSEMBLY_CACHE_MB", "256")) * 1024 * 1024
+
+class AssemblyCache:
+    """
+    Content-addressed disk cache of compiled source scripts. An assembly is stored under the hash of
+    its ScriptFiles plus the engine version and build and the Revit version it was built for, so a rebuilt
+    engine or another Revit version never picks up a stale build. Least recently used files are evicted
+    past max_bytes.
+    Scripts that were run are remembered, and rebuilt in the background when the watcher sees them change.
+    """
+    def __init__(self, directory: str = ASSEMBLY_CACHE_DIR, max_bytes: int = ASSEMBLY_CACHE_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._building: Dict[str, asyncio.Task] = {}
+        self._tracked: Dict[str, str] = {}  # script path -> script type
+        self._tasks: Set[asyncio.Task] = set()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.builds = 0
+        self.build_failures = 0
+
+    async def engine_key(self) -> Optional[str]:
+        """
+        The engine (version and, from add-ins that report it, build) and Revit version that builds are valid for,
+        or None while it is unknown (nothing is cached then).
+        """
+        if not ASSEMBLY_CACHE_ENABLED:
+            return None
+        status = status_monitor.snapshot() if status_monitor.running else await status_monitor.poll_once()
+        if not status.get("paracoreConnected") or not status.get("engineVersion") or not status.get("revitVersion"):
+            return None
+        return f"{status['engineVersion']}|{status.get('engineBuild') or ''}|{status['revitVersion']}"
+
+    def key(self, script_files: List[Dict[str, str]], engine_key: str) -> str:
+        return hashlib.sha256(f"{script_files_hash(script_files)}\0{engine_key}".encode('utf-8')).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.dll")
+
+    def _read(self, key: str) -> Optional[bytes]:
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            os.utime(path)  # recency for eviction
+            return data
+        except OSError:
+            return None
+
+    def _write(self, key: str, assembly: bytes):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(assembly)
+        os.replace(tmp_path, path)
+        self._evict()
+
+    def _entries(self) -> List[Tuple[float, int, str]]:
+        entries = []
+        if not os.path.isdir(self.directory):
+            return entries
+        for shard in os.scandir(self.directory):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                if entry.name.endswith(".dll"):
+                    st = entry.stat()
+                    entries.append((st.st_mtime, st.st_size, entry.path))
+        return entries
+
+    def _evict(self):
+        with self._lock:
+            entries = sorted(self._entries())
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in entries:
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                    total -= size
+                except OSError:
+                    pass
+
+    async def lookup(self, script_files: List[Dict[str, str]]) -> Optional[bytes]:
+        """The cached assembly for exactly these sources on the current engine, or None."""
+        engine_key = await self.engine_key()
+        if engine_key is None:
+            return None
+        assembly = await asyncio.to_thread(self._read, self.key(script_files, engine_key))
+        if assembly:
+            self.hits += 1
+            return assembly
+        self.misses += 1
+        return None
+
+    async def build(self, script_files: List[Dict[str, str]]) -> Tuple[Optional[bytes], str]:
+        """
+        Compiles the sources with BuildScript (once, however many callers ask at the same time)
+        and caches the result.
+        """
+        engine_key = await self.engine_key()
+        key = self.key(script_files, engine_key) if engine_key else None
+        if key is not None:
+            cached = await asyncio.to_thread(self._read, key)
+            if cached:
+                return cached, ""
+            task = self._building.get(key)
+            if task is None:
+                task = self._building[key] = asyncio.get_running_loop().create_task(self._build(script_files, key))
+                task.add_done_callback(lambda _: self._building.pop(key, None))
+            return await asyncio.shield(task)
+        return await self._build(script_files, None)
+
+    async def _build(self, script_files: List[Dict[str, str]], key: Optional[str]) -> Tuple[Optional[bytes], str]:
+        response = await build_script_async(json.dumps(script_files))
+        assembly = response.get("compiled_assembly") if response.get("is_success") else None
+        if not assembly:
+            self.build_failures += 1
+            return None, response.get("error_message") or "Compilation failed."
+        self.builds += 1
+        if key is not None:
+            try:
+                await asyncio.to_thread(self._write, key, assembly)
+            except OSError as e:
+                logger.warning(f"Could not write compiled assembly to the cache: {e}")
+        return assembly, ""
+
+    def build_soon(self, script_files: List[Dict[str, str]]):
+        """Schedules build() on the running loop, e.g. after a run from source missed the cache."""
+        task = asyncio.get_running_loop().create_task(self._build_logged(script_files))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _build_logged(self, script_files: List[Dict[str, str]]):
+        try:
+            if await self.engine_key() is None:
+                return  # nowhere to keep it
+            assembly, error = await self.build(script_files)
+            if assembly is None:
+                logger.debug(f"Background build failed: {error}")
+        except Exception as e:
+            logger.warning(f"Background build failed: {e}")
+
+    # --- Warming ---
+
+    def track(self, path: str, script_type: str):
+        """Remembers a run script so that edits to it are rebuilt ahead of its next run."""
+        self._tracked[os.path.normpath(path).replace('\\', '/')] = script_type
+
+    def on_paths_changed(self, paths: List[str]):
+        """Watcher listener: rebuilds tracked scripts whose files changed."""
+        changed = {}
+        for path in paths:
+            path = os.path.normpath(path).replace('\\', '/')
+            for script_path in (path, os.path.dirname(path)):
+                if script_path in self._tracked:
+                    changed[script_path] = self._tracked[script_path]
+                    break
+        if changed:
+            task = asyncio.get_running_loop().create_task(self._rebuild(changed))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _rebuild(self, scripts: Dict[str, str]):
+        for script_path, script_type in scripts.items():
+            try:
+                script_files = await asyncio.to_thread(read_script_files, script_path, script_type)
+            except OSError:
+                self._tracked.pop(script_path, None)  # deleted or moved
+                continue
+            if script_files:
+                await self._build_logged(script_files)
+
+    def stats(self) -> Dict[str, int]:
+        entries = self._entries()
+        return {
+            "enabled": ASSEMBLY_CACHE_ENABLED,
+            "entries": len(entries),
+            "bytes": sum(size for _, size, _ in entries),
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "builds": self.builds,
+            "build_failures": self.build_failures,
+            "tracked": len(self._tracked),
+        }
+
+# Global instance
+assembly_cache = AssemblyCache()
@@ -0,0 +1,170 @@
+import asyncio
+import glob
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+
+from grpc_client import get_combined_script_async, script_files_hash
+
+logger = logging.getLogger(__name__)
+
+# Memory budget for combined sources (characters, roughly bytes for C#)
+COMBINED_CACHE_MAX_CHARS = int(os.environ.get('PARACORE_COMBINED_CACHE_MB', '16')) * 1024 * 1024
+
+class CombinedScript(NamedTuple):
+    combined_script: str
+    # script_files_hash of the sources, the same token the script index and ETags use
+    content_hash: str
+
+def _leaf(content: str) -> str:
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+def _root(leaves: List[Tuple[str, str]]) -> str:
+    """Merkle root of a multi-file script: the hash of its (file name, file hash) leaves in name order."""
+    digest = hashlib.sha256()
+    for name, leaf in sorted(leaves):
+        digest.update(f"{name}\0{leaf}\n".encode('utf-8'))
+    return digest.hexdigest()
+
+def _norm(path: str) -> str:
+    return os.path.normpath(path).replace('\\', '/')
+
+def _stat_key(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+class CombinedScriptCache:
+    """
+    GetCombinedScript results for multi-file scripts, keyed by the Merkle root of the folder's .cs files.
+    File hashes are remembered against each file's stat signature, so a lookup only stats the folder;
+    sources are read and the engine is asked only when a file actually changed.
+    """
+    def __init__(self, max_chars: int = COMBINED_CACHE_MAX_CHARS):
+        self.max_chars = max_chars
+        self._leaves: Dict[str, Tuple[Tuple[int, int], str]] = {}  # file path -> (stat key, file hash)
+        self._entries: "OrderedDict[str, CombinedScript]" = OrderedDict()  # Merkle root -> result
+        self._chars = 0
+        self._folders: Set[str] = set()  # folders combined before; kept warm on watcher events
+        self._lock = threading.Lock()
+        self._tasks: Set[asyncio.Task] = set()
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, folder_path: str) -> Optional[CombinedScript]:
+        """The cached result if no .cs file in the folder changed since it was read; touches no file contents."""
+        cs_files = glob.glob(os.path.join(folder_path, "*.cs"))
+        leaves = []
+        with self._lock:
+            for path in cs_files:
+                known = self._leaves.get(_norm(path))
+                if known is None or known[0] != _stat_key(path):
+                    self.misses += 1
+                    return None
+                leaves.append((os.path.basename(path), known[1]))
+            root = _root(leaves)
+            entry = self._entries.get(root) if leaves else None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(root)
+            self.hits += 1
+            return entry
+
+    def read(self, folder_path: str) -> List[Dict[str, str]]:
+        """Reads the folder's .cs files as ScriptFiles, remembering each file's hash against its stat signature."""
+        script_files = []
+        for path in glob.glob(os.path.join(folder_path, "*.cs")):
+            before = _stat_key(path)
+            with open(path, 'r', encoding='utf-8-sig') as f:
+                content = f.read()
+            # A file rewritten while it was read gets no leaf, so the next lookup reads it again
+            if before is not None and before == _stat_key(path):
+                with self._lock:
+                    self._leaves[_norm(path)] = (before, _leaf(content))
+            script_files.append({"file_name": os.path.basename(path), "content": content})
+        return script_files
+
+    async def combine(self, folder_path: str, script_files: List[Dict[str, str]]) -> CombinedScript:
+        """Combined source of script_files (read from folder_path), from the cache or the engine."""
+        root = _root([(f["file_name"], _leaf(f["content"])) for f in script_files])
+        with self._lock:
+            self._folders.add(_norm(folder_path))
+            entry = self._entries.get(root)
+        if entry is not None:
+            return entry
+
+        response = await get_combined_script_async(script_files)
+        entry = CombinedScript(response.get("combined_script") or "", script_files_hash(script_files))
+        # Errors are not cached, so the next open asks the engine again
+        if entry.combined_script and not response.get("error_message"):
+            self._put(root, entry)
+        return entry
+
+    async def get(self, folder_path: str) -> CombinedScript:
+        return self.lookup(folder_path) or await self.combine(folder_path, self.read(folder_path))
+
+    def _put(self, root: str, entry: CombinedScript):
+        size = len(entry.combined_script)
+        if size > self.max_chars:
+            return
+        with self._lock:
+            old = self._entries.pop(root, None)
+            if old is not None:
+                self._chars -= len(old.combined_script)
+            self._entries[root] = entry
+            self._chars += size
+            while self._chars > self.max_chars:
+                _, evicted = self._entries.popitem(last=False)
+                self._chars -= len(evicted.combined_script)
+
+    # --- Warming ---
+
+    async def refresh(self, folder_path: str):
+        """Re-reads and re-combines a folder so the next open is a lookup."""
+        if not os.path.isdir(folder_path) or self.lookup(folder_path) is not None:
+            return
+        try:
+            script_files = self.read(folder_path)
+            if script_files:
+                await self.combine(folder_path, script_files)
+        except Exception as e:
+            logger.warning(f"Could not refresh combined script for {folder_path}: {e}")
+
+    def refresh_soon(self, folder_path: str):
+        """Schedules refresh() on the running loop (after a save, or from a watcher batch)."""
+        task = asyncio.get_running_loop().create_task(self.refresh(folder_path))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def on_paths_changed(self, paths: List[str]):
+        """Watcher listener: forgets changed files and re-combines the affected folders that were opened before."""
+        folders = set()
+        with self._lock:
+            for path in paths:
+                path = _norm(path)
+                self._leaves.pop(path, None)
+                folder = os.path.dirname(path) if path.lower().endswith(".cs") else path
+                if folder in self._folders:
+                    folders.add(folder)
+        for folder in folders:
+            self.refresh_soon(folder)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "chars": self._chars,
+                "max_chars": self.max_chars,
+                "files": len(self._leaves),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+# Global instance
+combined_script_cache = CombinedScriptCache()
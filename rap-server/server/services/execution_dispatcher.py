@@ -0,0 +1,160 @@
+import asyncio
+import logging
+import os
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, Deque, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Priority lanes, highest first: someone waiting at the UI, then the agent/MCP tools, then playlists and sweeps.
+LANES = ("interactive", "agent", "batch")
+DEFAULT_LANE = "interactive"
+# A lower-lane request that has waited this long is served next regardless of lane, so batches are never starved.
+MAX_LANE_WAIT_SECONDS = float(os.environ.get("PARACORE_MAX_LANE_WAIT", "120"))
+# Wait times of this many recent executions per lane feed the metrics.
+WAIT_WINDOW = 200
+
+# The slot held by the current task, so a nested slot() (a run job around its ExecuteScript call)
+# does not wait on itself
+_held: ContextVar[Optional["_Waiter"]] = ContextVar("held_execution_slot", default=None)
+
+class _Waiter:
+    __slots__ = ("future", "lane", "user", "enqueued_at", "started_at")
+
+    def __init__(self, future: asyncio.Future, lane: str, user: Any):
+        self.future = future
+        self.lane = lane
+        self.user = user
+        self.enqueued_at = time.time()
+        self.started_at: Optional[float] = None
+
+class ExecutionDispatcher:
+    """
+    Admits one script execution at a time to the Revit engine, which runs them serially anyway.
+    Waiting executions are ordered by lane priority and, within a lane, round-robin across users,
+    so one user's batch cannot hold everyone else behind it. Queue times are recorded per lane.
+    """
+    def __init__(self):
+        # lane -> user -> their waiting executions (users rotate to the back once served)
+        self._waiting: Dict[str, "OrderedDict[Any, Deque[_Waiter]]"] = {lane: OrderedDict() for lane in LANES}
+        self._current: Optional[_Waiter] = None
+        self._waits: Dict[str, Deque[float]] = {lane: deque(maxlen=WAIT_WINDOW) for lane in LANES}
+        self._served: Dict[str, int] = {lane: 0 for lane in LANES}
+
+    @asynccontextmanager
+    async def slot(self, lane: Optional[str] = None, user: Any = None):
+        """Holds the engine for the body of the `async with`; waits for its turn first. Re-entrant within a task."""
+        lane = lane or DEFAULT_LANE
+        if lane not in LANES:
+            raise ValueError(f"Unknown execution lane: {lane}. Expected one of {', '.join(LANES)}.")
+        held = _held.get()
+        if held is not None and held is self._current:
+            yield
+            return
+        waiter = await self._acquire(lane, user)
+        token = _held.set(waiter)
+        try:
+            yield
+        finally:
+            self._release(waiter)
+            try:
+                _held.reset(token)
+            except ValueError:
+                # An abandoned stream finalized from another context; the slot is released all the same
+                pass
+
+    async def _acquire(self, lane: str, user: Any) -> _Waiter:
+        waiter = _Waiter(asyncio.get_running_loop().create_future(), lane, user)
+        if self._current is None and not self.waiting():
+            self._start(waiter)
+            return waiter
+        self._waiting[lane].setdefault(user, deque()).append(waiter)
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # Granted just as the caller gave up: pass the slot on
+                self._release(waiter)
+            else:
+                self._discard(waiter)
+            raise
+        return waiter
+
+    def _start(self, waiter: _Waiter):
+        waiter.started_at = time.time()
+        wait = waiter.started_at - waiter.enqueued_at
+        self._waits[waiter.lane].append(wait)
+        self._served[waiter.lane] += 1
+        if wait >= 1:
+            logger.info(f"Execution ({waiter.lane}, user {waiter.user}) waited {wait:.1f}s for the engine.")
+        self._current = waiter
+        if not waiter.future.done():
+            waiter.future.set_result(None)
+
+    def _release(self, waiter: _Waiter):
+        if self._current is not waiter:
+            return
+        self._current = None
+        following = self._next()
+        # Skip waiters cancelled since they were queued (their task has not run its cleanup yet)
+        while following is not None and following.future.cancelled():
+            following = self._next()
+        if following is not None:
+            self._start(following)
+
+    def _discard(self, waiter: _Waiter):
+        users = self._waiting[waiter.lane]
+        queue = users.get(waiter.user)
+        if queue is not None and waiter in queue:
+            queue.remove(waiter)
+            if not queue:
+                del users[waiter.user]
+
+    def _next(self) -> Optional[_Waiter]:
+        heads = [(lane, user, queue[0]) for lane in LANES for user, queue in self._waiting[lane].items()]
+        if not heads:
+            return None
+        now = time.time()
+        starved = [h for h in heads if now - h[2].enqueued_at >= MAX_LANE_WAIT_SECONDS]
+        # heads are in lane priority order, then in each lane's round-robin order
+        lane, user, _ = min(starved, key=lambda h: h[2].enqueued_at) if starved else heads[0]
+        users = self._waiting[lane]
+        waiter = users[user].popleft()
+        if users[user]:
+            users.move_to_end(user)
+        else:
+            del users[user]
+        return waiter
+
+    def waiting(self) -> int:
+        return sum(len(queue) for users in self._waiting.values() for queue in users.values())
+
+    def stats(self) -> Dict[str, Any]:
+        now = time.time()
+        lanes = {}
+        for lane in LANES:
+            queued = [w for queue in self._waiting[lane].values() for w in queue]
+            waits = list(self._waits[lane])
+            lanes[lane] = {
+                "waiting": len(queued),
+                "users": len(self._waiting[lane]),
+                "served": self._served[lane],
+                "oldestWaitSeconds": round(now - min(w.enqueued_at for w in queued), 3) if queued else 0,
+                "avgWaitSeconds": round(sum(waits) / len(waits), 3) if waits else 0,
+                "maxWaitSeconds": round(max(waits), 3) if waits else 0,
+            }
+        current = self._current
+        return {
+            "inFlight": {
+                "lane": current.lane,
+                "user": current.user,
+                "runningSeconds": round(now - current.started_at, 3),
+            } if current else None,
+            "lanes": lanes,
+        }
+
+# Global instance
+execution_dispatcher = ExecutionDispatcher()
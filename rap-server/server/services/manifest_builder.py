@@ -0,0 +1,278 @@
+"""
+Incremental maintenance of an agent library's manifest.json.
+
+The library is laid out as GetScriptManifest scans it: every subfolder of the root (or each listed folder)
+is a source folder whose .cs files are single-file scripts and whose subfolders are multi-file scripts.
+A hidden state file next to manifest.json keeps one entry per script, keyed by its path relative to the
+root, with the stat signature and content hash it was extracted from. An update re-reads only scripts
+whose signature changed and re-extracts only those whose content hash changed; removed scripts are
+dropped. Scripts whose extraction failed, or was answered locally while the engine was unreachable, are
+listed but not recorded, so the next update extracts them again. manifest.json is then rewritten
+atomically in compact form and the library's generation counter is bumped, so consumers can tell a
+changed manifest from its generation alone.
+"""
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILE = "manifest.json"
+STATE_FILE = ".manifest-state.json"
+STATE_VERSION = 1
+
+_locks: Dict[str, threading.Lock] = {}
+_locks_guard = threading.Lock()
+# Per library: the stat signature of the state file and the generation read from it
+_generations: Dict[str, Tuple[Tuple[int, int, int], int]] = {}
+
+def source_folders(agent_scripts_path: str) -> List[str]:
+    """The folders GetScriptManifest scans: every subfolder of the root, or the listed ones (ROOT|path1,path2)."""
+    if "|" in agent_scripts_path:
+        root, _, targets = agent_scripts_path.partition("|")
+        if targets:
+            return [t for t in targets.split(",") if t]
+        agent_scripts_path = root
+    try:
+        with os.scandir(agent_scripts_path) as it:
+            return sorted(e.path for e in it
+                          if e.is_dir() and not e.name.startswith(".") and e.name not in ("bin", "obj"))
+    except OSError:
+        return []
+
+def _lock(root: str) -> threading.Lock:
+    with _locks_guard:
+        return _locks.setdefault(root, threading.Lock())
+
+def _discover(root: str) -> Dict[str, Tuple[str, List[str]]]:
+    """{relative path: (script type, .cs files)} for every script of the library."""
+    scripts = {}
+    for folder in source_folders(root):
+        try:
+            with os.scandir(folder) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.name.startswith("."):
+                continue
+            try:
+                if entry.is_dir():
+                    if entry.name in ("bin", "obj"):
+                        continue
+                    with os.scandir(entry.path) as sub:
+                        cs_files = sorted(e.path for e in sub if e.name.endswith(".cs") and e.is_file())
+                    if cs_files:
+                        scripts[os.path.relpath(entry.path, root)] = ("multi-file", cs_files)
+                elif entry.name.endswith(".cs"):
+                    scripts[os.path.relpath(entry.path, root)] = ("single-file", [entry.path])
+            except OSError:
+                continue
+    return scripts
+
+def _signature(cs_files: List[str]) -> List[List[Any]]:
+    signature = []
+    for path in cs_files:
+        st = os.stat(path)
+        signature.append([os.path.basename(path), st.st_mtime_ns, st.st_size])
+    return signature
+
+def _read_sources(cs_files: List[str]) -> List[Dict[str, str]]:
+    script_files = []
+    for path in cs_files:
+        with open(path, 'r', encoding='utf-8-sig') as f:
+            script_files.append({"file_name": os.path.basename(path), "content": f.read()})
+    return script_files
+
+def manifest_entry(name: str, script_type: str, absolute_path: str, relative_path: str,
+                   metadata: Dict[str, Any], parameters: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """A manifest entry in the shape GetScriptManifest serializes, from extracted metadata and parameter dicts."""
+    return {
+        "name": name,
+        "type": script_type,
+        "absolutePath": absolute_path,
+        "metadata": {
+            "description": metadata.get("description", ""),
+            "displayName": name,
+            "relativePath": relative_path,
+            "author": metadata.get("author", ""),
+            "categories": metadata.get("categories", []),
+            "usage_examples": metadata.get("usage_examples", []),
+            "dependencies": metadata.get("dependencies", []),
+            "document_type": metadata.get("document_type", ""),
+            "lastRun": metadata.get("last_run", ""),
+            "is_protected": metadata.get("is_protected", False),
+            "is_compiled": metadata.get("is_compiled", False),
+        },
+        "parameters": [{
+            "name": p.get("name"),
+            "type": p.get("type"),
+            "description": p.get("description"),
+            "defaultValue": p.get("defaultValueJson"),
+            "numericType": p.get("numericType"),
+            "unit": p.get("unit"),
+            "min": p.get("min"),
+            "max": p.get("max"),
+            "step": p.get("step"),
+            "options": p.get("options", []),
+            "isRevitElement": p.get("isRevitElement"),
+            "revitElementType": p.get("revitElementType"),
+            "revitElementCategory": p.get("revitElementCategory"),
+            "required": p.get("required"),
+            "group": p.get("group"),
+        } for p in parameters],
+    }
+
+def streamed_manifest_entry(entry: Dict[str, Any]) -> Dict[str, Any]:
+    """A manifest entry from a grpc_client.stream_script_manifest item."""
+    metadata = entry["metadata"]
+    return manifest_entry(entry["name"], entry["type"], entry["absolute_path"], metadata.get("file_path", ""),
+                          metadata, entry["parameters"])
+
+def _entry(root: str, relative_path: str, script_type: str, extracted: Dict[str, Any]) -> Dict[str, Any]:
+    metadata = extracted.get("metadata") or {}
+    name = metadata.get("name") or os.path.splitext(os.path.basename(relative_path))[0]
+    return manifest_entry(name, script_type, os.path.join(root, relative_path), relative_path,
+                          metadata, extracted.get("parameters") or [])
+
+def _load_state(root: str) -> Dict[str, Any]:
+    try:
+        with open(os.path.join(root, STATE_FILE), 'r', encoding='utf-8') as f:
+            state = json.load(f)
+        if state.get("version") == STATE_VERSION:
+            return state
+    except (OSError, ValueError):
+        pass
+    return {"version": STATE_VERSION, "generation": 0, "scripts": {}}
+
+def _write_json(path: str, data: Any):
+    # A temp file of its own per write: the API server and the MCP server may update the same library
+    fd, tmp_path = tempfile.mkstemp(prefix=f"{os.path.basename(path)}.", suffix=".tmp", dir=os.path.dirname(path))
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+def manifest_generation(agent_scripts_path: str) -> int:
+    """
+    The library's manifest generation; it increases every time an update changes manifest.json.
+    Read from the state file whenever that changed, so updates made by other processes count too.
+    """
+    try:
+        st = os.stat(os.path.join(agent_scripts_path, STATE_FILE))
+    except OSError:
+        return 0
+    signature = (st.st_ino, st.st_mtime_ns, st.st_size)
+    cached = _generations.get(agent_scripts_path)
+    if cached is None or cached[0] != signature:
+        cached = _generations[agent_scripts_path] = (signature, _load_state(agent_scripts_path)["generation"])
+    return cached[1]
+
+def update_manifest(agent_scripts_path: str, full: bool = False) -> Dict[str, Any]:
+    """
+    Brings manifest.json of a library up to date with its scripts. full re-reads and re-extracts
+    every script. Returns {"manifest", "generation", "added", "changed", "removed", "unchanged", "seconds"}.
+    """
+    from grpc_client import get_script_metadata_batch, is_offline_result, script_files_hash
+
+    started = time.perf_counter()
+    root = agent_scripts_path
+    with _lock(root):
+        state = _load_state(root)
+        previous = state["scripts"]
+        scripts: Dict[str, Dict[str, Any]] = {}
+        to_extract: List[Dict[str, Any]] = []
+        types: Dict[str, str] = {}
+        provisional = set()
+
+        for relative_path, (script_type, cs_files) in _discover(root).items():
+            known = previous.get(relative_path)
+            try:
+                signature = _signature(cs_files)
+                if not full and known is not None and known["type"] == script_type and known["signature"] == signature:
+                    scripts[relative_path] = known
+                    continue
+                script_files = _read_sources(cs_files)
+            except (OSError, UnicodeDecodeError) as e:
+                logger.warning(f"Skipping unreadable script {relative_path}: {e}")
+                continue
+            content_hash = script_files_hash(script_files)
+            if not full and known is not None and known["type"] == script_type and known["hash"] == content_hash:
+                # Touched but not edited: keep the entry, remember the new signature
+                scripts[relative_path] = {**known, "signature": signature}
+                continue
+            scripts[relative_path] = {"type": script_type, "signature": signature, "hash": content_hash, "entry": None}
+            types[relative_path] = script_type
+            to_extract.append({"id": relative_path, "script_files": script_files})
+
+        if to_extract:
+            results = get_script_metadata_batch(to_extract, include_parameters=True)
+            for unit in to_extract:
+                relative_path = unit["id"]
+                result = results.get(relative_path)
+                if result is None:
+                    # Not answered: keep what we had (or nothing) and retry on the next update
+                    if relative_path in previous:
+                        scripts[relative_path] = previous[relative_path]
+                    else:
+                        del scripts[relative_path]
+                    del types[relative_path]
+                    continue
+                if result.get("error_message"):
+                    logger.warning(f"Extraction of {relative_path} reported: {result['error_message']}")
+                if result.get("error_message") or is_offline_result(result):
+                    # Listed, but kept out of the state (like an unanswered script) so the next update retries it
+                    provisional.add(relative_path)
+                scripts[relative_path]["entry"] = _entry(root, relative_path, types[relative_path], result)
+
+        added = sum(1 for p in scripts if p not in previous)
+        changed = sum(1 for p in types if p in previous and p in scripts)
+        removed = sum(1 for p in previous if p not in scripts)
+        manifest = [scripts[p]["entry"] for p in sorted(scripts)]
+        manifest_path = os.path.join(root, MANIFEST_FILE)
+        stored = {p: s for p, s in scripts.items() if p not in provisional}
+        stored.update({p: previous[p] for p in provisional if p in previous})
+
+        manifest_changed = added or changed or removed or full or not os.path.exists(manifest_path)
+        if manifest_changed and provisional and not full and read_manifest(root) == manifest:
+            # Only retried scripts, extracted to the same entries as last time
+            manifest_changed = False
+        if manifest_changed:
+            state["generation"] += 1
+            state["scripts"] = stored
+            # manifest.json first: a crash in between only costs one redundant extraction
+            _write_json(manifest_path, manifest)
+            _write_json(os.path.join(root, STATE_FILE), state)
+            logger.info(f"Manifest of {root} updated to generation {state['generation']}: "
+                        f"{added} added, {changed} changed, {removed} removed")
+        elif stored != previous:
+            state["scripts"] = stored
+            _write_json(os.path.join(root, STATE_FILE), state)
+
+    return {
+        "manifest": manifest,
+        "generation": state["generation"],
+        "added": added,
+        "changed": changed,
+        "removed": removed,
+        "unchanged": len(scripts) - added - changed,
+        "seconds": round(time.perf_counter() - started, 3),
+    }
+
+def read_manifest(agent_scripts_path: str) -> Optional[List[Dict[str, Any]]]:
+    """manifest.json as it is on disk, or None if it is missing or unreadable."""
+    try:
+        with open(os.path.join(agent_scripts_path, MANIFEST_FILE), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
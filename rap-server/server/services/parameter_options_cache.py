@@ -0,0 +1,262 @@
+import asyncio
+import hashlib
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from database_config import SessionLocal
+from grpc_client import (
+    add_run_listener,
+    compute_parameter_options_async,
+    compute_parameter_options_batch_async,
+    get_context_async,
+    get_script_parameters_async,
+)
+from services.combined_script_cache import combined_script_cache
+from services.status_monitor import status_monitor
+from sqlalchemy import func
+
+import models
+
+logger = logging.getLogger(__name__)
+
+# Entries older than this are recomputed even without a change notification. Edits made directly in Revit
+# (or by another add-in) are not reported to the server, so this age limit is the only thing that bounds
+# how stale options can get after such an edit; only Paracore runs and document switches clear the cache.
+OPTIONS_CACHE_TTL_SECONDS = float(os.environ.get("PARACORE_OPTIONS_CACHE_TTL", "600"))
+OPTIONS_CACHE_MAX_ENTRIES = 512
+# Warm the cache for favorite and recently run scripts whenever a document becomes active (off by default).
+PREFETCH_ON_DOCUMENT_OPEN = os.environ.get("PARACORE_PREFETCH_OPTIONS", "0").lower() in ("1", "true", "yes")
+PREFETCH_RECENT_SCRIPTS = 10
+
+def document_key(status: Dict[str, Any], project_info: Optional[Dict[str, Any]] = None) -> Optional[str]:
+    """
+    Identity of the active Revit document in a status snapshot, or None when there is none.
+    project_info (from GetContext) adds the document's file path, which tells apart documents
+    that share a title, e.g. two copies of a model or a detached copy opened next to its central.
+    """
+    if not status.get("paracoreConnected") or not status.get("documentOpen"):
+        return None
+    file_path = (project_info or {}).get("file_path") or ""
+    return f"{status.get('revitVersion')}|{status.get('documentType')}|{status.get('documentTitle')}|{file_path}"
+
+async def load_options_source(absolute_path: str, script_type: str) -> str:
+    """The source ComputeParameterOptions runs against: the file itself, or a multi-file script combined."""
+    if script_type == "single-file":
+        with open(absolute_path, 'r', encoding='utf-8-sig') as f:
+            return f.read()
+    if script_type == "multi-file":
+        return (await combined_script_cache.get(absolute_path)).combined_script
+    raise ValueError(f"Invalid script type: {script_type}")
+
+async def computed_parameter_names(source_code: str) -> List[str]:
+    """Names of the parameters whose options come from the document (requiresCompute)."""
+    response = await get_script_parameters_async([{"file_name": "Script.cs", "content": source_code}])
+    return [p["name"] for p in response.get("parameters", []) if p.get("requiresCompute")]
+
+class ParameterOptionsCache:
+    """
+    ComputeParameterOptions results keyed by script hash, parameter name and the active document (including
+    its file path). Everything is dropped when the active document changes or a Paracore run may have changed
+    the model; successful results are otherwise served from memory, with their age, for
+    OPTIONS_CACHE_TTL_SECONDS, which is the only guard against edits made outside Paracore.
+    """
+    def __init__(self, ttl: float = OPTIONS_CACHE_TTL_SECONDS, max_entries: int = OPTIONS_CACHE_MAX_ENTRIES):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, str, str], Tuple[Dict[str, Any], float]]" = OrderedDict()
+        self._document: Optional[str] = None
+        self._prefetched_document: Optional[str] = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    async def _current_document(self) -> Optional[str]:
+        if status_monitor.running:
+            status = status_monitor.snapshot()
+        else:
+            # No background monitor (e.g. the MCP server process): ask Revit directly
+            status = await status_monitor.poll_once()
+        if document_key(status) is None:
+            return None
+        try:
+            context = await get_context_async()
+        except Exception:
+            # Without the file path the document cannot be told apart from a namesake: don't cache
+            return None
+        return document_key(status, context.get("project_info"))
+
+    def invalidate(self):
+        """Drops every entry (a run may have added or removed the elements options are built from)."""
+        with self._lock:
+            if self._entries:
+                self.invalidations += 1
+            self._entries.clear()
+
+    def _sync_document(self, document: Optional[str]):
+        with self._lock:
+            if document != self._document:
+                if self._entries:
+                    logger.info("Active document changed; parameter options cache cleared.")
+                    self.invalidations += 1
+                self._entries.clear()
+                self._document = document
+
+    def _key(self, document: Optional[str], source_code: str, parameter_name: str) -> Tuple[str, str, str]:
+        return (document or "", hashlib.sha256(source_code.encode('utf-8')).hexdigest(), parameter_name)
+
+    def _lookup(self, key: Tuple[str, str, str]) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None and time.time() - cached[1] <= self.ttl:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return {**cached[0], "from_cache": True, "cache_age_seconds": round(time.time() - cached[1], 1)}
+            self.misses += 1
+            return None
+
+    def _store(self, document: Optional[str], key: Tuple[str, str, str], result: Dict[str, Any]):
+        # Failures are not cached, and nothing is without a document to scope the result to
+        if document is None or not result.get("is_success"):
+            return
+        with self._lock:
+            if self._document == document:
+                self._entries[key] = (result, time.time())
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+
+    async def compute(self, source_code: str, parameter_name: str, refresh: bool = False) -> Dict[str, Any]:
+        """
+        The compute_parameter_options_async result, plus "from_cache" and "cache_age_seconds"
+        (0 for a fresh computation). refresh=True always recomputes.
+        """
+        document = await self._current_document()
+        self._sync_document(document)
+
+        key = self._key(document, source_code, parameter_name)
+        if document is not None and not refresh:
+            cached = self._lookup(key)
+            if cached is not None:
+                return cached
+
+        result = await compute_parameter_options_async(source_code, parameter_name)
+        self._store(document, key, result)
+        return {**result, "from_cache": False, "cache_age_seconds": 0}
+
+    async def compute_batch(self, scripts: List[Dict[str, Any]], refresh: bool = False) -> Dict[str, Any]:
+        """
+        Options for several scripts at once: scripts is [{"id", "source_code", "parameter_names"}].
+        Cached parameters are answered from memory; the rest go to the engine in a single batch call.
+        Returns {"results": {id: {parameter_name: result}}, "error_message"}.
+        """
+        document = await self._current_document()
+        self._sync_document(document)
+
+        results: Dict[str, Dict[str, Any]] = {}
+        queries = []
+        for script in scripts:
+            missing = []
+            for name in script["parameter_names"]:
+                cached = None
+                if document is not None and not refresh:
+                    cached = self._lookup(self._key(document, script["source_code"], name))
+                if cached is not None:
+                    results.setdefault(script["id"], {})[name] = cached
+                else:
+                    missing.append(name)
+            if missing:
+                queries.append({"id": script["id"], "script_content": script["source_code"],
+                                "parameter_names": missing})
+
+        error_message = ""
+        if queries:
+            response = await compute_parameter_options_batch_async(queries)
+            error_message = response.get("error_message", "")
+            sources = {q["id"]: q["script_content"] for q in queries}
+            for script_id, by_name in response["results"].items():
+                for name, result in by_name.items():
+                    self._store(document, self._key(document, sources[script_id], name), result)
+                    results.setdefault(script_id, {})[name] = {**result, "from_cache": False, "cache_age_seconds": 0}
+        return {"results": results, "error_message": error_message}
+
+    # --- Prefetch ---
+
+    def prefetch_candidates(self) -> List[Tuple[str, str]]:
+        """(path, type) of favorite scripts and the most recently run ones that can compute options."""
+        db = SessionLocal()
+        try:
+            paths = [path for (path,) in db.query(models.Script.path).filter(models.Script.is_favorite.is_(True)).all()]
+            recent = (
+                db.query(models.Script.path)
+                .join(models.Run, models.Run.script_id == models.Script.id)
+                .group_by(models.Script.path)
+                .order_by(func.max(models.Run.timestamp).desc())
+                .limit(PREFETCH_RECENT_SCRIPTS)
+                .all()
+            )
+            paths += [path for (path,) in recent]
+        finally:
+            db.close()
+
+        candidates = []
+        for path in dict.fromkeys(p for p in paths if p):
+            if os.path.isdir(path):
+                candidates.append((path, "multi-file"))
+            elif path.lower().endswith(".cs") and os.path.isfile(path):
+                candidates.append((path, "single-file"))
+        return candidates
+
+    async def prefetch(self) -> int:
+        """
+        Computes and caches options for prefetch_candidates() in one batch.
+        Returns the number of parameters computed.
+        """
+        scripts = []
+        for path, script_type in await asyncio.to_thread(self.prefetch_candidates):
+            try:
+                source_code = await load_options_source(path, script_type)
+                names = await computed_parameter_names(source_code) if source_code else []
+            except Exception as e:
+                logger.debug(f"Skipping options prefetch for {path}: {e}")
+                continue
+            if names:
+                scripts.append({"id": path, "source_code": source_code, "parameter_names": names})
+        if not scripts:
+            return 0
+        response = await self.compute_batch(scripts)
+        count = sum(len(by_name) for by_name in response["results"].values())
+        logger.info(f"Prefetched options for {count} parameters across {len(scripts)} scripts.")
+        return count
+
+    def on_status_changed(self, status: Dict[str, Any]):
+        """Status monitor listener: prefetch when a document becomes active."""
+        document = document_key(status)
+        if PREFETCH_ON_DOCUMENT_OPEN and document is not None and document != self._prefetched_document:
+            self._prefetched_document = document
+            asyncio.get_running_loop().create_task(self._prefetch_logged())
+
+    async def _prefetch_logged(self):
+        try:
+            await self.prefetch()
+        except Exception as e:
+            logger.error(f"Options prefetch failed: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "document": self._document,
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+            }
+
+# Global instance
+parameter_options_cache = ParameterOptionsCache()
+add_run_listener(parameter_options_cache.invalidate)
@@ -0,0 +1,157 @@
+import json
+import logging
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import grpc
+from grpc_client import execute_script_async, get_script_parameters_async
+from services.assembly_cache import assembly_cache
+
+logger = logging.getLogger(__name__)
+
+def parse_value(val):
+    """Multi-select values arrive from the frontend as JSON array strings."""
+    if isinstance(val, str) and val.startswith('[') and val.endswith(']'):
+        try:
+            return json.loads(val)
+        except json.JSONDecodeError:
+            pass
+    return val
+
+def flatten_parameters(parameters) -> Dict[str, Any]:
+    """
+    { "name": value } for CodeRunner's MapParameters, from what the frontend sends: a JSON string
+    or a list of ScriptParameter objects (camelCase or PascalCase). A dict is returned as is.
+    """
+    if parameters is None:
+        return {}
+    if isinstance(parameters, dict):
+        return parameters
+    if isinstance(parameters, str):
+        try:
+            param_list = json.loads(parameters)
+            return {p["name"]: parse_value(p.get("value")) for p in param_list if p.get("name")}
+        except (json.JSONDecodeError, TypeError, KeyError) as e:
+            print(f"Warning: Failed to parse parameters JSON: {parameters}, error: {e}")
+            return {}
+    if isinstance(parameters, list):
+        return {
+            p.get("name", p.get("Name")): parse_value(p.get("value", p.get("Value")))
+            for p in parameters
+            if p.get("name") or p.get("Name")
+        }
+    return {}
+
+def rich_parameters(definitions: List[Dict[str, Any]], values: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    The rich ScriptParameter list a compiled assembly is run with (as for .ptool tools), so the engine
+    still applies units and defaults: each extracted definition with its value from `values`, or its default.
+    """
+    rich = []
+    for definition in definitions:
+        name = definition.get("name")
+        if name in values:
+            value = values[name]
+        else:
+            try:
+                value = json.loads(definition.get("defaultValueJson") or "null")
+            except ValueError:
+                value = None
+        rich.append({**definition, "value": value})
+    if values.get("__script_name__"):
+        # Dashboard reporting name; ExecuteBinary takes it out before the script runs, as Execute does
+        rich.append({"name": "__script_name__", "value": values["__script_name__"]})
+    return rich
+
+async def compile_script(script_files: List[Dict[str, str]]) -> Dict[str, Any]:
+    """
+    Compiles a source script once with BuildScript, or takes it from the assembly cache.
+    Returns {"compiled_assembly": bytes or None, "definitions": its extracted parameters,
+    "error_message", "seconds"}.
+    """
+    started = time.perf_counter()
+    assembly, error_message = await assembly_cache.build(script_files)
+    definitions = []
+    if assembly:
+        response = await get_script_parameters_async(script_files)
+        definitions = response.get("parameters", [])
+    return {
+        "compiled_assembly": assembly or None,
+        "definitions": definitions,
+        "error_message": error_message,
+        "seconds": round(time.perf_counter() - started, 3),
+    }
+
+async def execute_parameter_set(
+    parameters,
+    script_files: Optional[List[Dict[str, str]]] = None,
+    compiled_assembly: Optional[bytes] = None,
+    definitions: Optional[List[Dict[str, Any]]] = None,
+    script_name: Optional[str] = None,
+    user: Any = None,
+) -> Dict[str, Any]:
+    """
+    One batch-lane run of a script with `parameters`: the compiled assembly with the rich parameter list when
+    definitions are given, a compiled assembly (.ptool) with parameters as sent, or the source otherwise.
+    An engine error is returned as a failed result rather than raised.
+    """
+    try:
+        if compiled_assembly is not None and definitions is not None:
+            values = {**flatten_parameters(parameters), "__script_name__": script_name}
+            parameters_json = json.dumps(rich_parameters(definitions, values))
+            return await execute_script_async(None, parameters_json, compiled_assembly, lane="batch", user=user)
+        if compiled_assembly is not None:
+            parameters_json = parameters if isinstance(parameters, str) else json.dumps(parameters)
+            return await execute_script_async(None, parameters_json, compiled_assembly, lane="batch", user=user)
+        parameters_json = json.dumps({**flatten_parameters(parameters), "__script_name__": script_name})
+        return await execute_script_async(json.dumps(script_files), parameters_json, lane="batch", user=user)
+    except grpc.RpcError as e:
+        return {"is_success": False, "output": "", "error_message": e.details() or str(e),
+                "error_details": [], "structured_output": []}
+
+async def run_sweep(
+    parameter_sets: List[Dict[str, Any]],
+    script_files: Optional[List[Dict[str, str]]] = None,
+    compiled_assembly: Optional[bytes] = None,
+    script_name: Optional[str] = None,
+    user: Any = None,
+    stop_on_error: bool = False,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Runs one script over parameter_sets ([{"name", "parameters"}], parameters in any form the frontend sends)
+    back to back in the batch lane. A source script (script_files) is compiled once up front and each set runs
+    the assembly; if it cannot be compiled, every set runs from source instead. A .ptool passes its
+    compiled_assembly directly, and each set's parameters are sent as they are, as /run-script does.
+    Yields {"event": "compiled", ...}, then {"event": "set_result", "index", "name", "result", "seconds"}
+    per set, then {"event": "summary", ...}.
+    """
+    started = time.perf_counter()
+    definitions = None
+    if compiled_assembly is None:
+        build = await compile_script(script_files)
+        compiled_assembly, definitions = build["compiled_assembly"], build["definitions"]
+        if compiled_assembly is None:
+            logger.warning(f"Sweep of {script_name}: compile failed, running each set from source. "
+                           f"{build['error_message']}")
+        yield {"event": "compiled", "compiled": compiled_assembly is not None,
+               "seconds": build["seconds"], "error_message": build["error_message"]}
+    else:
+        yield {"event": "compiled", "compiled": True, "seconds": 0, "error_message": ""}
+
+    succeeded = failed = 0
+    for index, parameter_set in enumerate(parameter_sets):
+        set_started = time.perf_counter()
+        result = await execute_parameter_set(parameter_set["parameters"], script_files, compiled_assembly,
+                                             definitions, script_name, user)
+        if result.get("is_success"):
+            succeeded += 1
+        else:
+            failed += 1
+        yield {"event": "set_result", "index": index, "name": parameter_set.get("name"),
+               "result": result, "seconds": round(time.perf_counter() - set_started, 3)}
+        if stop_on_error and not result.get("is_success"):
+            break
+
+    yield {"event": "summary", "total": len(parameter_sets), "succeeded": succeeded, "failed": failed,
+           "skipped": len(parameter_sets) - succeeded - failed,
+           "compiled": compiled_assembly is not None, "seconds": round(time.perf_counter() - started, 3)}
@@ -0,0 +1,195 @@
+import asyncio
+import logging
+import os
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import grpc
+from services import ptool_package
+from services.parameter_sweep import compile_script, execute_parameter_set
+from services.playlist_service import Playlist, playlist_service
+
+from utils import read_script_files, resolve_script_path
+
+logger = logging.getLogger(__name__)
+
+POLICIES = ("stop", "continue")
+# BuildScript calls in flight at once while pre-compiling a playlist.
+COMPILE_CONCURRENCY = 4
+
+def _script_type(absolute_path: str) -> Optional[str]:
+    if os.path.isdir(absolute_path):
+        return "multi-file"
+    lower = absolute_path.lower()
+    if lower.endswith(".cs") and os.path.isfile(absolute_path):
+        return "single-file"
+    if lower.endswith(".ptool") and os.path.isfile(absolute_path):
+        return "ptool"
+    return None
+
+def frontend_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    """A run result in the web app's ExecutionResult shape, as stored in lastExecutionResults."""
+    error = None
+    if not result.get("is_success"):
+        error = result.get("error_message") or "\n".join(result.get("error_details") or []) or None
+    return {
+        "output": result.get("output") or "",
+        "isSuccess": bool(result.get("is_success")),
+        "error": error,
+        "structuredOutput": result.get("structured_output") or [],
+        "internalData": result.get("internal_data") or "",
+    }
+
+class _Target:
+    """One distinct script of a playlist, loaded and (for sources) compiled once however many items use it."""
+    def __init__(self, absolute_path: str, script_type: str):
+        self.absolute_path = absolute_path
+        self.script_type = script_type
+        self.name = os.path.basename(absolute_path.rstrip("/\\"))
+        self.script_files: Optional[List[Dict[str, str]]] = None
+        self.compiled_assembly: Optional[bytes] = None
+        self.definitions: Optional[List[Dict[str, Any]]] = None
+        self.compile_error = ""
+
+    def load(self):
+        if self.script_type == "ptool":
+            self.compiled_assembly = ptool_package.read_assembly(self.absolute_path)
+            # A tool ships its rich parameter list; items override values by name
+            self.definitions = ptool_package.read_header(self.absolute_path)["parameters"]
+        else:
+            self.script_files = read_script_files(self.absolute_path, self.script_type)
+            if not self.script_files:
+                raise FileNotFoundError(f"No script files found in {self.absolute_path}")
+
+    async def compile(self):
+        if self.script_type == "ptool":
+            return
+        try:
+            build = await compile_script(self.script_files)
+        except grpc.RpcError as e:
+            # Items run from source instead, as a sweep does when its script does not compile
+            self.compile_error = e.details() or str(e)
+            logger.warning(f"Could not compile {self.absolute_path}, running it from source: {self.compile_error}")
+            return
+        self.compiled_assembly = build["compiled_assembly"]
+        self.definitions = build["definitions"] if self.compiled_assembly is not None else None
+        self.compile_error = build["error_message"]
+
+    async def run(self, values: Dict[str, Any], user: Any) -> Dict[str, Any]:
+        if self.script_type == "ptool":
+            parameters = [{**p, "value": values.get(p.get("name"), p.get("value"))} for p in self.definitions]
+            return await execute_parameter_set(parameters, compiled_assembly=self.compiled_assembly, user=user)
+        return await execute_parameter_set(values, self.script_files, self.compiled_assembly, self.definitions,
+                                           script_name=self.name, user=user)
+
+class PlaylistRunner:
+    """
+    Runs a whole .playlist.json on the server: every item is validated before anything runs, each distinct
+    script is loaded and compiled once (in parallel), then items execute back to back in the batch lane
+    with no UI round trip. policy "stop" ends at the first failure, "continue" runs every item.
+    lastExecutionResults is written to the playlist file once, at the end.
+    """
+    def __init__(self, playlist: Playlist, policy: str = "stop", user: Any = None):
+        if policy not in POLICIES:
+            raise ValueError(f"Invalid policy: {policy}. Expected one of {', '.join(POLICIES)}.")
+        self.playlist = playlist
+        self.policy = policy
+        self.user = user
+        self._targets: Dict[str, _Target] = {}
+        self._item_targets: List[_Target] = []
+
+    def validate(self) -> List[Dict[str, Any]]:
+        """
+        Problems that would stop an item from running, as [{"index", "scriptPath", "error"}];
+        empty when all is well.
+        """
+        errors = []
+        if not self.playlist.items:
+            errors.append({"index": None, "scriptPath": None, "error": "The playlist has no items."})
+        for index, item in enumerate(self.playlist.items):
+            try:
+                absolute_path = resolve_script_path(item.scriptPath)
+            except Exception as e:
+                errors.append({"index": index, "scriptPath": item.scriptPath, "error": str(e)})
+                continue
+            script_type = _script_type(absolute_path)
+            if script_type is None:
+                errors.append({"index": index, "scriptPath": item.scriptPath, "error": "Script not found."})
+                continue
+            target = self._targets.get(absolute_path)
+            if target is None:
+                target = self._targets[absolute_path] = _Target(absolute_path, script_type)
+                try:
+                    target.load()
+                except Exception as e:
+                    errors.append({"index": index, "scriptPath": item.scriptPath,
+                                   "error": f"Could not load script: {e}"})
+            self._item_targets.append(target)
+        return errors
+
+    async def _compile_all(self):
+        semaphore = asyncio.Semaphore(COMPILE_CONCURRENCY)
+
+        async def compile_one(target: _Target):
+            async with semaphore:
+                await target.compile()
+
+        await asyncio.gather(*(compile_one(t) for t in self._targets.values()))
+
+    async def run(self) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yields {"event": "validated", "errors"} (and stops there if there are any), {"event": "compiled", ...},
+        {"event": "item_result", "index", "scriptPath", "absolutePath", "result", "seconds"} per item that ran,
+        then {"event": "summary", ...} with throughput.
+        """
+        started = time.perf_counter()
+        errors = await asyncio.to_thread(self.validate)
+        yield {"event": "validated", "errors": errors, "items": len(self.playlist.items), "scripts": len(self._targets)}
+        if errors:
+            return
+
+        await self._compile_all()
+        compile_seconds = time.perf_counter() - started
+        yield {
+            "event": "compiled",
+            "scripts": len(self._targets),
+            "compiled": sum(1 for t in self._targets.values() if t.compiled_assembly is not None),
+            "errors": {t.absolute_path: t.compile_error for t in self._targets.values() if t.compile_error},
+            "seconds": round(compile_seconds, 3),
+        }
+
+        results: Dict[str, Dict[str, Any]] = {}
+        succeeded = failed = 0
+        execute_started = time.perf_counter()
+        for index, (item, target) in enumerate(zip(self.playlist.items, self._item_targets, strict=True)):
+            item_started = time.perf_counter()
+            result = await target.run(item.parameters or {}, self.user)
+            results[str(index)] = frontend_result(result)
+            if result.get("is_success"):
+                succeeded += 1
+            else:
+                failed += 1
+            yield {"event": "item_result", "index": index, "scriptPath": item.scriptPath,
+                   "absolutePath": target.absolute_path, "result": result,
+                   "seconds": round(time.perf_counter() - item_started, 3)}
+            if self.policy == "stop" and not result.get("is_success"):
+                break
+        execute_seconds = time.perf_counter() - execute_started
+
+        self.playlist.lastExecutionResults = results
+        saved = bool(self.playlist.filePath) and playlist_service.save_playlist(self.playlist.filePath, self.playlist)
+
+        ran = succeeded + failed
+        yield {
+            "event": "summary",
+            "total": len(self.playlist.items),
+            "succeeded": succeeded,
+            "failed": failed,
+            "skipped": len(self.playlist.items) - ran,
+            "policy": self.policy,
+            "compileSeconds": round(compile_seconds, 3),
+            "executeSeconds": round(execute_seconds, 3),
+            "totalSeconds": round(time.perf_counter() - started, 3),
+            "itemsPerMinute": round(ran * 60 / execute_seconds, 1) if execute_seconds > 0 else None,
+            "resultsSaved": saved,
+        }
@@ -41,7 +41,7 @@ class PlaylistService:
                     if file.endswith('.playlist.json'):
                         full_path = os.path.join(root, file)
                         try:
-                            playlist = self._load_playlist(full_path)
+                            playlist = self.load_playlist(full_path)
                             if playlist:
                                 playlists.append(playlist)
                         except Exception as e:
@@ -49,7 +49,10 @@ class PlaylistService:
 
         return playlists
 
-    def _load_playlist(self, file_path: str) -> Optional[Playlist]:
+    def load_playlist(self, file_path: str) -> Optional[Playlist]:
+        """
+        Reads a .playlist.json file. Returns None if it is missing or not a valid playlist.
+        """
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
                 data = json.load(f)
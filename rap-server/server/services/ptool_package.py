@@ -0,0 +1,177 @@
+"""
+.ptool packages: a compiled tool's metadata, parameters and assembly in one file.
+
+v1 is a single JSON document with the assembly base64-encoded inside it, so reading the metadata
+parses the whole file and every run decodes the assembly again.
+v2 is a small container:
+
+    b"PTOOL\\0v2"            8 bytes, magic
+    header length           4 bytes, little-endian
+    header                  UTF-8 JSON: {"format": 2, "metadata", "parameters", "source_hash",
+                                         "assembly": {"offset", "length", "sha256"}}
+    padding                 to an 8-byte boundary
+    assembly                raw bytes
+
+source_hash is the script_files_hash of the sources a tool was built from (null if unknown), so a
+folder build can skip tools that are up to date. The header is read without touching the payload,
+and the payload is read straight from a memory map. Readers here accept both versions;
+`python -m services.ptool_package upgrade <folder>...` rewrites v1 files in place.
+"""
+import argparse
+import base64
+import hashlib
+import json
+import logging
+import mmap
+import os
+import struct
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"PTOOL\0v2"
+_LENGTH = struct.Struct("<I")
+_PREFIX_SIZE = len(MAGIC) + _LENGTH.size
+# Format new packages are written in; PARACORE_PTOOL_FORMAT=1 keeps producing v1 for older installs.
+WRITE_FORMAT = int(os.environ.get("PARACORE_PTOOL_FORMAT", "2"))
+
+class PtoolFormatError(ValueError):
+    pass
+
+def _with_flags(metadata: Dict[str, Any]) -> Dict[str, Any]:
+    # Ensure flags are set even if not in the package
+    return {**metadata, "is_protected": True, "is_compiled": True}
+
+def package_format(path: str) -> int:
+    with open(path, 'rb') as f:
+        return 2 if f.read(len(MAGIC)) == MAGIC else 1
+
+def _read_v2_header(f) -> Dict[str, Any]:
+    prefix = f.read(_PREFIX_SIZE)
+    if len(prefix) < _PREFIX_SIZE or prefix[:len(MAGIC)] != MAGIC:
+        raise PtoolFormatError("Not a v2 .ptool package.")
+    (length,) = _LENGTH.unpack(prefix[len(MAGIC):])
+    header = json.loads(f.read(length).decode('utf-8'))
+    if header.get("format") != 2:
+        raise PtoolFormatError(f"Unsupported .ptool format: {header.get('format')}")
+    return header
+
+def read_header(path: str) -> Dict[str, Any]:
+    """{"format", "metadata", "parameters", "source_hash"} of a package; for v2 only the header is read."""
+    with open(path, 'rb') as f:
+        if f.read(len(MAGIC)) == MAGIC:
+            f.seek(0)
+            header = _read_v2_header(f)
+            return {"format": 2, "metadata": _with_flags(header.get("metadata") or {}),
+                    "parameters": header.get("parameters") or [], "source_hash": header.get("source_hash")}
+    with open(path, 'r', encoding='utf-8') as f:
+        package = json.load(f)
+    return {"format": 1, "metadata": _with_flags(package.get("metadata") or {}),
+            "parameters": package.get("parameters") or [], "source_hash": package.get("source_hash")}
+
+def read_assembly(path: str) -> bytes:
+    """
+    The compiled assembly. v2 payloads are sliced from a memory map (the one copy is the bytes
+    object gRPC needs); v1 packages are parsed and base64-decoded.
+    """
+    with open(path, 'rb') as f:
+        if f.read(len(MAGIC)) == MAGIC:
+            f.seek(0)
+            info = _read_v2_header(f)["assembly"]
+            offset, length = int(info["offset"]), int(info["length"])
+            if length == 0:
+                return b""
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if offset + length > len(mm):
+                    raise PtoolFormatError("Truncated .ptool package.")
+                return mm[offset:offset + length]
+    with open(path, 'r', encoding='utf-8') as f:
+        package = json.load(f)
+    return base64.b64decode(package.get("assembly", ""))
+
+def encode(metadata: Dict[str, Any], parameters: List[Dict[str, Any]], assembly: bytes, fmt: Optional[int] = None,
+           source_hash: Optional[str] = None) -> bytes:
+    fmt = fmt or WRITE_FORMAT
+    if fmt == 1:
+        package = {"metadata": metadata, "parameters": parameters,
+                   "assembly": base64.b64encode(assembly).decode('utf-8')}
+        if source_hash:
+            package["source_hash"] = source_hash
+        return json.dumps(package, indent=2).encode('utf-8')
+    if fmt != 2:
+        raise PtoolFormatError(f"Unsupported .ptool format: {fmt}")
+
+    def header_bytes(offset: int) -> bytes:
+        return json.dumps({
+            "format": 2,
+            "metadata": metadata,
+            "parameters": parameters,
+            "source_hash": source_hash,
+            "assembly": {"offset": offset, "length": len(assembly), "sha256": hashlib.sha256(assembly).hexdigest()},
+        }).encode('utf-8')
+
+    # The offset is part of the header, so size the header with a placeholder wide enough for any offset
+    size = _PREFIX_SIZE + len(header_bytes(10 ** 12))
+    offset = (size + 7) // 8 * 8
+    header = header_bytes(offset).ljust(offset - _PREFIX_SIZE, b" ")
+    return MAGIC + _LENGTH.pack(len(header)) + header + assembly
+
+def write_ptool(path: str, metadata: Dict[str, Any], parameters: List[Dict[str, Any]], assembly: bytes,
+                fmt: Optional[int] = None, source_hash: Optional[str] = None):
+    """Writes a package atomically (a reader never sees a half-written file)."""
+    data = encode(metadata, parameters, assembly, fmt, source_hash)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+def upgrade_file(path: str, dry_run: bool = False) -> bool:
+    """Rewrites a v1 package as v2. Returns False if it already was v2."""
+    if package_format(path) == 2:
+        return False
+    with open(path, 'r', encoding='utf-8') as f:
+        package = json.load(f)
+    assembly = base64.b64decode(package.get("assembly", ""))
+    if not dry_run:
+        write_ptool(path, package.get("metadata") or {}, package.get("parameters") or [], assembly, fmt=2,
+                    source_hash=package.get("source_hash"))
+    return True
+
+def upgrade_library(root: str, dry_run: bool = False) -> Dict[str, List[str]]:
+    """Upgrades every .ptool under root. Returns {"upgraded", "current", "failed"} paths."""
+    report: Dict[str, List[str]] = {"upgraded": [], "current": [], "failed": []}
+    for dirpath, dirs, files in os.walk(root):
+        dirs[:] = [d for d in dirs if d not in ('.git', 'node_modules')]
+        for name in files:
+            if not name.endswith('.ptool'):
+                continue
+            path = os.path.join(dirpath, name)
+            try:
+                report["upgraded" if upgrade_file(path, dry_run) else "current"].append(path)
+            except Exception as e:
+                logger.error(f"Could not upgrade {path}: {e}")
+                report["failed"].append(path)
+    return report
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m services.ptool_package", description="Manage .ptool packages.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    upgrade = commands.add_parser("upgrade", help="Rewrite v1 .ptool files under the given folders as v2.")
+    upgrade.add_argument("folders", nargs="+")
+    upgrade.add_argument("--dry-run", action="store_true", help="Only report what would be upgraded.")
+    args = parser.parse_args(argv)
+
+    failed = 0
+    for folder in args.folders:
+        report = upgrade_library(folder, args.dry_run)
+        for path in report["upgraded"]:
+            print(f"{'would upgrade' if args.dry_run else 'upgraded'}: {path}")
+        for path in report["failed"]:
+            print(f"failed: {path}")
+        print(f"{folder}: {len(report['upgraded'])} upgraded, {len(report['current'])} already v2, "
+              f"{len(report['failed'])} failed")
+        failed += len(report["failed"])
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
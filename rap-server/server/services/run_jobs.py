@@ -0,0 +1,201 @@
+import asyncio
+import logging
+import time
+import uuid
+from collections import OrderedDict, deque
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Set
+
+from services.execution_dispatcher import DEFAULT_LANE, LANES, execution_dispatcher
+
+logger = logging.getLogger(__name__)
+
+# Finished jobs kept for lookup and reconnects, and events kept per job for replay.
+MAX_FINISHED_JOBS = 200
+MAX_JOB_EVENTS = 5000
+# Wait/run times of this many recent jobs feed the queue statistics.
+STATS_WINDOW = 100
+
+FINISHED_STATES = ("succeeded", "failed", "cancelled")
+
+def _iso(timestamp: Optional[float]) -> Optional[str]:
+    return datetime.fromtimestamp(timestamp, timezone.utc).isoformat() if timestamp else None
+
+class RunJob:
+    """
+    One queued script run. Moves from "queued" to "running" to "succeeded", "failed" or "cancelled".
+    Every event it emits is numbered and kept (up to MAX_JOB_EVENTS), so a client can reconnect and replay.
+    """
+    def __init__(self, script_path: str, user_id: Optional[int], run: Callable[["RunJob"], Awaitable[Dict[str, Any]]],
+                 lane: str = DEFAULT_LANE):
+        self.id = uuid.uuid4().hex
+        self.script_path = script_path
+        self.user_id = user_id
+        self.lane = lane
+        self.state = "queued"
+        self.result: Optional[Dict[str, Any]] = None
+        self.error: Optional[str] = None
+        self.progress = {"outputLines": 0, "structuredOutputs": 0}
+        self.submitted_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self._run = run
+        self._events: Deque[Dict[str, Any]] = deque(maxlen=MAX_JOB_EVENTS)
+        self._next_seq = 0
+        self._subscribers: Set[asyncio.Queue] = set()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def finished(self) -> bool:
+        return self.state in FINISHED_STATES
+
+    def emit(self, event: Dict[str, Any]):
+        """Records an event ({"type": ...}) and pushes it to live subscribers."""
+        event = {**event, "seq": self._next_seq, "jobId": self.id}
+        self._next_seq += 1
+        if event["type"] == "output":
+            self.progress["outputLines"] += 1
+        elif event["type"] == "structured_output":
+            self.progress["structuredOutputs"] += 1
+        self._events.append(event)
+        for queue in list(self._subscribers):
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                # A stalled client misses live events; it can reconnect and replay from its last seq
+                pass
+
+    def subscribe(self, since: int = 0) -> asyncio.Queue:
+        """A queue pre-filled with the kept events from seq `since` on, then fed live ones."""
+        queue = asyncio.Queue(maxsize=MAX_JOB_EVENTS)
+        for event in self._events:
+            if event["seq"] >= since:
+                queue.put_nowait(event)
+        self._subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue):
+        self._subscribers.discard(queue)
+
+    def _set_state(self, state: str):
+        self.state = state
+        self.emit({"type": "state", "state": state})
+
+    def snapshot(self, position: Optional[int] = None) -> Dict[str, Any]:
+        now = time.time()
+        return {
+            "jobId": self.id,
+            "scriptPath": self.script_path,
+            "state": self.state,
+            "lane": self.lane,
+            "position": position,
+            "progress": {**self.progress, "events": self._next_seq},
+            "submittedAt": _iso(self.submitted_at),
+            "startedAt": _iso(self.started_at),
+            "finishedAt": _iso(self.finished_at),
+            "waitSeconds": round((self.started_at or now) - self.submitted_at, 3),
+            "runSeconds": round((self.finished_at or now) - self.started_at, 3) if self.started_at else None,
+            "result": self.result,
+            "error": self.error,
+        }
+
+class RunJobQueue:
+    """
+    Submitted script jobs. Each job waits for the engine at the execution dispatcher, in its lane,
+    so jobs are admitted one at a time with the same priority and per-user fairness as direct runs.
+    Submitting returns at once; callers poll the job or subscribe to its events.
+    """
+    def __init__(self):
+        self._jobs: "OrderedDict[str, RunJob]" = OrderedDict()
+        self._recent_waits: Deque[float] = deque(maxlen=STATS_WINDOW)
+        self._recent_runs: Deque[float] = deque(maxlen=STATS_WINDOW)
+        self.completed = 0
+
+    def submit(self, script_path: str, user_id: Optional[int], run: Callable[[RunJob], Awaitable[Dict[str, Any]]],
+               lane: str = DEFAULT_LANE) -> RunJob:
+        """Queues run(job), which executes the script, emits its events and returns the final result."""
+        if lane not in LANES:
+            raise ValueError(f"Unknown execution lane: {lane}. Expected one of {', '.join(LANES)}.")
+        job = RunJob(script_path, user_id, run, lane)
+        self._jobs[job.id] = job
+        job.emit({"type": "state", "state": "queued"})
+        job._task = asyncio.get_running_loop().create_task(self._execute(job))
+        return job
+
+    def get(self, job_id: str) -> Optional[RunJob]:
+        return self._jobs.get(job_id)
+
+    def position(self, job: RunJob) -> Optional[int]:
+        """0 while running, 1.. among queued jobs in submission order, None once finished."""
+        if job.state == "running":
+            return 0
+        if job.state != "queued":
+            return None
+        return [j for j in self._jobs.values() if j.state == "queued"].index(job) + 1
+
+    def jobs(self, user_id: Optional[int] = None) -> List[RunJob]:
+        return [j for j in self._jobs.values() if user_id is None or j.user_id == user_id]
+
+    def cancel(self, job: RunJob) -> bool:
+        """Cancels a queued job, or stops relaying a running one. Returns False if it had already finished."""
+        if job.finished:
+            return False
+        # For a running job this stops waiting on the engine;
+        # a script already executing in Revit runs to completion there
+        job._task.cancel()
+        return True
+
+    async def _execute(self, job: RunJob):
+        try:
+            async with execution_dispatcher.slot(job.lane, job.user_id):
+                job.started_at = time.time()
+                self._recent_waits.append(job.started_at - job.submitted_at)
+                job._set_state("running")
+                result = await job._run(job)
+            self._finish(job, "succeeded" if result.get("is_success") else "failed", result=result,
+                         error=result.get("error_message") or None)
+        except asyncio.CancelledError:
+            self._finish(job, "cancelled",
+                         error="Cancelled while running." if job.started_at else "Cancelled before it started.")
+        except Exception as e:
+            logger.error(f"Run job {job.id} failed: {e}")
+            self._finish(job, "failed", error=str(e))
+
+    def _finish(self, job: RunJob, state: str, result: Optional[Dict[str, Any]] = None, error: Optional[str] = None):
+        job.finished_at = time.time()
+        job.result = result
+        job.error = error
+        if job.started_at:
+            self._recent_runs.append(job.finished_at - job.started_at)
+        self.completed += 1
+        job._set_state(state)
+        job.emit({"type": "done", "job": job.snapshot()})
+        self._evict()
+
+    def _evict(self):
+        finished = [j for j in self._jobs.values() if j.finished]
+        for job in finished[:max(0, len(finished) - MAX_FINISHED_JOBS)]:
+            del self._jobs[job.id]
+
+    def stats(self) -> Dict[str, Any]:
+        now = time.time()
+        waits, runs = list(self._recent_waits), list(self._recent_runs)
+        queued = [j for j in self._jobs.values() if j.state == "queued"]
+        return {
+            "queued": len(queued),
+            "running": sum(1 for j in self._jobs.values() if j.state == "running"),
+            "completed": self.completed,
+            "oldestQueuedSeconds": round(now - queued[0].submitted_at, 3) if queued else 0,
+            "avgWaitSeconds": round(sum(waits) / len(waits), 3) if waits else 0,
+            "maxWaitSeconds": round(max(waits), 3) if waits else 0,
+            "avgRunSeconds": round(sum(runs) / len(runs), 3) if runs else 0,
+        }
+
+    async def stop(self):
+        tasks = [j._task for j in self._jobs.values() if j._task is not None and not j._task.done()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+# Global instance
+run_jobs = RunJobQueue()
@@ -0,0 +1,537 @@
+import asyncio
+import base64
+import functools
+import hashlib
+import json
+import logging
+import os
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+import grpc
+from database_config import SessionLocal
+from grpc_client import (
+    OFFLINE_SOURCE,
+    get_script_metadata_async,
+    get_script_metadata_batch_async,
+    get_script_parameters_async,
+    is_offline_result,
+    script_files_hash,
+)
+from services import ptool_package
+from services.script_search import script_search
+
+import models
+
+logger = logging.getLogger(__name__)
+
+# Threads used to stat and read script files during a scan, and how many metadata
+# requests a scan may have in flight against the engine at once.
+SCAN_WORKERS = int(os.environ.get("PARACORE_SCAN_WORKERS", "8"))
+METADATA_CONCURRENCY = int(os.environ.get("PARACORE_METADATA_CONCURRENCY", "4"))
+# Units extracted per step when streaming a listing, so the first items go out before the whole folder is parsed.
+STREAM_CHUNK_SIZE = int(os.environ.get("PARACORE_STREAM_CHUNK_SIZE", "32"))
+
+_pool: Optional[ThreadPoolExecutor] = None
+
+def _scan_pool() -> ThreadPoolExecutor:
+    global _pool
+    if _pool is None:
+        _pool = ThreadPoolExecutor(max_workers=SCAN_WORKERS, thread_name_prefix="script-scan")
+    return _pool
+
+def read_script_file(path: str) -> Optional[str]:
+    """Reads a .cs file, tolerating a UTF-8 BOM. Returns None if the file can't be decoded."""
+    try:
+        with open(path, 'r', encoding='utf-8-sig') as f:
+            return f.read()
+    except UnicodeDecodeError:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return f.read()
+        except Exception:
+            return None
+
+class ScriptUnit:
+    """One listable script found in a source folder, with its stat signature."""
+    def __init__(self, path: str, type: str, cs_files: List[str], size: int, mtime: float, ctime: float):
+        self.path = path
+        self.type = type
+        self.cs_files = cs_files
+        self.size = size
+        self.mtime = mtime
+        self.ctime = ctime
+        self.script_files: Optional[List[Dict[str, str]]] = None
+        self.content_hash: Optional[str] = None
+
+    def load(self) -> bool:
+        """Reads the unit's sources and computes its content hash. Returns False if nothing is readable."""
+        if self.type == "ptool":
+            with open(self.path, 'rb') as f:
+                self.content_hash = hashlib.sha256(f.read()).hexdigest()
+            return True
+
+        script_files = []
+        for fp in self.cs_files:
+            content = read_script_file(fp)
+            if content is None:
+                continue
+            script_files.append({"file_name": os.path.basename(fp), "content": content})
+        if not script_files:
+            return False
+        self.script_files = script_files
+        self.content_hash = script_files_hash(script_files)
+        return True
+
+def _norm(path: str) -> str:
+    return os.path.normpath(path).replace('\\', '/')
+
+def folder_key(folder_path: str) -> str:
+    """The key a source folder is indexed under: the same for trailing slashes, backslashes and (on Windows) case."""
+    return _norm(os.path.normcase(folder_path))
+
+def _scan_multi_file_folder(folder_path: str) -> Optional[ScriptUnit]:
+    """Stats a subfolder's .cs files in one scandir pass. Returns None if it holds no scripts."""
+    cs_files, total_size = [], 0
+    folder_stat = os.stat(folder_path)
+    latest_mtime = folder_stat.st_mtime
+    with os.scandir(folder_path) as it:
+        for entry in it:
+            if entry.name.lower().endswith(".cs") and entry.is_file():
+                entry_stat = entry.stat()
+                cs_files.append(entry.path)
+                total_size += entry_stat.st_size
+                # Robust date_modified for folders: latest mtime of the folder or any .cs file
+                latest_mtime = max(latest_mtime, entry_stat.st_mtime)
+    if not cs_files:
+        return None
+    cs_files.sort()
+    return ScriptUnit(_norm(folder_path), "multi-file", cs_files, total_size, latest_mtime, folder_stat.st_ctime)
+
+async def discover_units(folder_path: str) -> List[ScriptUnit]:
+    """
+    Stats every script unit in a source folder without reading file contents, using a single
+    os.scandir pass over the folder and one per subfolder (run concurrently on the scan pool).
+    Order is stable: single files, multi-file folders, then .ptool files, each sorted by name.
+    """
+    loop = asyncio.get_running_loop()
+    pool = _scan_pool()
+
+    def scan_top_level():
+        singles, subfolders, ptools = [], [], []
+        with os.scandir(folder_path) as it:
+            for entry in it:
+                try:
+                    name = entry.name.lower()
+                    if entry.is_dir():
+                        subfolders.append(entry.path)
+                    elif name.endswith(".cs"):
+                        st = entry.stat()
+                        singles.append(ScriptUnit(_norm(entry.path), "single-file", [entry.path],
+                                                  st.st_size, st.st_mtime, st.st_ctime))
+                    elif name.endswith(".ptool"):
+                        st = entry.stat()
+                        ptools.append(ScriptUnit(_norm(entry.path), "ptool", [], st.st_size, st.st_mtime, st.st_ctime))
+                except OSError:
+                    traceback.print_exc()
+        return singles, subfolders, ptools
+
+    singles, subfolders, ptools = await loop.run_in_executor(pool, scan_top_level)
+
+    def scan_subfolder(path):
+        try:
+            return _scan_multi_file_folder(path)
+        except OSError:
+            traceback.print_exc()
+            return None
+
+    multi = await asyncio.gather(*(loop.run_in_executor(pool, scan_subfolder, p) for p in subfolders))
+
+    def by_name(u):
+        return u.path.lower()
+    return sorted(singles, key=by_name) + sorted((u for u in multi if u), key=by_name) + sorted(ptools, key=by_name)
+
+async def extract_units(units: List[ScriptUnit], include_parameters: bool = True) -> Dict[str, Dict[str, Any]]:
+    """
+    Extracts metadata (and parameters) for loaded .cs units in one batched RPC.
+    Falls back to per-unit calls if the add-in predates GetScriptMetadataBatch.
+    Returns {path: {"metadata", "parameters", "error_message"}}.
+    """
+    if not units:
+        return {}
+    batch_units = [{"id": u.path, "script_files": u.script_files} for u in units]
+    try:
+        return await get_script_metadata_batch_async(batch_units, include_parameters=include_parameters,
+                                                     max_concurrency=METADATA_CONCURRENCY)
+    except grpc.RpcError as e:
+        if e.code() != grpc.StatusCode.UNIMPLEMENTED:
+            return {u.path: {"metadata": {}, "parameters": [], "error_message": e.details()} for u in units}
+
+    results = {}
+    semaphore = asyncio.Semaphore(METADATA_CONCURRENCY)
+
+    async def extract_one(u):
+        async with semaphore:
+            try:
+                responses = [await get_script_metadata_async(u.script_files)]
+                if include_parameters:
+                    responses.append(await get_script_parameters_async(u.script_files))
+                result = {
+                    "metadata": responses[0].get("metadata", {}),
+                    "parameters": responses[-1].get("parameters", []) if include_parameters else [],
+                    "error_message": "",
+                }
+                if any(is_offline_result(r) for r in responses):
+                    result["source"] = OFFLINE_SOURCE
+                results[u.path] = result
+            except grpc.RpcError as e:
+                results[u.path] = {"metadata": {}, "parameters": [], "error_message": e.details()}
+
+    await asyncio.gather(*(extract_one(u) for u in units))
+    return results
+
+def _read_ptool(path: str) -> Dict[str, Any]:
+    package = ptool_package.read_header(path)
+    return {"metadata": package["metadata"], "parameters": package["parameters"], "error_message": ""}
+
+def entry_to_listing(entry: models.ScriptIndexEntry) -> Dict[str, Any]:
+    """Shapes an index row like the /api/scripts response items."""
+    metadata = json.loads(entry.metadata_json) if entry.metadata_json else {}
+    item = {
+        "id": entry.path,
+        "name": os.path.basename(entry.path),
+        "type": "multi-file" if entry.type == "multi-file" else "single-file", # .ptool is treated as a single unit
+        "absolutePath": entry.path,
+        "sourcePath": entry.path,
+        "metadata": {
+            **metadata,
+            "dateCreated": datetime.fromtimestamp(entry.ctime).isoformat(),
+            "dateModified": datetime.fromtimestamp(entry.mtime).isoformat()
+        }
+    }
+    if entry.type == "ptool":
+        # IMPORTANT: Include baked parameters
+        item["parameters"] = json.loads(entry.parameters_json) if entry.parameters_json else []
+    return item
+
+def _unit_entry(folder_key: str, unit: ScriptUnit, result: Dict[str, Any],
+                entry: Optional[models.ScriptIndexEntry] = None) -> models.ScriptIndexEntry:
+    """Fills entry (a new, unsaved row if None) with a scanned unit and its extraction result."""
+    if entry is None:
+        entry = models.ScriptIndexEntry(path=unit.path)
+    entry.folder = folder_key
+    entry.type = unit.type
+    entry.size, entry.mtime, entry.ctime = unit.size, unit.mtime, unit.ctime
+    entry.content_hash = unit.content_hash
+    entry.metadata_json = json.dumps(result.get("metadata", {}))
+    entry.parameters_json = json.dumps(result.get("parameters", []))
+    return entry
+
+def _error_listing(unit: ScriptUnit, error_message: str) -> Dict[str, Any]:
+    fallback_name = os.path.basename(unit.path)
+    if unit.type == "single-file":
+        fallback_name = os.path.splitext(fallback_name)[0]
+    return {
+        "id": unit.path,
+        "name": os.path.basename(unit.path),
+        "type": "multi-file" if unit.type == "multi-file" else "single-file",
+        "absolutePath": unit.path,
+        "sourcePath": unit.path,
+        "metadata": {
+            "displayName": fallback_name,
+            "description": f"Error: {error_message}",
+            "dateCreated": datetime.fromtimestamp(unit.ctime).isoformat(),
+            "dateModified": datetime.fromtimestamp(unit.mtime).isoformat()
+        }
+    }
+
+# --- Listing filters, sort and cursor pagination (same semantics as the gallery's client-side controls) ---
+
+SCRIPT_TYPE_FILTERS = ("all", "tool", "single-file", "multi-file")
+SORT_FIELDS = ("name", "author", "lastRun", "created", "modified")
+_SORT_METADATA_KEYS = {"lastRun": "last_run", "created": "dateCreated", "modified": "dateModified"}
+
+def listing_matches(item: Dict[str, Any], categories: Optional[List[str]] = None,
+                    script_type: Optional[str] = None) -> bool:
+    """True if the item carries every category in categories and matches the type filter ("tool" = .ptool)."""
+    metadata = item.get("metadata") or {}
+    if categories:
+        item_categories = metadata.get("categories") or []
+        if not all(c in item_categories for c in categories):
+            return False
+    if script_type and script_type != "all":
+        is_tool = metadata.get("is_protected") is True
+        if script_type == "tool":
+            return is_tool
+        return item.get("type") == script_type and not is_tool
+    return True
+
+def parse_sort(sort: Optional[str]) -> Tuple[str, bool]:
+    """Parses "<field>-<asc|desc>" (e.g. "modified-desc") into (field, descending). Raises ValueError."""
+    field, _, order = (sort or "name-asc").partition("-")
+    if field not in SORT_FIELDS or order not in ("asc", "desc"):
+        raise ValueError(f"Invalid sort '{sort}'. Use <{'|'.join(SORT_FIELDS)}>-<asc|desc>.")
+    return field, order == "desc"
+
+def _sort_key(item: Dict[str, Any], field: str) -> Tuple[bool, str, str]:
+    """(missing, value, id): missing values sort last in either direction, ids break ties."""
+    metadata = item.get("metadata") or {}
+    if field == "name":
+        value = (item.get("name") or "").lower()
+    elif field == "author":
+        value = (metadata.get("author") or "").lower()
+    else:
+        value = metadata.get(_SORT_METADATA_KEYS[field]) or ""  # ISO timestamps compare as strings
+    return (value == "", value, item.get("id") or "")
+
+def _compare_keys(a: Tuple[bool, str, str], b: Tuple[bool, str, str], descending: bool) -> int:
+    if a[0] != b[0]:
+        return 1 if a[0] else -1
+    if a[1] != b[1]:
+        return (1 if a[1] > b[1] else -1) * (-1 if descending else 1)
+    return (a[2] > b[2]) - (a[2] < b[2])
+
+def sort_listing(items: List[Dict[str, Any]], sort: Optional[str] = None) -> List[Dict[str, Any]]:
+    field, descending = parse_sort(sort)
+    keyed = [(_sort_key(item, field), item) for item in items]
+    keyed.sort(key=functools.cmp_to_key(lambda a, b: _compare_keys(a[0], b[0], descending)))
+    return [item for _, item in keyed]
+
+def _encode_cursor(sort: str, key: Tuple[bool, str, str]) -> str:
+    raw = json.dumps([sort, key[0], key[1], key[2]], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+def _decode_cursor(cursor: str, sort: str) -> Tuple[bool, str, str]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        cursor_sort, missing, value, item_id = json.loads(raw)
+    except Exception:
+        raise ValueError("Invalid cursor.") from None
+    if cursor_sort != sort:
+        raise ValueError("Cursor was issued for a different sort order.")
+    return (bool(missing), str(value), str(item_id))
+
+def paginate_listing(items: List[Dict[str, Any]], sort: Optional[str] = None, limit: int = 100,
+                     cursor: Optional[str] = None) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    Sorts items and returns (page, next_cursor). The cursor encodes the sort key of the last item returned,
+    so pages stay consistent when scripts are added or removed between requests. Raises ValueError.
+    """
+    sort = sort or "name-asc"
+    field, descending = parse_sort(sort)
+    ordered = sort_listing(items, sort)
+    start = 0
+    if cursor:
+        after = _decode_cursor(cursor, sort)
+        start = next((i for i, item in enumerate(ordered)
+                      if _compare_keys(_sort_key(item, field), after, descending) > 0),
+                     len(ordered))
+    page = ordered[start:start + limit]
+    next_cursor = _encode_cursor(sort, _sort_key(page[-1], field)) if page and start + limit < len(ordered) else None
+    return page, next_cursor
+
+def _load_unit(unit: ScriptUnit) -> bool:
+    try:
+        return unit.load()
+    except Exception:
+        traceback.print_exc()
+        return False
+
+class ScriptIndex:
+    """
+    Persistent index of script units per source folder, stored in the local SQLite DB.
+    A rescan only reads units whose size/mtime changed and only re-extracts those whose content hash changed.
+    """
+    def __init__(self):
+        self.last_scan_stats: Dict[str, Dict[str, int]] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+        # Version tokens from the last scan: folder -> listing version, unit path -> content hash.
+        # Dropped by invalidate() as soon as the watcher reports a change, so a token that is present is current.
+        self._versions: Dict[str, str] = {}
+        self._content_hashes: Dict[str, str] = {}
+        self._invalidations = 0
+
+    def _lock(self, folder_key: str) -> asyncio.Lock:
+        # A listing request and a watcher-triggered rescan of the same folder must not race on inserts
+        return self._locks.setdefault(folder_key, asyncio.Lock())
+
+    def _listing(self, folder_key: str, entry: models.ScriptIndexEntry) -> Dict[str, Any]:
+        """Listing item for an index row; also keeps the folder's search index in step with the row."""
+        item = entry_to_listing(entry)
+        script_search.update(folder_key, entry.path, (entry.content_hash, entry.mtime), item, entry.parameters_json)
+        return item
+
+    def version(self, folder_path: str) -> Optional[str]:
+        """Version token of the folder's listing as of the last scan, or None if it may be stale."""
+        return self._versions.get(folder_key(folder_path))
+
+    def content_hash(self, path: str) -> Optional[str]:
+        """Content hash of an indexed script unit as of the last scan, or None if unknown or possibly stale."""
+        return self._content_hashes.get(path)
+
+    def invalidate(self, path: str):
+        """Forgets the version tokens a change to path (a script file or directory) may affect."""
+        key = folder_key(path)
+        path = _norm(path)
+        self._invalidations += 1
+        for folder in [f for f in self._versions if key == f or key.startswith(f + '/') or f.startswith(key + '/')]:
+            del self._versions[folder]
+        self._content_hashes.pop(path, None)
+        # A .cs file inside a multi-file script changes the folder unit
+        self._content_hashes.pop(os.path.dirname(path), None)
+        if not path.lower().endswith((".cs", ".ptool")):
+            for unit_path in [p for p in self._content_hashes if p.startswith(path + '/')]:
+                del self._content_hashes[unit_path]
+
+    async def rescan(self, folder_path: str) -> List[Dict[str, Any]]:
+        """Brings the index for folder_path up to date and returns its /api/scripts listing."""
+        key = folder_key(folder_path)
+        async with self._lock(key):
+            items = [(position, item) async for position, item in self._scan(folder_path, key, chunk_size=None)]
+        return [item for _, item in sorted(items, key=lambda pair: pair[0])]
+
+    async def stream(self, folder_path: str, chunk_size: int = STREAM_CHUNK_SIZE) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yields listing items as soon as each is ready: indexed, unchanged units first, then new or edited
+        ones as each chunk of chunk_size is extracted and stored. The index ends up as after a rescan.
+        """
+        key = folder_key(folder_path)
+        async with self._lock(key):
+            async for _, item in self._scan(folder_path, key, chunk_size):
+                yield item
+
+    async def _scan(self, folder_path: str, folder_key: str,
+                    chunk_size: Optional[int]) -> AsyncIterator[Tuple[int, Dict[str, Any]]]:
+        """
+        Updates the index and yields (discovery position, listing item);
+        chunk_size=None extracts everything in one go.
+        """
+        invalidations = self._invalidations
+        units = await discover_units(folder_path)
+        stats = {"units": len(units), "unchanged": 0, "touched": 0, "extracted": 0, "removed": 0, "failed": 0,
+                 "offline": 0}
+
+        db = SessionLocal()
+        try:
+            rows = db.query(models.ScriptIndexEntry).filter(models.ScriptIndexEntry.folder == folder_key).all()
+            existing = {e.path: e for e in rows}
+
+            changed: List[Tuple[int, ScriptUnit]] = []
+            for position, unit in enumerate(units):
+                entry = existing.get(unit.path)
+                if (entry is not None and entry.type == unit.type
+                        and entry.size == unit.size and entry.mtime == unit.mtime):
+                    stats["unchanged"] += 1
+                    yield position, self._listing(folder_key, entry)
+                else:
+                    changed.append((position, unit))
+
+            step = chunk_size or len(changed) or 1
+            for start in range(0, len(changed), step):
+                chunk = changed[start:start + step]
+                items = await self._index_units(db, folder_key, [unit for _, unit in chunk], existing, stats)
+                for position, unit in chunk:
+                    if unit.path in items:
+                        yield position, items[unit.path]
+
+            present = {u.path for u in units}
+            for path, entry in list(existing.items()):
+                if path not in present:
+                    db.delete(entry)
+                    del existing[path]
+                    self._content_hashes.pop(path, None)
+                    stats["removed"] += 1
+            db.commit()
+            script_search.prune(folder_key, present)
+            # A change reported while scanning may not be reflected, and offline results are only stand-ins;
+            # either way leave the tokens unset so the next request rescans
+            if invalidations == self._invalidations and not stats["offline"]:
+                self._record_versions(folder_key, units, existing)
+        finally:
+            db.close()
+
+        self.last_scan_stats[folder_key] = stats
+        if stats["extracted"] or stats["removed"] or stats["offline"]:
+            logger.info(f"Script index updated for {folder_key}: {stats}")
+
+    def _record_versions(self, folder_key: str, units: List[ScriptUnit], existing: Dict[str, models.ScriptIndexEntry]):
+        """Derives the listing version and per-unit content hashes from the scanned units and their index rows."""
+        digest = hashlib.sha256()
+        for unit in units:
+            entry = existing.get(unit.path)
+            # Units whose row doesn't match the scan were listed as errors (or from an older row)
+            current = entry is not None and entry.mtime == unit.mtime and entry.type == unit.type
+            content_hash = entry.content_hash if current else None
+            digest.update(f"{unit.path}\0{unit.type}\0{unit.mtime}\0{unit.ctime}\0{content_hash}\n".encode('utf-8'))
+            if content_hash:
+                self._content_hashes[unit.path] = content_hash
+            else:
+                self._content_hashes.pop(unit.path, None)
+        self._versions[folder_key] = digest.hexdigest()[:32]
+
+    async def _index_units(self, db, folder_key: str, units: List[ScriptUnit],
+                           existing: Dict[str, models.ScriptIndexEntry],
+                           stats: Dict[str, int]) -> Dict[str, Dict[str, Any]]:
+        """Reads, extracts and stores new or changed units, commits, and returns their listing items by path."""
+        # Read and hash the units concurrently on the scan pool
+        loop = asyncio.get_running_loop()
+        loaded = await asyncio.gather(*(loop.run_in_executor(_scan_pool(), _load_unit, u) for u in units))
+
+        items: Dict[str, Dict[str, Any]] = {}
+        to_extract: List[ScriptUnit] = []
+        ptools: List[ScriptUnit] = []
+        for unit, ok in zip(units, loaded, strict=True):
+            entry = existing.get(unit.path)
+            if not ok:
+                # Unreadable right now (e.g. mid-save): keep listing what the index already has
+                if entry is not None:
+                    items[unit.path] = self._listing(folder_key, entry)
+                continue
+            if entry is not None and entry.type == unit.type and entry.content_hash == unit.content_hash:
+                # Touched but not edited (e.g. git checkout): refresh the stat signature only
+                entry.size, entry.mtime, entry.ctime = unit.size, unit.mtime, unit.ctime
+                stats["touched"] += 1
+                items[unit.path] = self._listing(folder_key, entry)
+                continue
+            (ptools if unit.type == "ptool" else to_extract).append(unit)
+
+        results = await extract_units(to_extract)
+        for unit in ptools:
+            try:
+                results[unit.path] = _read_ptool(unit.path)
+            except Exception as e:
+                traceback.print_exc()
+                results[unit.path] = {"metadata": {}, "parameters": [], "error_message": str(e)}
+
+        for unit in to_extract + ptools:
+            result = results.get(unit.path)
+            if result is None or result.get("error_message"):
+                # Not persisted, so the next rescan retries the extraction
+                items[unit.path] = _error_listing(unit, (result or {}).get("error_message") or "No metadata returned.")
+                stats["failed"] += 1
+                continue
+            if is_offline_result(result):
+                # Extracted locally while the engine was down: listed, but left to the engine on the next scan
+                items[unit.path] = entry_to_listing(_unit_entry(folder_key, unit, result))
+                stats["offline"] += 1
+                continue
+            entry = existing.get(unit.path)
+            if entry is None:
+                # The row may have been indexed under another folder key (e.g. before the keys were normalized)
+                entry = db.query(models.ScriptIndexEntry).filter(models.ScriptIndexEntry.path == unit.path).first()
+                if entry is None:
+                    entry = models.ScriptIndexEntry(path=unit.path)
+                    db.add(entry)
+                existing[unit.path] = entry
+            _unit_entry(folder_key, unit, result, entry)
+            stats["extracted"] += 1
+            items[unit.path] = self._listing(folder_key, entry)
+
+        # Items are built before commit: committing expires the rows and would reload each one
+        db.commit()
+        return items
+
+# Global instance
+script_index = ScriptIndex()
@@ -0,0 +1,239 @@
+import heapq
+import json
+import logging
+import math
+import re
+import threading
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# BM25 parameters and per-field weights (a field's term counts are multiplied by its weight, BM25F-style)
+K1 = 1.2
+B = 0.75
+FIELD_WEIGHTS = {
+    "name": 3.0,
+    "categories": 2.0,
+    "parameters": 1.5,
+    "description": 1.0,
+    "usage_examples": 1.0,
+}
+# The last query term also matches longer terms starting with it (typeahead), up to this many expansions.
+MAX_PREFIX_EXPANSIONS = 64
+
+_WORD_RE = re.compile(r"[0-9A-Za-z]+")
+_CAMEL_RE = re.compile(r"[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|[0-9]+")
+
+def tokenize(text: str) -> List[str]:
+    """
+    Lowercased words; CamelCase and snake_case words also yield their parts
+    ("CreateWalls" -> createwalls, create, walls).
+    """
+    tokens = []
+    for word in _WORD_RE.findall(text or ""):
+        lower = word.lower()
+        tokens.append(lower)
+        parts = _CAMEL_RE.findall(word)
+        if len(parts) > 1:
+            tokens.extend(p.lower() for p in parts)
+    return tokens
+
+def script_fields(item: Dict[str, Any], parameters: Optional[List[Dict[str, Any]]] = None) -> Dict[str, str]:
+    """The searchable text of a /api/scripts listing item (plus its parameters), by field."""
+    metadata = item.get("metadata") or {}
+    name = item.get("name") or ""
+    display_name = metadata.get("displayName") or metadata.get("name") or ""
+    params = parameters if parameters is not None else (item.get("parameters") or [])
+    return {
+        "name": f"{name} {display_name}",
+        "categories": " ".join(metadata.get("categories") or []),
+        "parameters": " ".join(p.get("name") or "" for p in params),
+        "description": metadata.get("description") or "",
+        "usage_examples": " ".join(metadata.get("usage_examples") or []),
+    }
+
+class BM25Index:
+    """
+    In-memory inverted index with BM25 ranking. Documents are added, replaced and removed one at a time;
+    postings, document lengths and the average length are maintained incrementally.
+    """
+    def __init__(self):
+        self._postings: Dict[str, Dict[str, float]] = defaultdict(dict)  # term -> {doc_id: weighted tf}
+        self._doc_terms: Dict[str, Dict[str, float]] = {}
+        self._doc_lengths: Dict[str, float] = {}
+        self._signatures: Dict[str, Any] = {}
+        self._payloads: Dict[str, Any] = {}
+        self._total_length = 0.0
+        self._sorted_terms: Optional[List[str]] = None
+        # term -> (average length it was computed with, {doc_id: saturated tf}); see _impacts
+        self._impact_cache: Dict[str, Tuple[float, Dict[str, float]]] = {}
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._doc_lengths)
+
+    def __contains__(self, doc_id: str):
+        return doc_id in self._doc_lengths
+
+    def signature(self, doc_id: str) -> Any:
+        return self._signatures.get(doc_id)
+
+    def upsert(self, doc_id: str, fields: Dict[str, str], payload: Any = None, signature: Any = None):
+        """Indexes (or re-indexes) a document. fields maps a FIELD_WEIGHTS key to its text."""
+        terms: Dict[str, float] = defaultdict(float)
+        for field, text in fields.items():
+            weight = FIELD_WEIGHTS.get(field, 1.0)
+            for token in tokenize(text):
+                terms[token] += weight
+        with self._lock:
+            self._remove(doc_id)
+            for term, tf in terms.items():
+                if term not in self._postings:
+                    self._sorted_terms = None
+                self._postings[term][doc_id] = tf
+                self._impact_cache.pop(term, None)
+            length = sum(terms.values())
+            self._doc_terms[doc_id] = dict(terms)
+            self._doc_lengths[doc_id] = length
+            self._total_length += length
+            self._signatures[doc_id] = signature
+            self._payloads[doc_id] = payload
+
+    def remove(self, doc_id: str):
+        with self._lock:
+            self._remove(doc_id)
+
+    def _remove(self, doc_id: str):
+        terms = self._doc_terms.pop(doc_id, None)
+        if terms is None:
+            return
+        for term in terms:
+            self._impact_cache.pop(term, None)
+            postings = self._postings.get(term)
+            if postings is not None:
+                postings.pop(doc_id, None)
+                if not postings:
+                    del self._postings[term]
+                    self._sorted_terms = None
+        self._total_length -= self._doc_lengths.pop(doc_id, 0.0)
+        self._signatures.pop(doc_id, None)
+        self._payloads.pop(doc_id, None)
+
+    def doc_ids(self) -> List[str]:
+        with self._lock:
+            return list(self._doc_lengths)
+
+    def _impacts(self, term: str, postings: Dict[str, float], avg_length: float) -> Dict[str, float]:
+        """
+        The BM25 term-frequency component of each posting, cached per term. Entries are reused while the
+        average document length stays within 2% of the one they were computed with.
+        """
+        cached = self._impact_cache.get(term)
+        if cached is not None and abs(cached[0] - avg_length) <= 0.02 * avg_length:
+            return cached[1]
+        lengths = self._doc_lengths
+        base, scale = K1 * (1.0 - B), K1 * B / avg_length
+        impacts = {doc_id: tf * (K1 + 1.0) / (tf + base + scale * lengths[doc_id]) for doc_id, tf in postings.items()}
+        self._impact_cache[term] = (avg_length, impacts)
+        return impacts
+
+    def _expand_prefix(self, prefix: str) -> List[str]:
+        if self._sorted_terms is None:
+            self._sorted_terms = sorted(self._postings)
+        terms = self._sorted_terms
+        expansions = []
+        i = bisect_left(terms, prefix)
+        while i < len(terms) and terms[i].startswith(prefix) and len(expansions) < MAX_PREFIX_EXPANSIONS:
+            if terms[i] != prefix:
+                expansions.append(terms[i])
+            i += 1
+        return expansions
+
+    def search(self, query: str, limit: int = 20, prefix: bool = True) -> List[Tuple[str, float, Any]]:
+        """
+        Returns up to limit (doc_id, score, payload), best first.
+        With prefix, the last query word also matches as a prefix.
+        """
+        words = _WORD_RE.findall(query or "")
+        query_terms = tokenize(query)
+        if not query_terms:
+            return []
+        with self._lock:
+            n = len(self._doc_lengths)
+            if n == 0:
+                return []
+            avg_length = self._total_length / n or 1.0
+            # term -> weight in the query; prefix expansions count a little less than exact matches
+            weighted: Dict[str, float] = {}
+            for term in query_terms:
+                weighted[term] = max(weighted.get(term, 0.0), 1.0)
+            if prefix and words and query[-1:].isalnum():
+                for term in self._expand_prefix(words[-1].lower()):
+                    weighted.setdefault(term, 0.5)
+
+            scores: Dict[str, float] = {}
+            get = scores.get
+            for term, query_weight in weighted.items():
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                idf = math.log(1.0 + (n - len(postings) + 0.5) / (len(postings) + 0.5))
+                factor = query_weight * idf
+                for doc_id, impact in self._impacts(term, postings, avg_length).items():
+                    scores[doc_id] = get(doc_id, 0.0) + factor * impact
+
+            top = heapq.nlargest(limit, scores.items(), key=lambda kv: (kv[1], kv[0]))
+            return [(doc_id, score, self._payloads.get(doc_id)) for doc_id, score in top]
+
+class ScriptSearchIndex:
+    """One BM25 index per script source folder, kept in step with the script index as folders are scanned."""
+    def __init__(self):
+        self._indexes: Dict[str, BM25Index] = {}
+        self._lock = threading.Lock()
+
+    def folder(self, folder_key: str) -> BM25Index:
+        with self._lock:
+            index = self._indexes.get(folder_key)
+            if index is None:
+                index = self._indexes[folder_key] = BM25Index()
+            return index
+
+    def is_indexed(self, folder_key: str) -> bool:
+        return folder_key in self._indexes
+
+    def update(self, folder_key: str, path: str, signature: Any, item: Dict[str, Any],
+               parameters_json: Optional[str] = None):
+        """Indexes a listing item unless it is already indexed with the same signature (content hash, mtime)."""
+        index = self.folder(folder_key)
+        if path in index and index.signature(path) == signature:
+            return
+        parameters = None
+        if parameters_json:
+            try:
+                parameters = json.loads(parameters_json)
+            except ValueError:
+                parameters = None
+        index.upsert(path, script_fields(item, parameters), payload=item, signature=signature)
+
+    def prune(self, folder_key: str, present: Iterable[str]):
+        """Drops documents of scripts that are no longer in the folder."""
+        index = self.folder(folder_key)
+        present = set(present)
+        for doc_id in index.doc_ids():
+            if doc_id not in present:
+                index.remove(doc_id)
+
+    def search(self, folder_key: str, query: str, limit: int = 20) -> List[Dict[str, Any]]:
+        results = []
+        for _, score, item in self.folder(folder_key).search(query, limit):
+            results.append({**item, "score": round(score, 4)})
+        return results
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {folder: len(index) for folder, index in self._indexes.items()}
+
+# Global instance
+script_search = ScriptSearchIndex()
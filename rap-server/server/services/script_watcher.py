@@ -0,0 +1,291 @@
+import asyncio
+import json
+import logging
+import os
+import time
+from typing import Callable, Dict, List, Optional, Set
+
+from database_config import SessionLocal
+
+import models
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+    from watchdog.observers.polling import PollingObserver
+    WATCHDOG_AVAILABLE = True
+except ImportError:  # pragma: no cover - watchdog is in requirements, but keep the server usable without it
+    FileSystemEventHandler = object
+    WATCHDOG_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Quiet period after the last filesystem event before the batch is processed
+# (an editor save or a git pull produces a burst of events).
+DEBOUNCE_SECONDS = 0.75
+# How often the set of watched folders is re-read from the settings/workspaces tables.
+WATCH_SET_REFRESH_SECONDS = 60
+# Rescan cadence when no filesystem notifications are available at all.
+POLL_RESCAN_SECONDS = 30
+
+SCRIPT_EXTENSIONS = (".cs", ".ptool")
+IGNORED_DIRS = {".git", "bin", "obj", "node_modules", ".vs", ".vscode"}
+
+def _normalize(path: str) -> str:
+    return os.path.normpath(path).replace('\\', '/')
+
+def configured_script_folders() -> Set[str]:
+    """Custom script folders from user settings, registered workspaces and every folder already in the script index."""
+    folders = set()
+    db = SessionLocal()
+    try:
+        for w in db.query(models.Workspace).all():
+            if w.path and os.path.isdir(w.path):
+                folders.add(_normalize(w.path))
+
+        settings = db.query(models.UserSetting).filter(models.UserSetting.setting_key == "custom_script_folders").all()
+        for s in settings:
+            try:
+                for folder in json.loads(s.setting_value):
+                    if os.path.isdir(folder):
+                        folders.add(_normalize(folder))
+            except Exception:
+                continue
+
+    finally:
+        db.close()
+
+    for folder in indexed_folders():
+        if os.path.isdir(folder):
+            folders.add(_normalize(folder))
+
+    # Nested folders are covered by a recursive watch on their ancestor
+    return {f for f in folders if not any(f != other and f.startswith(other + '/') for other in folders)}
+
+def indexed_folders() -> List[str]:
+    """Source folders that have been listed through /api/scripts and therefore live in the script index."""
+    db = SessionLocal()
+    try:
+        return [f for (f,) in db.query(models.ScriptIndexEntry.folder).distinct().all() if f]
+    finally:
+        db.close()
+
+def _is_relevant(path: str, is_directory: bool) -> bool:
+    parts = _normalize(path).split('/')
+    if any(part in IGNORED_DIRS for part in parts):
+        return False
+    return is_directory or path.lower().endswith(SCRIPT_EXTENSIONS)
+
+class _EventHandler(FileSystemEventHandler):
+    """Forwards relevant watchdog events (raised on the observer thread) to the asyncio loop."""
+    def __init__(self, watcher: "ScriptLibraryWatcher", loop: asyncio.AbstractEventLoop):
+        self._watcher = watcher
+        self._loop = loop
+
+    def on_any_event(self, event):
+        if event.event_type in ("opened", "closed", "closed_no_write"):
+            return
+        # A directory "modified" event just echoes a change to one of its entries (e.g. manifest.json being written)
+        if event.is_directory and event.event_type == "modified":
+            return
+        paths = [event.src_path, getattr(event, "dest_path", "")]
+        for path in paths:
+            if path and _is_relevant(path, event.is_directory):
+                self._loop.call_soon_threadsafe(self._watcher.notify_changed, path)
+
+class ScriptLibraryWatcher:
+    """
+    Watches script folders and keeps the script index and caches current.
+    Filesystem events are debounced, affected index folders are rescanned in the background,
+    and subscribers (WebSocket clients) receive a "library_changed" event per batch.
+    """
+    def __init__(self):
+        self._observer = None
+        self._watches: Dict[str, object] = {}
+        self._pending: Set[str] = set()
+        self._debounce_handle: Optional[asyncio.TimerHandle] = None
+        self._subscribers: Set[asyncio.Queue] = set()
+        self._listeners: List[Callable[[List[str]], None]] = []
+        self._tasks: List[asyncio.Task] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.mode = "stopped"
+        self.last_change_at: Optional[float] = None
+
+    # --- Subscribers ---
+
+    def subscribe(self) -> asyncio.Queue:
+        queue = asyncio.Queue(maxsize=100)
+        self._subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue):
+        self._subscribers.discard(queue)
+
+    def add_listener(self, callback: Callable[[List[str]], None]):
+        """Registers a cache invalidation hook called with the changed paths of each batch."""
+        self._listeners.append(callback)
+
+    def _publish(self, event: dict):
+        for queue in list(self._subscribers):
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                # A stalled client only misses events; it will rescan on reconnect
+                pass
+
+    # --- Event handling ---
+
+    def notify_changed(self, path: str):
+        """Records a changed path and (re)starts the debounce timer. Must be called on the event loop."""
+        from services.script_index import script_index
+
+        path = _normalize(path)
+        # Version tokens (ETags) go stale right away, not after the debounced rescan
+        script_index.invalidate(path)
+        self._pending.add(path)
+        if self._debounce_handle is not None:
+            self._debounce_handle.cancel()
+        self._debounce_handle = self._loop.call_later(DEBOUNCE_SECONDS, self._flush)
+
+    def _flush(self):
+        self._debounce_handle = None
+        changed = sorted(self._pending)
+        self._pending.clear()
+        if changed:
+            task = asyncio.create_task(self._process(changed))
+            self._tasks.append(task)
+            task.add_done_callback(lambda t: self._tasks.remove(t) if t in self._tasks else None)
+
+    async def _process(self, changed: List[str]):
+        from services.script_index import folder_key, script_index
+
+        self.last_change_at = time.time()
+        for listener in self._listeners:
+            try:
+                listener(changed)
+            except Exception as e:
+                logger.error(f"Script watcher listener failed: {e}")
+
+        # Only folders that have been listed before are kept in the index; rescan those affected.
+        keys = [folder_key(p) for p in changed]
+        affected = [f for f in indexed_folders() if any(k == f or k.startswith(f + '/') for k in keys)]
+
+        for folder in affected:
+            if not os.path.isdir(folder):
+                continue
+            try:
+                await script_index.rescan(folder)
+            except Exception as e:
+                logger.error(f"Background rescan of {folder} failed: {e}")
+
+        self._publish({
+            "type": "library_changed",
+            "folders": affected,
+            "paths": changed,
+            "timestamp": self.last_change_at,
+        })
+
+    # --- Watch management ---
+
+    def covers(self, path: str) -> bool:
+        """
+        True if changes under path are reported by a live filesystem watch
+        (so cached version tokens can be trusted).
+        """
+        if self.mode not in ("native", "polling"):
+            return False
+        path = _normalize(path)
+        return any(path == folder or path.startswith(folder + '/') for folder in self._watches)
+
+    def refresh_watches(self):
+        """Adds watches for newly configured folders and drops watches for removed ones."""
+        if self._observer is None:
+            return
+        wanted = configured_script_folders()
+        for folder in set(self._watches) - wanted:
+            try:
+                self._observer.unschedule(self._watches.pop(folder))
+            except Exception:
+                pass
+        handler = _EventHandler(self, self._loop)
+        for folder in wanted - set(self._watches):
+            try:
+                self._watches[folder] = self._observer.schedule(handler, folder, recursive=True)
+            except Exception as e:
+                logger.warning(f"Could not watch {folder}: {e}")
+
+    def request_refresh(self):
+        """Thread-safe trigger for refresh_watches (sync routes run on the threadpool)."""
+        if self._loop is not None and self._observer is not None:
+            self._loop.call_soon_threadsafe(self.refresh_watches)
+
+    async def _refresh_loop(self):
+        while True:
+            await asyncio.sleep(WATCH_SET_REFRESH_SECONDS)
+            try:
+                self.refresh_watches()
+            except Exception as e:
+                logger.error(f"Error refreshing script watches: {e}")
+
+    async def _poll_loop(self):
+        """Last resort without watchdog: periodically rescan indexed folders and report what changed."""
+        from services.script_index import script_index
+        while True:
+            await asyncio.sleep(POLL_RESCAN_SECONDS)
+            for folder in indexed_folders():
+                if not os.path.isdir(folder):
+                    continue
+                try:
+                    await script_index.rescan(folder)
+                    stats = script_index.last_scan_stats.get(folder, {})
+                    if stats.get("extracted") or stats.get("removed"):
+                        self.last_change_at = time.time()
+                        self._publish({"type": "library_changed", "folders": [folder], "paths": [],
+                                       "timestamp": self.last_change_at})
+                except Exception as e:
+                    logger.error(f"Polling rescan of {folder} failed: {e}")
+
+    def start(self):
+        self._loop = asyncio.get_running_loop()
+        if not WATCHDOG_AVAILABLE:
+            logger.warning("watchdog is not installed; falling back to periodic rescans.")
+            self.mode = "rescan"
+            self._tasks.append(asyncio.create_task(self._poll_loop()))
+            return
+
+        try:
+            self._observer = Observer()
+            self.refresh_watches()
+            self._observer.start()
+            self.mode = "native"
+        except Exception as e:
+            # e.g. inotify watch limit reached or unsupported network drive
+            logger.warning(f"Native file watching unavailable ({e}); using polling observer.")
+            self._watches.clear()
+            self._observer = PollingObserver()
+            self.refresh_watches()
+            self._observer.start()
+            self.mode = "polling"
+        self._tasks.append(asyncio.create_task(self._refresh_loop()))
+        logger.info(f"Script watcher started ({self.mode}) for {len(self._watches)} folder(s).")
+
+    async def stop(self):
+        if self._debounce_handle is not None:
+            self._debounce_handle.cancel()
+            self._debounce_handle = None
+        for task in list(self._tasks):
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._tasks.clear()
+        if self._observer is not None:
+            self._observer.stop()
+            await asyncio.to_thread(self._observer.join, 5)
+            self._observer = None
+        self._watches.clear()
+        self.mode = "stopped"
+
+# Global instance
+script_watcher = ScriptLibraryWatcher()
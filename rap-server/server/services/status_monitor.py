@@ -0,0 +1,131 @@
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+import grpc
+from grpc_client import get_status_async
+
+logger = logging.getLogger(__name__)
+
+# Poll cadence while Revit is reachable, and the ceiling for the offline backoff.
+POLL_INTERVAL_SECONDS = 2.0
+MAX_BACKOFF_SECONDS = 30.0
+# A busy Revit must not stall the monitor for longer than this.
+STATUS_TIMEOUT_SECONDS = 3.0
+
+# Fields compared to decide whether the status actually changed.
+STATUS_FIELDS = ("paracoreConnected", "revitOpen", "revitVersion", "documentOpen", "documentTitle", "documentType",
+                 "engineVersion", "engineBuild")
+
+def _offline_status() -> Dict[str, Any]:
+    return {
+        "paracoreConnected": False,
+        "revitOpen": False,
+        "revitVersion": None,
+        "documentOpen": False,
+        "documentTitle": None,
+        "documentType": "None",
+        "engineVersion": None,
+        "engineBuild": None
+    }
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+class StatusMonitor:
+    """
+    Polls GetStatus in the background and keeps the latest snapshot in memory,
+    so /api/status never waits on Revit. Backs off exponentially while the add-in is offline.
+    """
+    def __init__(self):
+        self._status: Dict[str, Any] = _offline_status()
+        self._last_checked_at: Optional[str] = None
+        self._last_changed_at: Optional[str] = None
+        self._interval = POLL_INTERVAL_SECONDS
+        self._task: Optional[asyncio.Task] = None
+        self._listeners: List[Callable[[Dict[str, Any]], None]] = []
+
+    def add_listener(self, callback: Callable[[Dict[str, Any]], None]):
+        """Registers a hook called with the new status whenever it changes (e.g. another document became active)."""
+        self._listeners.append(callback)
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            **self._status,
+            "lastCheckedAt": self._last_checked_at,
+            "lastChangedAt": self._last_changed_at,
+            "nextCheckInSeconds": self._interval,
+        }
+
+    async def poll_once(self) -> Dict[str, Any]:
+        try:
+            response = await get_status_async(timeout=STATUS_TIMEOUT_SECONDS)
+            status = {
+                "paracoreConnected": response.paracore_connected,
+                "revitOpen": response.revit_open,
+                "revitVersion": response.revit_version or None,
+                "documentOpen": response.document_open,
+                "documentTitle": response.document_title or None,
+                "documentType": response.document_type or "None",
+                "engineVersion": response.engine_version or None,
+                "engineBuild": response.engine_build or None
+            }
+            self._interval = POLL_INTERVAL_SECONDS
+        except grpc.RpcError as e:
+            if e.code() == grpc.StatusCode.DEADLINE_EXCEEDED and self._status["paracoreConnected"]:
+                # Revit is busy (e.g. running a script) but was reachable; keep the last known status.
+                status = self._status
+            else:
+                status = _offline_status()
+                self._interval = min(self._interval * 2, MAX_BACKOFF_SECONDS)
+
+        now = _now_iso()
+        if self._last_changed_at is None or any(status[k] != self._status[k] for k in STATUS_FIELDS):
+            if self._last_changed_at is not None:
+                logger.info(f"Revit status changed: connected={status['paracoreConnected']}, "
+                            f"document={status['documentTitle']}")
+            self._last_changed_at = now
+            changed = True
+        else:
+            changed = False
+        self._status = status
+        if changed:
+            for listener in self._listeners:
+                try:
+                    listener(status)
+                except Exception as e:
+                    logger.error(f"Status listener failed: {e}")
+        self._last_checked_at = now
+        return self.snapshot()
+
+    async def _run(self):
+        logger.info("Starting Revit status monitor...")
+        while True:
+            try:
+                await self.poll_once()
+            except Exception as e:
+                logger.error(f"Error in status monitor loop: {e}")
+
+            await asyncio.sleep(self._interval)
+
+    def start(self):
+        if not self.running:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+# Global instance
+status_monitor = StatusMonitor()
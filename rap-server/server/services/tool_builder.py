@@ -0,0 +1,121 @@
+import asyncio
+import logging
+import os
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from grpc_client import get_script_metadata_async, get_script_parameters_async, script_files_hash
+from services import ptool_package
+from services.assembly_cache import assembly_cache
+from services.script_index import ScriptUnit, discover_units
+
+logger = logging.getLogger(__name__)
+
+# Tools built at once by a folder build; each issues its metadata, parameters and build requests together.
+BUILD_CONCURRENCY = 4
+
+class ToolBuildError(Exception):
+    pass
+
+def ptool_output_path(script_path: str) -> str:
+    """Where a script's tool is written: next to the .cs file, or beside a multi-file folder."""
+    if os.path.isdir(script_path):
+        return script_path.rstrip("/\\") + ".ptool"
+    return script_path[:-len(".cs")] + ".ptool" if script_path.lower().endswith(".cs") else script_path + ".ptool"
+
+def stored_source_hash(output_path: str) -> Optional[str]:
+    """The source hash recorded in an existing tool, or None if there is no (readable) tool."""
+    if not os.path.isfile(output_path):
+        return None
+    try:
+        return ptool_package.read_header(output_path)["source_hash"]
+    except Exception:
+        return None
+
+async def build_tool(script_path: str, script_files: List[Dict[str, str]]) -> Dict[str, Any]:
+    """
+    Builds a protected .ptool from a script's ScriptFiles. Metadata, parameters and the build are
+    requested concurrently (the build comes from the assembly cache when the sources are unchanged).
+    Returns {"output_path", "source_hash", "seconds"}; raises ToolBuildError if compilation fails.
+    """
+    started = time.perf_counter()
+    source_hash = script_files_hash(script_files)
+    metadata_res, params_res, (assembly, error_message) = await asyncio.gather(
+        get_script_metadata_async(script_files),
+        get_script_parameters_async(script_files),
+        assembly_cache.build(script_files),
+    )
+    if assembly is None:
+        raise ToolBuildError(f"Compilation failed: {error_message}")
+
+    # Force is_protected and is_compiled to True for the baked metadata
+    metadata = {**(metadata_res.get("metadata") or {}), "is_protected": True, "is_compiled": True}
+    parameters = params_res.get("parameters") or []
+
+    output_path = ptool_output_path(script_path)
+    await asyncio.to_thread(ptool_package.write_ptool, output_path, metadata, parameters, assembly,
+                            None, source_hash)
+    return {"output_path": output_path, "source_hash": source_hash, "seconds": round(time.perf_counter() - started, 3)}
+
+async def build_folder(folder_path: str, force: bool = False) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Builds a tool for every script in a folder, BUILD_CONCURRENCY at a time. A script whose source hash
+    matches the one stored in its existing .ptool is skipped unless force is set.
+    Yields {"event": "discovered", "total", "toBuild", "upToDate"}, then {"event": "tool", "scriptPath",
+    "outputPath", "status": built | skipped | failed, "seconds", "error"} per script as it finishes,
+    then {"event": "summary", "built", "skipped", "failed", "empty", "buildSeconds", "seconds"}
+    (empty: scripts with no readable source).
+    """
+    started = time.perf_counter()
+    units = [u for u in await discover_units(folder_path) if u.type != "ptool"]
+
+    def plan(unit: ScriptUnit):
+        if not unit.load():
+            return "empty"
+        if not force and stored_source_hash(ptool_output_path(unit.path)) == unit.content_hash:
+            return "skipped"
+        return "build"
+
+    decisions = await asyncio.gather(*(asyncio.to_thread(plan, u) for u in units))
+    to_build = [u for u, d in zip(units, decisions, strict=True) if d == "build"]
+    up_to_date = [u for u, d in zip(units, decisions, strict=True) if d == "skipped"]
+    yield {"event": "discovered", "total": len(units), "toBuild": len(to_build), "upToDate": len(up_to_date)}
+
+    for unit in up_to_date:
+        yield {"event": "tool", "scriptPath": unit.path, "outputPath": ptool_output_path(unit.path),
+               "status": "skipped", "seconds": 0, "error": None}
+
+    semaphore = asyncio.Semaphore(BUILD_CONCURRENCY)
+
+    async def build_one(unit: ScriptUnit) -> Dict[str, Any]:
+        async with semaphore:
+            unit_started = time.perf_counter()
+            try:
+                built = await build_tool(unit.path, unit.script_files)
+                return {"event": "tool", "scriptPath": unit.path, "outputPath": built["output_path"],
+                        "status": "built", "seconds": built["seconds"], "error": None}
+            except Exception as e:
+                logger.error(f"Building a tool from {unit.path} failed: {e}")
+                return {"event": "tool", "scriptPath": unit.path, "outputPath": ptool_output_path(unit.path),
+                        "status": "failed", "seconds": round(time.perf_counter() - unit_started, 3), "error": str(e)}
+
+    built = failed = 0
+    build_seconds = 0.0
+    tasks = [asyncio.ensure_future(build_one(u)) for u in to_build]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            update = await next_done
+            if update["status"] == "built":
+                built += 1
+            else:
+                failed += 1
+            build_seconds += update["seconds"]
+            yield update
+    finally:
+        # The client went away mid-build: stop the tools not yet started
+        for task in tasks:
+            task.cancel()
+
+    yield {"event": "summary", "built": built, "skipped": len(up_to_date), "failed": failed,
+           "empty": len(units) - len(to_build) - len(up_to_date),
+           "buildSeconds": round(build_seconds, 3), "seconds": round(time.perf_counter() - started, 3)}
@@ -0,0 +1,195 @@
+"""
+Checks the GetScriptMetadataBatch client against a fake CoreScript engine served on an ephemeral port:
+batches split into several requests, per-unit errors, and the per-script fallback for add-ins that
+answer UNIMPLEMENTED.
+
+Usage: python test_metadata_batch.py
+"""
+import asyncio
+import os
+import sys
+import tempfile
+
+# Isolated database for the run; must be set before database_config/grpc_client are imported.
+os.environ["DATABASE_URL"] = "sqlite:///" + os.path.join(tempfile.mkdtemp(), "test_metadata_batch.db")
+# Every unit goes to the engine; the local extractor is checked by test_script_extractor.py.
+os.environ["PARACORE_EXTRACTOR"] = "engine"
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import corescript_pb2
+import corescript_pb2_grpc
+import grpc
+import grpc_client
+
+SCRIPT_TEMPLATE = """/*
+Description: Test script {i}
+*/
+var p = new Params();
+Println($"Count {{p.Count}}");
+
+public class Params {{
+    public int Count {{ get; set; }} = {i};
+}}
+"""
+
+
+class FakeEngine(corescript_pb2_grpc.CoreScriptRunnerServicer):
+    """Answers from the file names; any unit with a file named Broken.cs fails on its own."""
+
+    def __init__(self, batch_implemented=True):
+        self.batch_implemented = batch_implemented
+        self.batch_requests = []
+        self.single_calls = []
+
+    def _result(self, script_files):
+        name = script_files[0].file_name
+        if any(f.file_name == "Broken.cs" for f in script_files):
+            return None, [], f"Failed to parse {name}"
+        metadata = corescript_pb2.ScriptMetadata(name=name, description=f"Extracted {name}")
+        return metadata, [corescript_pb2.ScriptParameter(name="Count", type="int")], ""
+
+    async def GetScriptMetadata(self, request, context):
+        self.single_calls.append(("metadata", request.script_files[0].file_name))
+        metadata, _, error = self._result(request.script_files)
+        return corescript_pb2.GetScriptMetadataResponse(metadata=metadata, error_message=error)
+
+    async def GetScriptParameters(self, request, context):
+        self.single_calls.append(("parameters", request.script_files[0].file_name))
+        _, parameters, error = self._result(request.script_files)
+        return corescript_pb2.GetScriptParametersResponse(parameters=parameters, error_message=error)
+
+    async def GetScriptMetadataBatch(self, request, context):
+        if not self.batch_implemented:
+            await context.abort(grpc.StatusCode.UNIMPLEMENTED, "Method not found!")
+        self.batch_requests.append([u.id for u in request.units])
+        results = []
+        for unit in request.units:
+            metadata, parameters, error = self._result(unit.script_files)
+            results.append(corescript_pb2.ScriptMetadataResult(
+                id=unit.id, metadata=metadata, error_message=error,
+                parameters=parameters if request.include_parameters else []))
+        return corescript_pb2.GetScriptMetadataBatchResponse(results=results)
+
+
+def _units(n, broken=()):
+    units = []
+    for i in range(n):
+        file_name = "Broken.cs" if i in broken else f"Script_{i:02d}.cs"
+        units.append({"id": f"unit-{i:02d}", "script_files": [
+            {"file_name": file_name, "content": SCRIPT_TEMPLATE.format(i=i)}]})
+    return units
+
+
+def _run_with_engine(fake, check):
+    """Serves fake on an ephemeral port and runs check(fake) against it, with fresh channels and cache."""
+    async def run():
+        server = grpc.aio.server()
+        corescript_pb2_grpc.add_CoreScriptRunnerServicer_to_server(fake, server)
+        port = server.add_insecure_port("127.0.0.1:0")
+        await server.start()
+        os.environ["GRPC_SERVER_ADDRESS"] = f"127.0.0.1:{port}"
+        grpc_client.clear_extraction_cache()
+        grpc_client.init_aio_channel()
+        try:
+            await check(fake)
+        finally:
+            await grpc_client.close_aio_channel()
+            await server.stop(None)
+    asyncio.run(run())
+
+
+def test_batch_split_into_requests():
+    units = _units(12)
+    unit_bytes = max(len(u["script_files"][0]["content"]) for u in units)
+
+    async def check(fake):
+        # Room for three units per request
+        grpc_client._METADATA_BATCH_MAX_BYTES = unit_bytes * 3 + 1
+        # The blocking client sends the requests one after the other on its own channel
+        loop = asyncio.get_running_loop()
+        results = await loop.run_in_executor(None, grpc_client.get_script_metadata_batch, units, True)
+        assert list(results) == [u["id"] for u in units], list(results)
+        assert [len(ids) for ids in fake.batch_requests] == [3, 3, 3, 3], fake.batch_requests
+        for unit in units:
+            result = results[unit["id"]]
+            assert result["error_message"] == "", result
+            assert result["metadata"]["name"] == unit["script_files"][0]["file_name"], result
+            assert [p["name"] for p in result["parameters"]] == ["Count"], result
+
+        # The async client with several requests in flight: answers still come back in request order
+        grpc_client.clear_extraction_cache()
+        fake.batch_requests.clear()
+        grpc_client._METADATA_BATCH_MAX_BYTES = unit_bytes * 100
+        results = await grpc_client.get_script_metadata_batch_async(units, include_parameters=True,
+                                                                    max_concurrency=4)
+        assert list(results) == [u["id"] for u in units], list(results)
+        assert sorted(len(ids) for ids in fake.batch_requests) == [3, 3, 3, 3], fake.batch_requests
+        assert sorted(i for ids in fake.batch_requests for i in ids) == [u["id"] for u in units]
+
+        # Everything is cached now: no further round trips
+        fake.batch_requests.clear()
+        await grpc_client.get_script_metadata_batch_async(units, include_parameters=True, max_concurrency=4)
+        assert fake.batch_requests == [], fake.batch_requests
+
+    original = grpc_client._METADATA_BATCH_MAX_BYTES
+    try:
+        _run_with_engine(FakeEngine(), check)
+    finally:
+        grpc_client._METADATA_BATCH_MAX_BYTES = original
+    print("Batch split into requests: OK")
+
+
+def test_per_unit_errors():
+    units = _units(5, broken={1, 3})
+
+    async def check(fake):
+        results = await grpc_client.get_script_metadata_batch_async(units, include_parameters=True)
+        assert list(results) == [u["id"] for u in units], list(results)
+        for i, unit in enumerate(units):
+            result = results[unit["id"]]
+            if i in (1, 3):
+                assert result["error_message"] == "Failed to parse Broken.cs", result
+            else:
+                assert result["error_message"] == "", result
+                assert result["metadata"]["name"] == f"Script_{i:02d}.cs", result
+
+        # Failures are not cached, so only the broken units are asked for again
+        fake.batch_requests.clear()
+        await grpc_client.get_script_metadata_batch_async(units, include_parameters=True)
+        assert fake.batch_requests == [["unit-01", "unit-03"]], fake.batch_requests
+
+    _run_with_engine(FakeEngine(), check)
+    print("Per-unit errors: OK")
+
+
+def test_unimplemented_falls_back_to_single_calls():
+    from services.script_index import ScriptUnit, extract_units
+
+    script_units = []
+    for unit in _units(3):
+        script_unit = ScriptUnit(unit["id"], "single-file", [], 0, 0.0, 0.0)
+        script_unit.script_files = unit["script_files"]
+        script_units.append(script_unit)
+
+    async def check(fake):
+        results = await extract_units(script_units, include_parameters=True)
+        assert sorted(results) == [u.path for u in script_units], sorted(results)
+        for unit in script_units:
+            result = results[unit.path]
+            assert result["error_message"] == "", result
+            assert result["metadata"]["name"] == unit.script_files[0]["file_name"], result
+            assert [p["name"] for p in result["parameters"]] == ["Count"], result
+            assert "source" not in result, result
+        assert fake.batch_requests == [], fake.batch_requests
+        assert sorted(fake.single_calls) == sorted(
+            (kind, u.script_files[0]["file_name"]) for u in script_units for kind in ("metadata", "parameters"))
+
+    _run_with_engine(FakeEngine(batch_implemented=False), check)
+    print("UNIMPLEMENTED fallback: OK")
+
+
+if __name__ == "__main__":
+    test_batch_split_into_requests()
+    test_per_unit_errors()
+    test_unimplemented_falls_back_to_single_calls()
+    print("All metadata batch checks passed.")
@@ -0,0 +1,116 @@
+"""
+Parity check for script_extractor against the engine's GetScriptMetadataBatch output.
+
+Each case in extractor_corpus/ is a single .cs file or a folder of .cs files (one multi-file script), with the
+engine's result stored next to it as <case>.expected.json: {"metadata", "parameters", "error_message",
+"recorded_from": {"engine_version", "revit_version"}}. Only recorded files show parity, so a case without an
+expected file, or with one that has no recorded_from (traced by hand), fails the run.
+
+Usage:
+  python test_script_extractor.py                      compare the local extractor with the recorded engine output
+  python test_script_extractor.py --allow-unrecorded   ... only reporting cases not recorded yet (while adding one)
+  python test_script_extractor.py --record             re-record the expected output from a running engine
+"""
+import json
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+CORPUS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "extractor_corpus")
+
+
+def load_corpus():
+    """[(case name, script_files)] in a stable order."""
+    cases = []
+    for entry in sorted(os.listdir(CORPUS_DIR)):
+        path = os.path.join(CORPUS_DIR, entry)
+        if os.path.isdir(path):
+            names = sorted(n for n in os.listdir(path) if n.endswith(".cs"))
+            files = [{"file_name": n, "content": _read(os.path.join(path, n))} for n in names]
+            cases.append((entry, files))
+        elif entry.endswith(".cs"):
+            cases.append((entry[:-3], [{"file_name": entry, "content": _read(path)}]))
+    return cases
+
+
+def _read(path):
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        return f.read()
+
+
+def _expected_path(case):
+    return os.path.join(CORPUS_DIR, f"{case}.expected.json")
+
+
+def record():
+    # Always ask the engine; the local extractor is what is being checked.
+    os.environ["PARACORE_EXTRACTOR"] = "engine"
+    import grpc_client
+
+    status = grpc_client.get_status()
+    recorded_from = {"engine_version": status.engine_version, "revit_version": status.revit_version}
+    cases = load_corpus()
+    units = [{"id": case, "script_files": files} for case, files in cases]
+    results = grpc_client.get_script_metadata_batch(units, include_parameters=True)
+    offline = [case for case, _ in cases if grpc_client.is_offline_result(results[case])]
+    if offline:
+        raise SystemExit(f"The engine went away while recording ({', '.join(offline)}); nothing was written.")
+    for case, _ in cases:
+        with open(_expected_path(case), "w", encoding="utf-8") as f:
+            json.dump({**results[case], "recorded_from": recorded_from}, f, indent=2, ensure_ascii=False)
+            f.write("\n")
+        print(f"Recorded {case}")
+
+
+def test_parity(strict=True):
+    import script_extractor
+
+    cases = load_corpus()
+    assert cases, "extractor corpus is empty"
+    unrecorded, hand_traced = [], []
+    for case, files in cases:
+        if not os.path.exists(_expected_path(case)):
+            unrecorded.append(case)
+            continue
+        with open(_expected_path(case), "r", encoding="utf-8") as f:
+            expected = json.load(f)
+        if "recorded_from" not in expected:
+            hand_traced.append(case)
+        actual = script_extractor.extract_script(files, include_parameters=True)
+        assert actual["error_message"] == expected["error_message"], (case, actual["error_message"])
+        assert actual["metadata"] == expected["metadata"], (case, actual["metadata"])
+        expected_names = [p["name"] for p in expected["parameters"]]
+        assert [p["name"] for p in actual["parameters"]] == expected_names, case
+        for got, want in zip(actual["parameters"], expected["parameters"], strict=True):
+            assert got == want, (case, got["name"], {k: (got[k], want[k]) for k in want if got.get(k) != want[k]})
+        print(f"{case}: OK ({len(expected_names)} parameters)")
+    if hand_traced:
+        print(f"Traced by hand, not recorded from the engine: {', '.join(hand_traced)}")
+    if unrecorded:
+        print(f"Not recorded yet (run --record against a live engine): {', '.join(unrecorded)}")
+    if strict:
+        assert not (hand_traced or unrecorded), "parity is only shown by cases recorded from the engine"
+
+
+def test_unsupported_source_defers_to_engine():
+    import script_extractor
+
+    files = [{"file_name": "Broken.cs",
+              "content": 'var p = new Params();\n'
+                         'public class Params { public string A { get; set; } = "unterminated; }\n'}]
+    try:
+        script_extractor.extract_script(files)
+    except script_extractor.UnsupportedSourceError:
+        print("Unsupported source: OK")
+        return
+    raise AssertionError("expected UnsupportedSourceError")
+
+
+if __name__ == "__main__":
+    if "--record" in sys.argv:
+        record()
+    else:
+        test_parity(strict="--allow-unrecorded" not in sys.argv)
+        test_unsupported_source_defers_to_engine()
+        print("All script extractor checks passed.")
@@ -1,3 +1,4 @@
+import glob
 import os
 import re
 
@@ -23,9 +24,9 @@ def redact_secrets(text: str) -> str:
 
     return redacted
 
-def resolve_script_path(relative_or_absolute_path: str) -> str:
+def normalize_script_path(relative_or_absolute_path: str) -> str:
     """
-    Resolves a script path to a consistent, absolute, and normalized form.
+    The absolute, forward-slash form of a script path, without checking that it exists.
     Handles both absolute and relative paths.
     """
     if os.path.isabs(relative_or_absolute_path):
@@ -38,12 +39,33 @@ def resolve_script_path(relative_or_absolute_path: str) -> str:
         safe_path = os.path.abspath(os.path.join(script_root_for_defaults, relative_or_absolute_path))
 
     # Ensure consistent forward slashes for storage/comparison
-    safe_path = safe_path.replace('\\', '/')
+    return safe_path.replace('\\', '/')
 
+def resolve_script_path(relative_or_absolute_path: str) -> str:
+    """
+    Resolves a script path to a consistent, absolute, and normalized form.
+    Handles both absolute and relative paths.
+    """
+    safe_path = normalize_script_path(relative_or_absolute_path)
     if not os.path.exists(safe_path):
         raise FileNotFoundError(f"Script not found at the resolved path: {safe_path}")
     return safe_path
 
+def read_script_files(absolute_path: str, script_type: str) -> list:
+    """
+    The ScriptFile payload of a script: [{"file_name", "content"}] for a single .cs file,
+    or for every .cs file in a multi-file folder.
+    """
+    if script_type == "single-file":
+        paths = [absolute_path]
+    else:
+        paths = sorted(glob.glob(os.path.join(absolute_path, "*.cs")))
+    script_files = []
+    for path in paths:
+        with open(path, 'r', encoding='utf-8-sig') as f:
+            script_files.append({"file_name": os.path.basename(path), "content": f.read()})
+    return script_files
+
 def get_or_create_script(db: Session, script_path: str, owner_id: int) -> models.Script:
     """
     Retrieves a script from the database by its path, creating it if it doesn't exist.